@@ -0,0 +1,99 @@
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from config import *
+from sim import WaveSim, evaluate_layouts, random_layout
+from track import Track
+
+# Headless benchmark for balance tuning: path lookups, one wave in the game
+# loop versus the simulator, and layouts evaluated per second.
+
+SEED = 7
+LOOKUPS = 200000
+TOWERS = 8
+WAVES = 5
+LAYOUTS = 1000
+
+
+def legacy_position(points, distance):
+    # The previous Path.get_position_at_distance: walk the segments
+    total_length = 0
+    for start, end in zip(points, points[1:]):
+        segment_length = ((end[0] - start[0])**2 + (end[1] - start[1])**2)**0.5
+        if total_length + segment_length >= distance:
+            progress = (distance - total_length) / segment_length
+            return start[0] + (end[0] - start[0]) * progress, start[1] + (end[1] - start[1]) * progress
+        total_length += segment_length
+    return points[-1]
+
+
+def bench_lookups():
+    track = Track(PATH_POINTS)
+    rng = random.Random(SEED)
+    distances = [rng.uniform(0, track.total_length) for _ in range(LOOKUPS)]
+    start = time.perf_counter()
+    for distance in distances:
+        legacy_position(PATH_POINTS, distance)
+    legacy = time.perf_counter() - start
+    start = time.perf_counter()
+    for distance in distances:
+        track.position_at(distance)
+    table = time.perf_counter() - start
+    return legacy * 1e9 / LOOKUPS, table * 1e9 / LOOKUPS
+
+
+def bench_game_wave(layout):
+    # Wave 1 through Game.update, with no drawing and no frame cap
+    import pygame
+    from game import Game
+    game = Game()
+    game.gold = 10 ** 9
+    for x, y, tower_type in layout:
+        game.selected_tower_type = tower_type
+        game.try_place_tower(x, y)
+    start = time.perf_counter()
+    while game.wave == 1 and not game.game_over:
+        game.update()
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+    return elapsed, game.frame
+
+
+def bench_sim_wave(layout):
+    sim = WaveSim(layout, pay=False)
+    start = time.perf_counter()
+    sim.run_wave()
+    return time.perf_counter() - start, sim.frame
+
+
+def bench_layouts(processes):
+    rng = random.Random(SEED)
+    layouts = [random_layout(rng, TOWERS) for _ in range(LAYOUTS)]
+    start = time.perf_counter()
+    evaluate_layouts(layouts, WAVES, processes=processes)
+    return LAYOUTS / (time.perf_counter() - start)
+
+
+def main():
+    legacy, table = bench_lookups()
+    print(f"position lookup: segment walk {legacy:.0f} ns, arc-length table {table:.0f} ns")
+
+    layout = random_layout(random.Random(SEED), TOWERS)
+    game_time, frames = bench_game_wave(layout)
+    sim_time, sim_frames = bench_sim_wave(layout)
+    print(f"wave 1 ({frames} frames, {frames / FPS:.0f} s of play): "
+          f"Game.update {game_time * 1000:.1f} ms, WaveSim {sim_time * 1000:.1f} ms ({sim_frames} frames)")
+
+    cpus = os.cpu_count() or 1
+    for processes in sorted({1, cpus}):
+        rate = bench_layouts(processes)
+        print(f"evaluate_layouts, {TOWERS} towers, {WAVES} waves, {processes} process(es): {rate:.0f} layouts/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
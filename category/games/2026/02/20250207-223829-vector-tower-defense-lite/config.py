@@ -19,6 +19,7 @@ ACCENT_COLOR = (70, 130, 180)
 ENEMY_SIZE = 15
 ENEMY_BASE_SPEED = 1.5
 ENEMY_SPAWN_INTERVAL = 1500  # ms
+ENEMY_SPAWN_FRAMES = ENEMY_SPAWN_INTERVAL * FPS // 1000
 
 # Tower types
 TOWER_TYPES = {
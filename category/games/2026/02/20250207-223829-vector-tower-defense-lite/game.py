@@ -27,7 +27,8 @@ class Game:
         self.wave = 1
         self.enemies_spawned = 0
         self.enemies_to_spawn = WAVE_LENGTH
-        self.last_spawn_time = 0
+        self.frame = 0
+        self.last_spawn_frame = 0
         self.selected_tower_type = 1
         self.game_over = False
         self.show_ranges = False
@@ -74,26 +75,27 @@ class Game:
         cost = TOWER_TYPES[self.selected_tower_type]["cost"]
         if self.gold >= cost:
             self.gold -= cost
-            self.towers.append(Tower(x, y, self.selected_tower_type))
+            self.towers.append(Tower(x, y, self.selected_tower_type, self.path))
 
-    def spawn_enemy(self, current_time):
+    def spawn_enemy(self):
         if self.enemies_spawned >= self.enemies_to_spawn:
             return
 
-        if current_time - self.last_spawn_time >= ENEMY_SPAWN_INTERVAL:
+        if self.frame - self.last_spawn_frame >= ENEMY_SPAWN_FRAMES:
             wave_multiplier = 1.0 + (self.wave - 1) * 0.2
             self.enemies.append(Enemy(self.path, wave_multiplier))
             self.enemies_spawned += 1
-            self.last_spawn_time = current_time
+            self.last_spawn_frame = self.frame
 
     def update(self):
         if self.game_over:
             return
 
-        current_time = pygame.time.get_ticks()
+        # Spawning counts frames, as sim.py does, so a wave plays the same at any frame rate
+        self.frame += 1
 
         # Spawn enemies
-        self.spawn_enemy(current_time)
+        self.spawn_enemy()
 
         # Check wave complete
         if (self.enemies_spawned >= self.enemies_to_spawn and
@@ -1,5 +1,6 @@
 import pygame
 from config import PATH_POINTS, PATH_COLOR, GRID_SIZE
+from track import Track
 
 
 class Path:
@@ -7,6 +8,7 @@ class Path:
         self.points = PATH_POINTS
         self.segments = self._create_segments()
         self.rects = self._create_collision_rects()
+        self.track = Track(self.points)
 
     def _create_segments(self):
         segments = []
@@ -36,22 +38,10 @@ class Path:
         return False
 
     def get_position_at_distance(self, distance):
-        total_length = 0
-        for start, end in self.segments:
-            segment_length = ((end[0] - start[0])**2 + (end[1] - start[1])**2)**0.5
-            if total_length + segment_length >= distance:
-                progress = (distance - total_length) / segment_length
-                x = start[0] + (end[0] - start[0]) * progress
-                y = start[1] + (end[1] - start[1]) * progress
-                return x, y
-            total_length += segment_length
-        return self.points[-1]
+        return self.track.position_at(distance)
 
     def get_total_length(self):
-        total = 0
-        for start, end in self.segments:
-            total += ((end[0] - start[0])**2 + (end[1] - start[1])**2)**0.5
-        return total
+        return self.track.total_length
 
     def draw(self, screen):
         path_width = GRID_SIZE
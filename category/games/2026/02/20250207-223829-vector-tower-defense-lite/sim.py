@@ -0,0 +1,290 @@
+import bisect
+import math
+import multiprocessing
+from config import *
+from track import Track
+
+# Headless wave simulation, free of pygame, for balance tuning.
+#
+# WaveSim follows the rules of Game.update frame by frame (enemy movement,
+# tower cooldowns and targeting, homing projectiles, waves and rewards)
+# without a window or clock, so a wave plays out in milliseconds.
+# evaluate_layouts runs many tower layouts across worker processes.
+#
+# A layout is a list of (x, y, tower_type). Towers are built in layout order
+# as soon as the gold covers them, the way a player would, unless pay=False,
+# which builds them all for free before the first frame. Positions that the
+# game would refuse (on the path, or on another tower) are skipped.
+
+LAYOUT_BATCH = 16
+
+
+class SimEnemy:
+    # x, y are the position at `placed`, updated only when a tower or projectile needs them
+    __slots__ = ("distance", "speed", "health", "value", "alive", "reached_end", "x", "y", "placed")
+
+    def __init__(self, track, wave_multiplier):
+        self.distance = 0
+        self.speed = ENEMY_BASE_SPEED * wave_multiplier
+        self.health = 30 * wave_multiplier
+        self.value = int(10 * wave_multiplier)
+        self.alive = True
+        self.reached_end = False
+        self.x, self.y = track.position_at(0)
+        self.placed = 0
+
+
+class SimTower:
+    __slots__ = ("x", "y", "type_id", "range", "damage", "max_cooldown", "cooldown", "intervals", "wake")
+
+    def __init__(self, x, y, tower_type, track):
+        config = TOWER_TYPES[tower_type]
+        self.x = x
+        self.y = y
+        self.type_id = tower_type
+        self.range = config["range"]
+        self.damage = config["damage"]
+        self.max_cooldown = config["fire_rate"]
+        self.cooldown = 0
+        # Stretches of the path in range; enemies elsewhere are never looked at
+        self.intervals = track.intervals_within(x, y, self.range)
+        # No enemy can be in range before this frame
+        self.wake = 0
+
+
+class WaveSim:
+    def __init__(self, layout, pay=True, track=None):
+        self.track = track or Track(PATH_POINTS)
+        self.pending = [(int(x), int(y), tower_type) for x, y, tower_type in layout]
+        self.pay = pay
+        self.towers = []
+        self.enemies = []
+        # Projectiles as [x, y, target, damage]
+        self.projectiles = []
+        self.lives = STARTING_LIVES
+        self.gold = STARTING_GOLD
+        self.score = 0
+        self.wave = 1
+        self.enemies_spawned = 0
+        self.enemies_to_spawn = WAVE_LENGTH
+        self.last_spawn_frame = 0
+        self.frame = 0
+        self.game_over = False
+        self.kills = 0
+        self.leaks = 0
+        self.spent = 0
+        self.rejected = 0
+        if not pay:
+            self._build()
+
+    def _can_place(self, x, y):
+        if self.track.is_on_path(x, y, GRID_SIZE):
+            return False
+        half = TOWER_SIZE // 2
+        for tower in self.towers:
+            if tower.x - half <= x < tower.x - half + TOWER_SIZE and tower.y - half <= y < tower.y - half + TOWER_SIZE:
+                return False
+        return True
+
+    def _build(self):
+        while self.pending:
+            x, y, tower_type = self.pending[0]
+            cost = TOWER_TYPES[tower_type]["cost"]
+            if self.pay and self.gold < cost:
+                return
+            if not self._can_place(x, y):
+                self.pending.pop(0)
+                self.rejected += 1
+                continue
+            if self.pay:
+                self.gold -= cost
+            self.spent += cost
+            self.towers.append(SimTower(x, y, tower_type, self.track))
+            self.pending.pop(0)
+
+    def _find_target(self, tower, neg_distances):
+        # Enemies are in spawn order, which is also furthest first: they share
+        # a speed within a wave and a wave starts only when the last one is gone
+        enemies = self.enemies
+        candidates = []
+        for start, end in tower.intervals:
+            lo = bisect.bisect_left(neg_distances, -end)
+            hi = bisect.bisect_right(neg_distances, -start)
+            candidates.extend(range(lo, hi))
+        if len(tower.intervals) > 1:
+            candidates.sort()
+        closest = None
+        closest_dist = tower.range
+        position_at = self.track.position_at
+        for i in candidates:
+            enemy = enemies[i]
+            if not enemy.alive:
+                continue
+            if enemy.placed != enemy.distance:
+                enemy.x, enemy.y = position_at(enemy.distance)
+                enemy.placed = enemy.distance
+            dist = math.sqrt((enemy.x - tower.x) ** 2 + (enemy.y - tower.y) ** 2)
+            if dist < closest_dist:
+                closest = enemy
+                closest_dist = dist
+        return closest
+
+    def _sleep(self, tower, neg_distances):
+        # Nothing in range: no enemy can enter it before the nearest one behind
+        # an interval reaches that interval's start, moving at the shared speed.
+        # An enemy already inside an interval but not strictly in range, such
+        # as one right on the edge, may step in on the next frame.
+        gap = None
+        for start, end in tower.intervals:
+            behind = bisect.bisect_right(neg_distances, -start)
+            if bisect.bisect_left(neg_distances, -end) < behind:
+                tower.wake = self.frame + 1
+                return
+            if behind < len(neg_distances):
+                distance = start + neg_distances[behind]
+                gap = distance if gap is None else min(gap, distance)
+        if gap is None:
+            tower.wake = float("inf")  # until the next spawn
+        else:
+            tower.wake = self.frame + max(1, int(gap / self.enemies[0].speed) - 1)
+
+    def step(self):
+        if self.game_over:
+            return
+        self.frame += 1
+        if self.pending:
+            self._build()
+
+        # Spawn enemies
+        if (self.enemies_spawned < self.enemies_to_spawn and
+                self.frame - self.last_spawn_frame >= ENEMY_SPAWN_FRAMES):
+            wave_multiplier = 1.0 + (self.wave - 1) * 0.2
+            self.enemies.append(SimEnemy(self.track, wave_multiplier))
+            self.enemies_spawned += 1
+            self.last_spawn_frame = self.frame
+            for tower in self.towers:
+                tower.wake = 0
+
+        # Check wave complete
+        if self.enemies_spawned >= self.enemies_to_spawn and not self.enemies:
+            self.wave += 1
+            self.enemies_spawned = 0
+            self.enemies_to_spawn = WAVE_LENGTH + self.wave * 2
+            self.gold += WAVE_BONUS
+
+        # Update enemies
+        track = self.track
+        remaining = []
+        for enemy in self.enemies:
+            if enemy.alive:
+                enemy.distance += enemy.speed
+                if enemy.distance >= track.total_length:
+                    enemy.reached_end = True
+                    enemy.alive = False
+            if enemy.reached_end:
+                self.lives -= 1
+                self.leaks += 1
+                if self.lives <= 0:
+                    self.game_over = True
+            elif not enemy.alive:
+                self.score += 10
+                self.gold += enemy.value
+                self.kills += 1
+            else:
+                remaining.append(enemy)
+        self.enemies = remaining
+
+        # Update towers; the game also aims idle turrets, which changes nothing here
+        neg_distances = None
+        for tower in self.towers:
+            if tower.cooldown > 0:
+                tower.cooldown -= 1
+            if tower.cooldown > 0 or not remaining or self.frame < tower.wake:
+                continue
+            if neg_distances is None:
+                neg_distances = [-enemy.distance for enemy in remaining]
+            target = self._find_target(tower, neg_distances)
+            if target:
+                tower.cooldown = tower.max_cooldown
+                self.projectiles.append([tower.x, tower.y, target, tower.damage])
+            else:
+                self._sleep(tower, neg_distances)
+
+        # Update projectiles
+        active = []
+        for projectile in self.projectiles:
+            x, y, target, damage = projectile
+            if not target.alive:
+                continue
+            if target.placed != target.distance:
+                target.x, target.y = track.position_at(target.distance)
+                target.placed = target.distance
+            dx = target.x - x
+            dy = target.y - y
+            dist = math.sqrt(dx ** 2 + dy ** 2)
+            if dist < PROJECTILE_SPEED:
+                target.health -= damage
+                if target.health <= 0:
+                    target.alive = False
+                continue
+            projectile[0] = x + dx / dist * PROJECTILE_SPEED
+            projectile[1] = y + dy / dist * PROJECTILE_SPEED
+            active.append(projectile)
+        self.projectiles = active
+
+    def run_wave(self):
+        # Fast-forward until the current wave is cleared or the game is lost
+        wave = self.wave
+        while self.wave == wave and not self.game_over:
+            self.step()
+        return self.summary()
+
+    def run(self, waves):
+        while self.wave <= waves and not self.game_over:
+            self.run_wave()
+        return self.summary()
+
+    def summary(self):
+        return {
+            "waves_cleared": self.wave - 1,
+            "game_over": self.game_over,
+            "lives": self.lives,
+            "score": self.score,
+            "gold": self.gold,
+            "kills": self.kills,
+            "leaks": self.leaks,
+            "frames": self.frame,
+            "towers": len(self.towers),
+            "spent": self.spent,
+            "rejected": self.rejected,
+        }
+
+
+def evaluate_layout(layout, waves=5, pay=True):
+    return WaveSim(layout, pay).run(waves)
+
+
+def _evaluate_job(job):
+    return evaluate_layout(*job)
+
+
+def evaluate_layouts(layouts, waves=5, pay=True, processes=None, batch=LAYOUT_BATCH):
+    # One summary per layout, in order. processes=1 runs in this process;
+    # otherwise layouts go to a worker pool `batch` at a time.
+    jobs = [(layout, waves, pay) for layout in layouts]
+    if processes == 1 or len(jobs) <= batch:
+        return [_evaluate_job(job) for job in jobs]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_evaluate_job, jobs, chunksize=batch)
+
+
+def random_layout(rng, towers, track=None):
+    # `towers` random placements off the path, for sampling the layout space
+    track = track or Track(PATH_POINTS)
+    layout = []
+    while len(layout) < towers:
+        x = rng.randrange(TOWER_SIZE // 2, SCREEN_WIDTH - TOWER_SIZE // 2)
+        y = rng.randrange(TOWER_SIZE // 2, SCREEN_HEIGHT - UI_HEIGHT - TOWER_SIZE // 2)
+        if not track.is_on_path(x, y, GRID_SIZE):
+            layout.append((x, y, rng.choice(list(TOWER_TYPES))))
+    return layout
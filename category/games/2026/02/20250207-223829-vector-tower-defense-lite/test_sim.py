@@ -0,0 +1,62 @@
+"""Check WaveSim against Game.update frame by frame."""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+
+from config import *
+from sim import WaveSim, random_layout
+
+# A basic tower 60 px along and 80 px below the first path segment: the
+# wave 1 enemy, moving 1.5 px a frame, sits exactly at its 100 px range
+# at distance 30, then steps inside
+EDGE_LAYOUT = [(90, 160, 1)]
+EDGE_FRAME = ENEMY_SPAWN_FRAMES + 19
+
+
+def lockstep(layout, waves):
+    """Run the game and the simulator side by side, returning the first frame they differ at."""
+    import pygame
+    from game import Game
+    game = Game()
+    game.gold = 10 ** 9
+    for x, y, tower_type in layout:
+        game.selected_tower_type = tower_type
+        game.try_place_tower(x, y)
+    game.gold = STARTING_GOLD
+    sim = WaveSim(layout, pay=False)
+    try:
+        while game.wave <= waves and not game.game_over:
+            game.update()
+            sim.step()
+            if ((game.score, game.gold, game.lives, len(game.enemies), len(game.projectiles)) !=
+                    (sim.score, sim.gold, sim.lives, len(sim.enemies), len(sim.projectiles))):
+                return game.frame
+    finally:
+        pygame.quit()
+    return None
+
+
+def test_tower_fires_once_enemy_crosses_range_edge():
+    """An enemy exactly at range is not a target, but the tower must not sleep past it."""
+    sim = WaveSim(EDGE_LAYOUT, pay=False)
+    while sim.frame < EDGE_FRAME:
+        sim.step()
+    assert sim.enemies[0].distance == 30
+    assert not sim.projectiles
+    sim.step()
+    assert len(sim.projectiles) == 1
+
+
+def test_matches_game_at_range_edge():
+    """The edge layout plays out the same in both."""
+    assert lockstep(EDGE_LAYOUT, waves=2) is None
+
+
+def test_matches_game_on_random_layouts():
+    """Random layouts play out the same in both."""
+    rng = random.Random(11)
+    for _ in range(20):
+        layout = random_layout(rng, 6)
+        assert lockstep(layout, waves=3) is None, layout
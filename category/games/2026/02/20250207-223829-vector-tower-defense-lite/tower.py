@@ -36,7 +36,7 @@ class Projectile:
 
 
 class Tower:
-    def __init__(self, x, y, tower_type):
+    def __init__(self, x, y, tower_type, path=None):
         self.x = x
         self.y = y
         self.type_id = tower_type
@@ -44,6 +44,8 @@ class Tower:
         self.cooldown = 0
         self.max_cooldown = self.config["fire_rate"]
         self.angle = 0
+        # Stretches of the path in range, as distances along it
+        self.intervals = path.track.intervals_within(x, y, self.config["range"]) if path else None
 
     def update(self, enemies):
         if self.cooldown > 0:
@@ -65,6 +67,9 @@ class Tower:
         for enemy in enemies:
             if not enemy.alive:
                 continue
+            if self.intervals is not None and not any(start <= enemy.distance <= end
+                                                      for start, end in self.intervals):
+                continue
             ex, ey = enemy.get_position()
             dist = math.sqrt((ex - self.x)**2 + (ey - self.y)**2)
             if dist < closest_dist:
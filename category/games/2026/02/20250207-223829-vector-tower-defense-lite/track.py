@@ -0,0 +1,69 @@
+import bisect
+import math
+
+
+# Arc-length lookups along the path polyline. Kept free of pygame so the
+# headless simulator can use it.
+class Track:
+    def __init__(self, points):
+        self.points = list(points)
+        # Distance along the path at each waypoint
+        self.cumulative = [0.0]
+        for (x0, y0), (x1, y1) in zip(self.points, self.points[1:]):
+            self.cumulative.append(self.cumulative[-1] + math.hypot(x1 - x0, y1 - y0))
+        self.total_length = self.cumulative[-1]
+
+    def position_at(self, distance):
+        cumulative = self.cumulative
+        if distance >= self.total_length:
+            return self.points[-1]
+        # First waypoint at or beyond the distance ends the segment it lies on
+        i = max(bisect.bisect_left(cumulative, distance), 1)
+        (x0, y0), (x1, y1) = self.points[i - 1], self.points[i]
+        start = cumulative[i - 1]
+        progress = (distance - start) / (cumulative[i] - start)
+        return x0 + (x1 - x0) * progress, y0 + (y1 - y0) * progress
+
+    def intervals_within(self, cx, cy, radius, slack=1e-6):
+        # Distance intervals (start, end) where the path is within radius of (cx, cy).
+        # A segment meets the circle at most twice, so it adds at most one
+        # interval; slack keeps points right on the edge inside.
+        intervals = []
+        for i, ((x0, y0), (x1, y1)) in enumerate(zip(self.points, self.points[1:])):
+            length = self.cumulative[i + 1] - self.cumulative[i]
+            if length == 0:
+                continue
+            ux, uy = (x1 - x0) / length, (y1 - y0) / length
+            # Solve |P0 + t*u - C| = radius for t along the segment
+            ox, oy = x0 - cx, y0 - cy
+            b = ox * ux + oy * uy
+            c = ox * ox + oy * oy - radius * radius
+            disc = b * b - c
+            if disc < 0:
+                continue
+            root = math.sqrt(disc)
+            t0 = max(-b - root, 0.0)
+            t1 = min(-b + root, length)
+            if t0 > t1:
+                continue
+            start = self.cumulative[i] + t0 - slack
+            end = self.cumulative[i] + t1 + slack
+            if intervals and start <= intervals[-1][1]:
+                intervals[-1][1] = max(intervals[-1][1], end)
+            else:
+                intervals.append([start, end])
+        return [tuple(interval) for interval in intervals]
+
+    def is_on_path(self, x, y, width, margin=5):
+        # Same test as colliding the pygame rects of the path band: touching edges don't count
+        left, top, right, bottom = x - margin, y - margin, x + margin, y + margin
+        for (x0, y0), (x1, y1) in zip(self.points, self.points[1:]):
+            if x0 == x1:  # Vertical segment
+                rx, ry = x0 - width // 2, min(y0, y1)
+                rw, rh = width, abs(y1 - y0)
+            else:  # Horizontal segment
+                rx, ry = min(x0, x1), y0 - width // 2
+                rw, rh = abs(x1 - x0), width
+            if left < rx + rw and rx < right and top < ry + rh and ry < bottom:
+                return True
+        return False
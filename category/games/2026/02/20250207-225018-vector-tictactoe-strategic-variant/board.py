@@ -1,16 +1,67 @@
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from config import *
 
 
+def _line_masks() -> Tuple[int, ...]:
+    """Bitmask of every row, column and diagonal; bit row * BOARD_SIZE + col is one cell."""
+    lines = []
+    for i in range(BOARD_SIZE):
+        lines.append(sum(1 << (i * BOARD_SIZE + j) for j in range(BOARD_SIZE)))
+        lines.append(sum(1 << (j * BOARD_SIZE + i) for j in range(BOARD_SIZE)))
+    lines.append(sum(1 << (i * BOARD_SIZE + i) for i in range(BOARD_SIZE)))
+    lines.append(sum(1 << (i * BOARD_SIZE + BOARD_SIZE - 1 - i) for i in range(BOARD_SIZE)))
+    return tuple(lines)
+
+
+def _neighbor_masks() -> Tuple[int, ...]:
+    """Bitmask of the up to 8 cells adjacent to each cell."""
+    masks = []
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            mask = 0
+            for dr in [-1, 0, 1]:
+                for dc in [-1, 0, 1]:
+                    nr, nc = row + dr, col + dc
+                    if (dr or dc) and 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE:
+                        mask |= 1 << (nr * BOARD_SIZE + nc)
+            masks.append(mask)
+    return tuple(masks)
+
+
+WIN_MASKS = _line_masks()
+NEIGHBOR_MASKS = _neighbor_masks()
+CELL_COUNT = BOARD_SIZE * BOARD_SIZE
+
+
+def has_line(mask: int) -> bool:
+    """True if the mask covers a whole row, column or diagonal."""
+    return any(mask & line == line for line in WIN_MASKS)
+
+
+def encode(mask1: int, mask2: int) -> int:
+    """Pack both players' piece masks into one integer state key."""
+    return mask1 | mask2 << CELL_COUNT
+
+
 class Board:
     def __init__(self):
         self.grid = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-        self.board_history = []
+        # masks[player]: bitmask of that player's pieces (index 0 unused)
+        self.masks = [0, 0, 0]
+        # Occurrences of each recorded state key
+        self.state_counts: Dict[int, int] = {}
+        self.last_state: Optional[int] = None
 
     def get_cell(self, row: int, col: int) -> int:
         return self.grid[row][col]
 
     def set_cell(self, row: int, col: int, player: int) -> None:
+        bit = 1 << (row * BOARD_SIZE + col)
+        previous = self.grid[row][col]
+        if previous:
+            self.masks[previous] &= ~bit
+        if player:
+            self.masks[player] |= bit
         self.grid[row][col] = player
 
     def is_empty(self, row: int, col: int) -> bool:
@@ -28,7 +79,7 @@ class Board:
         return pieces
 
     def count_pieces(self, player: int) -> int:
-        return len(self.get_player_pieces(player))
+        return bin(self.masks[player]).count('1')
 
     def is_adjacent(self, r1: int, c1: int, r2: int, c2: int) -> bool:
         return abs(r1 - r2) <= 1 and abs(c1 - c2) <= 1 and (r1 != r2 or c1 != c2)
@@ -57,39 +108,24 @@ class Board:
         return moves
 
     def check_win(self, player: int) -> bool:
-        for row in range(BOARD_SIZE):
-            if all(self.grid[row][col] == player for col in range(BOARD_SIZE)):
-                return True
-
-        for col in range(BOARD_SIZE):
-            if all(self.grid[row][col] == player for row in range(BOARD_SIZE)):
-                return True
-
-        if all(self.grid[i][i] == player for i in range(BOARD_SIZE)):
-            return True
-
-        if all(self.grid[i][BOARD_SIZE - 1 - i] == player for i in range(BOARD_SIZE)):
-            return True
-
-        return False
+        return has_line(self.masks[player])
 
     def is_full(self) -> bool:
-        return all(self.grid[row][col] != 0 for row in range(BOARD_SIZE) for col in range(BOARD_SIZE))
+        return self.masks[1] | self.masks[2] == (1 << CELL_COUNT) - 1
 
-    def get_state_key(self) -> str:
-        return ''.join(str(self.grid[row][col]) for row in range(BOARD_SIZE) for col in range(BOARD_SIZE))
+    def get_state_key(self) -> int:
+        return encode(self.masks[1], self.masks[2])
 
     def record_state(self) -> None:
         state_key = self.get_state_key()
-        self.board_history.append(state_key)
+        self.state_counts[state_key] = self.state_counts.get(state_key, 0) + 1
+        self.last_state = state_key
 
     def check_repetition_draw(self) -> bool:
-        if not self.board_history:
+        if self.last_state is None:
             return False
 
-        current_state = self.board_history[-1]
-        count = sum(1 for state in self.board_history if state == current_state)
-        return count >= MAX_REPETITION
+        return self.state_counts[self.last_state] >= MAX_REPETITION
 
     def get_cell_from_pos(self, x: int, y: int) -> Optional[Tuple[int, int]]:
         col = (x - BOARD_OFFSET_X) // CELL_SIZE
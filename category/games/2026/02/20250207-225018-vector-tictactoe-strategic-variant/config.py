@@ -31,6 +31,13 @@ TITLE_HEIGHT = 80
 MAX_PIECES_PER_PLAYER = 3
 MAX_REPETITION = 3
 
+# Solver settings
+SOLVER_TABLE_FILE = "solved_table.bin"
+AI_ENABLED = False
+AI_PLAYER = 2
+AI_MOVE_DELAY = 500  # milliseconds
+EVALUATOR_ENABLED = False
+
 # Rewards
 REWARD_WIN = 100
 REWARD_LOSS = -100
@@ -1,8 +1,10 @@
+import os
 import pygame
 import sys
 from typing import Optional, Tuple
 from config import *
 from board import Board
+from solver import Solver
 
 
 class Game:
@@ -14,6 +16,9 @@ class Game:
         self.font = pygame.font.Font(None, 32)
         self.title_font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 24)
+        self.solver = Solver(os.path.join(os.path.dirname(os.path.abspath(__file__)), SOLVER_TABLE_FILE))
+        self.ai_enabled = AI_ENABLED
+        self.show_evaluation = EVALUATOR_ENABLED
         self.reset_game()
 
     def reset_game(self):
@@ -27,6 +32,7 @@ class Game:
         self.total_score = {1: 0, 2: 0}
         self.turn_count = 0
         self.mouse_pos = (0, 0)
+        self.ai_wait = 0
 
     def handle_input(self) -> bool:
         for event in pygame.event.get():
@@ -38,11 +44,16 @@ class Game:
                     return False
                 elif event.key == pygame.K_SPACE and self.game_over:
                     self.reset_game()
+                elif event.key == pygame.K_a:
+                    self.ai_enabled = not self.ai_enabled
+                    self.ai_wait = 0
+                elif event.key == pygame.K_e:
+                    self.show_evaluation = not self.show_evaluation
 
             if event.type == pygame.MOUSEMOTION:
                 self.mouse_pos = event.pos
 
-            if event.type == pygame.MOUSEBUTTONDOWN and not self.game_over:
+            if event.type == pygame.MOUSEBUTTONDOWN and not self.game_over and not self.is_ai_turn():
                 if event.button == 1:
                     self.handle_click(event.pos)
 
@@ -73,6 +84,28 @@ class Game:
                 self.selected_piece = None
                 self.valid_destinations = []
 
+    def is_ai_turn(self) -> bool:
+        return self.ai_enabled and self.current_player == AI_PLAYER
+
+    def update(self, dt: int) -> None:
+        if self.game_over or not self.is_ai_turn():
+            self.ai_wait = 0
+            return
+
+        self.ai_wait += dt
+        if self.ai_wait < AI_MOVE_DELAY:
+            return
+        self.ai_wait = 0
+
+        move = self.solver.best_move(self.board, self.current_player)
+        if move is None:
+            return
+        from_pos, to_pos = move
+        if from_pos is None:
+            self.place_piece(*to_pos)
+        else:
+            self.move_piece(from_pos, to_pos)
+
     def update_valid_destinations(self) -> None:
         if not self.selected_piece:
             self.valid_destinations = []
@@ -284,7 +317,15 @@ class Game:
         info_rect = info_text.get_rect(center=(SCREEN_WIDTH // 2, ui_y + 60))
         self.screen.blit(info_text, info_rect)
 
-        help_text = self.small_font.render("[ESC] Quit  [SPACE] Restart", True, (150, 150, 150))
+        if self.show_evaluation and not self.game_over:
+            evaluation = self.small_font.render(self.solver.describe(self.board, self.current_player),
+                                                True, HIGHLIGHT_COLOR)
+            evaluation_rect = evaluation.get_rect(center=(SCREEN_WIDTH // 2, TITLE_HEIGHT - 5))
+            self.screen.blit(evaluation, evaluation_rect)
+
+        ai_label = f"AI: Player {AI_PLAYER}" if self.ai_enabled else "AI: off"
+        help_text = self.small_font.render(f"[A] {ai_label}  [E] Evaluate  [ESC] Quit  [SPACE] Restart",
+                                           True, (150, 150, 150))
         help_rect = help_text.get_rect(right=SCREEN_WIDTH - 20, bottom=SCREEN_HEIGHT - 10)
         self.screen.blit(help_text, help_rect)
 
@@ -331,6 +372,7 @@ class Game:
     def run(self) -> None:
         running = True
         while running:
+            dt = self.clock.tick(FPS)
             running = self.handle_input()
+            self.update(dt)
             self.draw()
-            self.clock.tick(FPS)
@@ -0,0 +1,221 @@
+import os
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from config import *
+from board import Board, CELL_COUNT, NEIGHBOR_MASKS, encode, has_line
+
+WIN = 1
+DRAW = 0
+LOSS = -1
+
+# Table entries pack (state key, result + 1, distance in plies) into one unsigned int
+_TABLE_MAGIC = b"TTTSV1\n"
+_DIST_BITS = 8
+_RESULT_BITS = 2
+
+Move = Tuple[Optional[Tuple[int, int]], Tuple[int, int]]
+
+
+def state_key(mask_to_move: int, mask_other: int, player: int) -> int:
+    """Key of a position from the side to move's point of view, plus who that is."""
+    return encode(mask_to_move, mask_other) | (player - 1) << (2 * CELL_COUNT)
+
+
+def _bits(mask: int) -> List[int]:
+    return [i for i in range(CELL_COUNT) if mask >> i & 1]
+
+
+def _successors(mine: int, theirs: int) -> List[Tuple[int, int, int]]:
+    """Legal (from_cell, to_cell, new_mine) moves; from_cell is -1 for a placement."""
+    empty = ~(mine | theirs) & ((1 << CELL_COUNT) - 1)
+    if bin(mine).count('1') < MAX_PIECES_PER_PLAYER:
+        return [(-1, cell, mine | 1 << cell) for cell in _bits(empty)]
+    moves = []
+    for src in _bits(mine):
+        for dst in _bits(NEIGHBOR_MASKS[src] & empty):
+            moves.append((src, dst, mine & ~(1 << src) | 1 << dst))
+    return moves
+
+
+class Solver:
+    """Perfect-play table for the whole game, built once and cached on disk.
+
+    The move phase (both players on the board with all their pieces) has
+    cycles, so it is solved by retrograde analysis: starting from the
+    positions where the side to move has already lost, results are pushed
+    back to predecessor positions, and anything never reached is a draw.
+    The placement phase cannot repeat a position and is solved on top of it
+    by backward induction. Every entry holds the result for the side to move
+    (WIN, DRAW or LOSS) and the distance to the end in plies under perfect
+    play. A winning line strictly shortens its distance every move, so it
+    never repeats a position and the repetition draw rule cannot save the
+    losing side.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.table: Dict[int, Tuple[int, int]] = {}
+        if not (path and self._load(path)):
+            self.build()
+            if path:
+                self._save(path)
+
+    def build(self) -> None:
+        self.table = {}
+        self._solve_move_phase()
+        self._solve_placement_phase()
+
+    def _move_phase_positions(self) -> List[Tuple[int, int, int]]:
+        """Every (mine, theirs, player) with both players on the board with all pieces."""
+        full = [m for m in range(1 << CELL_COUNT) if bin(m).count('1') == MAX_PIECES_PER_PLAYER]
+        return [(mine, theirs, player) for mine in full for theirs in full
+                if not mine & theirs for player in (1, 2)]
+
+    def _solve_move_phase(self) -> None:
+        positions = self._move_phase_positions()
+        remaining: Dict[int, int] = {}
+        queue = deque()
+
+        for mine, theirs, player in positions:
+            key = state_key(mine, theirs, player)
+            if has_line(theirs):
+                # The opponent has just completed a line
+                self.table[key] = (LOSS, 0)
+                queue.append((mine, theirs, player))
+            elif has_line(mine):
+                # Unreachable: a game never continues past a completed line
+                self.table[key] = (WIN, 0)
+            else:
+                count = len(_successors(mine, theirs))
+                remaining[key] = count
+                if count == 0:
+                    # Blocked with no legal move: counted as a loss for the side to move
+                    self.table[key] = (LOSS, 0)
+                    queue.append((mine, theirs, player))
+
+        while queue:
+            mine, theirs, player = queue.popleft()
+            result, distance = self.table[state_key(mine, theirs, player)]
+            # Predecessors: the opponent (theirs) moved one piece into its current cell
+            empty = ~(mine | theirs) & ((1 << CELL_COUNT) - 1)
+            previous_player = 3 - player
+            for dst in _bits(theirs):
+                for src in _bits(NEIGHBOR_MASKS[dst] & empty):
+                    before = theirs & ~(1 << dst) | 1 << src
+                    parent = state_key(before, mine, previous_player)
+                    if parent in self.table:
+                        continue
+                    if result == LOSS:
+                        self.table[parent] = (WIN, distance + 1)
+                        queue.append((before, mine, previous_player))
+                    else:
+                        remaining[parent] -= 1
+                        if remaining[parent] == 0:
+                            # Every move leads to an opponent win; the last one found is the longest
+                            self.table[parent] = (LOSS, distance + 1)
+                            queue.append((before, mine, previous_player))
+
+        for mine, theirs, player in positions:
+            self.table.setdefault(state_key(mine, theirs, player), (DRAW, 0))
+
+    def _solve_placement_phase(self) -> None:
+        # Player 1 places first, so placement positions have k + 1 vs k (player 2 to move)
+        # or k vs k (player 1 to move) pieces; solve from the most pieces down
+        for total in range(2 * MAX_PIECES_PER_PLAYER - 1, -1, -1):
+            for mask1 in range(1 << CELL_COUNT):
+                count1 = bin(mask1).count('1')
+                count2 = total - count1
+                if count1 not in (count2, count2 + 1) or count1 > MAX_PIECES_PER_PLAYER:
+                    continue
+                player = 1 if count1 == count2 else 2
+                free = ~mask1 & ((1 << CELL_COUNT) - 1)
+                for mask2 in self._masks_with(count2, free):
+                    if has_line(mask1) or has_line(mask2):
+                        continue
+                    mine, theirs = (mask1, mask2) if player == 1 else (mask2, mask1)
+                    self.table[state_key(mine, theirs, player)] = self._back_up(mine, theirs, player)
+
+    @staticmethod
+    def _masks_with(count: int, allowed: int) -> List[int]:
+        cells = _bits(allowed)
+        masks = [0]
+        for cell in cells:
+            masks += [m | 1 << cell for m in masks if bin(m).count('1') < count]
+        return [m for m in masks if bin(m).count('1') == count]
+
+    def _back_up(self, mine: int, theirs: int, player: int) -> Tuple[int, int]:
+        """Result of a position from its already solved children."""
+        best = None
+        for _, _, new_mine in _successors(mine, theirs):
+            if has_line(new_mine):
+                return (WIN, 1)
+            result, distance = self.table[state_key(theirs, new_mine, 3 - player)]
+            candidate = (-result, distance + 1 if result else 0)
+            if best is None or self._prefer(candidate, best):
+                best = candidate
+        return best if best is not None else (LOSS, 0)
+
+    @staticmethod
+    def _prefer(a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+        """Whether outcome a is better than b for the side choosing: win fast, lose slowly."""
+        if a[0] != b[0]:
+            return a[0] > b[0]
+        if a[0] == WIN:
+            return a[1] < b[1]
+        if a[0] == LOSS:
+            return a[1] > b[1]
+        return False
+
+    def _save(self, path: str) -> None:
+        entries = array('I', ((key << (_RESULT_BITS + _DIST_BITS)) | (result + 1) << _DIST_BITS | distance
+                              for key, (result, distance) in sorted(self.table.items())))
+        with open(path, 'wb') as f:
+            f.write(_TABLE_MAGIC)
+            entries.tofile(f)
+
+    def _load(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        with open(path, 'rb') as f:
+            if f.read(len(_TABLE_MAGIC)) != _TABLE_MAGIC:
+                return False
+            entries = array('I')
+            entries.frombytes(f.read())
+        dist_mask = (1 << _DIST_BITS) - 1
+        result_mask = (1 << _RESULT_BITS) - 1
+        self.table = {entry >> (_RESULT_BITS + _DIST_BITS): ((entry >> _DIST_BITS & result_mask) - 1,
+                                                              entry & dist_mask)
+                      for entry in entries}
+        return bool(self.table)
+
+    def evaluate(self, board: Board, player: int) -> Tuple[int, int]:
+        """(result, plies to the end) for player to move on board, under perfect play."""
+        mine, theirs = board.masks[player], board.masks[3 - player]
+        return self.table.get(state_key(mine, theirs, player), (DRAW, 0))
+
+    def best_move(self, board: Board, player: int) -> Optional[Move]:
+        """A perfect-play move in Board.get_valid_moves format, or None if there is none."""
+        mine, theirs = board.masks[player], board.masks[3 - player]
+        best_move = None
+        best = None
+        for src, dst, new_mine in _successors(mine, theirs):
+            if has_line(new_mine):
+                candidate = (WIN, 1)
+            else:
+                result, distance = self.table.get(state_key(theirs, new_mine, 3 - player), (DRAW, 0))
+                candidate = (-result, distance + 1 if result else 0)
+            if best is None or self._prefer(candidate, best):
+                best = candidate
+                from_pos = None if src < 0 else divmod(src, BOARD_SIZE)
+                best_move = (from_pos, divmod(dst, BOARD_SIZE))
+        return best_move
+
+    def describe(self, board: Board, player: int) -> str:
+        result, distance = self.evaluate(board, player)
+        moves = (distance + 1) // 2
+        if result == WIN:
+            return f"Player {player} wins in {moves} move{'s' if moves != 1 else ''}"
+        if result == LOSS:
+            return f"Player {3 - player} wins in {moves} move{'s' if moves != 1 else ''}"
+        return "Draw with perfect play"
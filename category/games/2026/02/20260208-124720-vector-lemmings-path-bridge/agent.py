@@ -56,7 +56,7 @@ class Agent:
                 if dist < blocker.blocker_radius:
                     # Turn around
                     self.vx = -self.vx
-                    self.bridge_direction = -self.vx / WALK_SPEED
+                    self.bridge_direction = 1 if self.vx < 0 else -1
                     break
 
         # Move and check collisions
@@ -0,0 +1,80 @@
+"""Throughput benchmark: Game.step_ai versus the batched LemmingsSim.
+
+Every configuration plays whole games with the random_skills policy and
+reports game frames per second.
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from config import *
+from sim import FRAME_LIMIT, GameStreams, LemmingsSim, random_skills, run_many
+
+BATCH_SIZES = [1, 64, 256, 1024]
+DURATION = 2.0
+SEED = 3
+RUN_MANY_GAMES = 512
+
+
+def bench_step_ai() -> float:
+    """Frames per second of Game.step_ai, one game at a time."""
+    from game import Game
+    game = Game()
+    rng = np.random.default_rng(SEED)
+    frames = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        game.reset_game()
+        game.game_state = "playing"
+        for frame in range(FRAME_LIMIT):
+            # The frame count stands in for the wall-clock timer, as in LemmingsSim
+            game.game_timer = GAME_TIME_LIMIT
+            action = (-1, -1)
+            if game.agents and rng.random() < 0.01:
+                action = (int(rng.integers(len(game.agents))), int(rng.integers(SKILL_BLOCKER, SKILL_BASHER + 1)))
+            _, _, done = game.step_ai(action)
+            frames += 1
+            if done:
+                break
+    return frames / (time.perf_counter() - start)
+
+
+def bench_sim(num_games: int) -> float:
+    """Game frames per second of LemmingsSim.step over num_games games."""
+    sim = LemmingsSim(num_games)
+    streams = GameStreams(range(SEED, SEED + num_games))
+    dones = np.zeros(num_games, dtype=bool)
+    frames = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        if dones.all():
+            sim.reset()
+            dones = np.zeros(num_games, dtype=bool)
+        frames += int((~dones).sum())
+        _, _, dones = sim.step(*random_skills(sim, streams))
+    return frames / (time.perf_counter() - start)
+
+
+def main() -> int:
+    """Print frames per second for every configuration."""
+    print(f"{'configuration':<30} {'frames/s':>12}")
+    print(f"{'Game.step_ai (single game)':<30} {bench_step_ai():>12,.0f}")
+    for num_games in BATCH_SIZES:
+        print(f"{f'LemmingsSim  N={num_games}':<30} {bench_sim(num_games):>12,.0f}")
+
+    seeds = range(RUN_MANY_GAMES)
+    start = time.perf_counter()
+    results = run_many(seeds, random_skills)
+    elapsed = time.perf_counter() - start
+    frames = sum(result["frames"] for result in results)
+    print(f"run_many: {len(results)} games, {frames / elapsed:,.0f} frames/s "
+          f"on {os.cpu_count()} CPUs, {sum(result['won'] for result in results)} won")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
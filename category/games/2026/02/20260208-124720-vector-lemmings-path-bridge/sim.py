@@ -0,0 +1,432 @@
+"""Headless batched Lemmings simulation with agents stored as NumPy arrays.
+
+LemmingsSim follows the rules of Game.update and Agent.update for many games
+at once. Agent position, velocity, state and skill live in (games, agents)
+arrays and terrain is resolved against a padded tile map per game, so one
+frame of every game costs a handful of array operations instead of a Python
+call per agent. run_many splits a list of seeds into batches and simulates
+them across worker processes.
+"""
+
+import multiprocessing
+import numpy as np
+from config import *
+
+# Agent state codes, indexing STATE_NAMES (the Agent.state strings)
+STATE_FALLING = 0
+STATE_WALKING = 1
+STATE_BLOCKED = 2
+STATE_BUILDING = 3
+STATE_BASHING = 4
+STATE_NAMES = ("falling", "walking", "blocked", "building", "bashing")
+
+# Game status codes
+STATUS_PLAYING = 0
+STATUS_WON = 1
+STATUS_LOST = 2
+
+# Per-agent observation columns
+OBS_ACTIVE = 0
+OBS_X = 1
+OBS_Y = 2
+OBS_VX = 3
+OBS_VY = 4
+OBS_STATE = 5
+OBS_SKILL = 6
+OBS_FEATURES = 7
+
+# Tiles around the map that read as ground, matching Level.get_tile out of bounds
+PAD = 4
+FRAME_LIMIT = GAME_TIME_LIMIT * FPS
+SAFE_FALL = TILE_SIZE * 4
+BUILD_FRAMES = 5
+BASH_FRAMES = 10
+BATCH_SIZE = 256
+
+# Tile code -> blocks movement
+SOLID_TILES = np.zeros(8, dtype=bool)
+SOLID_TILES[[TILE_GROUND, TILE_BRIDGE]] = True
+
+
+def default_tiles():
+    """Tile codes of the default level as a (GRID_HEIGHT, GRID_WIDTH) array."""
+    from level import Level
+    return np.array(Level().tiles, dtype=np.int8).T
+
+
+class LemmingsSim:
+    """num_games headless games stepped in lockstep on the same level.
+
+    Agent arrays are (num_games, TOTAL_AGENTS) with slots in spawn order; a
+    slot is in play once spawned while alive and not saved. Finished games
+    stay frozen until reset(). Within a game, builders and bashers act in
+    slot order before walkers move, so walkers see that frame's terrain edits.
+    """
+
+    def __init__(self, num_games=1, tiles=None):
+        self.num_games = num_games
+        self.base_tiles = default_tiles() if tiles is None else np.asarray(tiles, dtype=np.int8)
+        self.height, self.width = self.base_tiles.shape
+        entry_row, entry_col = np.argwhere(self.base_tiles == TILE_ENTRY)[0]
+        self.entry_pixel = (int(entry_col) * TILE_SIZE, int(entry_row) * TILE_SIZE)
+        self.games = np.arange(num_games)
+        self.reset()
+
+    def reset(self):
+        """Restore the level in every game and start over; returns the observation."""
+        g, n = self.num_games, TOTAL_AGENTS
+        self.tiles = np.full((g, self.height + 2 * PAD, self.width + 2 * PAD), TILE_GROUND, dtype=np.int8)
+        self.tiles[:, PAD:PAD + self.height, PAD:PAD + self.width] = self.base_tiles
+        self.solid = SOLID_TILES[self.tiles]
+
+        self.x = np.zeros((g, n))
+        self.y = np.zeros((g, n))
+        self.vx = np.full((g, n), WALK_SPEED)
+        self.vy = np.zeros((g, n))
+        self.fall_distance = np.zeros((g, n))
+        self.state = np.full((g, n), STATE_FALLING, dtype=np.int8)
+        self.skill = np.full((g, n), SKILL_NONE, dtype=np.int8)
+        self.skill_timer = np.zeros((g, n), dtype=np.int32)
+        self.bridge_direction = np.ones((g, n), dtype=np.int8)
+        self.alive = np.ones((g, n), dtype=bool)
+        self.saved = np.zeros((g, n), dtype=bool)
+
+        # Skill inventory per game, indexed by skill id
+        self.inventory = np.zeros((g, len(SKILL_NAMES)), dtype=np.int32)
+        self.inventory[:, SKILL_BLOCKER] = BLOCKER_COUNT
+        self.inventory[:, SKILL_BUILDER] = BUILDER_COUNT
+        self.inventory[:, SKILL_BASHER] = BASHER_COUNT
+
+        self.agents_saved = np.zeros(g, dtype=np.int32)
+        self.agents_dead = np.zeros(g, dtype=np.int32)
+        self.status = np.full(g, STATUS_PLAYING, dtype=np.int8)
+        self.rewards = np.zeros(g)
+        self.spawned = 0
+        self.spawn_timer = 0
+        self.frame = 0
+        self.obs = np.zeros((g, n, OBS_FEATURES), dtype=np.float32)
+        return self.observe()
+
+    def active(self):
+        """(num_games, TOTAL_AGENTS) mask of agents in play."""
+        mask = self.alive & ~self.saved
+        mask[:, self.spawned:] = False
+        mask &= (self.status == STATUS_PLAYING)[:, None]
+        return mask
+
+    def assign_skills(self, agents, skills):
+        """Give skills[g] to slot agents[g] in each game, following Agent.assign_skill.
+
+        Entries with agents < 0 or skills <= 0 are ignored, as are agents
+        not in play, already skilled or without that skill in stock. Returns
+        a boolean mask of the games where a skill was assigned.
+        """
+        agents = np.asarray(agents)
+        skills = np.asarray(skills)
+        ok = (agents >= 0) & (agents < self.spawned) & (skills > 0) & (skills < len(SKILL_NAMES))
+        games = self.games[ok]
+        slots = agents[ok]
+        chosen = skills[ok]
+        state = self.state[games, slots]
+        take = (self.active()[games, slots]
+                & (self.inventory[games, chosen] > 0)
+                & ((state == STATE_FALLING) | (state == STATE_WALKING)))
+        games, slots, chosen = games[take], slots[take], chosen[take]
+
+        self.state[games, slots] = np.select(
+            [chosen == SKILL_BLOCKER, chosen == SKILL_BUILDER], [STATE_BLOCKED, STATE_BUILDING], STATE_BASHING)
+        self.skill_timer[games, slots] = 0
+        self.skill[games, slots] = chosen
+        self.inventory[games, chosen] -= 1
+        assigned = np.zeros(self.num_games, dtype=bool)
+        assigned[games] = True
+        return assigned
+
+    def step(self, agents=None, skills=None):
+        """Assign skills (see assign_skills) and advance every game one frame.
+
+        Returns (obs, rewards, dones), matching step_ai per game: finished
+        games report done with a zero reward on later calls.
+        """
+        playing = self.status == STATUS_PLAYING
+        prev_saved = self.agents_saved.copy()
+        prev_dead = self.agents_dead.copy()
+        if agents is not None:
+            self.assign_skills(agents, skills)
+
+        self._update()
+
+        rewards = self.rewards
+        rewards[:] = (REWARD_PER_FRAME
+                      + (self.agents_saved - prev_saved) * REWARD_AGENT_SAVED
+                      + (self.agents_dead - prev_dead) * REWARD_AGENT_DIED)
+        rewards[self.status == STATUS_WON] = REWARD_WIN
+        rewards[self.status == STATUS_LOST] = REWARD_LOSE
+        rewards[~playing] = 0.0
+        return self.observe(), rewards, self.status != STATUS_PLAYING
+
+    def _update(self):
+        self.frame += 1
+        if self.frame > FRAME_LIMIT:
+            self.status[self.status == STATUS_PLAYING] = STATUS_LOST
+            return
+
+        self.spawn_timer += 1
+        if self.spawn_timer >= SPAWN_INTERVAL:
+            self.spawn_timer = 0
+            if self.spawned < TOTAL_AGENTS:
+                self.x[:, self.spawned], self.y[:, self.spawned] = self.entry_pixel
+                self.spawned += 1
+
+        active = self.active()
+        state = self.state
+        # Taken before the skill updates: an agent finishing a skill starts walking next frame
+        movers = active & ((state == STATE_FALLING) | (state == STATE_WALKING))
+        skilled = active & ((state == STATE_BUILDING) | (state == STATE_BASHING))
+        for slot in np.flatnonzero(skilled.any(axis=0)):
+            games = self.games[skilled[:, slot]]
+            building = state[games, slot] == STATE_BUILDING
+            self._update_building(games[building], slot)
+            self._update_bashing(games[~building], slot)
+        self._update_movers(movers)
+
+        finished = (self.status == STATUS_PLAYING) & ~self.active().any(axis=1)
+        if self.spawned >= TOTAL_AGENTS and finished.any():
+            won = self.agents_saved / TOTAL_AGENTS >= REQUIRED_SAVED_PERCENTAGE
+            self.status[finished] = np.where(won[finished], STATUS_WON, STATUS_LOST)
+
+    def _cells(self, px, py):
+        """Padded tile indices (row, col) of pixel coordinates, clamped to the padding."""
+        col = np.minimum(np.maximum(np.floor_divide(px, TILE_SIZE).astype(np.int64) + PAD, 0),
+                         self.tiles.shape[2] - 1)
+        row = np.minimum(np.maximum(np.floor_divide(py, TILE_SIZE).astype(np.int64) + PAD, 0),
+                         self.tiles.shape[1] - 1)
+        return row, col
+
+    def _update_movers(self, movers):
+        # Agents are addressed by flat index into the (games, agents) arrays
+        idx = np.flatnonzero(movers)
+        if not len(idx):
+            return
+        games = idx // TOTAL_AGENTS
+        x_all, y_all = self.x.reshape(-1), self.y.reshape(-1)
+        x, y = x_all[idx], y_all[idx]
+        vx = self.vx.reshape(-1)[idx]
+        vy = np.minimum(self.vy.reshape(-1)[idx] + GRAVITY, MAX_FALL_SPEED)
+        fall = self.fall_distance.reshape(-1)[idx]
+        state = self.state.reshape(-1)[idx]
+        bridge = self.bridge_direction.reshape(-1)[idx]
+        _, rows, cols = self.tiles.shape
+        tiles = self.tiles.reshape(-1)
+        solid = self.solid.reshape(-1)
+        base = games * (rows * cols)
+
+        # Walkers inside a blocker's radius in their own game turn around
+        blockers = self.active() & (self.state == STATE_BLOCKED)
+        if blockers.any():
+            near = ((x[:, None] - self.x[games]) ** 2 + (y[:, None] - self.y[games]) ** 2) ** 0.5 < BLOCKER_RADIUS
+            turn = (state == STATE_WALKING) & (near & blockers[games]).any(axis=1)
+            vx = np.where(turn, -vx, vx)
+            bridge = np.where(turn, -np.sign(vx), bridge).astype(np.int8)
+
+        new_x = x + vx
+        new_y = y + vy
+        row, col = self._cells(new_x, new_y)
+        tile = tiles[base + row * cols + col]
+        died = tile == TILE_HAZARD
+        saved = ~died & (tile == TILE_EXIT)
+        moving = ~died & ~saved
+
+        # Ground under the feet; landing snaps the y used for the wall probe
+        ground_row, _ = self._cells(new_x, new_y + AGENT_HEIGHT)
+        on_ground = solid[base + ground_row * cols + col]
+        landed = moving & on_ground & (vy > 0)
+        died |= landed & (fall > SAFE_FALL)
+        landed &= ~died
+        moving &= ~died
+        check_y = np.where(landed, (ground_row - PAD) * TILE_SIZE - AGENT_HEIGHT, y)
+        vy = np.where(landed, 0.0, vy)
+        fall = np.where(landed, 0.0, fall)
+        state = np.where(landed, STATE_WALKING, state)
+        falling = moving & ~on_ground
+        state = np.where(falling, STATE_FALLING, state)
+        fall = np.where(falling, fall + np.abs(vy), fall)
+
+        # Wall ahead at head height
+        right = vx > 0
+        wall_row, _ = self._cells(x, check_y)
+        _, wall_col = self._cells(np.where(right, new_x + AGENT_WIDTH, new_x), check_y)
+        hit = moving & solid[base + wall_row * cols + wall_col]
+        wall_x = (wall_col - PAD) * TILE_SIZE
+        new_x = np.where(hit & right, wall_x - AGENT_WIDTH - 1, np.where(hit, wall_x + TILE_SIZE, new_x))
+        vx = np.where(hit, np.where(right, -WALK_SPEED, WALK_SPEED), vx)
+        bridge = np.where(hit, np.where(right, 1, -1), bridge).astype(np.int8)
+
+        died |= moving & ((new_x < 0) | (new_x > SCREEN_WIDTH))
+        moving &= ~died
+
+        x_all[idx] = np.where(moving, new_x, x)
+        y_all[idx] = np.where(moving, new_y, y)
+        self.vx.reshape(-1)[idx] = vx
+        self.vy.reshape(-1)[idx] = vy
+        self.fall_distance.reshape(-1)[idx] = fall
+        self.state.reshape(-1)[idx] = state
+        self.bridge_direction.reshape(-1)[idx] = bridge
+        self.alive.reshape(-1)[idx[died]] = False
+        self.saved.reshape(-1)[idx[saved]] = True
+        np.add.at(self.agents_dead, games[died], 1)
+        np.add.at(self.agents_saved, games[saved], 1)
+
+    def _update_building(self, games, slot):
+        self.skill_timer[games, slot] += 1
+        games = games[self.skill_timer[games, slot] >= BUILD_FRAMES]
+        if not len(games):
+            return
+        self.skill_timer[games, slot] = 0
+        gx = np.floor_divide(self.x[games, slot], TILE_SIZE).astype(np.int64)
+        gy = np.floor_divide(self.y[games, slot], TILE_SIZE).astype(np.int64) - 1
+        direction = self.bridge_direction[games, slot].astype(np.int64)
+        # Level.build_bridge, one bridge tile per game at a time until blocked
+        building = np.ones(len(games), dtype=bool)
+        for i in range(BRIDGE_LENGTH):
+            bx = gx + i * direction
+            by = gy - (i * BRIDGE_HEIGHT) // BRIDGE_LENGTH
+            building &= (bx >= 0) & (bx < self.width) & (by >= 0) & (by < self.height)
+            rows = np.where(building, by + PAD, 0)
+            cols = np.where(building, bx + PAD, 0)
+            building &= self.tiles[games, rows, cols] == TILE_AIR
+            if not building.any():
+                break
+            self.tiles[games[building], rows[building], cols[building]] = TILE_BRIDGE
+            self.solid[games[building], rows[building], cols[building]] = True
+        self.state[games, slot] = STATE_WALKING
+
+    def _update_bashing(self, games, slot):
+        self.skill_timer[games, slot] += 1
+        games = games[self.skill_timer[games, slot] >= BASH_FRAMES]
+        if not len(games):
+            return
+        bx = np.floor_divide(self.x[games, slot] + AGENT_WIDTH // 2, TILE_SIZE).astype(np.int64)
+        bx += self.vx[games, slot] > 0
+        by = np.floor_divide(self.y[games, slot] + AGENT_HEIGHT // 2, TILE_SIZE).astype(np.int64)
+        # Level.remove_tile: only ground inside the map can be bashed
+        inside = (bx >= 0) & (bx < self.width) & (by >= 0) & (by < self.height)
+        rows, cols = np.where(inside, by + PAD, 0), np.where(inside, bx + PAD, 0)
+        bashed = inside & (self.tiles[games, rows, cols] == TILE_GROUND)
+        self.tiles[games[bashed], rows[bashed], cols[bashed]] = TILE_AIR
+        self.solid[games[bashed], rows[bashed], cols[bashed]] = False
+        self.skill_timer[games[bashed], slot] = 0
+        self.state[games[~bashed], slot] = STATE_WALKING
+
+    def observe(self):
+        """Fill and return the (num_games, TOTAL_AGENTS, OBS_FEATURES) observation array.
+
+        Rows follow spawn order and are all zero for agents not in play;
+        positions are normalized to the screen like get_observation.
+        """
+        obs = self.obs
+        obs[..., OBS_ACTIVE] = self.active()
+        obs[..., OBS_X] = self.x / SCREEN_WIDTH
+        obs[..., OBS_Y] = self.y / SCREEN_HEIGHT
+        obs[..., OBS_VX] = self.vx
+        obs[..., OBS_VY] = self.vy
+        obs[..., OBS_STATE] = self.state
+        obs[..., OBS_SKILL] = self.skill
+        obs[obs[..., OBS_ACTIVE] == 0] = 0
+        return obs
+
+    def terrain(self):
+        """Current (num_games, GRID_HEIGHT, GRID_WIDTH) tile codes."""
+        return self.tiles[:, PAD:PAD + self.height, PAD:PAD + self.width]
+
+
+class GameStreams:
+    """Random numbers for policies, drawn per game from that game's own seed.
+
+    Each game's Generator fills a block of frames at a time, so a game's
+    draws depend only on its seed and not on the other games in the batch,
+    while a frame's draws for every game still come out as one array.
+    """
+
+    BLOCK = 1024  # Frames drawn per refill
+    WIDTH = 3  # Uniforms per game per frame
+
+    def __init__(self, seeds):
+        self.generators = [np.random.default_rng(seed) for seed in seeds]
+        self.buffer = np.empty((len(self.generators), self.BLOCK, self.WIDTH))
+        self.position = self.BLOCK
+
+    def next(self):
+        """(games, WIDTH) uniforms in [0, 1) for the next frame."""
+        if self.position == self.BLOCK:
+            for game, generator in enumerate(self.generators):
+                self.buffer[game] = generator.random((self.BLOCK, self.WIDTH))
+            self.position = 0
+        draws = self.buffer[:, self.position]
+        self.position += 1
+        return draws
+
+
+def no_skills(sim, streams):
+    """Policy that never assigns a skill."""
+    return None, None
+
+
+def random_skills(sim, streams, rate=0.01):
+    """Policy that gives a random stocked skill to a random agent in about rate of the frames."""
+    draws = streams.next()
+    agents = (draws[:, 1] * max(sim.spawned, 1)).astype(np.int64)
+    skills = SKILL_BLOCKER + (draws[:, 2] * (SKILL_BASHER - SKILL_BLOCKER + 1)).astype(np.int64)
+    agents[draws[:, 0] >= rate] = -1
+    return agents, skills
+
+
+def run_batch(seeds, policy, tiles=None):
+    """Play one game per seed in a single LemmingsSim with policy(sim, streams) -> (agents, skills).
+
+    streams is a GameStreams over the seeds, so a game's result depends only
+    on its seed and not on the batch it ran in. Returns one summary dict per
+    seed.
+    """
+    seeds = list(seeds)
+    streams = GameStreams(seeds)
+    sim = LemmingsSim(len(seeds), tiles)
+    total = np.zeros(len(seeds))
+    frames = np.zeros(len(seeds), dtype=np.int32)
+    dones = np.zeros(len(seeds), dtype=bool)
+    while not dones.all():
+        playing = ~dones
+        _, rewards, dones = sim.step(*policy(sim, streams))
+        total += rewards
+        frames[playing & dones] = sim.frame
+    return [{
+        "seed": seed,
+        "won": bool(sim.status[i] == STATUS_WON),
+        "saved": int(sim.agents_saved[i]),
+        "dead": int(sim.agents_dead[i]),
+        "frames": int(frames[i]),
+        "reward": float(total[i]),
+        "skills": {skill: int(sim.inventory[i, skill]) for skill in (SKILL_BLOCKER, SKILL_BUILDER, SKILL_BASHER)},
+    } for i, seed in enumerate(seeds)]
+
+
+def _run_job(job):
+    return run_batch(*job)
+
+
+def run_many(seeds, policy, tiles=None, processes=None, batch_size=BATCH_SIZE):
+    """Simulate one game per seed, batch_size games per LemmingsSim, across worker processes.
+
+    policy must be picklable (a module-level function); see run_batch.
+    Results come back in seed order and depend only on the seeds, not on
+    batch_size or the number of processes. processes=1 runs in this process.
+    """
+    seeds = list(seeds)
+    jobs = [(seeds[i:i + batch_size], policy, tiles) for i in range(0, len(seeds), batch_size)]
+    if processes == 1 or len(jobs) == 1:
+        batches = [_run_job(job) for job in jobs]
+    else:
+        # Spawned workers: forking after pygame or BLAS threads start can deadlock
+        with multiprocessing.get_context("spawn").Pool(processes) as pool:
+            batches = pool.map(_run_job, jobs)
+    return [result for batch in batches for result in batch]
@@ -0,0 +1,175 @@
+"""Physics benchmark: the previous all-pairs step versus the PhysicsEngine solver.
+
+For towers of several heights, reports the cost of one step with the tower
+at rest, the mean step cost while a single pulled block's neighbours settle,
+and how many candidate removals evaluate_removals scores per second. The
+same step and evaluation costs are then measured with every block awake,
+the worst case after a pull disturbs the whole tower. Sleeping gives
+nothing back there, and that step is slower than the legacy one: the
+speedup holds only while most of the tower is at rest.
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from config import *
+from physics import PhysicsEngine
+from tower import Tower
+
+HEIGHTS = (TOWER_LAYERS, 50)
+REST_STEPS = 200
+LEGACY_STEPS = 20
+SETTLE_STEPS = 120
+EVAL_CANDIDATES = 12
+AWAKE_STEPS = 10
+AWAKE_CANDIDATES = 3
+DT = 1.0 / FPS
+
+# Constants of the previous engine
+LEGACY_FRICTION = 0.95
+LEGACY_RESTITUTION = 0.1
+
+
+def build(layers: int):
+    tower = Tower(layers)
+    engine = PhysicsEngine()
+    for block in tower.blocks:
+        engine.add_block(block)
+    return tower, engine
+
+
+def legacy_step(blocks, dt):
+    """The previous PhysicsEngine.update before a collapse: support, integrate, overlaps."""
+    live = [b for b in blocks if not (b.is_dragging or b.is_removed)]
+    # apply_block_support
+    for block in live:
+        supporting = []
+        for other in live:
+            if other is block or other.y > block.y:
+                continue
+            vertical_dist = block.y - other.y
+            if vertical_dist > BLOCK_HEIGHT * 1.5:
+                continue
+            if abs(block.x - other.x) < (block.width + other.width) / 2:
+                supporting.append((other, vertical_dist))
+        if supporting:
+            block.vy *= 0.9
+            for support, dist in supporting:
+                if dist < BLOCK_HEIGHT * 1.2 and block.y - support.y < BLOCK_HEIGHT:
+                    block.y = support.y - BLOCK_HEIGHT
+                    block.vy = 0
+    # Block.update
+    for block in live:
+        block.vy += GRAVITY * dt
+        block.vx *= LEGACY_FRICTION
+        block.vy *= LEGACY_FRICTION
+        block.angular_velocity *= LEGACY_FRICTION
+        block.x += block.vx * dt
+        block.y += block.vy * dt
+        block.rotation += block.angular_velocity * dt
+        if block.y + block.height / 2 > GROUND_Y:
+            block.y = GROUND_Y - block.height / 2
+            block.vy *= -LEGACY_RESTITUTION
+            block.vx *= LEGACY_FRICTION
+            if abs(block.vy) < 10:
+                block.vy = 0
+    # resolve_overlaps
+    for i, a in enumerate(live):
+        ax, ay, aw, ah = a.get_rect()
+        for b in live[i + 1:]:
+            bx, by, bw, bh = b.get_rect()
+            if ax < bx + bw and ax + aw > bx and ay < by + bh and ay + ah > by:
+                overlap_x = min(ax + aw - bx, bx + bw - ax)
+                overlap_y = min(ay + ah - by, by + bh - ay)
+                if overlap_x < overlap_y:
+                    shift = overlap_x / 2 if a.x < b.x else -overlap_x / 2
+                    a.x -= shift
+                    b.x += shift
+                else:
+                    shift = overlap_y / 2 if a.y < b.y else -overlap_y / 2
+                    a.y -= shift
+                    b.y += shift
+
+
+def legacy_ms(layers: int) -> float:
+    tower, _ = build(layers)
+    start = time.perf_counter()
+    for _ in range(LEGACY_STEPS):
+        legacy_step(tower.blocks, DT)
+    return (time.perf_counter() - start) * 1000 / LEGACY_STEPS
+
+
+def rest_us(layers: int) -> float:
+    _, engine = build(layers)
+    start = time.perf_counter()
+    for _ in range(REST_STEPS):
+        engine.update(DT)
+    return (time.perf_counter() - start) * 1e6 / REST_STEPS
+
+
+def removal_ms(layers: int):
+    """Mean step cost and steps taken until a centre block's neighbours fall asleep again."""
+    tower, engine = build(layers)
+    block = next(b for b in tower.blocks if b.layer == layers // 2 and b.position == 1)
+    engine.remove_block(block)
+    steps = 0
+    start = time.perf_counter()
+    for steps in range(1, SETTLE_STEPS + 1):
+        engine.update(DT)
+        if not any(b.awake for b in engine.blocks):
+            break
+    return (time.perf_counter() - start) * 1000 / steps, steps
+
+
+def evaluations_per_second(layers: int, awake: bool = False, count: int = EVAL_CANDIDATES) -> float:
+    tower, engine = build(layers)
+    if awake:
+        engine.wake_all()
+    selectable = [b for b in tower.blocks if tower.can_select_block(b)]
+    stride = max(1, len(selectable) // count)
+    candidates = selectable[::stride][:count]
+    start = time.perf_counter()
+    engine.evaluate_removals(candidates)
+    return len(candidates) / (time.perf_counter() - start)
+
+
+def awake_ms(layers: int) -> float:
+    """Mean step cost with every block awake, as right after a pull shakes the whole tower."""
+    _, engine = build(layers)
+    engine.wake_all()
+    start = time.perf_counter()
+    for _ in range(AWAKE_STEPS):
+        engine.wake_all()
+        engine.update(DT)
+    return (time.perf_counter() - start) * 1000 / AWAKE_STEPS
+
+
+def main() -> int:
+    """Print step costs and evaluation throughput per tower height."""
+    print(f"{'layers':>6} {'legacy ms/step':>15} {'rest us/step':>13} "
+          f"{'removal ms/step':>16} {'settle steps':>13} {'evals/s':>8}")
+    for layers in HEIGHTS:
+        removal, steps = removal_ms(layers)
+        print(f"{layers:>6} {legacy_ms(layers):>15.2f} {rest_us(layers):>13.1f} "
+              f"{removal:>16.2f} {steps:>13} {evaluations_per_second(layers):>8.1f}")
+
+    print()
+    print("Worst case, every block awake:")
+    print(f"{'layers':>6} {'legacy ms/step':>15} {'awake ms/step':>14} {'vs legacy':>10} {'s/eval':>8}")
+    slower = False
+    for layers in HEIGHTS:
+        legacy, awake = legacy_ms(layers), awake_ms(layers)
+        rate = evaluations_per_second(layers, awake=True, count=AWAKE_CANDIDATES)
+        slower = slower or awake > legacy
+        print(f"{layers:>6} {legacy:>15.2f} {awake:>14.2f} {awake / legacy:>9.1f}x {1 / rate:>8.2f}")
+    if slower:
+        print("Regression: with every block awake a step is slower than the legacy step;")
+        print("the speedup above holds only while most of the tower is at rest.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""Broadphase and oriented-box narrowphase for the tower physics."""
+
+import math
+from typing import List, Tuple
+
+# Edge numbers used in contact features, as in Box2D-Lite
+NO_EDGE, EDGE1, EDGE2, EDGE3, EDGE4 = range(5)
+# Feature of a contact point: (in_edge1, out_edge1, in_edge2, out_edge2)
+Feature = Tuple[int, int, int, int]
+
+RELATIVE_TOL = 0.95
+ABSOLUTE_TOL = 0.01
+
+
+def depth_overlap(a, b) -> bool:
+    """Whether two bodies share a depth slot (blocks in crossing layers always do)."""
+    return a.depth[0] < b.depth[1] and b.depth[0] < a.depth[1]
+
+
+def update_bounds(body, margin: float = 0.0):
+    """Cache the axis-aligned bounds of a rotated box on the body, grown by `margin`."""
+    c = abs(math.cos(body.rotation))
+    s = abs(math.sin(body.rotation))
+    ex = (body.width * c + body.height * s) / 2 + margin
+    ey = (body.width * s + body.height * c) / 2 + margin
+    body.min_x = body.x - ex
+    body.max_x = body.x + ex
+    body.min_y = body.y - ey
+    body.max_y = body.y + ey
+
+
+class SweepAndPrune:
+    """Sweep-and-prune along the axis the bodies are most spread out on.
+
+    The order of bodies along the axis is kept between steps. Bodies move
+    little from one step to the next, so re-sorting it with insertion sort is
+    close to linear. A tower is a column, so the sweep usually runs along y.
+    """
+
+    def __init__(self):
+        self.order = []
+        self.axis = "y"
+
+    def set_bodies(self, bodies):
+        """Replace the body set, keeping the previous order where possible."""
+        present = set(map(id, bodies))
+        kept = [b for b in self.order if id(b) in present]
+        known = set(map(id, kept))
+        self.order = kept + [b for b in bodies if id(b) not in known]
+
+    def _choose_axis(self):
+        movable = [b for b in self.order if not b.is_static]
+        if len(movable) < 2:
+            return
+        xs = [b.x for b in movable]
+        ys = [b.y for b in movable]
+        axis = "x" if max(xs) - min(xs) > max(ys) - min(ys) else "y"
+        if axis != self.axis:
+            self.axis = axis
+            self.order.sort(key=lambda b: b.min_x if axis == "x" else b.min_y)
+
+    def pairs(self) -> List[tuple]:
+        """Pairs whose bounds overlap, share a depth slot and include an awake body."""
+        self._choose_axis()
+        order = self.order
+        along_x = self.axis == "x"
+        # Insertion sort on the lower bound
+        for i in range(1, len(order)):
+            body = order[i]
+            key = body.min_x if along_x else body.min_y
+            j = i - 1
+            while j >= 0 and (order[j].min_x if along_x else order[j].min_y) > key:
+                order[j + 1] = order[j]
+                j -= 1
+            order[j + 1] = body
+
+        found = []
+        count = len(order)
+        for i in range(count):
+            a = order[i]
+            upper = a.max_x if along_x else a.max_y
+            for j in range(i + 1, count):
+                b = order[j]
+                if (b.min_x if along_x else b.min_y) > upper:
+                    break
+                if not (a.awake or b.awake):
+                    continue
+                if b.min_x > a.max_x or a.min_x > b.max_x or b.min_y > a.max_y or a.min_y > b.max_y:
+                    continue
+                if depth_overlap(a, b):
+                    found.append((a, b))
+        return found
+
+
+def _incident_edge(hx, hy, px, py, c, s, nx, ny):
+    """Edge of the incident box most anti-parallel to the reference normal, in world space."""
+    # Normal in the incident box frame, flipped
+    lx = -(c * nx + s * ny)
+    ly = -(-s * nx + c * ny)
+    if abs(lx) > abs(ly):
+        if lx > 0:
+            v = ((hx, -hy, (NO_EDGE, NO_EDGE, EDGE3, EDGE4)), (hx, hy, (NO_EDGE, NO_EDGE, EDGE4, EDGE1)))
+        else:
+            v = ((-hx, hy, (NO_EDGE, NO_EDGE, EDGE1, EDGE2)), (-hx, -hy, (NO_EDGE, NO_EDGE, EDGE2, EDGE3)))
+    else:
+        if ly > 0:
+            v = ((hx, hy, (NO_EDGE, NO_EDGE, EDGE4, EDGE1)), (-hx, hy, (NO_EDGE, NO_EDGE, EDGE1, EDGE2)))
+        else:
+            v = ((-hx, -hy, (NO_EDGE, NO_EDGE, EDGE2, EDGE3)), (hx, -hy, (NO_EDGE, NO_EDGE, EDGE3, EDGE4)))
+    return [(px + c * vx - s * vy, py + s * vx + c * vy, fp) for vx, vy, fp in v]
+
+
+def _clip(points, nx, ny, offset, clip_edge):
+    """Clip a segment to the half-plane n.v <= offset."""
+    (x0, y0, f0), (x1, y1, f1) = points
+    d0 = nx * x0 + ny * y0 - offset
+    d1 = nx * x1 + ny * y1 - offset
+    out = []
+    if d0 <= 0:
+        out.append(points[0])
+    if d1 <= 0:
+        out.append(points[1])
+    if d0 * d1 < 0:
+        t = d0 / (d0 - d1)
+        x = x0 + t * (x1 - x0)
+        y = y0 + t * (y1 - y0)
+        if d0 > 0:
+            out.append((x, y, (clip_edge, f0[1], NO_EDGE, f0[3])))
+        else:
+            out.append((x, y, (f1[0], clip_edge, f1[2], NO_EDGE)))
+    return out
+
+
+def collide(a, b, margin: float = 0.0) -> List[tuple]:
+    """Contact points between two oriented boxes (separating axis test plus clipping).
+
+    Returns up to two (separation, nx, ny, px, py, feature) tuples, with the
+    normal pointing from a to b. Points up to `margin` apart count as
+    contacts, so boxes resting face to face stay in contact through rounding.
+    """
+    hax, hay = a.width / 2, a.height / 2
+    hbx, hby = b.width / 2, b.height / 2
+    ca, sa = math.cos(a.rotation), math.sin(a.rotation)
+    cb, sb = math.cos(b.rotation), math.sin(b.rotation)
+
+    dpx, dpy = b.x - a.x, b.y - a.y
+    dax, day = ca * dpx + sa * dpy, -sa * dpx + ca * dpy
+    dbx, dby = cb * dpx + sb * dpy, -sb * dpx + cb * dpy
+
+    # C = RotA^T RotB
+    c11 = abs(ca * cb + sa * sb)
+    c12 = abs(-ca * sb + sa * cb)
+    c21 = abs(-sa * cb + ca * sb)
+    c22 = abs(sa * sb + ca * cb)
+
+    face_ax = abs(dax) - hax - (c11 * hbx + c12 * hby)
+    face_ay = abs(day) - hay - (c21 * hbx + c22 * hby)
+    if face_ax > margin or face_ay > margin:
+        return []
+    face_bx = abs(dbx) - (c11 * hax + c21 * hay) - hbx
+    face_by = abs(dby) - (c12 * hax + c22 * hay) - hby
+    if face_bx > margin or face_by > margin:
+        return []
+
+    # Prefer faces of a, then b, unless another axis separates clearly better
+    axis = 0
+    separation = face_ax
+    nx, ny = (ca, sa) if dax > 0 else (-ca, -sa)
+    if face_ay > RELATIVE_TOL * separation + ABSOLUTE_TOL * hay:
+        axis, separation = 1, face_ay
+        nx, ny = (-sa, ca) if day > 0 else (sa, -ca)
+    if face_bx > RELATIVE_TOL * separation + ABSOLUTE_TOL * hbx:
+        axis, separation = 2, face_bx
+        nx, ny = (cb, sb) if dbx > 0 else (-cb, -sb)
+    if face_by > RELATIVE_TOL * separation + ABSOLUTE_TOL * hby:
+        axis, separation = 3, face_by
+        nx, ny = (-sb, cb) if dby > 0 else (sb, -cb)
+
+    if axis == 0:
+        fnx, fny = nx, ny
+        front = a.x * fnx + a.y * fny + hax
+        snx, sny = -sa, ca
+        side = a.x * snx + a.y * sny
+        neg_side, pos_side = -side + hay, side + hay
+        neg_edge, pos_edge = EDGE3, EDGE1
+        incident = _incident_edge(hbx, hby, b.x, b.y, cb, sb, fnx, fny)
+    elif axis == 1:
+        fnx, fny = nx, ny
+        front = a.x * fnx + a.y * fny + hay
+        snx, sny = ca, sa
+        side = a.x * snx + a.y * sny
+        neg_side, pos_side = -side + hax, side + hax
+        neg_edge, pos_edge = EDGE2, EDGE4
+        incident = _incident_edge(hbx, hby, b.x, b.y, cb, sb, fnx, fny)
+    elif axis == 2:
+        fnx, fny = -nx, -ny
+        front = b.x * fnx + b.y * fny + hbx
+        snx, sny = -sb, cb
+        side = b.x * snx + b.y * sny
+        neg_side, pos_side = -side + hby, side + hby
+        neg_edge, pos_edge = EDGE3, EDGE1
+        incident = _incident_edge(hax, hay, a.x, a.y, ca, sa, fnx, fny)
+    else:
+        fnx, fny = -nx, -ny
+        front = b.x * fnx + b.y * fny + hby
+        snx, sny = cb, sb
+        side = b.x * snx + b.y * sny
+        neg_side, pos_side = -side + hbx, side + hbx
+        neg_edge, pos_edge = EDGE2, EDGE4
+        incident = _incident_edge(hax, hay, a.x, a.y, ca, sa, fnx, fny)
+
+    clipped = _clip(incident, -snx, -sny, neg_side, neg_edge)
+    if len(clipped) < 2:
+        return []
+    clipped = _clip(clipped, snx, sny, pos_side, pos_edge)
+    if len(clipped) < 2:
+        return []
+
+    contacts = []
+    for x, y, feature in clipped:
+        sep = fnx * x + fny * y - front
+        if sep <= margin:
+            if axis >= 2:
+                feature = (feature[2], feature[3], feature[0], feature[1])
+            # Slide the point onto the reference face
+            contacts.append((sep, nx, ny, x - sep * fnx, y - sep * fny, feature))
+    return contacts
@@ -28,18 +28,33 @@ LAYER_HEIGHT = BLOCK_HEIGHT
 
 # Physics settings
 GRAVITY = 500.0
-FRICTION = 0.95
-RESTITUTION = 0.1  # Bounciness (low for wood)
 GROUND_Y = SCREEN_HEIGHT - 80
+GROUND_THICKNESS = 200
 TOWER_CENTER_X = SCREEN_WIDTH // 2
-TOWER_BASE_Y = GROUND_Y - 10
+TOWER_BASE_Y = GROUND_Y
+CONTACT_FRICTION = 0.6  # Wood on wood
+CONTACT_BIAS = 0.2  # Share of penetration corrected per step
+CONTACT_SLOP = 0.5  # Penetration allowed before correcting (pixels)
+CONTACT_MARGIN = 1.0  # Gap still treated as touching (pixels)
+SOLVER_ITERATIONS = 20
+SOLVER_TOLERANCE = 0.01  # Impulse change that counts as converged
 
 # Game mechanics
 MAX_PULL_DISTANCE = 150
 DROP_ZONE_HEIGHT = 80
+PLACE_DROP_GAP = 2  # Placed blocks start this far above their layer
 STABILITY_THRESHOLD = 0.15  # Max tilt angle before warning
 COLLAPSE_THRESHOLD = 0.4  # Max tilt before collapse
 BLOCK_MASS = 1.0
+STABILITY_EVAL_STEPS = 90  # Steps simulated per candidate removal
+STABILITY_EVAL_SHIFT = 10.0  # Block displacement (pixels) that scores 0
+STABILITY_EVAL_SETTLE = 0.1  # Seconds the disturbed blocks must stay still
+
+# Sleeping (speeds in pixels/s, impulses in mass * pixels/s)
+SLEEP_SPEED = 5.0
+SLEEP_TIME = 0.5  # Seconds an island must stay still before sleeping
+WAKE_SPEED = 15.0
+WAKE_IMPULSE = 0.25 * BLOCK_MASS * GRAVITY / FPS
 
 # Scoring
 SCORE_PER_BLOCK = 10
@@ -2,7 +2,7 @@
 
 import pygame
 import sys
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from config import *
 from physics import PhysicsEngine, Block
 from tower import Tower
@@ -377,6 +377,17 @@ class Game:
 
         return obs
 
+    def evaluate_removals(self) -> List[Tuple[int, float]]:
+        """Score pulling out each block the player may select, for AI planning.
+
+        Returns (block index, stability score) pairs, where 0.0 means the
+        tower would collapse. The game state is left unchanged.
+        """
+        candidates = [(i, block) for i, block in enumerate(self.tower.blocks)
+                      if self.tower.can_select_block(block)]
+        scores = self.physics.evaluate_removals([block for _, block in candidates])
+        return [(i, score) for (i, _), score in zip(candidates, scores)]
+
     def run(self):
         """Main game loop."""
         while self.running:
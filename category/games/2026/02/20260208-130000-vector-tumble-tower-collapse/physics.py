@@ -1,13 +1,31 @@
-"""Physics simulation for block tower."""
+"""Physics simulation for block tower.
+
+Blocks are oriented boxes in the side view that also cover a range of depth
+slots: the blocks of a horizontal layer run front to back through all three
+slots, while each block of a crossing layer fills one slot across the full
+width. Only blocks that share a slot touch, so the three blocks of a
+crossing layer can sit in the same place on screen without colliding.
+"""
 
 import math
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from config import *
+from collision import SweepAndPrune, collide, depth_overlap, update_bounds
+
+
+def _support_width(points: List[Tuple[float, float]]) -> float:
+    """Width of a contact manifold: the distance between its points, at least 1 pixel."""
+    if len(points) < 2:
+        return 1.0
+    (x0, y0), (x1, y1) = points[0], points[1]
+    return max(math.hypot(x1 - x0, y1 - y0), 1.0)
 
 
 class Block:
     """Represents a single tower block with physics properties."""
 
+    is_static = False
+
     def __init__(self, x: float, y: float, layer: int, position: int,
                  horizontal: bool = True):
         """
@@ -24,7 +42,6 @@ class Block:
         self.y = y
         self.layer = layer
         self.position = position
-        self.horizontal = horizontal
         self.rotation = 0.0  # In radians
 
         self.vx = 0.0
@@ -35,13 +52,32 @@ class Block:
         self.is_removed = False
         self.is_collapsed = False
 
-        # Calculate dimensions based on orientation
+        # Solver state
+        self.body_id = 0
+        self.awake = False
+        self.sleep_time = 0.0
+        self.inv_mass = 1.0 / BLOCK_MASS
+        self.min_x = self.max_x = x
+        self.min_y = self.max_y = y
+
+        self.set_orientation(horizontal, position)
+
+    def set_orientation(self, horizontal: bool, position: int):
+        """Set dimensions and depth slots for a layer orientation."""
+        self.horizontal = horizontal
+        self.position = position
         if self.horizontal:
-            self.width = BLOCK_WIDTH * 3
+            # Seen end-on, running through every depth slot
+            self.width = BLOCK_WIDTH
             self.height = BLOCK_HEIGHT
+            self.depth = (0, BLOCKS_PER_LAYER)
         else:
-            self.width = BLOCK_WIDTH
+            # Seen side-on, spanning the tower in its own depth slot
+            self.width = BLOCK_WIDTH * BLOCKS_PER_LAYER
             self.height = BLOCK_HEIGHT
+            self.depth = (position, position + 1)
+        self.inv_inertia = 12.0 / (BLOCK_MASS * (self.width ** 2 + self.height ** 2))
+        self.reach = math.hypot(self.width, self.height) / 2
 
     def get_rect(self) -> Tuple[float, float, float, float]:
         """Get bounding box (left, top, width, height)."""
@@ -84,50 +120,144 @@ class Block:
         return (abs(local_x) <= self.width / 2 and
                 abs(local_y) <= self.height / 2)
 
-    def update(self, dt: float):
-        """Update physics for non-dragging blocks."""
-        if self.is_dragging or self.is_removed:
-            return
+    def speed(self) -> float:
+        """Fastest speed of any point of the block (linear plus spin at the corners)."""
+        return math.hypot(self.vx, self.vy) + abs(self.angular_velocity) * self.reach
+
 
-        # Apply gravity
-        self.vy += GRAVITY * dt
+class Ground:
+    """The floor as a static box whose top face is GROUND_Y."""
 
-        # Apply friction
-        self.vx *= FRICTION
-        self.vy *= FRICTION
-        self.angular_velocity *= FRICTION
+    is_static = True
+    awake = False
+    body_id = -1
+    inv_mass = 0.0
+    inv_inertia = 0.0
+    rotation = 0.0
+    vx = vy = angular_velocity = 0.0
+
+    def __init__(self):
+        self.width = SCREEN_WIDTH * 4
+        self.height = GROUND_THICKNESS
+        self.x = SCREEN_WIDTH / 2
+        self.y = GROUND_Y + GROUND_THICKNESS / 2
+        self.depth = (0, BLOCKS_PER_LAYER)
+        update_bounds(self)
 
-        # Update position
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.rotation += self.angular_velocity * dt
 
-        # Ground collision
-        if self.y + self.height / 2 > GROUND_Y:
-            self.y = GROUND_Y - self.height / 2
-            self.vy *= -RESTITUTION
-            self.vx *= FRICTION
-            if abs(self.vy) < 10:
-                self.vy = 0
+class Contact:
+    """One contact point of a manifold, with its accumulated impulses."""
+
+    __slots__ = ("x", "y", "nx", "ny", "separation", "feature", "pn", "pt",
+                 "r1x", "r1y", "r2x", "r2y", "mass_normal", "mass_tangent", "bias")
+
+    def __init__(self, separation, nx, ny, x, y, feature):
+        self.separation = separation
+        self.nx = nx
+        self.ny = ny
+        self.x = x
+        self.y = y
+        self.feature = feature
+        self.pn = 0.0
+        self.pt = 0.0
+
+
+class Arbiter:
+    """The contact manifold between two bodies, kept across steps for warm starting."""
+
+    __slots__ = ("a", "b", "contacts")
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+        self.contacts: List[Contact] = []
+
+    def update(self, points):
+        """Replace the contact points, carrying impulses over for matching features."""
+        old = {c.feature: c for c in self.contacts}
+        contacts = []
+        for point in points:
+            contact = Contact(*point)
+            previous = old.get(contact.feature)
+            if previous is not None:
+                contact.pn = previous.pn
+                contact.pt = previous.pt
+            contacts.append(contact)
+        self.contacts = contacts
+
+    def copy(self) -> "Arbiter":
+        twin = Arbiter(self.a, self.b)
+        for c in self.contacts:
+            contact = Contact(c.separation, c.nx, c.ny, c.x, c.y, c.feature)
+            contact.pn = c.pn
+            contact.pt = c.pt
+            twin.contacts.append(contact)
+        return twin
 
 
 class PhysicsEngine:
-    """Manages physics simulation for the tower."""
+    """Manages physics simulation for the tower.
+
+    Each step runs a sweep-and-prune broadphase over the blocks in play, finds
+    box-box contact manifolds with a separating axis test, and solves them
+    with sequential impulses (accumulated, clamped, warm started from the
+    previous step). Blocks whose island has stayed still for SLEEP_TIME fall
+    asleep: they are skipped entirely and act as immovable to the blocks
+    still moving. A sleeping block wakes when a moving block hits it, pushes
+    it up or sideways, or when a block it touches is taken out of play.
+    When nothing is awake a step costs one pass over the block list.
+    """
 
     def __init__(self):
         """Initialize the physics engine."""
         self.blocks: List[Block] = []
         self.collapsed = False
         self.stability_score = 1.0
+        self.ground = Ground()
+        self.broadphase = SweepAndPrune()
+        self.arbiters: Dict[Tuple[int, int], Arbiter] = {}
+        self._base_blocks: List[Block] = []
+        self._in_play: List[Block] = []
+        self._in_play_ids = set()
+        # Blocks pulled since the last step; one may be back already, placed on top
+        self._pulled = set()
+        self.broadphase.set_bodies([self.ground])
+        # Sleeping block id -> [(sleeping block under it, support width)]
+        self._supports: Dict[int, list] = {}
+        # Sleeping block id -> impulse it passed on to awake blocks this step
+        self._pressed: Dict[int, list] = {}
 
     def add_block(self, block: Block):
-        """Add a block to the simulation."""
+        """Add a block to the simulation.
+
+        Blocks start asleep, resting where the tower builder put them.
+        """
+        block.body_id = len(self.blocks)
+        block.awake = False
+        update_bounds(block, CONTACT_MARGIN)
         self.blocks.append(block)
+        if block.layer == 0:
+            self._base_blocks.append(block)
+        if not (block.is_removed or block.is_dragging):
+            self._in_play.append(block)
+            self._in_play_ids.add(id(block))
+            self.broadphase.order.append(block)
 
     def remove_block(self, block: Block):
         """Remove a block from tower (being moved by player)."""
         if block in self.blocks:
             block.is_removed = True
+            self._pulled.add(id(block))
+
+    def wake(self, body):
+        """Make a block take part in the simulation again."""
+        if not body.is_static:
+            body.awake = True
+            body.sleep_time = 0.0
+
+    def wake_all(self):
+        for block in self._in_play:
+            self.wake(block)
 
     def calculate_center_of_mass(self) -> Tuple[float, float]:
         """Calculate the center of mass of all non-removed blocks."""
@@ -150,8 +280,8 @@ class PhysicsEngine:
         """Calculate tower tilt angle based on center of mass offset."""
         com_x, com_y = self.calculate_center_of_mass()
 
-        # Find base blocks (layer 0, not removed)
-        base_blocks = [b for b in self.blocks if b.layer == 0 and not b.is_removed]
+        # Base blocks (layer 0, not removed); layer 0 never gains blocks
+        base_blocks = [b for b in self._base_blocks if not b.is_removed]
         if not base_blocks:
             return 0.0
 
@@ -169,136 +299,402 @@ class PhysicsEngine:
         is_stable = tilt < STABILITY_THRESHOLD
         return is_stable, tilt
 
+    def _grounded_block(self) -> Optional[Block]:
+        """A block above the base layer that has reached the ground, if any."""
+        for block in self.blocks:
+            if block.is_removed or block.is_dragging:
+                continue
+            if block.layer > 0 and block.max_y >= GROUND_Y - 5:
+                return block
+        return None
+
     def check_collapse(self) -> bool:
         """Check if tower has collapsed."""
         if self.collapsed:
             return True
 
         # Check for blocks touching ground (except during drag)
-        for block in self.blocks:
-            if block.is_removed or block.is_dragging:
-                continue
-            if block.layer > 0:  # Not base layer
-                if block.y + block.height / 2 >= GROUND_Y - 5:
-                    self.collapsed = True
-                    block.is_collapsed = True
-                    return True
+        block = self._grounded_block()
+        if block is not None:
+            self.collapsed = True
+            block.is_collapsed = True
+            self.wake_all()
+            return True
 
         # Check tilt threshold
         _, tilt = self.check_stability()
         if tilt >= COLLAPSE_THRESHOLD:
             self.collapsed = True
+            self.wake_all()
             return True
 
         return False
 
-    def apply_block_support(self, dt: float):
-        """Apply support forces from blocks below."""
-        for block in self.blocks:
-            if block.is_dragging or block.is_removed:
-                continue
-
-            # Find blocks below that could support this one
-            supporting = []
-            for other in self.blocks:
-                if other is block or other.is_removed or other.is_dragging:
-                    continue
-
-                # Check if other is below this block
-                if other.y > block.y:
-                    continue
+    def _sync_blocks(self):
+        """Track blocks entering or leaving play (pulled out, dragged, placed)."""
+        in_play = [b for b in self.blocks if not (b.is_removed or b.is_dragging)]
+        ids = set(map(id, in_play))
+        pulled = self._pulled
+        if ids == self._in_play_ids and not pulled:
+            return
+        for block in self._in_play:
+            if id(block) not in ids or id(block) in pulled:
+                # Whatever it was holding up or pressing on must move again
+                for other in in_play:
+                    if (other.min_x <= block.max_x and block.min_x <= other.max_x and
+                            other.min_y <= block.max_y and block.min_y <= other.max_y and
+                            depth_overlap(block, other)):
+                        self.wake(other)
+                self.arbiters = {k: a for k, a in self.arbiters.items()
+                                 if a.a is not block and a.b is not block}
+        for block in in_play:
+            if id(block) not in self._in_play_ids or id(block) in pulled:
+                update_bounds(block, CONTACT_MARGIN)
+                self.wake(block)
+        self._pulled = set()
+        self._in_play = in_play
+        self._in_play_ids = ids
+        self._supports = {}
+        self.broadphase.set_bodies(in_play + [self.ground])
+
+    def step(self, dt: float):
+        """Advance the simulation by one fixed step."""
+        self._sync_blocks()
+        awake = [b for b in self._in_play if b.awake]
+        if not awake:
+            return
 
-                # Check vertical proximity
-                vertical_dist = block.y - other.y
-                if vertical_dist > BLOCK_HEIGHT * 1.5:
+        for body in awake:
+            body.vy += GRAVITY * dt
+
+        # Contacts for every pair with an awake block; pairs of sleepers keep theirs
+        old = self.arbiters
+        arbiters = {k: a for k, a in old.items() if not (a.a.awake or a.b.awake)}
+        live = []
+        for a, b in self.broadphase.pairs():
+            if a.body_id > b.body_id:
+                a, b = b, a
+            points = collide(a, b, CONTACT_MARGIN)
+            if points:
+                key = (a.body_id, b.body_id)
+                arbiter = old.get(key) or Arbiter(a, b)
+                arbiter.update(points)
+                arbiters[key] = arbiter
+                live.append(arbiter)
+        self.arbiters = arbiters
+
+        self._apply_sleeper_loads(live, dt)
+        self._solve(live, dt)
+
+        for body in awake:
+            body.x += body.vx * dt
+            body.y += body.vy * dt
+            body.rotation += body.angular_velocity * dt
+            update_bounds(body, CONTACT_MARGIN)
+
+        self._update_sleep(awake, live, dt)
+
+    def _sleeping_supports(self, upper) -> list:
+        """Sleeping blocks that `upper` (asleep) rests on, with the width of each contact."""
+        supports = self._supports.get(id(upper))
+        if supports is None:
+            supports = []
+            for lower in self._in_play:
+                if (lower is upper or lower.awake or lower.min_y <= upper.min_y or
+                        lower.min_x > upper.max_x or upper.min_x > lower.max_x or
+                        lower.min_y > upper.max_y or not depth_overlap(upper, lower)):
                     continue
-
-                # Check horizontal overlap
-                dx = abs(block.x - other.x)
-                if dx < (block.width + other.width) / 2:
-                    supporting.append((other, vertical_dist))
-
-            if supporting:
-                # Apply support force
-                block.vy *= 0.9  # Damping
-                for support, dist in supporting:
-                    if dist < BLOCK_HEIGHT * 1.2:
-                        # Direct contact support
-                        if block.y - support.y < BLOCK_HEIGHT:
-                            block.y = support.y - BLOCK_HEIGHT
-                            block.vy = 0
-
-    def resolve_overlaps(self):
-        """Resolve block overlaps."""
-        for i, block_a in enumerate(self.blocks):
-            if block_a.is_dragging or block_a.is_removed:
+                points = collide(upper, lower, CONTACT_MARGIN)
+                if points and points[0][2] > 0.5:
+                    supports.append((lower, _support_width([(p[3], p[4]) for p in points])))
+            self._supports[id(upper)] = supports
+        return supports
+
+    def _apply_sleeper_loads(self, arbiters: List[Arbiter], dt: float):
+        """Press awake blocks with the weight of the sleeping blocks resting on them.
+
+        The solver treats a sleeping block as immovable, so on its own it would
+        hold up whatever is under it instead of weighing it down. Each sleeping
+        block carries its own weight plus its share of the sleepers resting on
+        it, split between its supports by contact width; the shares that land
+        on awake blocks are applied to them at the contact points.
+        """
+        self._pressed = {}
+        resting = {}
+        for arbiter in arbiters:
+            a, b = arbiter.a, arbiter.b
+            if a.awake == b.awake:
                 continue
+            sleeper = b if a.awake else a
+            if sleeper.is_static:
+                continue
+            # Downward component of the normal from the sleeper to the awake block
+            down = arbiter.contacts[0].ny * (-1.0 if sleeper is b else 1.0)
+            if down > 0.5:
+                resting.setdefault(id(sleeper), []).append(arbiter)
+        if not resting:
+            return
 
-            for block_b in self.blocks[i + 1:]:
-                if block_b.is_dragging or block_b.is_removed:
+        # Only sleepers above the lowest loaded point can contribute
+        lowest = max(max(arbiter.a.max_y, arbiter.b.max_y)
+                     for group in resting.values() for arbiter in group)
+        sleepers = sorted((b for b in self._in_play if not b.awake and b.min_y < lowest),
+                          key=lambda b: b.y)
+        weight = BLOCK_MASS * GRAVITY
+        load = {}
+        for upper in sleepers:
+            carried = load.get(id(upper), 0.0) + weight
+            supports = self._sleeping_supports(upper)
+            on_awake = resting.get(id(upper), ())
+            widths = [_support_width([(c.x, c.y) for c in arbiter.contacts]) for arbiter in on_awake]
+            total = sum(w for _, w in supports) + sum(widths)
+            if total <= 0.0:
+                continue
+            for lower, width in supports:
+                load[id(lower)] = load.get(id(lower), 0.0) + carried * width / total
+            for arbiter, width in zip(on_awake, widths):
+                a, b = arbiter.a, arbiter.b
+                body, sign = (b, 1.0) if a is upper else (a, -1.0)
+                impulse = carried * width / total * dt / len(arbiter.contacts) * sign
+                pressed = self._pressed.setdefault(id(upper), [0.0, 0.0])
+                for c in arbiter.contacts:
+                    px, py = impulse * c.nx, impulse * c.ny
+                    pressed[0] += px
+                    pressed[1] += py
+                    body.vx += body.inv_mass * px
+                    body.vy += body.inv_mass * py
+                    body.angular_velocity += body.inv_inertia * ((c.x - body.x) * py - (c.y - body.y) * px)
+
+    @staticmethod
+    def _solve_order(arbiter: Arbiter) -> int:
+        """Floors first, ceilings last.
+
+        A block between a sleeping block below and one above can be held by
+        either; solving the floor first lets it take the weight, so a ceiling
+        only pushes when something really rises into it.
+        """
+        a, b = arbiter.a, arbiter.b
+        if a.awake and b.awake:
+            return 1
+        # The normal points from a to b; screen y grows downwards
+        b_above = arbiter.contacts[0].ny < 0
+        return 2 if b_above == a.awake else 0
+
+    def _solve(self, arbiters: List[Arbiter], dt: float):
+        """Sequential impulses over the contact points; sleeping blocks do not move.
+
+        Iterations stop early once no normal impulse changes by more than
+        SOLVER_TOLERANCE, which warm starting makes common for resting stacks.
+        """
+        inv_dt = 1.0 / dt
+        solved = []
+        for arbiter in sorted(arbiters, key=self._solve_order):
+            a, b = arbiter.a, arbiter.b
+            ima, iia = (a.inv_mass, a.inv_inertia) if a.awake else (0.0, 0.0)
+            imb, iib = (b.inv_mass, b.inv_inertia) if b.awake else (0.0, 0.0)
+            for c in arbiter.contacts:
+                c.r1x, c.r1y = c.x - a.x, c.y - a.y
+                c.r2x, c.r2y = c.x - b.x, c.y - b.y
+                rn1 = c.r1x * c.nx + c.r1y * c.ny
+                rn2 = c.r2x * c.nx + c.r2y * c.ny
+                k = (ima + imb + iia * (c.r1x * c.r1x + c.r1y * c.r1y - rn1 * rn1)
+                     + iib * (c.r2x * c.r2x + c.r2y * c.r2y - rn2 * rn2))
+                c.mass_normal = 1.0 / k
+                rt1 = c.r1x * c.ny - c.r1y * c.nx
+                rt2 = c.r2x * c.ny - c.r2y * c.nx
+                k = (ima + imb + iia * (c.r1x * c.r1x + c.r1y * c.r1y - rt1 * rt1)
+                     + iib * (c.r2x * c.r2x + c.r2y * c.r2y - rt2 * rt2))
+                c.mass_tangent = 1.0 / k
+                if c.separation > 0.0:
+                    # Speculative: allow closing the gap this step, no further
+                    c.bias = -c.separation * inv_dt
+                else:
+                    c.bias = -CONTACT_BIAS * inv_dt * min(0.0, c.separation + CONTACT_SLOP)
+
+                # Warm start with last step's impulses
+                px = c.pn * c.nx + c.pt * c.ny
+                py = c.pn * c.ny - c.pt * c.nx
+                a.vx -= ima * px
+                a.vy -= ima * py
+                a.angular_velocity -= iia * (c.r1x * py - c.r1y * px)
+                b.vx += imb * px
+                b.vy += imb * py
+                b.angular_velocity += iib * (c.r2x * py - c.r2y * px)
+            solved.append((a, b, ima, iia, imb, iib, arbiter.contacts))
+
+        for _ in range(SOLVER_ITERATIONS):
+            largest = 0.0
+            for a, b, ima, iia, imb, iib, contacts in solved:
+                avx, avy, aw = a.vx, a.vy, a.angular_velocity
+                bvx, bvy, bw = b.vx, b.vy, b.angular_velocity
+                for c in contacts:
+                    nx, ny = c.nx, c.ny
+                    r1x, r1y, r2x, r2y = c.r1x, c.r1y, c.r2x, c.r2y
+
+                    # Normal impulse, kept non-negative in total
+                    dvx = bvx - bw * r2y - avx + aw * r1y
+                    dvy = bvy + bw * r2x - avy - aw * r1x
+                    dp = c.mass_normal * (c.bias - (dvx * nx + dvy * ny))
+                    pn = c.pn + dp
+                    if pn < 0.0:
+                        pn = 0.0
+                    dp = pn - c.pn
+                    c.pn = pn
+                    if dp > largest or -dp > largest:
+                        largest = abs(dp)
+                    px, py = dp * nx, dp * ny
+                    avx -= ima * px
+                    avy -= ima * py
+                    aw -= iia * (r1x * py - r1y * px)
+                    bvx += imb * px
+                    bvy += imb * py
+                    bw += iib * (r2x * py - r2y * px)
+
+                    # Friction impulse, inside the cone of the normal impulse
+                    dvx = bvx - bw * r2y - avx + aw * r1y
+                    dvy = bvy + bw * r2x - avy - aw * r1x
+                    dp = -c.mass_tangent * (dvx * ny - dvy * nx)
+                    limit = CONTACT_FRICTION * pn
+                    pt = c.pt + dp
+                    if pt > limit:
+                        pt = limit
+                    elif pt < -limit:
+                        pt = -limit
+                    dp = pt - c.pt
+                    c.pt = pt
+                    px, py = dp * ny, -dp * nx
+                    avx -= ima * px
+                    avy -= ima * py
+                    aw -= iia * (r1x * py - r1y * px)
+                    bvx += imb * px
+                    bvy += imb * py
+                    bw += iib * (r2x * py - r2y * px)
+                if ima:
+                    a.vx, a.vy, a.angular_velocity = avx, avy, aw
+                if imb:
+                    b.vx, b.vy, b.angular_velocity = bvx, bvy, bw
+            if largest < SOLVER_TOLERANCE:
+                break
+
+    def _update_sleep(self, awake: List[Block], arbiters: List[Arbiter], dt: float):
+        """Wake sleepers that moving blocks disturb, and put still islands to sleep."""
+        for body in awake:
+            if body.speed() < SLEEP_SPEED:
+                body.sleep_time += dt
+            else:
+                body.sleep_time = 0.0
+
+        # Union-find over contacts between awake blocks
+        parent = {id(body): id(body) for body in awake}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        pushed = {}
+        for arbiter in arbiters:
+            a, b = arbiter.a, arbiter.b
+            a_moving, b_moving = id(a) in parent, id(b) in parent
+            if a_moving and b_moving:
+                parent[find(id(a))] = find(id(b))
+            elif a_moving != b_moving:
+                sleeper, mover, sign = (b, a, 1.0) if a_moving else (a, b, -1.0)
+                if sleeper.is_static:
                     continue
-
-                # Simple AABB check
-                a_rect = block_a.get_rect()
-                b_rect = block_b.get_rect()
-
-                if (a_rect[0] < b_rect[0] + b_rect[2] and
-                    a_rect[0] + a_rect[2] > b_rect[0] and
-                    a_rect[1] < b_rect[1] + b_rect[3] and
-                    a_rect[1] + a_rect[3] > b_rect[1]):
-
-                    # Calculate overlap
-                    overlap_x = min(a_rect[0] + a_rect[2] - b_rect[0],
-                                    b_rect[0] + b_rect[2] - a_rect[0])
-                    overlap_y = min(a_rect[1] + a_rect[3] - b_rect[1],
-                                    b_rect[1] + b_rect[3] - a_rect[1])
-
-                    # Separate along smallest axis
-                    if overlap_x < overlap_y:
-                        if block_a.x < block_b.x:
-                            block_a.x -= overlap_x / 2
-                            block_b.x += overlap_x / 2
-                        else:
-                            block_a.x += overlap_x / 2
-                            block_b.x -= overlap_x / 2
-                    else:
-                        if block_a.y < block_b.y:
-                            block_a.y -= overlap_y / 2
-                            block_b.y += overlap_y / 2
-                        else:
-                            block_a.y += overlap_y / 2
-                            block_b.y -= overlap_y / 2
+                if mover.speed() > WAKE_SPEED:
+                    self.wake(sleeper)
+                    continue
+                # Impulse on the sleeper, summed over the blocks touching it
+                px = sum(c.pn * c.nx + c.pt * c.ny for c in arbiter.contacts) * sign
+                py = sum(c.pn * c.ny - c.pt * c.nx for c in arbiter.contacts) * sign
+                total = pushed.setdefault(id(sleeper), [sleeper, 0.0, 0.0])
+                total[1] += px
+                total[2] += py
+        for sleeper, px, py in pushed.values():
+            # Awake blocks under a sleeper push back on the load it put on them
+            load_x, load_y = self._pressed.get(id(sleeper), (0.0, 0.0))
+            px += load_x
+            py += load_y
+            # Being pressed down is what resting under a load feels like, and the
+            # load lets friction hold a sideways push; anything beyond that, or a
+            # push upwards, is something only the sleeper's own weight resists
+            lift = max(0.0, -py)
+            press = max(0.0, py) + max(0.0, load_y)
+            if lift > WAKE_IMPULSE or abs(px) > WAKE_IMPULSE + CONTACT_FRICTION * press:
+                self.wake(sleeper)
+
+        settled = {}
+        for body in awake:
+            root = find(id(body))
+            settled[root] = settled.get(root, True) and body.sleep_time >= SLEEP_TIME
+        for body in awake:
+            if settled[find(id(body))]:
+                body.awake = False
+                body.vx = body.vy = body.angular_velocity = 0.0
+                self._supports = {}
 
     def update(self, dt: float):
         """Update physics simulation."""
-        if self.collapsed:
-            # Apply gravity to all blocks
-            for block in self.blocks:
-                if not block.is_dragging:
-                    block.vy += GRAVITY * dt
-                    block.x += block.vx * dt
-                    block.y += block.vy * dt
-                    block.rotation += block.angular_velocity * dt
-
-                    # Ground collision
-                    if block.y + block.height / 2 > GROUND_Y:
-                        block.y = GROUND_Y - block.height / 2
-                        block.vy *= -0.3
-                        block.vx *= 0.8
-                        block.angular_velocity *= 0.8
-                        if abs(block.vy) < 5:
-                            block.vy = 0
-            return
-
-        # Apply support forces
-        self.apply_block_support(dt)
-
-        # Update individual blocks
-        for block in self.blocks:
-            block.update(dt)
-
-        # Resolve overlaps
-        self.resolve_overlaps()
+        self.step(dt)
 
         # Check for collapse
         self.check_collapse()
+
+    # Headless stability evaluation
+
+    def _save_state(self):
+        bodies = [(b, b.x, b.y, b.rotation, b.vx, b.vy, b.angular_velocity, b.awake,
+                   b.sleep_time, b.is_removed, b.is_collapsed) for b in self.blocks]
+        arbiters = {k: a.copy() for k, a in self.arbiters.items()}
+        return (bodies, arbiters, self.collapsed, self.stability_score,
+                self._in_play, self._in_play_ids, set(self._pulled), list(self.broadphase.order))
+
+    def _restore_state(self, state):
+        bodies, arbiters, collapsed, score, in_play, in_play_ids, pulled, order = state
+        for (b, b.x, b.y, b.rotation, b.vx, b.vy, b.angular_velocity, b.awake,
+             b.sleep_time, b.is_removed, b.is_collapsed) in bodies:
+            update_bounds(b, CONTACT_MARGIN)
+        self.arbiters = arbiters
+        self.collapsed = collapsed
+        self.stability_score = score
+        self._in_play = in_play
+        self._in_play_ids = in_play_ids
+        self._pulled = pulled
+        self.broadphase.order = order
+        self._supports = {}
+
+    def evaluate_removal(self, block: Block, steps: int = STABILITY_EVAL_STEPS,
+                         dt: float = 1.0 / FPS) -> float:
+        """Score pulling `block` out of the tower, leaving the simulation untouched.
+
+        The removal is simulated for up to `steps` fixed steps, stopping early
+        once every disturbed block has stayed slower than SLEEP_SPEED for
+        STABILITY_EVAL_SETTLE seconds. Returns 0.0 if the tower collapses,
+        otherwise 1.0 minus the largest block displacement as a fraction of
+        STABILITY_EVAL_SHIFT (floored at 0.0).
+        """
+        state = self._save_state()
+        try:
+            start = [(b, b.x, b.y, b.rotation) for b in self._in_play if b is not block]
+            block.is_removed = True
+            collapsed = False
+            for _ in range(steps):
+                self.step(dt)
+                if self._grounded_block() is not None or self.calculate_tilt() >= COLLAPSE_THRESHOLD:
+                    collapsed = True
+                    break
+                if all(b.sleep_time >= STABILITY_EVAL_SETTLE for b in self._in_play if b.awake):
+                    break
+            shift = max((math.hypot(b.x - x, b.y - y) + abs(b.rotation - r) * b.reach
+                         for b, x, y, r in start), default=0.0)
+        finally:
+            self._restore_state(state)
+        if collapsed:
+            return 0.0
+        return max(0.0, 1.0 - shift / STABILITY_EVAL_SHIFT)
+
+    def evaluate_removals(self, blocks: List[Block], steps: int = STABILITY_EVAL_STEPS) -> List[float]:
+        """Stability scores for pulling out each of `blocks` in turn (see evaluate_removal)."""
+        return [self.evaluate_removal(block, steps) for block in blocks]
@@ -8,9 +8,10 @@ from physics import Block
 class Tower:
     """Manages the tower structure."""
 
-    def __init__(self):
+    def __init__(self, layers: int = TOWER_LAYERS):
         """Initialize an empty tower."""
         self.blocks: List[Block] = []
+        self.layers = layers
         self.top_layer = 0
         self.build_tower()
 
@@ -18,11 +19,11 @@ class Tower:
         """Build the initial tower."""
         self.blocks.clear()
 
-        for layer in range(TOWER_LAYERS):
+        for layer in range(self.layers):
             horizontal = layer % 2 == 0
             self.add_layer(layer, horizontal)
 
-        self.top_layer = TOWER_LAYERS - 1
+        self.top_layer = self.layers - 1
 
     def add_layer(self, layer: int, horizontal: bool):
         """Add a layer to the tower."""
@@ -34,20 +35,16 @@ class Tower:
             for i in range(BLOCKS_PER_LAYER):
                 x = TOWER_CENTER_X + (i - 1) * spacing
                 block = Block(x, y, layer, i, horizontal=True)
-                block.width = BLOCK_WIDTH
                 self.blocks.append(block)
         else:
-            # Three blocks perpendicular (visual only, all at same x)
+            # Three blocks perpendicular, one behind the other in depth
             for i in range(BLOCKS_PER_LAYER):
-                x = TOWER_CENTER_X
-                y_pos = y + (i - 1) * (BLOCK_WIDTH / 3)
-                block = Block(x, y_pos, layer, i, horizontal=False)
-                block.height = BLOCK_WIDTH
+                block = Block(TOWER_CENTER_X, y, layer, i, horizontal=False)
                 self.blocks.append(block)
 
     def get_top_layer_y(self) -> float:
         """Get the Y position of the top layer."""
-        return TOWER_BASE_Y - (TOWER_LAYERS + 0.5) * LAYER_HEIGHT
+        return TOWER_BASE_Y - (self.layers + 0.5) * LAYER_HEIGHT
 
     def get_drop_zone_rect(self) -> Tuple[float, float, float, float]:
         """Get the drop zone rectangle."""
@@ -81,20 +78,20 @@ class Tower:
         dz_x, dz_y, dz_w, dz_h = self.get_drop_zone_rect()
         return dz_x <= x <= dz_x + dz_w and dz_y <= y <= dz_y + dz_h
 
-    def get_highest_layer_in_drop_zone(self) -> int:
-        """Get the highest layer with blocks in drop zone."""
-        highest = TOWER_LAYERS - 1
-        for block in self.blocks:
-            if block.is_removed and self.is_in_drop_zone(block.x, block.y):
-                # Calculate approximate layer based on y position
-                layer = int((TOWER_BASE_Y - block.y) / LAYER_HEIGHT)
-                highest = max(highest, layer)
-        return highest
-
     def place_block_on_top(self, block: Block, x: float) -> bool:
-        """Place block on top of tower."""
-        highest = self.get_highest_layer_in_drop_zone()
-        new_layer = highest + 1
+        """Place block on top of tower.
+
+        The block fills the top layer if it has a free slot, otherwise it
+        starts a new layer.
+        """
+        def taken_slots(layer: int) -> set:
+            return {b.position for b in self.blocks
+                    if b is not block and not b.is_removed and b.layer == layer}
+
+        new_layer = self.top_layer
+        if len(taken_slots(new_layer)) >= BLOCKS_PER_LAYER:
+            new_layer += 1
+        taken = taken_slots(new_layer)
 
         # Determine orientation for new layer
         horizontal = new_layer % 2 == 0
@@ -112,37 +109,28 @@ class Tower:
 
             target_x = TOWER_CENTER_X + (slot - 1) * BLOCK_WIDTH
         else:
-            # Stack in depth (all at same x visually)
-            slot = 0
+            # Stack in depth (all at same x visually), front slot first
+            free = [s for s in range(BLOCKS_PER_LAYER) if s not in taken]
+            slot = free[0]
             target_x = TOWER_CENTER_X
 
         # Check if slot is occupied
-        for b in self.blocks:
-            if b.is_removed and b.layer == new_layer:
-                if abs(b.x - target_x) < BLOCK_WIDTH / 2:
-                    return False  # Slot occupied
+        if slot in taken:
+            return False
 
-        # Place the block
-        y = TOWER_BASE_Y - (new_layer + 0.5) * LAYER_HEIGHT
+        # Place the block just above its layer and let it settle
+        y = TOWER_BASE_Y - (new_layer + 0.5) * LAYER_HEIGHT - PLACE_DROP_GAP
         block.x = target_x
         block.y = y
         block.layer = new_layer
-        block.position = slot
-        block.horizontal = horizontal
+        block.set_orientation(horizontal, slot)
         block.is_removed = False
+        block.is_dragging = False
         block.vx = 0
         block.vy = 0
         block.rotation = 0
         block.angular_velocity = 0
 
-        # Update dimensions
-        if horizontal:
-            block.width = BLOCK_WIDTH
-            block.height = BLOCK_HEIGHT
-        else:
-            block.width = BLOCK_WIDTH
-            block.height = BLOCK_HEIGHT
-
         self.top_layer = new_layer
         return True
 
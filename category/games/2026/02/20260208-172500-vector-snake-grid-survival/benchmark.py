@@ -0,0 +1,153 @@
+"""Long-snake benchmark: the former list-based snake versus snake_core.
+
+A snake of a given length is laid along a Hamiltonian cycle of a large board
+and then follows the cycle, so it never dies and keeps eating; steps per
+second are reported for both implementations, plus SnakeVecEnv throughput.
+"""
+
+import random
+import sys
+import time
+from config import *
+from snake_core import ACTIONS, SnakeEnv, SnakeVecEnv
+
+COLS = 100
+ROWS = 100
+FILL_FRACTIONS = [0.0, 0.25, 0.5, 0.9]
+DURATION = 1.0
+SEED = 11
+
+
+def cycle_next(x, y, cols, rows):
+    """Next cell on a Hamiltonian cycle: serpentine over columns 1.., back up column 0."""
+    if x == 0:
+        return (1, 0) if y == 0 else (0, y - 1)
+    if y % 2 == 0:
+        return (x + 1, y) if x < cols - 1 else (x, y + 1)
+    if x > 1:
+        return (x - 1, y)
+    return (0, y) if y == rows - 1 else (x, y + 1)
+
+
+def cycle_path(length, cols, rows):
+    """Return length consecutive cycle cells ending at (cols // 2, 0), tail first."""
+    order = [(0, 0)]
+    while len(order) < cols * rows:
+        order.append(cycle_next(*order[-1], cols, rows))
+    end = order.index((cols // 2, 0))
+    return [order[(end - i) % len(order)] for i in range(length - 1, -1, -1)]
+
+
+def action_towards(head, target):
+    """Action index that moves head onto the adjacent target cell."""
+    return ACTIONS.index((target[0] - head[0], target[1] - head[1]))
+
+
+class LegacySnake:
+    """The former list-based snake and food spawn, on a board of any size."""
+
+    def __init__(self, body, cols, rows, rng):
+        self.body = list(body)
+        self.cols = cols
+        self.rows = rows
+        self.rng = rng
+        self.grow_pending = 0
+        self.spawn()
+
+    def spawn(self):
+        empty_positions = []
+        for x in range(self.cols):
+            for y in range(self.rows):
+                if (x, y) not in self.body:
+                    empty_positions.append((x, y))
+        self.food = self.rng.choice(empty_positions) if empty_positions else None
+
+    def step(self, direction):
+        head_x, head_y = self.body[0]
+        new_x, new_y = head_x + direction[0], head_y + direction[1]
+        if new_x < 0 or new_x >= self.cols or new_y < 0 or new_y >= self.rows:
+            return False
+        if (new_x, new_y) in self.body[:-1]:
+            return False
+        self.body.insert(0, (new_x, new_y))
+        if self.grow_pending > 0:
+            self.grow_pending -= 1
+        else:
+            self.body.pop()
+        if self.body[0] == self.food:
+            self.grow_pending += 1
+            self.spawn()
+        return True
+
+
+def run_legacy(path, rng):
+    """Steps per second and foods eaten for the list-based snake."""
+    snake = LegacySnake(reversed(path), COLS, ROWS, rng)
+    steps = eaten = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        head = snake.body[0]
+        target = cycle_next(*head, COLS, ROWS)
+        food = snake.food
+        if not snake.step((target[0] - head[0], target[1] - head[1])):
+            raise RuntimeError("legacy snake died on the cycle")
+        eaten += snake.body[0] == food
+        steps += 1
+    return steps / (time.perf_counter() - start), eaten
+
+
+def run_core(path, rng):
+    """Steps per second and foods eaten for SnakeEnv."""
+    env = SnakeEnv(COLS, ROWS, rng.randrange(1 << 30))
+    env.body.reset([y * COLS + x for x, y in reversed(path)])
+    (hx, hy), (nx, ny) = path[-1], path[-2]
+    env.direction = (hx - nx, hy - ny)
+    env.food = env.body.free.sample(env.rng)
+    steps = eaten = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        head = env.body.head()
+        x, y = head % COLS, head // COLS
+        reward, done = env.step(action_towards((x, y), cycle_next(x, y, COLS, ROWS)))
+        if done and not env.won:
+            raise RuntimeError("snake_core snake died on the cycle")
+        eaten += reward > 0
+        steps += 1
+        if done:
+            break
+    return steps / (time.perf_counter() - start), eaten
+
+
+def run_vec(num_envs):
+    """Game steps per second for SnakeVecEnv with random actions on the default board."""
+    vec = SnakeVecEnv(num_envs, seed=SEED)
+    rng = random.Random(SEED)
+    actions = [[rng.randrange(4) for _ in range(num_envs)] for _ in range(64)]
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        vec.step(actions[calls % len(actions)])
+        calls += 1
+    return calls * num_envs / (time.perf_counter() - start)
+
+
+def main() -> int:
+    """Print steps per second at each snake length."""
+    print(f"{COLS}x{ROWS} board, snake following a Hamiltonian cycle")
+    print(f"{'length':>7} {'legacy steps/s':>15} {'eaten':>6} {'core steps/s':>13} {'eaten':>6} {'speedup':>8}")
+    for fraction in FILL_FRACTIONS:
+        length = max(INITIAL_SNAKE_LENGTH, int(COLS * ROWS * fraction))
+        path = cycle_path(length, COLS, ROWS)
+        legacy_rate, legacy_eaten = run_legacy(path, random.Random(SEED))
+        core_rate, core_eaten = run_core(path, random.Random(SEED))
+        print(f"{length:>7} {legacy_rate:>15,.0f} {legacy_eaten:>6} {core_rate:>13,.0f} {core_eaten:>6} "
+              f"{core_rate / legacy_rate:>7.1f}x")
+
+    print(f"\nSnakeVecEnv, {GRID_COLS}x{GRID_ROWS} board, random actions")
+    for num_envs in (1, 64, 1024):
+        print(f"  N={num_envs:<5} {run_vec(num_envs):>12,.0f} steps/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
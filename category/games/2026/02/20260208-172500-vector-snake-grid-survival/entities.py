@@ -3,12 +3,15 @@
 import pygame
 import random
 from config import *
+from snake_core import SnakeBody
 
 
 class Snake:
     """Represents the snake entity."""
 
     def __init__(self):
+        # Ring-buffer body with an occupancy bitmap and free-cell set (see snake_core)
+        self.cells = SnakeBody(GRID_COLS, GRID_ROWS)
         self.reset()
 
     def reset(self):
@@ -17,16 +20,20 @@ class Snake:
         start_x = GRID_COLS // 2
         start_y = GRID_ROWS // 2
 
-        # Snake body as list of (grid_x, grid_y) positions
-        self.body = [
-            (start_x, start_y),
-            (start_x, start_y + 1),
-            (start_x, start_y + 2)
-        ]
+        self.cells.reset([
+            start_y * GRID_COLS + start_x,
+            (start_y + 1) * GRID_COLS + start_x,
+            (start_y + 2) * GRID_COLS + start_x
+        ])
         self.direction = DIR_UP
         self.next_direction = DIR_UP
         self.grow_pending = 0
 
+    @property
+    def body(self):
+        """Snake body as a list of (grid_x, grid_y) positions, head first."""
+        return self.cells.positions()
+
     def set_direction(self, direction):
         """Set the snake's direction (prevents 180-degree turns)."""
         # Prevent reversing direction
@@ -41,7 +48,7 @@ class Snake:
         self.direction = self.next_direction
 
         # Calculate new head position
-        head_x, head_y = self.body[0]
+        head_x, head_y = self.get_head_position()
         new_x = head_x + self.direction[0]
         new_y = head_y + self.direction[1]
 
@@ -49,18 +56,20 @@ class Snake:
         if new_x < 0 or new_x >= GRID_COLS or new_y < 0 or new_y >= GRID_ROWS:
             return False
 
-        # Check self collision (skip the tail as it will move)
-        if (new_x, new_y) in self.body[:-1]:
-            return False
-
-        # Add new head
-        self.body.insert(0, (new_x, new_y))
+        # Check self collision (the tail moves away unless the snake is growing)
+        new_cell = new_y * GRID_COLS + new_x
+        if self.cells.occupied[new_cell]:
+            if self.grow_pending > 0 or new_cell != self.cells.tail():
+                return False
 
         # Remove tail if not growing
         if self.grow_pending > 0:
             self.grow_pending -= 1
         else:
-            self.body.pop()
+            self.cells.pop_tail()
+
+        # Add new head
+        self.cells.push_head(new_cell)
 
         return True
 
@@ -70,19 +79,21 @@ class Snake:
 
     def get_head_position(self):
         """Get current head position."""
-        return self.body[0]
+        head = self.cells.head()
+        return (head % GRID_COLS, head // GRID_COLS)
 
     def get_length(self):
         """Get current snake length."""
-        return len(self.body)
+        return len(self.cells)
 
     def check_food_collision(self, food_pos):
         """Check if snake head collides with food."""
-        return self.body[0] == food_pos
+        return self.get_head_position() == food_pos
 
     def draw(self, surface):
         """Draw the snake."""
-        for i, (grid_x, grid_y) in enumerate(self.body):
+        body = self.body
+        for i, (grid_x, grid_y) in enumerate(body):
             x = grid_x * GRID_SIZE
             y = grid_y * GRID_SIZE + UI_HEIGHT
 
@@ -112,7 +123,7 @@ class Snake:
                     pygame.draw.circle(surface, (255, 255, 255), (x + GRID_SIZE - eye_offset, y + GRID_SIZE - eye_offset), eye_size)
             else:
                 # Body segments fade slightly
-                fade_factor = 1 - (i / max(len(self.body), 20)) * 0.3
+                fade_factor = 1 - (i / max(len(body), 20)) * 0.3
                 color = (
                     int(COLOR_SNAKE_BODY[0] * fade_factor),
                     int(COLOR_SNAKE_BODY[1] * fade_factor),
@@ -130,17 +141,11 @@ class Food:
         self.spawn_timer = 0
         self.pulse_phase = 0
 
-    def spawn(self, snake_body):
-        """Spawn food at a random empty position."""
-        empty_positions = []
-
-        for x in range(GRID_COLS):
-            for y in range(GRID_ROWS):
-                if (x, y) not in snake_body:
-                    empty_positions.append((x, y))
-
-        if empty_positions:
-            self.position = random.choice(empty_positions)
+    def spawn(self, snake_cells):
+        """Spawn food at a random cell not covered by the snake's SnakeBody."""
+        cell = snake_cells.free.sample(random)
+        if cell >= 0:
+            self.position = (cell % GRID_COLS, cell // GRID_COLS)
 
     def update(self):
         """Update food animation."""
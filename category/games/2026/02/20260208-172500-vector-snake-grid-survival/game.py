@@ -22,7 +22,7 @@ class Game:
         """Reset the entire game state."""
         self.snake = Snake()
         self.food = Food()
-        self.food.spawn(self.snake.body)
+        self.food.spawn(self.snake.cells)
         self.score = 0
         self.high_score = 0
         self.game_over = False
@@ -85,7 +85,7 @@ class Game:
             self.speed = min(MAX_SPEED, self.speed + SPEED_INCREMENT)
 
         # Spawn new food
-        self.food.spawn(self.snake.body)
+        self.food.spawn(self.snake.cells)
 
     def _game_over(self):
         """Handle game over."""
@@ -0,0 +1,256 @@
+"""Headless snake core: ring-buffer body, occupancy bitmap and O(1) free-cell sampling.
+
+Cells are integer ids (y * cols + x). Every structure is allocated once per
+board, so a step costs the same whether the snake is 3 or 3000 cells long.
+Nothing here imports pygame.
+"""
+
+import random
+from config import *
+
+# Action index -> direction, matching the README action space
+ACTIONS = (DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT)
+
+
+class FreeCellSet:
+    """Set of free cell ids with O(1) add, remove and uniform sampling.
+
+    The free cells are kept in the first `size` slots of a permutation of all
+    cells; removing one swaps it with the last free slot.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.cells = list(range(capacity))
+        self.index = list(range(capacity))
+        self.size = capacity
+
+    def reset(self):
+        """Mark every cell as free."""
+        self.size = self.capacity
+
+    def remove(self, cell):
+        """Mark a free cell as used."""
+        i = self.index[cell]
+        last = self.size - 1
+        moved = self.cells[last]
+        self.cells[i] = moved
+        self.index[moved] = i
+        self.cells[last] = cell
+        self.index[cell] = last
+        self.size = last
+
+    def add(self, cell):
+        """Mark a used cell as free."""
+        i = self.index[cell]
+        first = self.size
+        moved = self.cells[first]
+        self.cells[i] = moved
+        self.index[moved] = i
+        self.cells[first] = cell
+        self.index[cell] = first
+        self.size = first + 1
+
+    def __contains__(self, cell):
+        return self.index[cell] < self.size
+
+    def __len__(self):
+        return self.size
+
+    def sample(self, rng=random):
+        """Return a uniformly random free cell, or -1 if none is free."""
+        if not self.size:
+            return -1
+        return self.cells[rng.randrange(self.size)]
+
+
+class SnakeBody:
+    """Snake body in a fixed-capacity ring buffer, head first.
+
+    occupied is a bytearray bitmap of the board and free holds every cell the
+    body does not cover, both updated as the head is pushed and the tail popped.
+    """
+
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.capacity = cols * rows
+        self.ring = [0] * self.capacity
+        self.occupied = bytearray(self.capacity)
+        self.free = FreeCellSet(self.capacity)
+        self.head_slot = 0
+        self.length = 0
+
+    def reset(self, cells):
+        """Replace the body with the given cell ids, head first."""
+        for cell in self:
+            self.occupied[cell] = 0
+        self.free.reset()
+        self.head_slot = 0
+        self.length = 0
+        for cell in reversed(cells):
+            self.push_head(cell)
+
+    def push_head(self, cell):
+        """Add a new head segment."""
+        self.head_slot = (self.head_slot - 1) % self.capacity
+        self.ring[self.head_slot] = cell
+        self.occupied[cell] = 1
+        self.free.remove(cell)
+        self.length += 1
+
+    def pop_tail(self):
+        """Remove and return the tail segment."""
+        self.length -= 1
+        cell = self.ring[(self.head_slot + self.length) % self.capacity]
+        self.occupied[cell] = 0
+        self.free.add(cell)
+        return cell
+
+    def head(self):
+        """Return the head cell id."""
+        return self.ring[self.head_slot]
+
+    def tail(self):
+        """Return the tail cell id."""
+        return self.ring[(self.head_slot + self.length - 1) % self.capacity]
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """Iterate cell ids from head to tail."""
+        ring, capacity, start = self.ring, self.capacity, self.head_slot
+        for i in range(self.length):
+            yield ring[(start + i) % capacity]
+
+    def positions(self):
+        """Return the body as a list of (x, y) tuples, head first."""
+        cols = self.cols
+        return [(cell % cols, cell // cols) for cell in self]
+
+
+class SnakeEnv:
+    """One headless Snake game with the rules and rewards of the pygame version."""
+
+    def __init__(self, cols=GRID_COLS, rows=GRID_ROWS, seed=None):
+        self.cols = cols
+        self.rows = rows
+        self.rng = random.Random(seed)
+        self.body = SnakeBody(cols, rows)
+        self.reset()
+
+    def reset(self):
+        """Start a new game with a length-3 snake in the middle, heading up."""
+        x, y = self.cols // 2, self.rows // 2
+        self.body.reset([(y + i) * self.cols + x for i in range(INITIAL_SNAKE_LENGTH)])
+        self.direction = DIR_UP
+        self.grow_pending = 0
+        self.score = 0
+        self.steps = 0
+        self.done = False
+        self.won = False
+        self.food = self.body.free.sample(self.rng)
+
+    def step(self, action):
+        """Turn to ACTIONS[action] (reversals are ignored) and move; returns (reward, done)."""
+        if self.done:
+            return 0, True
+        direction = ACTIONS[action]
+        if (-direction[0], -direction[1]) != self.direction:
+            self.direction = direction
+        self.steps += 1
+
+        body = self.body
+        cols = self.cols
+        head = body.ring[body.head_slot]
+        x = head % cols + self.direction[0]
+        y = head // cols + self.direction[1]
+        if x < 0 or x >= cols or y < 0 or y >= self.rows:
+            return self._die()
+
+        cell = y * cols + x
+        # The tail only gets out of the way when the snake is not growing
+        tail_moves = self.grow_pending == 0
+        if body.occupied[cell] and not (tail_moves and cell == body.tail()):
+            return self._die()
+
+        if tail_moves:
+            body.pop_tail()
+        else:
+            self.grow_pending -= 1
+        body.push_head(cell)
+
+        reward = SCORE_STEP
+        if cell == self.food:
+            reward += SCORE_FOOD
+            self.score += SCORE_FOOD
+            self.grow_pending += 1
+            self.food = body.free.sample(self.rng)
+            if self.food < 0:
+                # The snake fills the board
+                self.done = True
+                self.won = True
+        return reward, self.done
+
+    def _die(self):
+        """End the game after a collision."""
+        self.done = True
+        self.score += PENALTY_DEATH
+        return PENALTY_DEATH, True
+
+    def features(self):
+        """Return [head_x, head_y, food_x, food_y, direction index] (food -1, -1 if none)."""
+        head = self.body.head()
+        food_x, food_y = (self.food % self.cols, self.food // self.cols) if self.food >= 0 else (-1, -1)
+        return [head % self.cols, head // self.cols, food_x, food_y, ACTIONS.index(self.direction)]
+
+    def grid(self):
+        """Return the rows x cols categorical grid (0 empty, 1 body, 2 head, 3 food)."""
+        cells = [0] * (self.cols * self.rows)
+        for cell in self.body:
+            cells[cell] = 1
+        cells[self.body.head()] = 2
+        if self.food >= 0:
+            cells[self.food] = 3
+        return [cells[r * self.cols:(r + 1) * self.cols] for r in range(self.rows)]
+
+
+class SnakeVecEnv:
+    """Several SnakeEnv games stepped together.
+
+    step(actions) returns (rewards, dones) as lists that are reused between
+    calls. With auto_reset, a finished game reports done once and starts over
+    on the same call.
+    """
+
+    def __init__(self, num_envs, cols=GRID_COLS, rows=GRID_ROWS, seed=None, auto_reset=True):
+        base = random.Random(seed)
+        self.envs = [SnakeEnv(cols, rows, base.randrange(1 << 30)) for _ in range(num_envs)]
+        self.auto_reset = auto_reset
+        self.rewards = [0] * num_envs
+        self.dones = [False] * num_envs
+
+    def __len__(self):
+        return len(self.envs)
+
+    def reset(self):
+        """Restart every game."""
+        for env in self.envs:
+            env.reset()
+
+    def step(self, actions):
+        """Apply one action per game; returns the shared (rewards, dones) lists."""
+        rewards, dones = self.rewards, self.dones
+        auto_reset = self.auto_reset
+        for i, env in enumerate(self.envs):
+            reward, done = env.step(actions[i])
+            rewards[i] = reward
+            dones[i] = done
+            if done and auto_reset:
+                env.reset()
+        return rewards, dones
+
+    def features(self):
+        """Return the feature vector of every game."""
+        return [env.features() for env in self.envs]
@@ -0,0 +1,290 @@
+"""NumPy-backed grid backend for Minesweeper.
+
+Drop-in alternative to entities.Grid for large boards. Mines, neighbour counts,
+revealed and flagged state live in boolean/int8 arrays padded with a one-cell
+border, so a cell's eight neighbours are always at fixed flat offsets. Reveals
+flood iteratively, with a plain stack for small regions and a vectorised
+frontier for large ones, so board size is bounded by memory rather than by
+Python's recursion limit.
+"""
+
+from typing import List, Optional, Tuple
+import numpy as np
+from config import *
+
+SCALAR_FLOOD_LIMIT = 1024  # Opened cells before a reveal switches to the vectorised flood
+
+
+class CellView:
+    """Read-only view of one ArrayGrid cell with the same attributes as entities.Cell."""
+
+    __slots__ = ("grid", "row", "col", "_index")
+
+    def __init__(self, grid: "ArrayGrid", row: int, col: int):
+        self.grid = grid
+        self.row = row
+        self.col = col
+        self._index = (row + 1) * (grid.cols + 2) + col + 1
+
+    @property
+    def is_mine(self) -> bool:
+        return bool(self.grid._mine_flat[self._index])
+
+    @property
+    def is_revealed(self) -> bool:
+        return bool(self.grid._revealed_flat[self._index])
+
+    @property
+    def is_flagged(self) -> bool:
+        return bool(self.grid._flagged_flat[self._index])
+
+    @property
+    def neighbor_mines(self) -> int:
+        return int(self.grid._counts_flat[self._index])
+
+    def get_state(self) -> int:
+        """Get the state representation for AI agents."""
+        return int(self.grid.state[self.row, self.col])
+
+
+class ArrayGrid:
+    """Minesweeper grid whose cell state is held in NumPy arrays."""
+
+    def __init__(self, rows: int = GRID_ROWS, cols: int = GRID_COLS, mines: int = TOTAL_MINES,
+                 seed: Optional[int] = None):
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.rng = np.random.default_rng(seed)
+        self.game_over = False
+        self.won = False
+        self.revealed_count = 0
+        self.flagged_count = 0
+        self.total_reward = 0.0
+
+        width = cols + 2
+        # Flat offsets of the 8 neighbours in the padded layout
+        self._offsets = np.array([-width - 1, -width, -width + 1, -1, 1,
+                                  width - 1, width, width + 1], dtype=np.int64)
+        self._offset_list = self._offsets.tolist()
+        self._allocate()
+        self._place_mines()
+
+    def _allocate(self) -> None:
+        """Allocate the padded state arrays and the interior views onto them."""
+        shape = (self.rows + 2, self.cols + 2)
+        self._mine_pad = np.zeros(shape, dtype=bool)
+        self._counts_pad = np.zeros(shape, dtype=np.int8)
+        self._revealed_pad = np.zeros(shape, dtype=bool)
+        self._flagged_pad = np.zeros(shape, dtype=bool)
+        # Border cells are never revealable, which stops every flood at the edge
+        self._inside_pad = np.zeros(shape, dtype=bool)
+        self._inside_pad[1:-1, 1:-1] = True
+
+        self._mine_flat = self._mine_pad.ravel()
+        self._counts_flat = self._counts_pad.ravel()
+        self._revealed_flat = self._revealed_pad.ravel()
+        self._flagged_flat = self._flagged_pad.ravel()
+        self._inside_flat = self._inside_pad.ravel()
+
+        self.mine = self._mine_pad[1:-1, 1:-1]
+        self.counts = self._counts_pad[1:-1, 1:-1]
+        self.revealed = self._revealed_pad[1:-1, 1:-1]
+        self.flagged = self._flagged_pad[1:-1, 1:-1]
+        # Agent-facing state, kept current on every reveal and flag
+        self.state = np.full((self.rows, self.cols), CELL_HIDDEN, dtype=np.int8)
+
+    def _place_mines(self) -> None:
+        """Randomly place mines in the grid."""
+        mask = np.zeros(self.rows * self.cols, dtype=bool)
+        mask[self.rng.choice(self.rows * self.cols, self.mines, replace=False)] = True
+        self.load_mines(mask.reshape(self.rows, self.cols))
+
+    def load_mines(self, mine_mask: np.ndarray) -> None:
+        """Use the given (rows, cols) boolean mine layout and recompute neighbour counts."""
+        self.mine[:] = mine_mask
+        self.mines = int(np.count_nonzero(mine_mask))
+        self._calculate_neighbors()
+
+    def _calculate_neighbors(self) -> None:
+        """Count adjacent mines with a 3x3 box convolution over the padded mine array."""
+        padded = self._mine_pad.astype(np.int8)
+        rows, cols = self.rows, self.cols
+        counts = np.zeros((rows, cols), dtype=np.int8)
+        for dr in (0, 1, 2):
+            for dc in (0, 1, 2):
+                if dr == 1 and dc == 1:
+                    continue
+                counts += padded[dr:dr + rows, dc:dc + cols]
+        # Mines carry no count, matching entities.Grid
+        counts[self.mine] = 0
+        self.counts[:] = counts
+        # Cells a flood may pass through: zero-count, mine-free and not on the border
+        self._zero_flat = ((self._counts_flat == 0) & ~self._mine_flat & self._inside_flat)
+
+    def get_cell(self, row: int, col: int) -> Optional[CellView]:
+        """Get a cell at the given position."""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return CellView(self, row, col)
+        return None
+
+    def reveal(self, row: int, col: int) -> bool:
+        """Reveal a cell. Returns True if safe, False if mine."""
+        if self.game_over:
+            return True
+
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            self.total_reward += PENALTY_INVALID
+            return True
+
+        index = (row + 1) * (self.cols + 2) + col + 1
+        if self._revealed_flat[index] or self._flagged_flat[index]:
+            self.total_reward += PENALTY_INVALID
+            return True
+
+        if self._mine_flat[index]:
+            self._revealed_flat[index] = True
+            self._game_over(won=False)
+            return False
+
+        if self._counts_flat[index] == 0:
+            opened = self._flood(index)
+            self._write_state(opened)
+            newly_revealed = len(opened)
+        else:
+            self._revealed_flat[index] = True
+            self.state[row, col] = self._counts_flat[index]
+            newly_revealed = 1
+
+        self.revealed_count += newly_revealed
+        self.total_reward += REWARD_SAFE_REVEAL * newly_revealed
+
+        # Check win condition
+        safe_cells = self.rows * self.cols - self.mines
+        if self.revealed_count == safe_cells:
+            self._game_over(won=True)
+
+        return True
+
+    def _flood(self, start: int) -> np.ndarray:
+        """Reveal the region opened by the zero cell at start; returns its flat indices.
+
+        Small regions, which is nearly all of them on standard boards, are
+        walked with a plain stack. Once a region passes SCALAR_FLOOD_LIMIT
+        cells, the cells still waiting on the stack become the frontier of
+        the vectorised flood. Flags and already revealed cells stop the
+        flood, as in entities.Grid.
+        """
+        revealed = self._revealed_flat
+        flagged = self._flagged_flat
+        passable = self._zero_flat
+        inside = self._inside_flat
+        offsets = self._offset_list
+        revealed[start] = True
+        opened = [start]
+        stack = [start]
+        while stack:
+            if len(opened) > SCALAR_FLOOD_LIMIT:
+                return self._flood_frontier(np.array(stack, dtype=np.int64), opened)
+            cell = stack.pop()
+            for offset in offsets:
+                neighbour = cell + offset
+                if revealed[neighbour] or flagged[neighbour] or not inside[neighbour]:
+                    continue
+                # Neighbours of a zero cell are never mines
+                revealed[neighbour] = True
+                opened.append(neighbour)
+                if passable[neighbour]:
+                    stack.append(neighbour)
+        return np.array(opened, dtype=np.int64)
+
+    def _flood_frontier(self, frontier: np.ndarray, opened: List[int]) -> np.ndarray:
+        """Finish a large flood breadth-first from revealed zero cells not yet expanded.
+
+        The whole frontier is expanded per step, then one pass adds the
+        numbered cells bordering the newly opened zeros. Only the frontier's
+        neighbours are touched, so the cost is proportional to the opened area.
+        """
+        revealed = self._revealed_flat
+        flagged = self._flagged_flat
+        passable = self._zero_flat
+        zeros = [frontier]
+
+        while True:
+            neighbours = (frontier[:, None] + self._offsets).ravel()
+            neighbours = neighbours[passable[neighbours] & ~revealed[neighbours] & ~flagged[neighbours]]
+            if not neighbours.size:
+                break
+            frontier = np.unique(neighbours)
+            revealed[frontier] = True
+            zeros.append(frontier)
+
+        region = np.concatenate(zeros)
+        border = (region[:, None] + self._offsets).ravel()
+        border = np.unique(border[self._inside_flat[border] & ~revealed[border] & ~flagged[border]])
+        revealed[border] = True
+        return np.concatenate((np.array(opened, dtype=np.int64), *zeros[1:], border))
+
+    def _write_state(self, indices: np.ndarray) -> None:
+        """Copy the counts of newly revealed flat indices into the agent state."""
+        rows, cols = np.divmod(indices, self.cols + 2)
+        self.state[rows - 1, cols - 1] = self._counts_flat[indices]
+
+    def toggle_flag(self, row: int, col: int) -> None:
+        """Toggle flag on a cell."""
+        if self.game_over:
+            return
+
+        if 0 <= row < self.rows and 0 <= col < self.cols and not self.revealed[row, col]:
+            flagged = not self.flagged[row, col]
+            self.flagged[row, col] = flagged
+            if flagged:
+                self.state[row, col] = CELL_FLAGGED
+                self.flagged_count += 1
+            else:
+                self.state[row, col] = CELL_HIDDEN
+                self.flagged_count -= 1
+
+    def _game_over(self, won: bool) -> None:
+        """Handle game over state."""
+        self.game_over = True
+        self.won = won
+
+        if won:
+            self.total_reward += REWARD_WIN
+        else:
+            self.total_reward += PENALTY_MINE
+            # Reveal all mines
+            self.revealed |= self.mine
+            shown = self.mine & ~self.flagged
+            self.state[shown] = self.counts[shown]
+
+    def reset(self) -> None:
+        """Reset the grid for a new game."""
+        self.game_over = False
+        self.won = False
+        self.revealed_count = 0
+        self.flagged_count = 0
+        self.total_reward = 0.0
+
+        self._allocate()
+        self._place_mines()
+
+    def get_state(self) -> np.ndarray:
+        """Get the current grid state for AI agents as a read-only view (no copy)."""
+        view = self.state.view()
+        view.flags.writeable = False
+        return view
+
+    def get_adjacent_hidden(self, row: int, col: int) -> List[Tuple[int, int]]:
+        """Get list of adjacent hidden cell positions."""
+        r0, r1 = max(row - 1, 0), min(row + 2, self.rows)
+        c0, c1 = max(col - 1, 0), min(col + 2, self.cols)
+        hidden = ~(self.revealed[r0:r1, c0:c1] | self.flagged[r0:r1, c0:c1])
+        return [(r0 + r, c0 + c) for r, c in zip(*np.nonzero(hidden)) if (r0 + r, c0 + c) != (row, col)]
+
+    def get_adjacent_flags(self, row: int, col: int) -> int:
+        """Count flagged cells adjacent to position."""
+        r0, r1 = max(row - 1, 0), min(row + 2, self.rows)
+        c0, c1 = max(col - 1, 0), min(col + 2, self.cols)
+        return int(np.count_nonzero(self.flagged[r0:r1, c0:c1])) - int(self.flagged[row, col])
@@ -0,0 +1,114 @@
+"""Random-reveal benchmark comparing entities.Grid with array_grid.ArrayGrid."""
+
+import sys
+import time
+import numpy as np
+from config import *
+from entities import Grid
+from array_grid import ArrayGrid
+
+# (rows, cols, mines, games) board sizes; the largest is beyond the reach of the recursive Grid.
+# Small boards are played many times so the totals are not lost in timer noise.
+BOARDS = [
+    (9, 9, 10, 200),
+    (16, 30, 99, 100),
+    (100, 100, 1600, 1),
+    (300, 300, 14400, 1),
+    (1000, 1000, 160000, 1),
+    (1000, 1000, 50000, 1),
+]
+REVEALS = 200
+SEED = 1234
+
+
+def make_cell_grid(mine_mask: np.ndarray) -> Grid:
+    """Build an entities.Grid with the given mine layout."""
+    grid = Grid()
+    grid.rows, grid.cols = mine_mask.shape
+    grid.mines = int(np.count_nonzero(mine_mask))
+    grid._initialize_cells()
+    for row, col in zip(*np.nonzero(mine_mask)):
+        grid.cells[row][col].is_mine = True
+    grid._calculate_neighbors()
+    return grid
+
+
+def make_array_grid(mine_mask: np.ndarray) -> ArrayGrid:
+    """Build an ArrayGrid with the given mine layout."""
+    rows, cols = mine_mask.shape
+    grid = ArrayGrid(rows, cols, 0)
+    grid.load_mines(mine_mask)
+    return grid
+
+
+def run_reveals(grid, order) -> int:
+    """Reveal safe cells from order until REVEALS calls were made; returns the call count."""
+    calls = 0
+    for row, col in order:
+        if calls == REVEALS or grid.game_over:
+            break
+        if not grid.get_cell(row, col).is_revealed:
+            grid.reveal(row, col)
+            calls += 1
+    return calls
+
+
+def bench(name, build, layouts):
+    """Time board construction and the reveal sequences for one backend."""
+    setup = reveal_time = 0.0
+    calls = revealed = 0
+    grids = []
+    for mine_mask, order in layouts:
+        start = time.perf_counter()
+        try:
+            grid = build(mine_mask)
+            built = time.perf_counter()
+            calls += run_reveals(grid, order)
+        except RecursionError:
+            print(f"  {name:<10} RecursionError")
+            return None
+        done = time.perf_counter()
+        setup += built - start
+        reveal_time += done - built
+        revealed += grid.revealed_count
+        grids.append(grid)
+    print(f"  {name:<10} setup={setup:8.3f}s  reveals={calls:>6}  reveal_time={reveal_time:8.3f}s  "
+          f"per_reveal={reveal_time / calls * 1e6:7.1f}us  revealed={revealed}")
+    return grids
+
+
+def warm_up() -> None:
+    """Run one large flood on the array backend so one-time NumPy imports are not timed."""
+    mine_mask = np.zeros((60, 60), dtype=bool)
+    mine_mask[-1, -1] = True
+    make_array_grid(mine_mask).reveal(0, 0)
+
+
+def main() -> int:
+    """Run the benchmark on every board size."""
+    rng = np.random.default_rng(SEED)
+    warm_up()
+    mismatches = 0
+    for rows, cols, mines, games in BOARDS:
+        layouts = []
+        for _ in range(games):
+            mine_mask = np.zeros(rows * cols, dtype=bool)
+            mine_mask[rng.choice(rows * cols, mines, replace=False)] = True
+            mine_mask = mine_mask.reshape(rows, cols)
+            safe = np.argwhere(~mine_mask)
+            order = [tuple(cell) for cell in safe[rng.permutation(len(safe))]]
+            layouts.append((mine_mask, order))
+
+        print(f"{rows}x{cols}, {mines} mines, {games} game(s) of up to {REVEALS} random safe reveals")
+        cell_grids = bench("cells", make_cell_grid, layouts)
+        array_grids = bench("array", make_array_grid, layouts)
+        if cell_grids is not None and array_grids is not None:
+            if any(cell_grid.get_state() != array_grid.get_state().tolist()
+                   for cell_grid, array_grid in zip(cell_grids, array_grids)):
+                print("  MISMATCH: final states differ")
+                mismatches += 1
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
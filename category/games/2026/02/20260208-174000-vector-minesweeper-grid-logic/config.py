@@ -15,6 +15,12 @@ GRID_OFFSET_Y = (SCREEN_HEIGHT - GRID_ROWS * CELL_SIZE) // 2 + 20
 # Mines
 TOTAL_MINES = 10
 
+# Grid backend: "cells" (entities.Grid), "array" (array_grid.ArrayGrid, NumPy), or
+# "auto" to use the array backend only on boards of at least ARRAY_BACKEND_MIN_CELLS,
+# since per-call NumPy overhead makes it slower on standard sizes up to expert
+GRID_BACKEND = "auto"
+ARRAY_BACKEND_MIN_CELLS = 10000
+
 # Colors (professional gray and blue tones)
 COLOR_BG = (18, 18, 22)
 COLOR_GRID = (35, 35, 40)
@@ -33,6 +39,10 @@ COLOR_CELL_HOVER = (55, 55, 65)
 COLOR_MINE = (200, 60, 60)
 COLOR_FLAG = (220, 180, 60)
 
+# Solver overlay colors
+COLOR_PROB_SAFE = (80, 200, 120)
+COLOR_PROB_MINE = (220, 70, 70)
+
 # Number colors
 COLOR_NUMBERS = {
     0: (80, 80, 90),
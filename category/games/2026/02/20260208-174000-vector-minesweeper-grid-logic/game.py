@@ -3,6 +3,8 @@
 import pygame
 from config import *
 from entities import Grid
+from array_grid import ArrayGrid
+from solver import MinesweeperSolver
 
 
 class Game:
@@ -17,7 +19,11 @@ class Game:
         self.small_font = pygame.font.Font(None, 22)
         self.large_font = pygame.font.Font(None, 48)
 
-        self.grid = Grid()
+        use_array = GRID_BACKEND == "array" or (
+            GRID_BACKEND == "auto" and GRID_ROWS * GRID_COLS >= ARRAY_BACKEND_MIN_CELLS)
+        self.grid = ArrayGrid() if use_array else Grid()
+        self.solver = MinesweeperSolver(self.grid)
+        self.show_overlay = False
         self.mouse_pos = (0, 0)
         self.hover_cell = None
 
@@ -32,6 +38,11 @@ class Game:
                     return False
                 if event.key == pygame.K_r or event.key == pygame.K_SPACE:
                     self.grid.reset()
+                    self.solver.reset()
+                if event.key == pygame.K_p:
+                    self.show_overlay = not self.show_overlay
+                    if self.show_overlay:
+                        self.solver.update()
 
             if event.type == pygame.MOUSEMOTION:
                 self.mouse_pos = event.pos
@@ -60,12 +71,16 @@ class Game:
         if self.hover_cell and not self.grid.game_over:
             row, col = self.hover_cell
             self.grid.reveal(row, col)
+            if self.show_overlay:
+                self.solver.update()
 
     def _handle_right_click(self) -> None:
         """Handle right mouse click (flag)."""
         if self.hover_cell and not self.grid.game_over:
             row, col = self.hover_cell
             self.grid.toggle_flag(row, col)
+            if self.show_overlay:
+                self.solver.update()
 
     def update(self) -> None:
         """Update game state."""
@@ -111,7 +126,7 @@ class Game:
         controls_text = self.small_font.render("L-Click: Reveal | R-Click: Flag", True, COLOR_TEXT_DIM)
         self.screen.blit(controls_text, (SCREEN_WIDTH - controls_text.get_width() - 20, 20))
 
-        restart_text = self.small_font.render("R: New Game", True, COLOR_TEXT_DIM)
+        restart_text = self.small_font.render("R: New Game | P: Probabilities", True, COLOR_TEXT_DIM)
         self.screen.blit(restart_text, (SCREEN_WIDTH - restart_text.get_width() - 20, 45))
 
     def _draw_grid(self) -> None:
@@ -163,6 +178,8 @@ class Game:
                 self._draw_mine(x, y)
             elif cell.neighbor_mines > 0:
                 self._draw_number(x, y, cell.neighbor_mines)
+        elif self.show_overlay and not self.grid.game_over:
+            self._draw_probability(x, y, self.solver.probabilities[row][col])
 
     def _draw_number(self, x: int, y: int, number: int) -> None:
         """Draw a number in the cell."""
@@ -173,6 +190,20 @@ class Game:
         )
         self.screen.blit(text, text_rect)
 
+    def _draw_probability(self, x: int, y: int, probability: float) -> None:
+        """Draw the solver's mine probability for a hidden cell."""
+        color = tuple(
+            int(safe + (mine - safe) * probability)
+            for safe, mine in zip(COLOR_PROB_SAFE, COLOR_PROB_MINE)
+        )
+        if probability == 0.0:
+            # Proven safe
+            rect = pygame.Rect(x + 3, y + 3, CELL_SIZE - 6, CELL_SIZE - 6)
+            pygame.draw.rect(self.screen, color, rect, 2)
+        text = self.small_font.render(f"{probability * 100:.0f}%", True, color)
+        text_rect = text.get_rect(center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2))
+        self.screen.blit(text, text_rect)
+
     def _draw_mine(self, x: int, y: int) -> None:
         """Draw a mine in the cell."""
         center_x = x + CELL_SIZE // 2
@@ -0,0 +1,327 @@
+"""Constraint-propagation Minesweeper solver with per-cell mine probabilities.
+
+Works with either grid backend (entities.Grid or array_grid.ArrayGrid). Each
+revealed number becomes a constraint over its hidden neighbours, taken from
+get_adjacent_hidden, with its flags (get_adjacent_flags) already subtracted;
+flags are trusted as mines. Trivially decided cells are propagated first, the
+rest of the frontier is split into independent components that are enumerated
+exactly, and the components are combined with the unconstrained cells under
+the global mine count. A component too large to enumerate within
+ENUMERATION_LIMIT search steps falls back to per-cell constraint densities.
+"""
+
+import math
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
+from config import *
+
+Cell = Tuple[int, int]
+Constraint = Tuple[Tuple[Cell, ...], int]
+
+COMPONENT_CACHE_SIZE = 512  # Enumerated components kept, least recently used dropped first
+ENUMERATION_LIMIT = 200000  # Search steps per component before falling back to an estimate
+
+
+class _EnumerationTooLarge(Exception):
+    """Raised inside the enumeration when a component exceeds ENUMERATION_LIMIT."""
+
+
+class ComponentSolution:
+    """Exact enumeration of one frontier component, grouped by mine count."""
+
+    def __init__(self, cells: Tuple[Cell, ...], totals: np.ndarray, mine_counts: np.ndarray):
+        self.cells = cells
+        # totals[k]: solutions with k mines; mine_counts[k, i]: of those, how many mine cells[i]
+        self.totals = totals
+        self.mine_counts = mine_counts
+
+
+class MinesweeperSolver:
+    """Mine-probability and safe-move service for a Minesweeper grid.
+
+    Call update() after every reveal or flag. Only the constraints around cells
+    whose state changed are rebuilt, and component enumerations are cached by
+    their constraint set in a bounded LRU, so untouched parts of the frontier
+    are not enumerated again.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all cached state; call after the grid starts a new game."""
+        self._known = np.full((self.grid.rows, self.grid.cols), CELL_HIDDEN, dtype=np.int8)
+        self._constraints: Dict[Cell, Constraint] = {}
+        self._component_cache: "OrderedDict[FrozenSet[Constraint], ComponentSolution]" = OrderedDict()
+        self.probabilities = np.full((self.grid.rows, self.grid.cols),
+                                     self.grid.mines / (self.grid.rows * self.grid.cols))
+        self.safe_moves: List[Cell] = []
+        self.known_mines: List[Cell] = []
+
+    def update(self) -> np.ndarray:
+        """Refresh constraints from the grid and recompute the probability matrix."""
+        state = np.asarray(self.grid.get_state(), dtype=np.int8)
+        changed = np.argwhere(state != self._known)
+        self._known = state.copy()
+
+        dirty = set()
+        for row, col in changed:
+            for r in range(max(row - 1, 0), min(row + 2, self.grid.rows)):
+                for c in range(max(col - 1, 0), min(col + 2, self.grid.cols)):
+                    dirty.add((r, c))
+        for row, col in dirty:
+            self._rebuild_constraint(row, col, int(state[row, col]))
+
+        self._solve(state)
+        return self.probabilities
+
+    def _rebuild_constraint(self, row: int, col: int, value: int) -> None:
+        """Recompute the constraint of one cell, dropping it if it has none."""
+        self._constraints.pop((row, col), None)
+        if value <= 0:
+            return
+        hidden = self.grid.get_adjacent_hidden(row, col)
+        if hidden:
+            remaining = value - self.grid.get_adjacent_flags(row, col)
+            self._constraints[(row, col)] = (tuple(hidden), remaining)
+
+    def _propagate(self, constraints: List[Constraint]) -> Tuple[List[Constraint], set, set]:
+        """Apply the all-safe / all-mines rules until nothing changes."""
+        mines = set()
+        safe = set()
+        changed = True
+        while changed:
+            changed = False
+            reduced = []
+            for cells, remaining in constraints:
+                open_cells = tuple(cell for cell in cells if cell not in mines and cell not in safe)
+                remaining -= sum(1 for cell in cells if cell in mines)
+                if not open_cells:
+                    continue
+                if remaining == 0:
+                    safe.update(open_cells)
+                    changed = True
+                elif remaining == len(open_cells):
+                    mines.update(open_cells)
+                    changed = True
+                else:
+                    reduced.append((open_cells, remaining))
+            constraints = reduced
+        return constraints, mines, safe
+
+    def _components(self, constraints: List[Constraint]) -> List[FrozenSet[Constraint]]:
+        """Split constraints into groups that share no cells."""
+        parent = list(range(len(constraints)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        owner: Dict[Cell, int] = {}
+        for index, (cells, _) in enumerate(constraints):
+            for cell in cells:
+                if cell in owner:
+                    parent[find(index)] = find(owner[cell])
+                else:
+                    owner[cell] = index
+
+        groups: Dict[int, set] = {}
+        for index, constraint in enumerate(constraints):
+            groups.setdefault(find(index), set()).add(constraint)
+        return [frozenset(group) for group in groups.values()]
+
+    def _enumerate(self, component: FrozenSet[Constraint]) -> ComponentSolution:
+        """Count every mine assignment of a component that satisfies all its constraints."""
+        cached = self._component_cache.get(component)
+        if cached is not None:
+            self._component_cache.move_to_end(component)
+            return cached
+
+        # Order cells so that each constraint is closed as early as possible
+        constraints = sorted(component)
+        order: List[Cell] = []
+        seen = set()
+        for cells, _ in constraints:
+            for cell in cells:
+                if cell not in seen:
+                    seen.add(cell)
+                    order.append(cell)
+        index = {cell: i for i, cell in enumerate(order)}
+        size = len(order)
+
+        targets = [remaining for _, remaining in constraints]
+        # Per constraint: mines placed so far and cells still unassigned
+        placed = [0] * len(constraints)
+        unassigned = [len(cells) for cells, _ in constraints]
+        touching: List[List[int]] = [[] for _ in range(size)]
+        for ci, (cells, _) in enumerate(constraints):
+            for cell in cells:
+                touching[index[cell]].append(ci)
+
+        totals = np.zeros(size + 1, dtype=np.float64)
+        mine_counts = np.zeros((size + 1, size), dtype=np.float64)
+        assignment = [0] * size
+        budget = [ENUMERATION_LIMIT]
+
+        def assign(position: int, mines: int) -> None:
+            budget[0] -= 1
+            if budget[0] < 0:
+                raise _EnumerationTooLarge
+            if position == size:
+                totals[mines] += 1
+                mine_counts[mines] += assignment
+                return
+            for value in (0, 1):
+                ok = True
+                for ci in touching[position]:
+                    placed[ci] += value
+                    unassigned[ci] -= 1
+                    if placed[ci] > targets[ci] or placed[ci] + unassigned[ci] < targets[ci]:
+                        ok = False
+                if ok:
+                    assignment[position] = value
+                    assign(position + 1, mines + value)
+                for ci in touching[position]:
+                    placed[ci] -= value
+                    unassigned[ci] += 1
+            assignment[position] = 0
+
+        try:
+            assign(0, 0)
+            solution = ComponentSolution(tuple(order), totals, mine_counts)
+        except _EnumerationTooLarge:
+            solution = self._estimate(constraints, order)
+        self._component_cache[component] = solution
+        if len(self._component_cache) > COMPONENT_CACHE_SIZE:
+            self._component_cache.popitem(last=False)
+        return solution
+
+    def _estimate(self, constraints: List[Constraint], order: List[Cell]) -> ComponentSolution:
+        """Approximate a component too large to enumerate.
+
+        Each cell gets the mean mine density of the constraints it is in, and
+        the component is treated as holding the rounded total of those. The
+        estimates are never exactly 0 or 1, so no cell is claimed to be proven
+        safe or a mine.
+        """
+        densities: Dict[Cell, List[float]] = {cell: [] for cell in order}
+        for cells, remaining in constraints:
+            for cell in cells:
+                densities[cell].append(remaining / len(cells))
+        size = len(order)
+        marginals = np.array([min(max(sum(values) / len(values), 1e-6), 1 - 1e-6)
+                              for values in (densities[cell] for cell in order)])
+        expected = min(int(round(marginals.sum())), size)
+        totals = np.zeros(size + 1, dtype=np.float64)
+        mine_counts = np.zeros((size + 1, size), dtype=np.float64)
+        totals[expected] = 1.0
+        mine_counts[expected] = marginals
+        return ComponentSolution(tuple(order), totals, mine_counts)
+
+    def _solve(self, state: np.ndarray) -> None:
+        """Recompute probabilities, safe moves and known mines from the constraints."""
+        rows, cols = state.shape
+        constraints, mines, safe = self._propagate(list(self._constraints.values()))
+        solutions = [self._enumerate(component) for component in self._components(constraints)]
+
+        hidden = state == CELL_HIDDEN
+        probabilities = np.zeros((rows, cols))
+        probabilities[state == CELL_FLAGGED] = 1.0
+        frontier = np.zeros((rows, cols), dtype=bool)
+        for row, col in mines:
+            probabilities[row, col] = 1.0
+            frontier[row, col] = True
+        for row, col in safe:
+            frontier[row, col] = True
+        for solution in solutions:
+            for row, col in solution.cells:
+                frontier[row, col] = True
+
+        unconstrained = int(np.count_nonzero(hidden & ~frontier))
+        remaining = self.grid.mines - int(np.count_nonzero(state == CELL_FLAGGED)) - len(mines)
+        other_probability = self._combine(solutions, unconstrained, remaining, probabilities)
+        probabilities[hidden & ~frontier] = other_probability
+
+        # Drop the last few ulps so that decided cells read as exactly 0 or 1
+        probabilities[hidden & (probabilities < 1e-12)] = 0.0
+        probabilities[hidden & (probabilities > 1 - 1e-12)] = 1.0
+        self.probabilities = probabilities
+        self.safe_moves = [tuple(cell) for cell in np.argwhere(hidden & (probabilities == 0.0)).tolist()]
+        self.known_mines = [tuple(cell) for cell in np.argwhere(hidden & (probabilities == 1.0)).tolist()]
+
+    def _combine(self, solutions: List[ComponentSolution], unconstrained: int, remaining: int,
+                 probabilities: np.ndarray) -> float:
+        """Weight component solutions by the ways to place the leftover mines.
+
+        A combination with K frontier mines is weighted by C(unconstrained,
+        remaining - K). Writes component cell probabilities into the matrix and
+        returns the probability for each unconstrained cell.
+        """
+        dists = [solution.totals for solution in solutions]
+        # prefix[i]: mine-count distribution of components before i; suffix[i]: from i on
+        prefix = [np.ones(1)]
+        for dist in dists:
+            prefix.append(np.convolve(prefix[-1], dist))
+        suffix = [np.ones(1)]
+        for dist in reversed(dists):
+            suffix.append(np.convolve(suffix[-1], dist))
+        suffix.reverse()
+        combined = prefix[-1]
+
+        weights = np.zeros(len(combined))
+        log_weights = {}
+        for k in range(len(combined)):
+            left = remaining - k
+            if 0 <= left <= unconstrained:
+                log_weights[k] = (math.lgamma(unconstrained + 1) - math.lgamma(left + 1) -
+                                  math.lgamma(unconstrained - left + 1))
+        if not log_weights:
+            # The flags or the grid contradict the mine count; nothing is consistent
+            return 0.0
+        peak = max(log_weights.values())
+        for k, log_weight in log_weights.items():
+            weights[k] = math.exp(log_weight - peak)
+
+        norm = float(np.dot(combined, weights))
+        if norm <= 0:
+            return 0.0
+
+        for i, solution in enumerate(solutions):
+            others = np.convolve(prefix[i], suffix[i + 1])
+            # weight_by_k[k]: total weight of everything else when this component holds k mines
+            weight_by_k = np.array([np.dot(others, weights[k:k + len(others)])
+                                    for k in range(len(solution.totals))])
+            cell_probabilities = weight_by_k @ solution.mine_counts / norm
+            for (row, col), probability in zip(solution.cells, cell_probabilities):
+                probabilities[row, col] = probability
+
+        if unconstrained == 0:
+            return 0.0
+        expected_left = np.array([remaining - k for k in range(len(combined))], dtype=np.float64)
+        return float(np.dot(combined * weights, expected_left) / norm / unconstrained)
+
+    def best_guess(self) -> Optional[Cell]:
+        """Return the hidden cell least likely to be a mine, or None if none is hidden."""
+        hidden = self._known == CELL_HIDDEN
+        if not hidden.any():
+            return None
+        masked = np.where(hidden, self.probabilities, np.inf)
+        row, col = np.unravel_index(int(np.argmin(masked)), masked.shape)
+        return int(row), int(col)
+
+    def play_safe_moves(self) -> bool:
+        """Reveal proven-safe cells until none are left; returns True if the game is won.
+
+        Used to check boards for the no-guess property: a board passes if this
+        wins after the opening reveal.
+        """
+        self.update()
+        while self.safe_moves and not self.grid.game_over:
+            for row, col in self.safe_moves:
+                self.grid.reveal(row, col)
+            self.update()
+        return self.grid.won
@@ -0,0 +1,42 @@
+"""Solver benchmark: solves every entry in LEVELS and reports throughput and peak RSS."""
+
+import sys
+from config import *
+from entities import GameState
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MB, or 0.0 if unknown."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main() -> int:
+    """Solve each level with the configured time and state budgets."""
+    print(f"Budget: {SOLVER_TIME_LIMIT:.1f}s, {SOLVER_MAX_STATES} states per level")
+    print(f"{'level':>5} {'status':>10} {'pushes':>6} {'moves':>6} {'expanded':>9} "
+          f"{'generated':>9} {'time(s)':>8} {'states/s':>10} {'rss(MB)':>8}")
+
+    failures = 0
+    for level_index in range(len(LEVELS)):
+        state = GameState(level_index)
+        result = state.solve()
+        if result.status == "limit":
+            failures += 1
+        print(f"{level_index + 1:>5} {result.status:>10} {result.pushes:>6} {len(result.moves):>6} "
+              f"{result.states_expanded:>9} {result.states_generated:>9} {result.elapsed:>8.3f} "
+              f"{result.states_per_second:>10.0f} {peak_rss_mb():>8.1f}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -47,6 +47,13 @@ PENALTY_INVALID = -0.5
 # Frame rate
 FPS = 60
 
+# Solver
+SOLVER_TIME_LIMIT = 10.0  # seconds per solve
+SOLVER_MAX_STATES = 2000000  # distinct states kept before giving up
+CORRAL_STATE_LIMIT = 200  # states searched per corral deadlock check
+SOLVER_STEP_DELAY = 120  # ms between auto-played solution moves
+ZOBRIST_SEED = 20260208
+
 # Level layouts (# = wall, . = floor, @ = worker, $ = box, * = target, + = worker on target, % = box on target)
 LEVELS = [
     [
@@ -2,6 +2,7 @@
 
 from typing import List, Tuple, Optional, Set
 from config import *
+from solver import LevelAnalysis, SokobanSolver, SolveResult
 
 
 class GameState:
@@ -20,6 +21,8 @@ class GameState:
         self.level_complete = False
         self.game_won = False
         self.deadlocked = False
+        self.analysis: Optional[LevelAnalysis] = None
+        self.solver: Optional[SokobanSolver] = None
 
         self._load_level(level_index)
 
@@ -66,6 +69,9 @@ class GameState:
                     grid_row.append(STATE_FLOOR)
             self.grid.append(grid_row)
 
+        self.analysis = LevelAnalysis(self.grid, self.targets)
+        self.solver = SokobanSolver(self.analysis)
+
     def move(self, dx: int, dy: int) -> bool:
         """Attempt to move the worker. Returns True if move was successful."""
         if self.level_complete or self.deadlocked:
@@ -112,7 +118,7 @@ class GameState:
                 self.total_reward += REWARD_BOX_ON_TARGET
 
             # Check for deadlock after box push
-            self._check_deadlock()
+            self._check_deadlock((box_new_x, box_new_y), (new_x, new_y))
 
         # Move the worker
         self.worker_pos = (new_x, new_y)
@@ -135,48 +141,18 @@ class GameState:
             self.game_won = True
         self.total_reward += REWARD_LEVEL_COMPLETE
 
-    def _check_deadlock(self) -> None:
-        """Check if any box is in a deadlock position (cannot be moved to a target)."""
-        for box in self.boxes:
-            if box in self.targets:
-                continue
+    def _check_deadlock(self, box: Tuple[int, int], worker: Tuple[int, int]) -> None:
+        """Check if the push that just moved a box created a deadlock.
 
-            x, y = box
-            # A box is deadlocked if it's in a corner and not on a target
-            # Check if adjacent cells are walls
-            walls = 0
-            if x > 0 and self.grid[x - 1][y] == STATE_WALL:
-                walls += 1
-            if x < self.rows - 1 and self.grid[x + 1][y] == STATE_WALL:
-                walls += 1
-            if y > 0 and self.grid[x][y - 1] == STATE_WALL:
-                walls += 1
-            if y < self.cols - 1 and self.grid[x][y + 1] == STATE_WALL:
-                walls += 1
-
-            # Check if boxed in by other boxes
-            boxes = 0
-            if (x - 1, y) in self.boxes:
-                boxes += 1
-            if (x + 1, y) in self.boxes:
-                boxes += 1
-            if (x, y - 1) in self.boxes:
-                boxes += 1
-            if (x, y + 1) in self.boxes:
-                boxes += 1
-
-            obstacles = walls + boxes
-            if obstacles >= 2:
-                # Check if it's a corner deadlock
-                horizontal_blocked = (x > 0 and self.grid[x - 1][y] == STATE_WALL) or \
-                                    (x < self.rows - 1 and self.grid[x + 1][y] == STATE_WALL) or \
-                                    ((x - 1, y) in self.boxes) or ((x + 1, y) in self.boxes)
-                vertical_blocked = (y > 0 and self.grid[x][y - 1] == STATE_WALL) or \
-                                  (y < self.cols - 1 and self.grid[x][y + 1] == STATE_WALL) or \
-                                  ((x, y - 1) in self.boxes) or ((x, y + 1) in self.boxes)
-
-                if horizontal_blocked and vertical_blocked:
-                    self.deadlocked = True
+        Only the pushed box is examined (dead squares, freeze and corral
+        deadlocks); boxes that were not moved cannot have become stuck.
+        """
+        if self.solver.push_deadlock(self.boxes, worker, box):
+            self.deadlocked = True
+
+    def solve(self) -> SolveResult:
+        """Search for a push-optimal solution from the current position."""
+        return self.solver.solve(self.boxes, self.worker_pos)
 
     def next_level(self) -> None:
         """Advance to the next level."""
@@ -1,6 +1,8 @@
 """Main game logic for Vector Sokoban Warehouse Logic."""
 
 import pygame
+from collections import deque
+from typing import Deque, Tuple
 from config import *
 from entities import GameState
 
@@ -18,6 +20,9 @@ class Game:
         self.large_font = pygame.font.Font(None, 48)
 
         self.game_state = GameState()
+        self.solution: Deque[Tuple[int, int]] = deque()
+        self.solver_message = ""
+        self.last_step_time = 0
 
     def handle_input(self) -> bool:
         """Handle keyboard input."""
@@ -31,9 +36,14 @@ class Game:
 
                 if event.key == pygame.K_r:
                     self.game_state.reset_level()
+                    self._clear_solution()
 
                 if event.key == pygame.K_n and self.game_state.level_complete:
                     self.game_state.next_level()
+                    self._clear_solution()
+
+                if event.key == pygame.K_f:
+                    self._start_solver()
 
                 # Movement
                 dx, dy = 0, 0
@@ -47,13 +57,41 @@ class Game:
                     dy = 1
 
                 if dx != 0 or dy != 0:
+                    self.solution.clear()
                     self.game_state.move(dx, dy)
 
         return True
 
+    def _start_solver(self) -> None:
+        """Solve from the current position and queue the solution for playback."""
+        if self.game_state.level_complete or self.game_state.deadlocked:
+            return
+        result = self.game_state.solve()
+        if result.solved:
+            self.solution = deque(result.moves)
+            self.solver_message = f"Solver: {result.pushes} pushes, {result.states_expanded} states"
+        elif result.status == "unsolvable":
+            self.solution.clear()
+            self.solver_message = "Solver: no solution"
+        else:
+            self.solution.clear()
+            self.solver_message = "Solver: search limit reached"
+        self.last_step_time = pygame.time.get_ticks()
+
+    def _clear_solution(self) -> None:
+        """Drop any queued solution moves and the solver status."""
+        self.solution.clear()
+        self.solver_message = ""
+
     def update(self) -> None:
         """Update game state."""
-        pass
+        if not self.solution:
+            return
+        now = pygame.time.get_ticks()
+        if now - self.last_step_time >= SOLVER_STEP_DELAY:
+            self.last_step_time = now
+            dx, dy = self.solution.popleft()
+            self.game_state.move(dx, dy)
 
     def draw(self) -> None:
         """Render the game."""
@@ -97,11 +135,16 @@ class Game:
         reward_text = self.small_font.render(f"Reward: {self.game_state.total_reward:.1f}", True, COLOR_TEXT_DIM)
         self.screen.blit(reward_text, (SCREEN_WIDTH // 2 - reward_text.get_width() // 2, 50))
 
+        # Solver status
+        if self.solver_message:
+            solver_text = self.small_font.render(self.solver_message, True, COLOR_TEXT_DIM)
+            self.screen.blit(solver_text, (SCREEN_WIDTH // 2 - solver_text.get_width() // 2, 30))
+
         # Controls
         controls_text = self.small_font.render("Arrow Keys / WASD: Move", True, COLOR_TEXT_DIM)
         self.screen.blit(controls_text, (SCREEN_WIDTH - controls_text.get_width() - 20, 15))
 
-        restart_text = self.small_font.render("R: Restart | N: Next Level", True, COLOR_TEXT_DIM)
+        restart_text = self.small_font.render("R: Restart | N: Next Level | F: Solve", True, COLOR_TEXT_DIM)
         self.screen.blit(restart_text, (SCREEN_WIDTH - restart_text.get_width() - 20, 40))
 
     def _draw_grid(self) -> None:
@@ -0,0 +1,473 @@
+"""Deadlock tables and push-optimal A* solver for Sokoban."""
+
+import heapq
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from config import *
+
+# Worker moves as (dx, dy) row/column deltas, in the same order as the cell offsets
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+UNREACHABLE = 1 << 30
+
+
+@dataclass
+class SolveResult:
+    """Outcome of a solver run."""
+
+    status: str  # "solved", "unsolvable" or "limit"
+    moves: List[Tuple[int, int]] = field(default_factory=list)
+    pushes: int = 0
+    states_expanded: int = 0
+    states_generated: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def solved(self) -> bool:
+        return self.status == "solved"
+
+    @property
+    def states_per_second(self) -> float:
+        return self.states_expanded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class LevelAnalysis:
+    """Static tables for one level: dead squares, push distances and Zobrist keys.
+
+    Cells are addressed by a flat index into the level padded with a one-tile wall
+    border, so neighbour lookups never need bounds checks.
+    """
+
+    def __init__(self, grid: List[List[int]], targets: Set[Tuple[int, int]]):
+        self.rows = len(grid)
+        self.cols = max((len(row) for row in grid), default=0)
+        self.width = self.cols + 2
+        self.size = (self.rows + 2) * self.width
+        self.offsets = [dx * self.width + dy for dx, dy in DIRECTIONS]
+
+        self.wall = bytearray([1]) * self.size
+        for row_idx, row in enumerate(grid):
+            for col_idx, tile in enumerate(row):
+                if tile != STATE_WALL:
+                    self.wall[self.cell(row_idx, col_idx)] = 0
+
+        self.target = bytearray(self.size)
+        self.target_cells = sorted(self.cell(r, c) for r, c in targets)
+        for cell in self.target_cells:
+            self.target[cell] = 1
+
+        # distances[i][cell]: pushes needed to bring a lone box from cell to target i
+        self.distances = [self._pull_distances(target) for target in self.target_cells]
+        self.dead = bytearray(self.size)
+        for cell in range(self.size):
+            if not self.wall[cell] and all(d[cell] == UNREACHABLE for d in self.distances):
+                self.dead[cell] = 1
+
+        rng = random.Random(ZOBRIST_SEED)
+        self.zobrist_box = [rng.getrandbits(64) for _ in range(self.size)]
+        self.zobrist_worker = [rng.getrandbits(64) for _ in range(self.size)]
+
+    def cell(self, row: int, col: int) -> int:
+        """Return the flat cell index of a grid position."""
+        return (row + 1) * self.width + col + 1
+
+    def position(self, cell: int) -> Tuple[int, int]:
+        """Return the grid position of a flat cell index."""
+        row, col = divmod(cell, self.width)
+        return row - 1, col - 1
+
+    def is_dead_square(self, row: int, col: int) -> bool:
+        """Check if a box on this square can never reach any target."""
+        return bool(self.dead[self.cell(row, col)])
+
+    def _pull_distances(self, target: int) -> List[int]:
+        """Breadth-first search of box pulls away from a target, ignoring other boxes."""
+        dist = [UNREACHABLE] * self.size
+        dist[target] = 0
+        queue = [target]
+        for cell in queue:
+            for off in self.offsets:
+                # The box reached cell by being pushed from cell - off,
+                # with the worker standing at cell - 2 * off
+                src = cell - off
+                if self.wall[src] or self.wall[src - off] or dist[src] != UNREACHABLE:
+                    continue
+                dist[src] = dist[cell] + 1
+                queue.append(src)
+        return dist
+
+    def freeze_deadlock(self, cell: int, occupied: bytearray) -> bool:
+        """Check if the box on cell is frozen together with a box that is off target."""
+        frozen: Set[int] = set()
+        if not self._is_frozen(cell, occupied, set(), frozen):
+            return False
+        return any(not self.target[box] for box in frozen)
+
+    def _is_frozen(self, cell: int, occupied: bytearray, visiting: Set[int], frozen: Set[int]) -> bool:
+        """Check if a box can move along neither axis; boxes being checked count as walls."""
+        visiting.add(cell)
+        for off in (1, self.width):
+            before = cell - off
+            after = cell + off
+            if self.wall[before] or self.wall[after]:
+                continue
+            if self.dead[before] and self.dead[after]:
+                continue
+            if before in visiting or after in visiting:
+                continue
+            if occupied[before] and self._is_frozen(before, occupied, visiting, frozen):
+                continue
+            if occupied[after] and self._is_frozen(after, occupied, visiting, frozen):
+                continue
+            visiting.discard(cell)
+            return False
+        frozen.add(cell)
+        return True
+
+
+class SokobanSolver:
+    """A* search over box pushes with deadlock pruning and Zobrist-hashed states.
+
+    The heuristic is the minimum-cost matching of boxes to targets over the
+    precomputed push distances, which never overestimates the pushes left, so
+    the first solution found is push-optimal.
+    """
+
+    def __init__(self, analysis: LevelAnalysis, time_limit: float = SOLVER_TIME_LIMIT,
+                 max_states: int = SOLVER_MAX_STATES):
+        self.analysis = analysis
+        self.time_limit = time_limit
+        self.max_states = max_states
+        self._heuristic_cache: Dict[Tuple[int, ...], int] = {}
+        self._corral_cache: Dict[Tuple[Tuple[int, ...], int, FrozenSet[int]], bool] = {}
+
+    def solve(self, boxes: Set[Tuple[int, int]], worker: Tuple[int, int]) -> SolveResult:
+        """Find a push-optimal solution from the given boxes and worker position."""
+        level = self.analysis
+        start_time = time.perf_counter()
+        start_boxes = tuple(sorted(level.cell(r, c) for r, c in boxes))
+        start_worker = level.cell(*worker)
+
+        if len(start_boxes) > len(level.target_cells):
+            return SolveResult("unsolvable", elapsed=time.perf_counter() - start_time)
+
+        occupied = bytearray(level.size)
+        for box in start_boxes:
+            occupied[box] = 1
+        start_h = self._heuristic(start_boxes)
+        if start_h >= UNREACHABLE or any(level.freeze_deadlock(b, occupied) for b in start_boxes):
+            return SolveResult("unsolvable", elapsed=time.perf_counter() - start_time)
+
+        reach, start_norm = self._reach(start_worker, occupied)
+        box_hash = 0
+        for box in start_boxes:
+            box_hash ^= level.zobrist_box[box]
+        start_key = box_hash ^ level.zobrist_worker[start_norm]
+
+        best_g: Dict[int, int] = {start_key: 0}
+        parents: Dict[int, Optional[Tuple[int, int, int]]] = {start_key: None}
+        counter = 0
+        open_heap = [(start_h, start_h, counter, 0, start_key, box_hash, start_boxes, start_worker)]
+        expanded = 0
+
+        while open_heap:
+            _, _, _, g, key, box_hash, state_boxes, state_worker = heapq.heappop(open_heap)
+            if best_g[key] < g:
+                continue
+
+            if all(level.target[box] for box in state_boxes):
+                pushes = self._trace_pushes(key, parents)
+                return SolveResult("solved", self._replay(start_boxes, start_worker, pushes),
+                                   len(pushes), expanded, len(best_g), time.perf_counter() - start_time)
+
+            expanded += 1
+            if expanded & 255 == 0 and time.perf_counter() - start_time > self.time_limit:
+                return SolveResult("limit", states_expanded=expanded, states_generated=len(best_g),
+                                   elapsed=time.perf_counter() - start_time)
+            if len(best_g) > self.max_states:
+                return SolveResult("limit", states_expanded=expanded, states_generated=len(best_g),
+                                   elapsed=time.perf_counter() - start_time)
+
+            for box in state_boxes:
+                occupied[box] = 1
+            reach, _ = self._reach(state_worker, occupied)
+
+            for box in state_boxes:
+                for direction, off in enumerate(level.offsets):
+                    dst = box + off
+                    if (not reach[box - off] or level.wall[dst] or occupied[dst] or
+                            level.dead[dst]):
+                        continue
+
+                    occupied[box] = 0
+                    occupied[dst] = 1
+                    child_key = None
+                    if not level.freeze_deadlock(dst, occupied):
+                        child_reach, child_norm = self._reach(box, occupied)
+                        if not self._corral_deadlock(dst, box, occupied, child_reach):
+                            child_box_hash = box_hash ^ level.zobrist_box[box] ^ level.zobrist_box[dst]
+                            child_key = child_box_hash ^ level.zobrist_worker[child_norm]
+                    occupied[dst] = 0
+                    occupied[box] = 1
+                    if child_key is None:
+                        continue
+
+                    child_g = g + 1
+                    if best_g.get(child_key, UNREACHABLE) <= child_g:
+                        continue
+                    child_boxes = tuple(sorted(dst if b == box else b for b in state_boxes))
+                    h = self._heuristic(child_boxes)
+                    if h >= UNREACHABLE:
+                        continue
+                    best_g[child_key] = child_g
+                    parents[child_key] = (key, box, direction)
+                    counter += 1
+                    heapq.heappush(open_heap, (child_g + h, h, counter, child_g, child_key,
+                                               child_box_hash, child_boxes, box))
+
+            for box in state_boxes:
+                occupied[box] = 0
+
+        return SolveResult("unsolvable", states_expanded=expanded, states_generated=len(best_g),
+                           elapsed=time.perf_counter() - start_time)
+
+    def push_deadlock(self, boxes: Set[Tuple[int, int]], worker: Tuple[int, int],
+                      pushed: Tuple[int, int]) -> bool:
+        """Check if the push that just moved a box to `pushed` created a deadlock.
+
+        Only the pushed box and the area around it are examined: the dead-square
+        table, a freeze check and a corral check.
+        """
+        level = self.analysis
+        dst = level.cell(*pushed)
+        if level.dead[dst]:
+            return True
+        occupied = bytearray(level.size)
+        for row, col in boxes:
+            occupied[level.cell(row, col)] = 1
+        if level.freeze_deadlock(dst, occupied):
+            return True
+        reach, _ = self._reach(level.cell(*worker), occupied)
+        return self._corral_deadlock(dst, level.cell(*worker), occupied, reach)
+
+    def _reach(self, worker: int, occupied: bytearray) -> Tuple[bytearray, int]:
+        """Flood the worker's reachable area; returns it and its lowest cell index."""
+        level = self.analysis
+        wall = level.wall
+        seen = bytearray(level.size)
+        seen[worker] = 1
+        queue = [worker]
+        lowest = worker
+        for cell in queue:
+            if cell < lowest:
+                lowest = cell
+            for off in level.offsets:
+                nxt = cell + off
+                if not seen[nxt] and not wall[nxt] and not occupied[nxt]:
+                    seen[nxt] = 1
+                    queue.append(nxt)
+        return seen, lowest
+
+    def _heuristic(self, boxes: Tuple[int, ...]) -> int:
+        """Minimum total push distance over all box-to-target matchings."""
+        cached = self._heuristic_cache.get(boxes)
+        if cached is None:
+            cost = [[d[box] for d in self.analysis.distances] for box in boxes]
+            cached = min_cost_matching(cost)
+            self._heuristic_cache[boxes] = cached
+        return cached
+
+    def _corral_deadlock(self, pushed: int, worker: int, occupied: bytearray, reach: bytearray) -> bool:
+        """Check if the pushed box closed off an area that can no longer be solved.
+
+        Only corrals whose boxes can be pushed solely into the corral are tested.
+        The boxes around the corral are then searched on their own, with every
+        other box removed; removing boxes only makes the puzzle easier, so if
+        they cannot all reach targets or open the corral, the state is dead.
+        """
+        level = self.analysis
+        corral: Set[int] = set()
+        corral_boxes: Set[int] = set()
+        for off in level.offsets:
+            seed = pushed + off
+            if level.wall[seed] or occupied[seed] or reach[seed] or seed in corral:
+                continue
+            corral.add(seed)
+            stack = [seed]
+            while stack:
+                cell = stack.pop()
+                for step in level.offsets:
+                    nxt = cell + step
+                    if level.wall[nxt] or nxt in corral:
+                        continue
+                    if occupied[nxt]:
+                        corral_boxes.add(nxt)
+                    elif not reach[nxt]:
+                        corral.add(nxt)
+                        stack.append(nxt)
+        if not corral:
+            return False
+        if (all(level.target[box] for box in corral_boxes) and
+                not any(level.target[cell] for cell in corral)):
+            return False
+
+        for box in corral_boxes:
+            for off in level.offsets:
+                dst = box + off
+                if (reach[box - off] and not level.wall[dst] and not occupied[dst] and
+                        not level.dead[dst] and dst not in corral):
+                    return False
+
+        return self._corral_unsolvable(tuple(sorted(corral_boxes)), worker, corral)
+
+    def _corral_unsolvable(self, boxes: Tuple[int, ...], worker: int, corral: Set[int]) -> bool:
+        """Exhaustively search the reduced corral puzzle within CORRAL_STATE_LIMIT states."""
+        level = self.analysis
+        occupied = bytearray(level.size)
+        for box in boxes:
+            occupied[box] = 1
+        _, norm = self._reach(worker, occupied)
+        # The verdict depends on which cells must stay closed off, not just the boxes
+        cache_key = (boxes, norm, frozenset(corral))
+        cached = self._corral_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = True
+        seen = {(boxes, norm)}
+        queue = [(boxes, worker)]
+        for state_boxes, state_worker in queue:
+            if len(seen) > CORRAL_STATE_LIMIT:
+                result = False
+                break
+            occupied = bytearray(level.size)
+            for box in state_boxes:
+                occupied[box] = 1
+            reach, _ = self._reach(state_worker, occupied)
+            if all(level.target[box] for box in state_boxes) or any(reach[cell] for cell in corral):
+                result = False
+                break
+            for box in state_boxes:
+                for off in level.offsets:
+                    dst = box + off
+                    if (not reach[box - off] or level.wall[dst] or occupied[dst] or
+                            level.dead[dst]):
+                        continue
+                    occupied[box] = 0
+                    occupied[dst] = 1
+                    if not level.freeze_deadlock(dst, occupied):
+                        child_boxes = tuple(sorted(dst if b == box else b for b in state_boxes))
+                        _, child_norm = self._reach(box, occupied)
+                        if (child_boxes, child_norm) not in seen:
+                            seen.add((child_boxes, child_norm))
+                            queue.append((child_boxes, box))
+                    occupied[dst] = 0
+                    occupied[box] = 1
+
+        self._corral_cache[cache_key] = result
+        return result
+
+    def _trace_pushes(self, key: int, parents: Dict[int, Optional[Tuple[int, int, int]]]) -> List[Tuple[int, int]]:
+        """Walk parent links back to the start and return (box cell, direction) pushes."""
+        pushes = []
+        link = parents[key]
+        while link is not None:
+            key, box, direction = link
+            pushes.append((box, direction))
+            link = parents[key]
+        pushes.reverse()
+        return pushes
+
+    def _replay(self, boxes: Tuple[int, ...], worker: int, pushes: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Expand a push sequence into single-step worker moves."""
+        level = self.analysis
+        occupied = bytearray(level.size)
+        for box in boxes:
+            occupied[box] = 1
+        moves = []
+        for box, direction in pushes:
+            off = level.offsets[direction]
+            moves.extend(self._walk(worker, box - off, occupied))
+            moves.append(DIRECTIONS[direction])
+            occupied[box] = 0
+            occupied[box + off] = 1
+            worker = box
+        return moves
+
+    def _walk(self, start: int, goal: int, occupied: bytearray) -> List[Tuple[int, int]]:
+        """Shortest worker path between two cells, as a list of moves."""
+        level = self.analysis
+        came_from = {start: None}
+        queue = [start]
+        for cell in queue:
+            if cell == goal:
+                break
+            for direction, off in enumerate(level.offsets):
+                nxt = cell + off
+                if nxt not in came_from and not level.wall[nxt] and not occupied[nxt]:
+                    came_from[nxt] = (cell, direction)
+                    queue.append(nxt)
+        path = []
+        link = came_from[goal]
+        while link is not None:
+            cell, direction = link
+            path.append(DIRECTIONS[direction])
+            link = came_from[cell]
+        path.reverse()
+        return path
+
+
+def min_cost_matching(cost: List[List[int]]) -> int:
+    """Hungarian algorithm: cheapest assignment of each row to a distinct column.
+
+    Rows must not outnumber columns. Returns UNREACHABLE if every complete
+    assignment uses an UNREACHABLE entry.
+    """
+    n = len(cost)
+    if n == 0:
+        return 0
+    m = len(cost[0])
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    match = [0] * (m + 1)  # match[j]: row assigned to column j (1-based, 0 = free)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        minv = [float('inf')] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            delta = float('inf')
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = cost[i0 - 1][j - 1] - u[i0] - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    total = 0
+    for j in range(1, m + 1):
+        if match[j]:
+            total += cost[match[j] - 1][j - 1]
+    return total if total < UNREACHABLE else UNREACHABLE
@@ -0,0 +1,418 @@
+"""Headless batch environment running N Tetris games in lockstep.
+
+Each board is stored as one integer bitmask per row (bit c is column c) in an
+(N, H + 2 * PAD) NumPy array whose PAD rows above and below are solid, so a
+piece is tested against the board with one AND per piece row and no bounds
+checks. Every step is a handful of NumPy operations over all games, and the
+rules (actions, wall kicks, 7-bag, rewards) follow GameState.get_action_result.
+pygame is never imported.
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+from config import *
+from entities import Tetromino
+
+PAD = 4
+FULL_ROW = (1 << GRID_WIDTH) - 1
+# Anchor columns covered by the piece tables; anything outside never fits
+COL_PAD = 4
+NUM_COLS = GRID_WIDTH + 2 * COL_PAD
+# Orientation 0 is the spawn layout; 1..4 are the normalised layouts after 1..4 clockwise turns
+NUM_ORIENTS = 5
+NEXT_ORIENT = np.array([1, 2, 3, 4, 1], dtype=np.int64)
+# ROW_CELLS[mask] is the (W,) 0/1 cell row of a row bitmask, used to unpack observations
+ROW_CELLS = ((np.arange(FULL_ROW + 1)[:, None] >> np.arange(GRID_WIDTH)) & 1).astype(np.uint8)
+LINE_SCORES = np.array([0, SCORE_1_LINE, SCORE_2_LINES, SCORE_3_LINES, SCORE_4_LINES], dtype=np.int64)
+
+ACTION_LEFT, ACTION_RIGHT, ACTION_DOWN, ACTION_ROTATE, ACTION_DROP, ACTION_HOLD = range(6)
+NUM_ACTIONS = 6
+
+
+def _build_tables():
+    """Precompute per (shape, orientation, anchor column) row masks and layout data."""
+    num_shapes = len(SHAPE_ORDER)
+    masks = np.zeros((num_shapes, NUM_ORIENTS, NUM_COLS, 4), dtype=np.int64)
+    in_bounds = np.zeros((num_shapes, NUM_ORIENTS, NUM_COLS), dtype=bool)
+    top = np.zeros((num_shapes, NUM_ORIENTS), dtype=np.int64)
+    # bottom[s, o, ci, x]: lowest block offset of the piece in board column x, or -1 if uncovered
+    bottom = np.full((num_shapes, NUM_ORIENTS, NUM_COLS, GRID_WIDTH), -1, dtype=np.int64)
+    spawn_row = np.zeros(num_shapes, dtype=np.int64)
+    kicks = np.zeros((num_shapes, 4, 5, 2), dtype=np.int64)
+
+    for s, shape_type in enumerate(SHAPE_ORDER):
+        piece = Tetromino(shape_type)
+        spawn_row[s] = piece.row
+        kicks[s] = WALL_KICKS['I'] if shape_type == 'I' else WALL_KICKS['normal']
+        layouts = [piece.blocks]
+        for _ in range(4):
+            piece.blocks = piece.rotate(1)
+            layouts.append(piece.blocks)
+
+        for o, blocks in enumerate(layouts):
+            top[s, o] = min(r for r, _ in blocks)
+            for ci in range(NUM_COLS):
+                col = ci - COL_PAD
+                columns = [col + c for _, c in blocks]
+                in_bounds[s, o, ci] = all(0 <= x < GRID_WIDTH for x in columns)
+                if not in_bounds[s, o, ci]:
+                    continue
+                for r, c in blocks:
+                    masks[s, o, ci, r - top[s, o]] |= 1 << (col + c)
+                    bottom[s, o, ci, col + c] = max(bottom[s, o, ci, col + c], r)
+    return masks, in_bounds, top, bottom, spawn_row, kicks
+
+
+PIECE_MASKS, PIECE_IN_BOUNDS, PIECE_TOP, PIECE_BOTTOM, SPAWN_ROW, KICKS = _build_tables()
+
+
+def _placement_tables():
+    """Precompute straight-drop data for the 4 x W placements of every shape.
+
+    For placement p = (rotation - 1) * W + column, index[s, p, j] and
+    offset[s, p, j] describe the piece's j-th column: the entry of the
+    flattened (4, W) "first filled row below offset row k in column x" table
+    to read, and 1 + k to subtract from it. Unused entries get an offset that
+    never limits the drop. valid[s, rotation - 1, column] marks in-bounds
+    placements, keeping only the first of every distinct cell set, and
+    masks holds their row bitmasks.
+    """
+    num_shapes = len(SHAPE_ORDER)
+    index = np.zeros((num_shapes, 4 * GRID_WIDTH, 4), dtype=np.intp)
+    offset = np.full((num_shapes, 4 * GRID_WIDTH, 4), -2 * GRID_HEIGHT, dtype=np.int16)
+    valid = np.zeros((num_shapes, 4, GRID_WIDTH), dtype=bool)
+    for s in range(num_shapes):
+        seen = set()
+        for o in range(4):
+            for col in range(GRID_WIDTH):
+                ci = col + COL_PAD
+                if not PIECE_IN_BOUNDS[s, o + 1, ci]:
+                    continue
+                key = (PIECE_TOP[s, o + 1], tuple(PIECE_MASKS[s, o + 1, ci]))
+                if key not in seen:
+                    seen.add(key)
+                    valid[s, o, col] = True
+                covered = np.flatnonzero(PIECE_BOTTOM[s, o + 1, ci] >= 0)
+                for j, x in enumerate(covered):
+                    k = PIECE_BOTTOM[s, o + 1, ci, x]
+                    index[s, o * GRID_WIDTH + col, j] = k * GRID_WIDTH + x
+                    offset[s, o * GRID_WIDTH + col, j] = k + 1
+    masks = PIECE_MASKS[:, 1:, COL_PAD:COL_PAD + GRID_WIDTH].copy()
+    return index, offset, valid, masks
+
+
+PLACE_INDEX, PLACE_OFFSET, PLACE_VALID, PLACE_MASKS = _placement_tables()
+ROW_FILLED = ROW_CELLS.astype(bool)
+ROW_NUMBERS = np.arange(GRID_HEIGHT, dtype=np.int16)[:, None]
+
+
+class BatchTetrisEnv:
+    """N Tetris games stepped together with the GameState action set.
+
+    step(actions) takes one action per game (0=left, 1=right, 2=down,
+    3=rotate, 4=drop, 5=hold) and returns (observations, rewards, dones).
+    Observations are (N, H, W) uint8 grids with 1 for locked blocks and 2 for
+    the falling piece, or (N, H) row bitmasks with the piece ORed in when
+    packed=True. With auto_reset, finished games report done once and are
+    restarted in the same call.
+    """
+
+    def __init__(self, num_envs: int, seed: Optional[int] = None, packed: bool = False,
+                 auto_reset: bool = True):
+        self.num_envs = num_envs
+        self.packed = packed
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+
+        self.rows = np.zeros((num_envs, GRID_HEIGHT + 2 * PAD), dtype=np.int64)
+        self.board = self.rows[:, PAD:PAD + GRID_HEIGHT]
+        self.shape = np.zeros(num_envs, dtype=np.int64)
+        self.orient = np.zeros(num_envs, dtype=np.int64)
+        self.piece_row = np.zeros(num_envs, dtype=np.int64)
+        self.piece_col = np.zeros(num_envs, dtype=np.int64)
+        self.next_shape = np.zeros(num_envs, dtype=np.int64)
+        self.hold_shape = np.full(num_envs, -1, dtype=np.int64)
+        self.can_hold = np.ones(num_envs, dtype=bool)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.lines_cleared = np.zeros(num_envs, dtype=np.int64)
+        self.game_over = np.zeros(num_envs, dtype=bool)
+        self._bag = np.zeros((num_envs, len(SHAPE_ORDER)), dtype=np.int64)
+        self._bag_pos = np.full(num_envs, len(SHAPE_ORDER), dtype=np.int64)
+        self._all = np.arange(num_envs)
+        self._window = np.arange(4, dtype=np.int64)
+        self._drop_offsets = np.arange(GRID_HEIGHT + 1, dtype=np.int64)
+
+        self.reset()
+
+    # ------------------------------------------------------------------
+    # Episode control
+    # ------------------------------------------------------------------
+
+    def reset(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Restart every game, or only those selected by a boolean mask."""
+        self._reset(self._all if mask is None else np.flatnonzero(mask))
+        return self.observe()
+
+    def _reset(self, idx: np.ndarray) -> None:
+        """Restart the games in idx."""
+        if len(idx):
+            self.rows[idx] = 0
+            self.rows[idx, :PAD] = FULL_ROW
+            self.rows[idx, PAD + GRID_HEIGHT:] = FULL_ROW
+            self.score[idx] = 0
+            self.lines_cleared[idx] = 0
+            self.game_over[idx] = False
+            self.hold_shape[idx] = -1
+            self._bag_pos[idx] = len(SHAPE_ORDER)
+            current = self._draw(idx)
+            self.next_shape[idx] = self._draw(idx)
+            self._spawn(idx, current)
+
+    def _draw(self, idx: np.ndarray) -> np.ndarray:
+        """Take the next shape from each game's 7-bag, refilling empty bags."""
+        empty = idx[self._bag_pos[idx] == len(SHAPE_ORDER)]
+        if len(empty):
+            self._bag[empty] = np.argsort(self.rng.random((len(empty), len(SHAPE_ORDER))), axis=1)
+            self._bag_pos[empty] = 0
+        shapes = self._bag[idx, self._bag_pos[idx]]
+        self._bag_pos[idx] += 1
+        return shapes
+
+    def _spawn(self, idx: np.ndarray, shapes: np.ndarray) -> None:
+        """Put the given shapes at the spawn position; games where they do not fit are over."""
+        self.shape[idx] = shapes
+        self.orient[idx] = 0
+        self.piece_row[idx] = SPAWN_ROW[shapes]
+        self.piece_col[idx] = GRID_WIDTH // 2
+        self.can_hold[idx] = True
+        blocked = ~self._fits(idx, shapes, 0, self.piece_row[idx], self.piece_col[idx])
+        self.game_over[idx[blocked]] = True
+
+    # ------------------------------------------------------------------
+    # Collision
+    # ------------------------------------------------------------------
+
+    def _fits(self, idx, shapes, orients, rows, cols) -> np.ndarray:
+        """Test piece positions for the games in idx; every argument broadcasts against idx."""
+        ci = np.clip(cols + COL_PAD, 0, NUM_COLS - 1)
+        masks = PIECE_MASKS[shapes, orients, ci]
+        first = np.clip(rows + PIECE_TOP[shapes, orients] + PAD, 0, GRID_HEIGHT + PAD)
+        window = self.rows[idx[:, None], first[:, None] + self._window]
+        return PIECE_IN_BOUNDS[shapes, orients, ci] & ~(window & masks).any(axis=1)
+
+    def _landing_rows(self, idx: np.ndarray) -> np.ndarray:
+        """Row the current piece would hard-drop to, for the games in idx."""
+        shapes, orients = self.shape[idx], self.orient[idx]
+        ci = np.clip(self.piece_col[idx] + COL_PAD, 0, NUM_COLS - 1)
+        masks = PIECE_MASKS[shapes, orients, ci]
+        # Windows for every drop distance at once: (n, GRID_HEIGHT + 1, 4)
+        first = self.piece_row[idx] + PIECE_TOP[shapes, orients] + PAD
+        rows = np.clip(first[:, None, None] + self._drop_offsets[None, :, None] + self._window, 0,
+                       GRID_HEIGHT + 2 * PAD - 1)
+        window = self.rows[idx[:, None, None], rows]
+        blocked = (window & masks[:, None, :]).any(axis=2)
+        # The piece stops one row above its first blocked position below the current one
+        return self.piece_row[idx] + blocked[:, 1:].argmax(axis=1)
+
+    # ------------------------------------------------------------------
+    # Stepping
+    # ------------------------------------------------------------------
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Apply one action per game; returns (observations, rewards, dones)."""
+        actions = np.asarray(actions, dtype=np.int64)
+        rewards = np.zeros(self.num_envs, dtype=np.float64)
+        lines_before = self.lines_cleared.copy()
+        live = ~self.game_over
+
+        idx = np.flatnonzero(live & ((actions == ACTION_LEFT) | (actions == ACTION_RIGHT)))
+        if len(idx):
+            cols = self.piece_col[idx] + np.where(actions[idx] == ACTION_LEFT, -1, 1)
+            ok = self._fits(idx, self.shape[idx], self.orient[idx], self.piece_row[idx], cols)
+            self.piece_col[idx[ok]] = cols[ok]
+            rewards[idx] = np.where(ok, 0.1, -0.1)
+
+        idx = np.flatnonzero(live & (actions == ACTION_DOWN))
+        if len(idx):
+            rows = self.piece_row[idx] + 1
+            ok = self._fits(idx, self.shape[idx], self.orient[idx], rows, self.piece_col[idx])
+            self.piece_row[idx[ok]] = rows[ok]
+            self.score[idx[ok]] += SOFT_DROP_SCORE
+            rewards[idx] = np.where(ok, 1.0, -0.1)
+
+        idx = np.flatnonzero(live & (actions == ACTION_ROTATE))
+        if len(idx):
+            rewards[idx] = np.where(self._rotate(idx), 0.1, -0.1)
+
+        idx = np.flatnonzero(live & (actions == ACTION_DROP))
+        if len(idx):
+            landing = self._landing_rows(idx)
+            distance = landing - self.piece_row[idx]
+            self.piece_row[idx] = landing
+            self.score[idx] += distance * HARD_DROP_SCORE
+            rewards[idx] = distance * 2.0
+            self._lock(idx)
+
+        idx = np.flatnonzero(live & (actions == ACTION_HOLD))
+        if len(idx):
+            ok = self.can_hold[idx]
+            rewards[idx] = np.where(ok, 0.1, 0.0)
+            self._hold(idx[ok])
+
+        rewards += (self.lines_cleared - lines_before) * 100
+        return self._finish(rewards)
+
+    def _finish(self, rewards: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Collect done flags, auto-reset finished games and build the observations."""
+        dones = self.game_over.copy()
+        if self.auto_reset and dones.any():
+            self._reset(np.flatnonzero(dones))
+        return self.observe(), rewards, dones
+
+    def _rotate(self, idx: np.ndarray) -> np.ndarray:
+        """Rotate clockwise with wall kicks; returns which games rotated."""
+        shapes = self.shape[idx]
+        new_orients = NEXT_ORIENT[self.orient[idx]]
+        kick_index = (self.orient[idx] % 4 + 1) % 4
+        rotated = np.zeros(len(idx), dtype=bool)
+        # O does not rotate
+        pending = np.flatnonzero(shapes != SHAPE_ORDER.index('O'))
+        for k in range(5):
+            if not len(pending):
+                break
+            sub = idx[pending]
+            dx = KICKS[shapes[pending], kick_index[pending], k, 0]
+            dy = KICKS[shapes[pending], kick_index[pending], k, 1]
+            rows = self.piece_row[sub] + dy
+            cols = self.piece_col[sub] + dx
+            ok = self._fits(sub, shapes[pending], new_orients[pending], rows, cols)
+            done = sub[ok]
+            self.orient[done] = new_orients[pending[ok]]
+            self.piece_row[done] = rows[ok]
+            self.piece_col[done] = cols[ok]
+            rotated[pending[ok]] = True
+            pending = pending[~ok]
+        return rotated
+
+    def _hold(self, idx: np.ndarray) -> None:
+        """Swap the current piece with the held one (or the next piece if none is held)."""
+        if not len(idx):
+            return
+        current = self.shape[idx].copy()
+        held = self.hold_shape[idx]
+        empty = held < 0
+        incoming = np.where(empty, self.next_shape[idx], held)
+        if empty.any():
+            self.next_shape[idx[empty]] = self._draw(idx[empty])
+        self.hold_shape[idx] = current
+        self.shape[idx] = incoming
+        self.orient[idx] = 0
+        self.piece_row[idx] = SPAWN_ROW[incoming]
+        self.piece_col[idx] = GRID_WIDTH // 2
+        self.can_hold[idx] = False
+
+    def _lock(self, idx: np.ndarray) -> None:
+        """Write the current pieces into their boards, clear lines and spawn the next pieces."""
+        shapes, orients = self.shape[idx], self.orient[idx]
+        ci = np.clip(self.piece_col[idx] + COL_PAD, 0, NUM_COLS - 1)
+        first = self.piece_row[idx] + PIECE_TOP[shapes, orients] + PAD
+        # Rows within one game are distinct, so the fancy-indexed OR has no duplicates
+        rows = first[:, None] + self._window
+        self.rows[idx[:, None], rows] |= PIECE_MASKS[shapes, orients, ci]
+        self._clear_lines(idx)
+        self._spawn(idx, self.next_shape[idx])
+        self.next_shape[idx] = self._draw(idx)
+
+    def _clear_lines(self, idx: np.ndarray) -> None:
+        """Drop full rows, shifting the rows above them down, and score the clears."""
+        board = self.board[idx]
+        full = board == FULL_ROW
+        counts = full.sum(axis=1)
+        cleared = counts > 0
+        if not cleared.any():
+            return
+        idx, board, full, counts = idx[cleared], board[cleared], full[cleared], counts[cleared]
+        # Stable sort puts full rows first and keeps the others in order, then blank the full ones
+        key = np.where(full, -1, np.arange(GRID_HEIGHT))
+        board = np.take_along_axis(board, np.argsort(key, axis=1, kind='stable'), axis=1)
+        board[np.arange(GRID_HEIGHT) < counts[:, None]] = 0
+        self.board[idx] = board
+        self.lines_cleared[idx] += counts
+        self.score[idx] += LINE_SCORES[counts]
+
+    # ------------------------------------------------------------------
+    # Placements
+    # ------------------------------------------------------------------
+
+    def enumerate_placements(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return every final resting position of each game's current piece.
+
+        Returns (rows, valid), both shaped (N, 4, W) and indexed by
+        [game, rotation - 1, column]: rotation r is the layout after r
+        clockwise turns (4 is the spawn shape, normalised) and rows holds the
+        anchor row the piece rests at when dropped straight down in that
+        column from the top of the board (its spawn height). valid is False
+        where the piece does not fit at the top, and for duplicates of an
+        earlier placement with the same cells (e.g. the four O rotations).
+        """
+        n = self.num_envs
+        # first[g, r, x]: first filled row at or below row r in column x, GRID_HEIGHT if none
+        filled = np.where(ROW_FILLED[self.board], ROW_NUMBERS, np.int16(GRID_HEIGHT))
+        first = np.minimum.accumulate(filled[:, ::-1], axis=1)[:, ::-1]
+        # below[g, k * W + x]: first filled row under offset row k in column x
+        below = first[:, 1:5].reshape(n, -1)
+
+        # Normalised layouts start at offset row 0, so a piece starts with its top on row 0.
+        # Each piece column is a contiguous run ending at offset row k; it stops on the
+        # first filled cell under that run's start position.
+        limits = below[np.arange(n)[:, None], PLACE_INDEX[self.shape].reshape(n, -1)]
+        rows = (limits.reshape(n, 4 * GRID_WIDTH, 4) - PLACE_OFFSET[self.shape]).min(axis=2)
+        rows = rows.reshape(n, 4, GRID_WIDTH).astype(np.int64)
+
+        start_clear = ~(PLACE_MASKS[self.shape] & self.board[:, None, None, :4]).any(axis=3)
+        valid = PLACE_VALID[self.shape] & start_clear & ~self.game_over[:, None, None]
+        return rows, valid
+
+    def place(self, rotations, cols) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Lock each game's current piece at an enumerated placement.
+
+        rotations (1..4) and cols select an entry of enumerate_placements();
+        games given an invalid placement are ended. The reward is 100 per
+        cleared line, as in get_action_result.
+        """
+        rotations = np.asarray(rotations, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        rows, valid = self.enumerate_placements()
+        rewards = np.zeros(self.num_envs, dtype=np.float64)
+        ok = valid[self._all, rotations - 1, cols]
+        self.game_over |= ~ok
+
+        idx = np.flatnonzero(ok)
+        if len(idx):
+            lines_before = self.lines_cleared[idx].copy()
+            self.orient[idx] = rotations[idx]
+            self.piece_col[idx] = cols[idx]
+            self.piece_row[idx] = rows[idx, rotations[idx] - 1, cols[idx]]
+            self._lock(idx)
+            rewards[idx] = (self.lines_cleared[idx] - lines_before) * 100
+        return self._finish(rewards)
+
+    # ------------------------------------------------------------------
+    # Observations
+    # ------------------------------------------------------------------
+
+    def piece_rows(self) -> np.ndarray:
+        """Return (N, H) row bitmasks holding only each game's falling piece."""
+        padded = np.zeros_like(self.rows)
+        shapes, orients = self.shape, self.orient
+        ci = np.clip(self.piece_col + COL_PAD, 0, NUM_COLS - 1)
+        first = np.clip(self.piece_row + PIECE_TOP[shapes, orients] + PAD, 0, GRID_HEIGHT + PAD)
+        padded[self._all[:, None], first[:, None] + self._window] = PIECE_MASKS[shapes, orients, ci]
+        return padded[:, PAD:PAD + GRID_HEIGHT]
+
+    def observe(self) -> np.ndarray:
+        """Return the stacked observations of all games."""
+        piece = self.piece_rows()
+        if self.packed:
+            return self.board | piece
+        return ROW_CELLS[self.board] + 2 * ROW_CELLS[piece]
@@ -0,0 +1,70 @@
+"""Throughput benchmark: GameState.get_action_result versus BatchTetrisEnv."""
+
+import random
+import sys
+import time
+import numpy as np
+from config import *
+from entities import GameState
+from batch_env import BatchTetrisEnv, NUM_ACTIONS
+
+BATCH_SIZES = [1, 64, 1024, 4096]
+DURATION = 1.0
+SEED = 7
+
+
+def bench_legacy() -> float:
+    """Steps per second of a single GameState driven with random actions."""
+    random.seed(SEED)
+    state = GameState()
+    steps = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        for _ in range(1000):
+            _, done = state.get_action_result(random.randrange(NUM_ACTIONS))
+            if done:
+                state.reset()
+        steps += 1000
+    return steps / (time.perf_counter() - start)
+
+
+def bench_step(num_envs: int) -> float:
+    """Game steps per second of BatchTetrisEnv.step with random actions."""
+    env = BatchTetrisEnv(num_envs, seed=SEED)
+    rng = np.random.default_rng(SEED)
+    actions = rng.integers(0, NUM_ACTIONS, size=(256, num_envs))
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        env.step(actions[calls % len(actions)])
+        calls += 1
+    return calls * num_envs / (time.perf_counter() - start)
+
+
+def bench_placements(num_envs: int) -> float:
+    """Pieces per second placed with enumerate_placements and place, choosing the lowest placement."""
+    env = BatchTetrisEnv(num_envs, seed=SEED)
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        rows, valid = env.enumerate_placements()
+        flat = np.where(valid, rows, -1).reshape(num_envs, -1).argmax(axis=1)
+        env.place(flat // GRID_WIDTH + 1, flat % GRID_WIDTH)
+        calls += 1
+    return calls * num_envs / (time.perf_counter() - start)
+
+
+def main() -> int:
+    """Print steps per second for every configuration."""
+    print(f"{'configuration':<32} {'steps/s':>12}")
+    print(f"{'GameState (single game)':<32} {bench_legacy():>12,.0f}")
+    for num_envs in BATCH_SIZES:
+        print(f"{f'BatchTetrisEnv.step  N={num_envs}':<32} {bench_step(num_envs):>12,.0f}")
+    for num_envs in BATCH_SIZES:
+        print(f"{f'enumerate+place      N={num_envs}':<32} {bench_placements(num_envs):>12,.0f}")
+    print(f"pygame imported: {'pygame' in sys.modules}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,8 +14,8 @@ class Tetromino:
         self.color_index = SHAPE_ORDER.index(shape_type)
         self.rotation = 0  # 0, 1, 2, 3 representing 0, 90, 180, 270 degrees
 
-        # Starting position (centered at top)
-        self.row = 0
+        # Starting position (centered, with the topmost block on the first row)
+        self.row = -min(r for r, c in self.blocks)
         self.col = GRID_WIDTH // 2
 
     def get_blocks(self) -> list:
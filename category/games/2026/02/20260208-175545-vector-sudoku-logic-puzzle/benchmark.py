@@ -0,0 +1,98 @@
+"""Generation and solving benchmark: reports puzzles per second for each engine path."""
+
+import random
+import sys
+import time
+import config
+import engine
+
+SEED = 2024
+GENERATE_COUNT = 50
+SOLVE_COUNT = 200
+
+
+def legacy_solve(cells) -> bool:
+    """The former naive backtracking fill, rescanning row, column and box for every candidate."""
+    grid = engine.to_grid(cells)
+
+    def valid(row, col, num):
+        if num in grid[row]:
+            return False
+        if any(grid[r][col] == num for r in range(config.GRID_SIZE)):
+            return False
+        box_row = row // config.BOX_SIZE * config.BOX_SIZE
+        box_col = col // config.BOX_SIZE * config.BOX_SIZE
+        return all(grid[r][c] != num for r in range(box_row, box_row + config.BOX_SIZE)
+                   for c in range(box_col, box_col + config.BOX_SIZE))
+
+    def fill():
+        for row in range(config.GRID_SIZE):
+            for col in range(config.GRID_SIZE):
+                if grid[row][col] == config.EMPTY_CELL:
+                    for num in range(1, config.GRID_SIZE + 1):
+                        if valid(row, col, num):
+                            grid[row][col] = num
+                            if fill():
+                                return True
+                            grid[row][col] = config.EMPTY_CELL
+                    return False
+        return True
+
+    return fill()
+
+
+def rate(label: str, count: int, elapsed: float) -> None:
+    """Print one throughput line."""
+    print(f"  {label:<34} {count:>5} in {elapsed:7.3f}s  {count / elapsed:9.1f} puzzles/s")
+
+
+def timed(func, items):
+    """Run func over items and return the elapsed time."""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    """Benchmark generation at two clue targets, then solving the generated puzzles."""
+    rng = random.Random(SEED)
+
+    print("Generation (unique solution guaranteed)")
+    start = time.perf_counter()
+    game_range = [engine.generate_puzzle(rng.randint(config.MIN_CLUES, config.MAX_CLUES), rng)
+                  for _ in range(GENERATE_COUNT)]
+    rate(f"{config.MIN_CLUES}-{config.MAX_CLUES} clues", GENERATE_COUNT, time.perf_counter() - start)
+    start = time.perf_counter()
+    minimal = [engine.generate_puzzle(0, rng) for _ in range(GENERATE_COUNT)]
+    rate("minimal (no clue removable)", GENERATE_COUNT, time.perf_counter() - start)
+    start = time.perf_counter()
+    levels = [engine.rate_puzzle(puzzle) for puzzle, _ in minimal]
+    rate("difficulty rating", GENERATE_COUNT, time.perf_counter() - start)
+    print("  " + ", ".join(f"{name}: {levels.count(level)}"
+                           for level, name in enumerate(config.DIFFICULTY_NAMES)))
+
+    puzzles = [puzzle for puzzle, _ in minimal]
+    puzzles = (puzzles * (SOLVE_COUNT // len(puzzles) + 1))[:SOLVE_COUNT]
+    print(f"Solving {SOLVE_COUNT} minimal puzzles")
+    rate("DLX, first solution", SOLVE_COUNT, timed(lambda p: engine.DLXSolver(p).count_solutions(1), puzzles))
+    rate("DLX, uniqueness check (limit 2)", SOLVE_COUNT,
+         timed(lambda p: engine.DLXSolver(p).count_solutions(2), puzzles))
+    rate("bitmask, first solution", SOLVE_COUNT, timed(engine.solve_bitmask, puzzles))
+    rate("bitmask, uniqueness check (limit 2)", SOLVE_COUNT,
+         timed(lambda p: engine.BitmaskSolver(p).count_solutions(2), puzzles))
+    legacy = puzzles[:10]
+    rate("legacy backtracking, first solution", len(legacy), timed(legacy_solve, legacy))
+
+    mismatches = 0
+    for puzzle, solution in minimal:
+        solver = engine.DLXSolver(puzzle)
+        if solver.count_solutions(2) != 1 or solver.solution != solution or engine.solve_bitmask(puzzle) != solution:
+            mismatches += 1
+    if mismatches:
+        print(f"MISMATCH: {mismatches} puzzles did not solve back to their generated solution")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
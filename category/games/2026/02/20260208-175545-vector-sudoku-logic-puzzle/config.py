@@ -55,3 +55,10 @@ STATE_EMPTY = 0
 STATE_GIVEN = 1
 STATE_USER = 2
 STATE_ERROR = 3
+
+# Puzzle generation
+# Rated by the hardest technique a solve needs; "Extreme" puzzles need guessing
+DIFFICULTY_NAMES = ["Easy", "Medium", "Hard", "Expert", "Extreme"]
+PUZZLE_PACK_FILE = "puzzle_pack.txt"
+PUZZLE_PACK_SIZE = 2000
+PACK_MIN_CLUES = 24
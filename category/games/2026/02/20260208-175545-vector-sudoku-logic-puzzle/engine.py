@@ -0,0 +1,577 @@
+"""Sudoku solver core: bitmask candidates, dancing-links solver, rater and generator.
+
+Boards are flat lists of 81 ints in row-major order, 0 for an empty cell.
+Digit d is bit ``1 << (d - 1)`` in a candidate mask.
+"""
+
+import random
+from typing import List, Optional, Tuple
+import config
+
+SIZE = config.GRID_SIZE
+BOX = config.BOX_SIZE
+CELLS = SIZE * SIZE
+ALL_DIGITS = (1 << SIZE) - 1
+
+ROW_OF = [i // SIZE for i in range(CELLS)]
+COL_OF = [i % SIZE for i in range(CELLS)]
+BOX_OF = [(i // SIZE) // BOX * BOX + (i % SIZE) // BOX for i in range(CELLS)]
+
+ROWS = [[r * SIZE + c for c in range(SIZE)] for r in range(SIZE)]
+COLS = [[r * SIZE + c for r in range(SIZE)] for c in range(SIZE)]
+BOXES = [[i for i in range(CELLS) if BOX_OF[i] == b] for b in range(SIZE)]
+UNITS = ROWS + COLS + BOXES
+PEERS = [sorted(set(ROWS[ROW_OF[i]] + COLS[COL_OF[i]] + BOXES[BOX_OF[i]]) - {i}) for i in range(CELLS)]
+
+DIGIT_OF_BIT = {1 << d: d + 1 for d in range(SIZE)}
+
+
+def to_flat(grid: List[List[int]]) -> List[int]:
+    """Flatten a 9x9 grid into a list of 81 ints."""
+    return [value for row in grid for value in row]
+
+
+def to_grid(cells: List[int]) -> List[List[int]]:
+    """Reshape a list of 81 ints into a 9x9 grid."""
+    return [list(cells[r * SIZE:(r + 1) * SIZE]) for r in range(SIZE)]
+
+
+def to_string(cells: List[int]) -> str:
+    """Encode a board as an 81-character string, '.' for empty cells."""
+    return "".join(str(v) if v else "." for v in cells)
+
+
+def from_string(text: str) -> List[int]:
+    """Decode an 81-character board string ('.' or '0' for empty cells)."""
+    return [int(ch) if ch.isdigit() else 0 for ch in text.strip()]
+
+
+# ---------------------------------------------------------------------------
+# Bitmask backtracking solver
+# ---------------------------------------------------------------------------
+
+class BitmaskSolver:
+    """Backtracking solver keeping used digits per row, column and box as bitmasks.
+
+    Candidates for a cell are the complement of three ORed masks, and the
+    search always branches on the empty cell with the fewest candidates.
+    """
+
+    def __init__(self, cells: List[int]):
+        self.cells = list(cells)
+        self.rows = [0] * SIZE
+        self.cols = [0] * SIZE
+        self.boxes = [0] * SIZE
+        self.valid = True
+        for i, value in enumerate(self.cells):
+            if value:
+                bit = 1 << (value - 1)
+                r, c, b = ROW_OF[i], COL_OF[i], BOX_OF[i]
+                if (self.rows[r] | self.cols[c] | self.boxes[b]) & bit:
+                    self.valid = False
+                self.rows[r] |= bit
+                self.cols[c] |= bit
+                self.boxes[b] |= bit
+        self.empties = [i for i in range(CELLS) if not self.cells[i]]
+        self.count = 0
+        self.solution: Optional[List[int]] = None
+
+    def candidates(self, index: int) -> int:
+        """Return the candidate mask of a cell."""
+        return ALL_DIGITS & ~(self.rows[ROW_OF[index]] | self.cols[COL_OF[index]] |
+                              self.boxes[BOX_OF[index]])
+
+    def count_solutions(self, limit: int = 2) -> int:
+        """Count solutions, stopping once limit is reached."""
+        self.count = 0
+        self.solution = None
+        if self.valid:
+            self._search(limit)
+        return self.count
+
+    def _search(self, limit: int) -> bool:
+        """Depth-first search; returns True once limit solutions were found."""
+        empties = self.empties
+        if not empties:
+            self.count += 1
+            if self.solution is None:
+                self.solution = list(self.cells)
+            return self.count >= limit
+
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        best_pos = -1
+        best_mask = 0
+        best_count = SIZE + 1
+        for pos, index in enumerate(empties):
+            mask = ALL_DIGITS & ~(rows[ROW_OF[index]] | cols[COL_OF[index]] | boxes[BOX_OF[index]])
+            n = mask.bit_count()
+            if n < best_count:
+                best_pos, best_mask, best_count = pos, mask, n
+                if n <= 1:
+                    break
+        if best_count == 0:
+            return False
+
+        index = empties[best_pos]
+        empties[best_pos] = empties[-1]
+        empties.pop()
+        r, c, b = ROW_OF[index], COL_OF[index], BOX_OF[index]
+        mask = best_mask
+        done = False
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+            self.cells[index] = DIGIT_OF_BIT[bit]
+            done = self._search(limit)
+            rows[r] ^= bit
+            cols[c] ^= bit
+            boxes[b] ^= bit
+            if done:
+                break
+        self.cells[index] = 0
+        empties.append(index)
+        empties[best_pos], empties[-1] = empties[-1], empties[best_pos]
+        return done
+
+
+def solve_bitmask(cells: List[int]) -> Optional[List[int]]:
+    """Return the first solution found by the bitmask solver, or None."""
+    solver = BitmaskSolver(cells)
+    solver.count_solutions(limit=1)
+    return solver.solution
+
+
+# ---------------------------------------------------------------------------
+# Dancing-links exact cover solver
+# ---------------------------------------------------------------------------
+
+# Exact-cover columns: 81 cell, 81 row-digit, 81 column-digit and 81 box-digit constraints
+_COLUMNS = 4 * CELLS
+
+
+def _option_columns(index: int, digit: int) -> Tuple[int, int, int, int]:
+    """Return the four constraint columns covered by placing digit at index."""
+    d = digit - 1
+    return (index,
+            CELLS + ROW_OF[index] * SIZE + d,
+            2 * CELLS + COL_OF[index] * SIZE + d,
+            3 * CELLS + BOX_OF[index] * SIZE + d)
+
+
+def _build_links():
+    """Build the full 729-option dancing-links structure as parallel lists.
+
+    Node 0 is the root, nodes 1.._COLUMNS are column headers, and each option
+    adds four nodes. Returns (left, right, up, down, column, size, option_of)
+    where option_of maps a node to its (cell index, digit).
+    """
+    total = 1 + _COLUMNS + CELLS * SIZE * 4
+    left = list(range(total))
+    right = list(range(total))
+    up = list(range(total))
+    down = list(range(total))
+    column = [0] * total
+    size = [0] * (1 + _COLUMNS)
+    option_of = [None] * total
+
+    for col in range(1, _COLUMNS + 1):
+        left[col] = col - 1
+        right[col - 1] = col
+        column[col] = col
+    left[0] = _COLUMNS
+    right[_COLUMNS] = 0
+
+    node = _COLUMNS + 1
+    for index in range(CELLS):
+        for digit in range(1, SIZE + 1):
+            first = node
+            for col in _option_columns(index, digit):
+                col += 1
+                column[node] = col
+                option_of[node] = (index, digit)
+                up[node] = up[col]
+                down[node] = col
+                down[up[col]] = node
+                up[col] = node
+                size[col] += 1
+                if node != first:
+                    left[node] = node - 1
+                    right[node - 1] = node
+                node += 1
+            left[first] = node - 1
+            right[node - 1] = first
+    return left, right, up, down, column, size, option_of
+
+
+_LINKS = _build_links()
+# Node of each (cell, digit) option's cell-constraint entry
+_OPTION_NODE = {}
+for _node, _option in enumerate(_LINKS[6]):
+    if _option is not None and _LINKS[4][_node] == _option[0] + 1:
+        _OPTION_NODE[_option] = _node
+
+
+class DLXSolver:
+    """Knuth's Algorithm X with dancing links over the 324 Sudoku constraints."""
+
+    def __init__(self, cells: List[int]):
+        left, right, up, down, column, size, option_of = _LINKS
+        self.left = left[:]
+        self.right = right[:]
+        self.up = up[:]
+        self.down = down[:]
+        self.column = column
+        self.size = size[:]
+        self.option_of = option_of
+        self.cells = list(cells)
+        self.valid = True
+        self.count = 0
+        self.solution: Optional[List[int]] = None
+
+        # Select the given clues up front
+        covered = set()
+        for index, value in enumerate(self.cells):
+            if not value:
+                continue
+            node = _OPTION_NODE[(index, value)]
+            cols = [self.column[n] for n in (node, self.right[node], self.right[self.right[node]],
+                                             self.left[node])]
+            if covered.intersection(cols):
+                self.valid = False
+                return
+            covered.update(cols)
+            self._select(node)
+
+    def _cover(self, col: int) -> None:
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[col]] = right[col]
+        left[right[col]] = left[col]
+        i = down[col]
+        while i != col:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, col: int) -> None:
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[col]
+        while i != col:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[col]] = col
+        left[right[col]] = col
+
+    def _select(self, node: int) -> None:
+        """Cover every column of the option containing node."""
+        self._cover(self.column[node])
+        j = self.right[node]
+        while j != node:
+            self._cover(self.column[j])
+            j = self.right[j]
+
+    def _deselect(self, node: int) -> None:
+        """Undo _select, in reverse order."""
+        j = self.left[node]
+        while j != node:
+            self._uncover(self.column[j])
+            j = self.left[j]
+        self._uncover(self.column[node])
+
+    def count_solutions(self, limit: int = 2) -> int:
+        """Count solutions, stopping once limit is reached."""
+        self.count = 0
+        self.solution = None
+        if self.valid:
+            self._search(limit, [])
+        return self.count
+
+    def _search(self, limit: int, chosen: List[int]) -> bool:
+        """Algorithm X; returns True once limit solutions were found."""
+        right, size = self.right, self.size
+        if right[0] == 0:
+            self.count += 1
+            if self.solution is None:
+                solution = list(self.cells)
+                for node in chosen:
+                    index, digit = self.option_of[node]
+                    solution[index] = digit
+                self.solution = solution
+            return self.count >= limit
+
+        # Branch on the column with the fewest remaining options
+        col = right[0]
+        best = col
+        best_size = size[col]
+        while col != 0 and best_size > 1:
+            if size[col] < best_size:
+                best, best_size = col, size[col]
+            col = right[col]
+        if best_size == 0:
+            return False
+
+        self._cover(best)
+        done = False
+        node = self.down[best]
+        while node != best:
+            chosen.append(node)
+            j = right[node]
+            while j != node:
+                self._cover(self.column[j])
+                j = right[j]
+            done = self._search(limit, chosen)
+            j = self.left[node]
+            while j != node:
+                self._uncover(self.column[j])
+                j = self.left[j]
+            chosen.pop()
+            if done:
+                break
+            node = self.down[node]
+        self._uncover(best)
+        return done
+
+
+def count_solutions(cells: List[int], limit: int = 2) -> int:
+    """Count solutions of a board with the DLX solver, up to limit."""
+    return DLXSolver(cells).count_solutions(limit)
+
+
+def has_unique_solution(cells: List[int]) -> bool:
+    """Check whether a board has exactly one solution."""
+    return count_solutions(cells, limit=2) == 1
+
+
+# ---------------------------------------------------------------------------
+# Human-technique rater
+# ---------------------------------------------------------------------------
+
+TECHNIQUE_LEVELS = {
+    "naked_single": 0,
+    "hidden_single": 0,
+    "locked_candidates": 1,
+    "naked_pair": 2,
+    "hidden_pair": 2,
+    "naked_triple": 3,
+    "x_wing": 3,
+}
+
+
+class LogicRater:
+    """Solves with human techniques, simplest first, to rate a puzzle's difficulty.
+
+    The rating is the hardest technique the solve needed, mapped onto
+    config.DIFFICULTY_NAMES; a puzzle the techniques cannot finish is rated
+    with the last (hardest) name.
+    """
+
+    def __init__(self, cells: List[int]):
+        self.cells = list(cells)
+        self.candidates = [0] * CELLS
+        for i in range(CELLS):
+            if not self.cells[i]:
+                used = 0
+                for p in PEERS[i]:
+                    if self.cells[p]:
+                        used |= 1 << (self.cells[p] - 1)
+                self.candidates[i] = ALL_DIGITS & ~used
+        self.used: List[str] = []
+
+    def _place(self, index: int, digit: int) -> None:
+        self.cells[index] = digit
+        self.candidates[index] = 0
+        bit = 1 << (digit - 1)
+        for p in PEERS[index]:
+            self.candidates[p] &= ~bit
+
+    def _eliminate(self, cells, mask: int) -> bool:
+        """Remove mask from the candidates of cells; returns True if anything changed."""
+        changed = False
+        for i in cells:
+            if self.candidates[i] & mask:
+                self.candidates[i] &= ~mask
+                changed = True
+        return changed
+
+    def _naked_single(self) -> bool:
+        for i in range(CELLS):
+            mask = self.candidates[i]
+            if mask and mask & (mask - 1) == 0:
+                self._place(i, DIGIT_OF_BIT[mask])
+                return True
+        return False
+
+    def _hidden_single(self) -> bool:
+        for unit in UNITS:
+            for d in range(SIZE):
+                bit = 1 << d
+                spots = [i for i in unit if self.candidates[i] & bit]
+                if len(spots) == 1:
+                    self._place(spots[0], d + 1)
+                    return True
+        return False
+
+    def _locked_candidates(self) -> bool:
+        for box in BOXES:
+            for d in range(SIZE):
+                bit = 1 << d
+                spots = [i for i in box if self.candidates[i] & bit]
+                if len(spots) < 2:
+                    continue
+                # Pointing: the digit's spots in a box share a row or column
+                for line_of, lines in ((ROW_OF, ROWS), (COL_OF, COLS)):
+                    line = line_of[spots[0]]
+                    if all(line_of[i] == line for i in spots):
+                        if self._eliminate([i for i in lines[line] if i not in box], bit):
+                            return True
+        for lines in (ROWS, COLS):
+            for line in lines:
+                for d in range(SIZE):
+                    bit = 1 << d
+                    spots = [i for i in line if self.candidates[i] & bit]
+                    if len(spots) < 2:
+                        continue
+                    # Claiming: the digit's spots in a line share a box
+                    box = BOX_OF[spots[0]]
+                    if all(BOX_OF[i] == box for i in spots):
+                        if self._eliminate([i for i in BOXES[box] if i not in line], bit):
+                            return True
+        return False
+
+    def _naked_subset(self, size: int) -> bool:
+        for unit in UNITS:
+            open_cells = [i for i in unit if self.candidates[i]]
+            small = [i for i in open_cells if self.candidates[i].bit_count() <= size]
+            for group in _combinations(small, size):
+                mask = 0
+                for i in group:
+                    mask |= self.candidates[i]
+                if mask.bit_count() == size:
+                    if self._eliminate([i for i in open_cells if i not in group], mask):
+                        return True
+        return False
+
+    def _hidden_pair(self) -> bool:
+        for unit in UNITS:
+            spots = {}
+            for d in range(SIZE):
+                cells = tuple(i for i in unit if self.candidates[i] & (1 << d))
+                if len(cells) == 2:
+                    spots.setdefault(cells, []).append(d)
+            for cells, digits in spots.items():
+                if len(digits) == 2:
+                    keep = (1 << digits[0]) | (1 << digits[1])
+                    if self._eliminate(cells, ALL_DIGITS & ~keep):
+                        return True
+        return False
+
+    def _x_wing(self) -> bool:
+        for lines, cross_of, crosses in ((ROWS, COL_OF, COLS), (COLS, ROW_OF, ROWS)):
+            for d in range(SIZE):
+                bit = 1 << d
+                pairs = {}
+                for li, line in enumerate(lines):
+                    spots = [i for i in line if self.candidates[i] & bit]
+                    if len(spots) == 2:
+                        pairs.setdefault((cross_of[spots[0]], cross_of[spots[1]]), []).append(li)
+                for (a, b), found in pairs.items():
+                    if len(found) == 2:
+                        wing = set(lines[found[0]]) | set(lines[found[1]])
+                        others = [i for i in crosses[a] + crosses[b] if i not in wing]
+                        if self._eliminate(others, bit):
+                            return True
+        return False
+
+    def rate(self) -> Tuple[int, bool]:
+        """Solve as far as the techniques allow; returns (level, solved)."""
+        steps = (
+            ("naked_single", self._naked_single),
+            ("hidden_single", self._hidden_single),
+            ("locked_candidates", self._locked_candidates),
+            ("naked_pair", lambda: self._naked_subset(2)),
+            ("hidden_pair", self._hidden_pair),
+            ("naked_triple", lambda: self._naked_subset(3)),
+            ("x_wing", self._x_wing),
+        )
+        level = 0
+        while not all(self.cells):
+            for name, step in steps:
+                if step():
+                    self.used.append(name)
+                    level = max(level, TECHNIQUE_LEVELS[name])
+                    break
+            else:
+                return len(config.DIFFICULTY_NAMES) - 1, False
+        return level, True
+
+
+def _combinations(items, size):
+    """Yield every size-element combination of items (size 2 or 3)."""
+    n = len(items)
+    for a in range(n):
+        for b in range(a + 1, n):
+            if size == 2:
+                yield (items[a], items[b])
+                continue
+            for c in range(b + 1, n):
+                yield (items[a], items[b], items[c])
+
+
+def rate_puzzle(cells: List[int]) -> int:
+    """Return the difficulty index (into config.DIFFICULTY_NAMES) of a puzzle."""
+    level, _ = LogicRater(cells).rate()
+    return level
+
+
+# ---------------------------------------------------------------------------
+# Generator
+# ---------------------------------------------------------------------------
+
+def generate_solution(rng: random.Random = random) -> List[int]:
+    """Fill an empty board with a random complete solution."""
+    cells = [0] * CELLS
+    # Independent boxes on the diagonal can be filled freely
+    for b in range(0, SIZE, BOX + 1):
+        digits = list(range(1, SIZE + 1))
+        rng.shuffle(digits)
+        for i, digit in zip(BOXES[b], digits):
+            cells[i] = digit
+    solver = BitmaskSolver(cells)
+    rng.shuffle(solver.empties)
+    solver.count_solutions(limit=1)
+    return solver.solution
+
+
+def generate_puzzle(num_clues: int = 0, rng: random.Random = random) -> Tuple[List[int], List[int]]:
+    """Generate a (puzzle, solution) pair whose puzzle has a unique solution.
+
+    Clues are removed in random order and put back whenever removing them
+    would allow a second solution. Removal stops once num_clues clues are left
+    (0 removes as many as possible).
+    """
+    solution = generate_solution(rng)
+    puzzle = list(solution)
+    order = list(range(CELLS))
+    rng.shuffle(order)
+    clues = CELLS
+    for index in order:
+        if clues <= num_clues:
+            break
+        value = puzzle[index]
+        puzzle[index] = 0
+        if has_unique_solution(puzzle):
+            clues -= 1
+        else:
+            puzzle[index] = value
+    return puzzle, solution
@@ -1,8 +1,11 @@
 """Game entities and logic."""
 
+import os
 import random
 from typing import List, Tuple, Set
 import config
+import engine
+import puzzle_pack
 
 
 class Cell:
@@ -37,20 +40,20 @@ class SudokuBoard:
         self.solution: List[List[int]] = [[config.EMPTY_CELL for _ in range(config.GRID_SIZE)]
                                            for _ in range(config.GRID_SIZE)]
         self.given_cells: Set[Tuple[int, int]] = set()
+        self.difficulty = 0
         self.seed = seed or random.randint(1, 999999)
         random.seed(self.seed)
 
     def generate_puzzle(self, num_clues: int = 32) -> None:
-        """Generate a new Sudoku puzzle with the specified number of clues."""
-        # Generate a complete valid solution
-        self._generate_solution()
+        """Generate a new Sudoku puzzle with a unique solution and the specified number of clues."""
+        puzzle, solution = engine.generate_puzzle(num_clues)
+        self.load_puzzle(puzzle, solution)
 
-        # Copy solution to grid
-        self.grid = [row[:] for row in self.solution]
-
-        # Remove numbers to create the puzzle
-        cells_to_remove = config.GRID_SIZE * config.GRID_SIZE - num_clues
-        self._remove_numbers(cells_to_remove)
+    def load_puzzle(self, puzzle: List[int], solution: List[int], difficulty: int | None = None) -> None:
+        """Load a puzzle and its solution given as flat lists of 81 values."""
+        self.grid = engine.to_grid(puzzle)
+        self.solution = engine.to_grid(solution)
+        self.difficulty = engine.rate_puzzle(puzzle) if difficulty is None else difficulty
 
         # Mark given cells
         self.given_cells.clear()
@@ -59,69 +62,6 @@ class SudokuBoard:
                 if self.grid[row][col] != config.EMPTY_CELL:
                     self.given_cells.add((row, col))
 
-    def _generate_solution(self) -> None:
-        """Generate a complete valid Sudoku solution using backtracking."""
-        self.solution = [[config.EMPTY_CELL for _ in range(config.GRID_SIZE)]
-                         for _ in range(config.GRID_SIZE)]
-        self._fill_grid(self.solution)
-
-    def _fill_grid(self, grid: List[List[int]]) -> bool:
-        """Fill the grid using backtracking algorithm."""
-        empty_cell = self._find_empty(grid)
-        if not empty_cell:
-            return True
-
-        row, col = empty_cell
-        numbers = list(range(1, 10))
-        random.shuffle(numbers)
-
-        for num in numbers:
-            if self._is_valid_placement(grid, row, col, num):
-                grid[row][col] = num
-                if self._fill_grid(grid):
-                    return True
-                grid[row][col] = config.EMPTY_CELL
-
-        return False
-
-    def _find_empty(self, grid: List[List[int]]) -> Tuple[int, int] | None:
-        """Find an empty cell in the grid."""
-        for row in range(config.GRID_SIZE):
-            for col in range(config.GRID_SIZE):
-                if grid[row][col] == config.EMPTY_CELL:
-                    return (row, col)
-        return None
-
-    def _is_valid_placement(self, grid: List[List[int]], row: int, col: int, num: int) -> bool:
-        """Check if placing a number at a position is valid."""
-        # Check row
-        if num in grid[row]:
-            return False
-
-        # Check column
-        for r in range(config.GRID_SIZE):
-            if grid[r][col] == num:
-                return False
-
-        # Check 3x3 box
-        box_row = (row // config.BOX_SIZE) * config.BOX_SIZE
-        box_col = (col // config.BOX_SIZE) * config.BOX_SIZE
-        for r in range(box_row, box_row + config.BOX_SIZE):
-            for c in range(box_col, box_col + config.BOX_SIZE):
-                if grid[r][c] == num:
-                    return False
-
-        return True
-
-    def _remove_numbers(self, count: int) -> None:
-        """Remove numbers from the grid to create the puzzle."""
-        positions = [(r, c) for r in range(config.GRID_SIZE)
-                     for c in range(config.GRID_SIZE)]
-        random.shuffle(positions)
-
-        for row, col in positions[:count]:
-            self.grid[row][col] = config.EMPTY_CELL
-
     def is_given(self, row: int, col: int) -> bool:
         """Check if a cell is a given clue."""
         return (row, col) in self.given_cells
@@ -197,6 +137,8 @@ class GameState:
     """Manages the overall game state."""
 
     def __init__(self):
+        self.pack = puzzle_pack.load_pack(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                       config.PUZZLE_PACK_FILE))
         self.board = SudokuBoard()
         self.cells: List[List[Cell]] = []
         self.selected_cell: Tuple[int, int] | None = None
@@ -208,7 +150,11 @@ class GameState:
     def new_game(self) -> None:
         """Start a new game."""
         self.board = SudokuBoard()
-        self.board.generate_puzzle(random.randint(config.MIN_CLUES, config.MAX_CLUES))
+        if self.pack:
+            self.board.load_puzzle(*random.choice(self.pack))
+        else:
+            # No pack on disk: generate live
+            self.board.generate_puzzle(random.randint(config.MIN_CLUES, config.MAX_CLUES))
         self._initialize_cells()
         self.selected_cell = None
         self.score = 0
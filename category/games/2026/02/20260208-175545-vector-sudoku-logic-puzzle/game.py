@@ -105,6 +105,10 @@ class SudokuGame:
         moves_text = self.font_small.render(f"Moves: {self.state.moves}", True, config.COLOR_TEXT)
         self.screen.blit(moves_text, (120, 50))
 
+        difficulty = config.DIFFICULTY_NAMES[self.state.board.difficulty]
+        difficulty_text = self.font_small.render(f"Level: {difficulty}", True, config.COLOR_TEXT)
+        self.screen.blit(difficulty_text, (220, 50))
+
     def _draw_new_game_button(self) -> None:
         """Draw the new game button."""
         mouse_pos = pygame.mouse.get_pos()
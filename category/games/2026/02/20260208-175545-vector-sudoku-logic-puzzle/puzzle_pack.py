@@ -0,0 +1,69 @@
+"""Pre-generated puzzle pack: build it once, load it at startup.
+
+Each line of the pack holds one puzzle as three space-separated fields: the
+81-character puzzle ('.' for empty cells), the 81-character solution and the
+difficulty index into config.DIFFICULTY_NAMES.
+
+Build a pack with:  uv run puzzle_pack.py [count] [seed]
+"""
+
+import os
+import random
+import sys
+import time
+from typing import List, Tuple
+import config
+import engine
+
+PackEntry = Tuple[List[int], List[int], int]
+
+
+def build_pack(count: int, seed: int = 0) -> List[PackEntry]:
+    """Generate count unique-solution puzzles with clue counts in the configured range."""
+    rng = random.Random(seed)
+    entries = []
+    for _ in range(count):
+        puzzle, solution = engine.generate_puzzle(rng.randint(config.PACK_MIN_CLUES, config.MAX_CLUES), rng)
+        entries.append((puzzle, solution, engine.rate_puzzle(puzzle)))
+    return entries
+
+
+def save_pack(path: str, entries: List[PackEntry]) -> None:
+    """Write a pack to disk."""
+    with open(path, "w", encoding="utf-8") as f:
+        for puzzle, solution, difficulty in entries:
+            f.write(f"{engine.to_string(puzzle)} {engine.to_string(solution)} {difficulty}\n")
+
+
+def load_pack(path: str) -> List[PackEntry]:
+    """Read a pack from disk; returns an empty list if there is no pack file."""
+    if not os.path.exists(path):
+        return []
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) == 3:
+                entries.append((engine.from_string(fields[0]), engine.from_string(fields[1]), int(fields[2])))
+    return entries
+
+
+def main() -> int:
+    """Build the pack next to this file."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else config.PUZZLE_PACK_SIZE
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), config.PUZZLE_PACK_FILE)
+
+    start = time.perf_counter()
+    entries = build_pack(count, seed)
+    elapsed = time.perf_counter() - start
+    save_pack(path, entries)
+
+    print(f"Wrote {len(entries)} puzzles to {path} in {elapsed:.1f}s ({len(entries) / elapsed:.1f} puzzles/s)")
+    for level, name in enumerate(config.DIFFICULTY_NAMES):
+        print(f"  {name:<8} {sum(1 for entry in entries if entry[2] == level)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
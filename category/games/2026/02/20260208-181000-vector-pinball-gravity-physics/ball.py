@@ -17,7 +17,7 @@ class Ball:
         self.radius = BALL_RADIUS
 
     def update(self):
-        """Apply physics and update position."""
+        """Apply one explicit Euler step (Physics.step replaces this in the game)."""
         # Apply gravity
         self.vy += GRAVITY
 
@@ -51,9 +51,9 @@ class Ball:
             self.radius * 2
         )
 
-    def launch(self, speed=15):
+    def launch(self, speed=15, rng=random):
         """Launch the ball upward."""
-        self.vx = (random.random() * 2 - 1) * 2
+        self.vx = (rng.random() * 2 - 1) * 2
         self.vy = -speed
 
     def bounce_horizontal(self):
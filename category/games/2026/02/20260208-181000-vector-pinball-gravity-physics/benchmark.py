@@ -0,0 +1,125 @@
+"""Physics benchmark: the previous per-frame Euler step versus the Physics core.
+
+Reports throughput in simulated seconds per wall second (one step is one
+frame at FPS) while a seeded random policy plays through step_ai, and
+counts how often a ball fired at MAX_SPEED passes through a wall.
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from config import *
+from ball import Ball
+from game import Game
+
+DURATION = 3.0
+SEED = 11
+SHOTS = 2000
+MAX_GAME_STEPS = 20000
+
+
+def legacy_step(game):
+    """The previous Game.update: one Euler step, then overlap tests against everything."""
+    if game.game_state != "playing":
+        return
+    game.left_flipper.update()
+    game.right_flipper.update()
+    game.ball.update()
+    for bumper in game.bumpers:
+        bumper.update()
+        if bumper.check_collision(game.ball):
+            game.score += bumper.points
+    for slingshot in game.slingshots:
+        slingshot.update()
+        if slingshot.check_collision(game.ball):
+            game.score += slingshot.points
+    for wall in game.walls:
+        wall.check_collision(game.ball)
+    game.left_flipper.check_collision(game.ball)
+    game.right_flipper.check_collision(game.ball)
+    if game.ball.is_lost():
+        game.ball_count -= 1
+        if game.ball_count > 0:
+            game.reset_ball()
+        else:
+            game.game_state = "game_over"
+
+
+def throughput(legacy: bool):
+    """Simulated seconds per wall second and sub-steps per step."""
+    game = Game(seed=SEED)
+    if legacy:
+        game.fixed_update = lambda: legacy_step(game)
+    policy = random.Random(SEED)
+    steps = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        game.reset_game(SEED + steps)
+        game.handle_action()
+        for _ in range(MAX_GAME_STEPS):
+            steps += 1
+            if game.step_ai(policy.randrange(4))[2]:
+                break
+    elapsed = time.perf_counter() - start
+    return steps / FPS / elapsed, game.physics.substeps / steps
+
+
+def crossed(wall, x0, y0, x1, y1) -> bool:
+    """Whether the ball centre moved across the wall segment."""
+    def side(x, y):
+        return (wall.x2 - wall.x1) * (y - wall.y1) - (wall.y2 - wall.y1) * (x - wall.x1)
+    s0, s1 = side(x0, y0), side(x1, y1)
+    if s0 * s1 >= 0:
+        return False
+    t = s0 / (s0 - s1)
+    qx, qy = x0 + t * (x1 - x0), y0 + t * (y1 - y0)
+    length_sq = (wall.x2 - wall.x1) ** 2 + (wall.y2 - wall.y1) ** 2
+    u = ((qx - wall.x1) * (wall.x2 - wall.x1) + (qy - wall.y1) * (wall.y2 - wall.y1)) / length_sq
+    return 0 <= u <= 1
+
+
+def tunnels(legacy: bool) -> int:
+    """Balls out of SHOTS fired at a wall at MAX_SPEED that end up on its far side."""
+    game = Game(seed=SEED)
+    rng = random.Random(SEED)
+    count = 0
+    for _ in range(SHOTS):
+        wall = rng.choice(game.walls)
+        length = math.hypot(wall.x2 - wall.x1, wall.y2 - wall.y1)
+        nx, ny = -(wall.y2 - wall.y1) / length, (wall.x2 - wall.x1) / length
+        side = rng.choice([-1, 1])
+        offset = rng.uniform(12, 30)
+        ball = Ball((wall.x1 + wall.x2) / 2 + nx * side * offset, (wall.y1 + wall.y2) / 2 + ny * side * offset)
+        angle = math.atan2(-ny * side, -nx * side) + rng.uniform(-0.6, 0.6)
+        ball.vx, ball.vy = MAX_SPEED * math.cos(angle), MAX_SPEED * math.sin(angle)
+        for _ in range(3):
+            x0, y0 = ball.x, ball.y
+            if legacy:
+                ball.update()
+                for other in game.walls:
+                    other.check_collision(ball)
+            else:
+                game.physics.step(ball)
+            if crossed(wall, x0, y0, ball.x, ball.y):
+                count += 1
+                break
+    return count
+
+
+def main() -> int:
+    """Print throughput and tunnelling for both steppers."""
+    print(f"{'stepper':<22} {'sim s / wall s':>15} {'substeps/step':>14} {'tunnels':>12}")
+    for name, legacy in (("Euler + overlap", True), ("Physics (swept)", False)):
+        speed, substeps = throughput(legacy)
+        substeps_text = "1.00" if legacy else f"{substeps:.2f}"
+        print(f"{name:<22} {speed:>15.1f} {substeps_text:>14} {tunnels(legacy):>7} / {SHOTS}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,6 +35,7 @@ FLIPPER_ACTIVE_ANGLE = -30  # degrees from horizontal
 FLIPPER_SPEED = 0.5  # rotation speed per frame
 LEFT_FLIPPER_PIVOT = (120, 530)
 RIGHT_FLIPPER_PIVOT = (280, 530)
+FLIPPER_PIVOT_RADIUS = 6
 
 # Bumper settings
 BUMPER_RADIUS = 20
@@ -46,6 +47,13 @@ SLINGSHOT_POINTS = 5
 # Wall settings
 WALL_THICKNESS = 5
 
+# Physics core (one fixed step per frame at FPS)
+PHYSICS_MAX_TRAVEL = BALL_RADIUS / 2  # pixels the ball may move per sub-step
+PHYSICS_MAX_SUBSTEPS = 16
+PHYSICS_MAX_CONTACTS = 4  # contacts resolved per sub-step
+PHYSICS_MAX_STEPS_PER_FRAME = 5  # accumulator cap after a stall
+PHYSICS_GRID_CELL = 50
+
 # Reward structure for AI training
 REWARD_BUMPER_HIT = 10
 REWARD_SURVIVAL_FRAME = 0.1
@@ -76,7 +76,15 @@ class Flipper:
         )
 
         # Draw pivot point
-        pygame.draw.circle(screen, SILVER, (self.pivot_x, self.pivot_y), 6)
+        pygame.draw.circle(screen, SILVER, (self.pivot_x, self.pivot_y), FLIPPER_PIVOT_RADIUS)
+
+    def on_hit(self, ball, nx, ny):
+        """Bounce the ball off the blade, kicking it if the flipper is up; scores nothing."""
+        ball.bounce_normal(nx, ny)
+        if self.is_active:
+            ball.vy -= 12
+            ball.vx += 8 if self.is_left else -8
+        return 0
 
     def check_collision(self, ball):
         """Check and handle collision with ball."""
@@ -121,7 +129,7 @@ class Flipper:
 
         # Check collision with pivot point
         pivot_dist = math.sqrt(dx * dx + dy * dy)
-        if pivot_dist < ball.radius + 6:
+        if pivot_dist < ball.radius + FLIPPER_PIVOT_RADIUS:
             # Normalize direction from pivot to ball
             if pivot_dist > 0:
                 nx = dx / pivot_dist
@@ -129,7 +137,7 @@ class Flipper:
                 ball.bounce_normal(nx, ny)
 
                 # Push ball out
-                overlap = ball.radius + 6 - pivot_dist
+                overlap = ball.radius + FLIPPER_PIVOT_RADIUS - pivot_dist
                 ball.x += nx * overlap
                 ball.y += ny * overlap
 
@@ -5,18 +5,21 @@ import random
 from config import *
 from ball import Ball
 from flipper import Flipper
+from physics import Physics
 from table import Bumper, Slingshot, Wall
 
 
 class Game:
     """Main game class managing rendering and game loop."""
 
-    def __init__(self):
+    def __init__(self, seed=None):
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Vector Pinball Gravity Physics")
         self.clock = pygame.time.Clock()
         self.running = True
+        self.rng = random.Random(seed)
+        self.frame_time = 1 / FPS
 
         self.ball = Ball()
         self.left_flipper = Flipper(*LEFT_FLIPPER_PIVOT, is_left=True)
@@ -56,12 +59,12 @@ class Game:
 
         # Walls
         self.walls = [
-            # Left side
+            # Left side (the inlane ends at the flipper pivot so the ball cannot lodge between them)
             Wall(0, 100, 0, 500),
-            Wall(0, 500, 100, 530),
+            Wall(0, 500, LEFT_FLIPPER_PIVOT[0], LEFT_FLIPPER_PIVOT[1]),
             # Right side
             Wall(400, 100, 400, 500),
-            Wall(400, 500, 300, 530),
+            Wall(400, 500, RIGHT_FLIPPER_PIVOT[0], RIGHT_FLIPPER_PIVOT[1]),
             # Top corners
             Wall(0, 0, 100, 100),
             Wall(400, 0, 300, 100),
@@ -75,13 +78,19 @@ class Game:
             Wall(300, 530, 260, 560),
         ]
 
+        self.physics = Physics(self.bumpers, self.slingshots, self.walls,
+                               [self.left_flipper, self.right_flipper])
+
     def reset_ball(self):
         """Reset ball to starting position."""
         self.ball = Ball()
-        self.ball.launch()
+        self.ball.launch(rng=self.rng)
 
-    def reset_game(self):
-        """Reset game to initial state."""
+    def reset_game(self, seed=None):
+        """Reset game to initial state; a seed makes the following run replayable."""
+        if seed is not None:
+            self.rng.seed(seed)
+        self.physics.accumulator = 0.0
         self.score = 0
         self.ball_count = 3
         self.game_state = "ready"
@@ -117,35 +126,29 @@ class Game:
                 self.high_score = self.score
             self.reset_game()
 
-    def update(self):
-        """Update game state."""
+    def update(self, elapsed=None):
+        """Update game state.
+
+        With `elapsed` wall-clock seconds, runs as many fixed steps as the
+        physics accumulator has due; without it, runs exactly one.
+        """
+        steps = 1 if elapsed is None else self.physics.steps_for(elapsed)
+        for _ in range(steps):
+            self.fixed_update()
+
+    def fixed_update(self):
+        """Advance the game by one fixed step."""
         if self.game_state == "playing":
-            # Update flippers
+            # Update flippers and animations
             self.left_flipper.update()
             self.right_flipper.update()
-
-            # Update ball
-            self.ball.update()
-
-            # Check collisions with bumpers
             for bumper in self.bumpers:
                 bumper.update()
-                if bumper.check_collision(self.ball):
-                    self.score += bumper.points
-
-            # Check collisions with slingshots
             for slingshot in self.slingshots:
                 slingshot.update()
-                if slingshot.check_collision(self.ball):
-                    self.score += slingshot.points
-
-            # Check collisions with walls
-            for wall in self.walls:
-                wall.check_collision(self.ball)
 
-            # Check collisions with flippers
-            self.left_flipper.check_collision(self.ball)
-            self.right_flipper.check_collision(self.ball)
+            # Move the ball and score the contacts along the way
+            self.score += self.physics.step(self.ball)
 
             # Check if ball is lost
             if self.ball.is_lost():
@@ -282,8 +285,8 @@ class Game:
         """Main game loop."""
         while self.running:
             self.handle_input()
-            self.update()
+            self.update(self.frame_time)
             self.render()
-            self.clock.tick(FPS)
+            self.frame_time = self.clock.tick(FPS) / 1000
 
         pygame.quit()
@@ -0,0 +1,276 @@
+"""Fixed-timestep ball physics with swept collision against the table."""
+
+import math
+from config import *
+
+# Fraction of a sub-step left unused after a contact, so the ball ends
+# just outside the collider instead of touching it
+CONTACT_SKIN = 0.01
+
+
+class SegmentCollider:
+    """A capsule: every point within `radius` of the segment AB."""
+
+    def __init__(self, ax, ay, bx, by, radius, on_hit):
+        self.radius = radius
+        self.on_hit = on_hit
+        self.set_points(ax, ay, bx, by)
+
+    def set_points(self, ax, ay, bx, by):
+        """Move the segment (used for flippers)."""
+        self.ax, self.ay, self.bx, self.by = ax, ay, bx, by
+
+    def bounds(self):
+        """Bounding box (left, top, right, bottom) of the capsule."""
+        r = self.radius
+        return (min(self.ax, self.bx) - r, min(self.ay, self.by) - r,
+                max(self.ax, self.bx) + r, max(self.ay, self.by) + r)
+
+    def closest(self, px, py):
+        """Closest point of the segment to P."""
+        dx = self.bx - self.ax
+        dy = self.by - self.ay
+        length_sq = dx * dx + dy * dy
+        if length_sq == 0:
+            return self.ax, self.ay
+        t = max(0.0, min(1.0, ((px - self.ax) * dx + (py - self.ay) * dy) / length_sq))
+        return self.ax + t * dx, self.ay + t * dy
+
+    def sweep(self, px, py, dx, dy, ball_radius):
+        """Time of impact in [0, 1] of a circle moving from P by D, with the contact normal.
+
+        Returns None when the circle does not touch the capsule or is already
+        moving away from it.
+        """
+        reach = self.radius + ball_radius
+        cx, cy = self.closest(px, py)
+        ox, oy = px - cx, py - cy
+        dist = math.hypot(ox, oy)
+        if dist < reach:
+            # Already touching: only a contact if still closing in
+            if dist == 0:
+                nx, ny = _segment_normal(self, dx, dy)
+            else:
+                nx, ny = ox / dist, oy / dist
+            return (0.0, nx, ny) if dx * nx + dy * ny < 0 else None
+
+        best = None
+        # Flat sides: the offset line on the side the ball starts from
+        sx = self.bx - self.ax
+        sy = self.by - self.ay
+        length = math.hypot(sx, sy)
+        if length > 0:
+            nx, ny = -sy / length, sx / length
+            s0 = (px - self.ax) * nx + (py - self.ay) * ny
+            if s0 < 0:
+                nx, ny, s0 = -nx, -ny, -s0
+            approach = dx * nx + dy * ny
+            if approach < 0 and s0 >= reach:
+                t = (s0 - reach) / -approach
+                if t <= 1:
+                    qx, qy = px + t * dx, py + t * dy
+                    u = ((qx - self.ax) * sx + (qy - self.ay) * sy) / (length * length)
+                    if 0 <= u <= 1:
+                        best = (t, nx, ny)
+        if best is None:
+            # Rounded ends
+            for ex, ey in ((self.ax, self.ay), (self.bx, self.by)):
+                hit = _sweep_point(px, py, dx, dy, ex, ey, reach)
+                if hit is not None and (best is None or hit[0] < best[0]):
+                    best = hit
+        return best
+
+
+class CircleCollider:
+    """A disc of `radius` around C."""
+
+    def __init__(self, cx, cy, radius, on_hit):
+        self.cx = cx
+        self.cy = cy
+        self.radius = radius
+        self.on_hit = on_hit
+
+    def bounds(self):
+        r = self.radius
+        return self.cx - r, self.cy - r, self.cx + r, self.cy + r
+
+    def sweep(self, px, py, dx, dy, ball_radius):
+        """Time of impact in [0, 1] of a circle moving from P by D, with the contact normal."""
+        reach = self.radius + ball_radius
+        ox, oy = px - self.cx, py - self.cy
+        dist = math.hypot(ox, oy)
+        if dist < reach:
+            if dist == 0:
+                return None
+            nx, ny = ox / dist, oy / dist
+            return (0.0, nx, ny) if dx * nx + dy * ny < 0 else None
+        return _sweep_point(px, py, dx, dy, self.cx, self.cy, reach)
+
+
+def _segment_normal(segment, dx, dy):
+    """Unit normal of a segment facing against the motion D."""
+    sx = segment.bx - segment.ax
+    sy = segment.by - segment.ay
+    length = math.hypot(sx, sy) or 1.0
+    nx, ny = -sy / length, sx / length
+    if dx * nx + dy * ny > 0:
+        nx, ny = -nx, -ny
+    return nx, ny
+
+
+def _sweep_point(px, py, dx, dy, cx, cy, reach):
+    """First time in [0, 1] that P + tD comes within `reach` of C, with the normal there."""
+    ox, oy = px - cx, py - cy
+    a = dx * dx + dy * dy
+    if a == 0:
+        return None
+    b = ox * dx + oy * dy
+    if b >= 0:
+        return None  # moving away
+    c = ox * ox + oy * oy - reach * reach
+    disc = b * b - a * c
+    if disc < 0:
+        return None
+    t = (-b - math.sqrt(disc)) / a
+    if not 0 <= t <= 1:
+        return None
+    nx = (ox + t * dx) / reach
+    ny = (oy + t * dy) / reach
+    return t, nx, ny
+
+
+class ColliderGrid:
+    """Uniform grid over the table; each collider is listed in every cell its bounds touch."""
+
+    def __init__(self, cell_size=PHYSICS_GRID_CELL):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+
+    def add(self, collider, bounds=None):
+        """Register a collider, optionally under wider bounds (for moving colliders)."""
+        left, top, right, bottom = bounds or collider.bounds()
+        size = self.cell_size
+        for cx in range(int(left // size), int(right // size) + 1):
+            for cy in range(int(top // size), int(bottom // size) + 1):
+                self.cells.setdefault((cx, cy), []).append((self.count, collider))
+        self.count += 1
+
+    def query(self, left, top, right, bottom):
+        """Colliders whose cells overlap the box, in registration order."""
+        size = self.cell_size
+        found = {}
+        for cx in range(int(left // size), int(right // size) + 1):
+            for cy in range(int(top // size), int(bottom // size) + 1):
+                for order, collider in self.cells.get((cx, cy), ()):
+                    found[order] = collider
+        return [found[order] for order in sorted(found)]
+
+
+class Physics:
+    """Steps the ball at a fixed rate against the table geometry.
+
+    One fixed step is one frame at FPS, in the same per-frame units as the
+    config constants. A step is split into sub-steps so the ball never moves
+    more than PHYSICS_MAX_TRAVEL per sub-step. Each sub-step moves the ball
+    to its first contact (a swept test), responds, and carries on with the
+    rest of the motion. Table elements are looked up through a grid built
+    once when the table is set up.
+    """
+
+    def __init__(self, bumpers, slingshots, walls, flippers):
+        self.flippers = flippers
+        self.grid = ColliderGrid()
+        for wall in walls:
+            self.grid.add(SegmentCollider(wall.x1, wall.y1, wall.x2, wall.y2, WALL_THICKNESS / 2, wall.on_hit))
+        for bumper in bumpers:
+            self.grid.add(CircleCollider(bumper.x, bumper.y, bumper.radius, bumper.on_hit))
+        for slingshot in slingshots:
+            self.grid.add(CircleCollider(slingshot.x, slingshot.y + slingshot.height / 2,
+                                         slingshot.width / 2, slingshot.on_hit))
+        self.flipper_colliders = []
+        for flipper in flippers:
+            blade = SegmentCollider(flipper.pivot_x, flipper.pivot_y, *flipper.get_end_point(),
+                                    flipper.width / 2, flipper.on_hit)
+            # The blade's rounded end covers the pivot; a separate, wider pivot disc
+            # would stand proud of the inlane wall and trap the ball against it.
+            # Registered over the whole swing so the grid stays static
+            reach = flipper.length + flipper.width
+            swing = (flipper.pivot_x - reach, flipper.pivot_y - reach,
+                     flipper.pivot_x + reach, flipper.pivot_y + reach)
+            self.grid.add(blade, swing)
+            self.flipper_colliders.append((flipper, blade))
+        self.accumulator = 0.0
+        self.substeps = 0
+
+    def steps_for(self, elapsed):
+        """Add wall-clock seconds to the accumulator and return the fixed steps now due."""
+        self.accumulator = min(self.accumulator + elapsed, PHYSICS_MAX_STEPS_PER_FRAME / FPS)
+        steps = int(self.accumulator * FPS + 1e-9)
+        self.accumulator -= steps / FPS
+        return steps
+
+    def step(self, ball):
+        """Advance the ball by one fixed step; return the points scored."""
+        for flipper, blade in self.flipper_colliders:
+            blade.set_points(flipper.pivot_x, flipper.pivot_y, *flipper.get_end_point())
+
+        speed = math.hypot(ball.vx, ball.vy) + GRAVITY
+        substeps = min(PHYSICS_MAX_SUBSTEPS, max(1, math.ceil(speed / PHYSICS_MAX_TRAVEL)))
+        self.substeps += substeps
+        h = 1.0 / substeps
+        damping = FRICTION ** h
+        points = 0
+        for _ in range(substeps):
+            ball.vy += GRAVITY * h
+            ball.vx *= damping
+            ball.vy *= damping
+            speed = math.hypot(ball.vx, ball.vy)
+            if speed > MAX_SPEED:
+                scale = MAX_SPEED / speed
+                ball.vx *= scale
+                ball.vy *= scale
+            points += self._move(ball, h)
+        return points
+
+    def _move(self, ball, h):
+        """Move the ball for h of a step, stopping at contacts along the way."""
+        points = 0
+        remaining = 1.0
+        r = ball.radius
+        for _ in range(PHYSICS_MAX_CONTACTS):
+            dx = ball.vx * h * remaining
+            dy = ball.vy * h * remaining
+            candidates = self.grid.query(min(ball.x, ball.x + dx) - r, min(ball.y, ball.y + dy) - r,
+                                         max(ball.x, ball.x + dx) + r, max(ball.y, ball.y + dy) + r)
+            first = None
+            for collider in candidates:
+                hit = collider.sweep(ball.x, ball.y, dx, dy, r)
+                if hit is not None and (first is None or hit[0] < first[0][0]):
+                    first = (hit, collider)
+            if first is None:
+                ball.x += dx
+                ball.y += dy
+                return points
+
+            (t, nx, ny), collider = first
+            ball.x += dx * t + nx * CONTACT_SKIN
+            ball.y += dy * t + ny * CONTACT_SKIN
+            self._separate(ball, collider, nx, ny)
+            points += collider.on_hit(ball, nx, ny)
+            remaining *= 1 - t
+            if remaining <= 0:
+                break
+        return points
+
+    @staticmethod
+    def _separate(ball, collider, nx, ny):
+        """Push the ball out of a collider it starts inside of."""
+        if isinstance(collider, SegmentCollider):
+            cx, cy = collider.closest(ball.x, ball.y)
+        else:
+            cx, cy = collider.cx, collider.cy
+        overlap = collider.radius + ball.radius - math.hypot(ball.x - cx, ball.y - cy)
+        if overlap > 0:
+            ball.x += nx * overlap
+            ball.y += ny * overlap
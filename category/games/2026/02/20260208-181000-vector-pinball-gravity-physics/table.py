@@ -51,19 +51,23 @@ class Bumper:
                 ball.x += nx * overlap
                 ball.y += ny * overlap
 
-                # Bounce with extra energy
-                ball.bounce_normal(nx, ny)
-                ball.vx *= 1.2
-                ball.vy *= 1.2
-
-                # Flash effect
-                self.color = WHITE
-                self.hit_timer = 5
-
+                self.on_hit(ball, nx, ny)
                 return True
 
         return False
 
+    def on_hit(self, ball, nx, ny):
+        """Bounce the ball off the contact normal; return the points scored."""
+        # Bounce with extra energy
+        ball.bounce_normal(nx, ny)
+        ball.vx *= 1.2
+        ball.vy *= 1.2
+
+        # Flash effect
+        self.color = WHITE
+        self.hit_timer = 5
+        return self.points
+
 
 class Slingshot:
     """Triangular slingshot that bounces the ball."""
@@ -119,19 +123,23 @@ class Slingshot:
                 ball.x += nx * overlap
                 ball.y += ny * overlap
 
-                # Bounce with extra energy
-                ball.bounce_normal(nx, ny)
-                ball.vx *= 1.3
-                ball.vy *= 1.3
-
-                # Flash effect
-                self.color = WHITE
-                self.hit_timer = 5
-
+                self.on_hit(ball, nx, ny)
                 return True
 
         return False
 
+    def on_hit(self, ball, nx, ny):
+        """Bounce the ball off the contact normal; return the points scored."""
+        # Bounce with extra energy
+        ball.bounce_normal(nx, ny)
+        ball.vx *= 1.3
+        ball.vy *= 1.3
+
+        # Flash effect
+        self.color = WHITE
+        self.hit_timer = 5
+        return self.points
+
 
 class Wall:
     """Static wall boundary."""
@@ -198,9 +206,12 @@ class Wall:
             ball.x += normal_x * overlap
             ball.y += normal_y * overlap
 
-            # Bounce
-            ball.bounce_normal(normal_x, normal_y)
-
+            self.on_hit(ball, normal_x, normal_y)
             return True
 
         return False
+
+    def on_hit(self, ball, nx, ny):
+        """Bounce the ball off the contact normal; walls score nothing."""
+        ball.bounce_normal(nx, ny)
+        return 0
@@ -0,0 +1,134 @@
+"""Gravity tick cost and rollout throughput for Vector Boulder Dash Logic.
+
+Compares the former full-cave scan against the active-cell scheduler on
+caves of growing size, checks both leave the cave in the same state, and
+measures how many step_ai calls per second bulk rollouts reach.
+
+Run with: uv run python benchmark.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config import *
+from game import GameState
+from grid import Grid
+
+CAVE_SIZES = ((20, 15), (100, 40), (400, 100))
+TICKS = 200
+DIGS_PER_TICK = 2
+ROLLOUTS = 200
+ROLLOUT_STEPS = 200
+SEED = 3
+
+
+def legacy_update_physics(grid, player_x, player_y):
+    """The former Grid.update_physics body: every cell, every tick."""
+    player_crushed = False
+    for y in range(grid.height - 2, -1, -1):
+        direction = 1 if (grid.height - y) % 2 == 1 else -1
+        x_range = range(grid.width - 1, -1, -1) if direction == -1 else range(grid.width)
+        for x in x_range:
+            tile = grid.get_tile(x, y)
+            if grid.is_rounded(tile):
+                below = grid.get_tile(x, y + 1)
+                if grid.can_fall_into(below):
+                    grid.grid[y][x] = TILE_EMPTY
+                    grid.grid[y + 1][x] = tile
+                    if x == player_x and y + 1 == player_y:
+                        player_crushed = True
+                elif grid.can_roll_off(below) or below in (TILE_WALL, TILE_DIRT):
+                    if grid.can_fall_into(grid.get_tile(x - 1, y)) and grid.can_fall_into(grid.get_tile(x - 1, y + 1)):
+                        grid.grid[y][x] = TILE_EMPTY
+                        grid.grid[y + 1][x - 1] = tile
+                        if x - 1 == player_x and y + 1 == player_y:
+                            player_crushed = True
+                    elif grid.can_fall_into(grid.get_tile(x + 1, y)) and grid.can_fall_into(grid.get_tile(x + 1, y + 1)):
+                        grid.grid[y][x] = TILE_EMPTY
+                        grid.grid[y + 1][x + 1] = tile
+                        if x + 1 == player_x and y + 1 == player_y:
+                            player_crushed = True
+    return player_crushed
+
+
+def random_cave(width, height, rng):
+    """A walled cave of dirt with scattered rocks, diamonds and open pockets."""
+    rows = ["#" * width]
+    for _ in range(height - 2):
+        cells = rng.choices(".O$ ", weights=(70, 15, 5, 10), k=width - 2)
+        rows.append("#" + "".join(cells) + "#")
+    rows.append("#" * width)
+    return "\n".join(rows)
+
+
+def dig_plan(width, height, rng):
+    """Cells to dig each tick, the same for both engines."""
+    return [[(rng.randrange(1, width - 1), rng.randrange(1, height - 1)) for _ in range(DIGS_PER_TICK)]
+            for _ in range(TICKS)]
+
+
+def run(grid, plan, tick):
+    """Dig and tick through the plan; returns seconds spent ticking."""
+    elapsed = 0.0
+    for digs in plan:
+        for x, y in digs:
+            if grid.get_tile(x, y) == TILE_DIRT:
+                grid.set_tile(x, y, TILE_EMPTY)
+        start = time.perf_counter()
+        tick(grid)
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def physics():
+    """Time gravity ticks with and without the scheduler on each cave size."""
+    print(f"Gravity tick, {TICKS} ticks with {DIGS_PER_TICK} cells dug before each")
+    for width, height in CAVE_SIZES:
+        rng = random.Random(SEED)
+        level = random_cave(width, height, rng)
+        plan = dig_plan(width, height, rng)
+
+        legacy_grid = Grid()
+        legacy_grid.load_level(level)
+        legacy = run(legacy_grid, plan, lambda grid: legacy_update_physics(grid, -1, -1))
+
+        active_grid = Grid()
+        active_grid.load_level(level)
+        active = run(active_grid, plan, lambda grid: grid.tick(-1, -1))
+
+        assert active_grid.grid == legacy_grid.grid, f"caves diverged at {width}x{height}"
+        print(f"  {width:>3}x{height:<3}  full scan {legacy / TICKS * 1e6:9.1f} us   "
+              f"active cells {active / TICKS * 1e6:7.1f} us   {legacy / active:6.1f}x   (identical)")
+
+
+def rollouts():
+    """Random-policy rollouts branched from one cloned start state."""
+    rng = random.Random(SEED)
+    root = GameState()
+    steps = 0
+    start = time.perf_counter()
+    for _ in range(ROLLOUTS):
+        state = root.clone()
+        for _ in range(ROLLOUT_STEPS):
+            steps += 1
+            _, _, done = state.step_ai(rng.randrange(5), observe=False)
+            if done:
+                break
+    elapsed = time.perf_counter() - start
+    print(f"Rollouts: {ROLLOUTS} random-policy games, {steps} step_ai calls in {elapsed:.2f}s "
+          f"({steps / elapsed:,.0f} steps/s)")
+
+
+def main():
+    """Run both benchmarks."""
+    physics()
+    rollouts()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
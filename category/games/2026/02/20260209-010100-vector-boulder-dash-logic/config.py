@@ -46,6 +46,7 @@ DIAMONDS_TO_OPEN_EXIT = 5
 MAX_ENEMIES = 3
 SCORE_PER_DIAMOND = 10
 SCORE_EXIT_BONUS = 50
+SCORE_ENEMY_KILL = 20
 ENEMY_MOVE_INTERVAL = 500  # ms between enemy moves
 
 # Physics update timing
@@ -62,3 +63,4 @@ REWARD_DIAMOND = 10.0
 REWARD_EXIT = 50.0
 REWARD_DEATH = -100.0
 REWARD_ENEMY_KILL = 20.0
+AI_STEP_TIME = GRAVITY_UPDATE_INTERVAL  # Simulated ms per step_ai action
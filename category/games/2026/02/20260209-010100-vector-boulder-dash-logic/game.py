@@ -6,8 +6,8 @@ from grid import Grid
 from player import Player
 
 
-class Game:
-    """Main game class managing rendering and game loop."""
+class GameState:
+    """Game rules and state without a window, for agents and bulk rollouts."""
 
     DEFAULT_LEVEL = """####################
 #..................#
@@ -25,13 +25,8 @@ class Game:
 #..P...............#
 ####################"""
 
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(CAPTION)
-        self.clock = pygame.time.Clock()
-        self.running = True
-
+    def __init__(self, level_data=None):
+        self.level_data = level_data or self.DEFAULT_LEVEL
         self.grid = Grid()
         self.player = None
         self.score = 0
@@ -40,13 +35,18 @@ class Game:
         self.game_state = "ready"  # ready, playing, game_over, win
         self.message = ""
         self.steps_taken = 0
+        self.ai_time = 0  # Simulated clock for step_ai, in ms
 
-        # Fonts
-        self.score_font = pygame.font.Font(None, FONT_SIZE_SCORE)
-        self.message_font = pygame.font.Font(None, FONT_SIZE_MESSAGE)
-        self.info_font = pygame.font.Font(None, FONT_SIZE_INFO)
+        self.load_level(self.level_data)
 
-        self.load_level(self.DEFAULT_LEVEL)
+    def clone(self):
+        """An independent copy of the game, to branch rollouts from."""
+        other = self.__class__.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        other.grid = self.grid.clone()
+        other.player = Player(self.player.start_x, self.player.start_y)
+        other.player.x, other.player.y = self.player.x, self.player.y
+        return other
 
     def find_player_start(self, level_data):
         """Find player starting position from level data."""
@@ -68,16 +68,137 @@ class Game:
 
     def reset_game(self):
         """Reset to initial state."""
-        self.load_level(self.DEFAULT_LEVEL)
+        self.load_level(self.level_data)
         self.level = 1
         self.game_state = "ready"
         self.message = ""
 
     def restart_level(self):
         """Restart current level."""
-        self.load_level(self.DEFAULT_LEVEL)
+        self.load_level(self.level_data)
         self.game_state = "playing"
 
+    def move_player(self, dx, dy):
+        """Move the player one cell, collecting diamonds and finishing at the exit."""
+        moved, got_diamond, at_exit = self.player.move(dx, dy, self.grid)
+        if moved:
+            self.steps_taken += 1
+        if got_diamond:
+            self.score += SCORE_PER_DIAMOND
+        if at_exit:
+            self.score += SCORE_EXIT_BONUS
+            self.game_state = "win"
+            self.message = f"Level Complete! Score: {self.score}"
+
+    def update(self, current_time):
+        """Update game state."""
+        if self.game_state == "playing":
+            # Update physics
+            crushed = self.grid.update_physics(current_time, self.player.x, self.player.y)
+            if crushed:
+                self.game_state = "game_over"
+                self.message = "Crushed by a rock!"
+                if self.score > self.high_score:
+                    self.high_score = self.score
+
+            # Update enemies
+            caught = self.grid.update_enemies(current_time, self.player.x, self.player.y)
+            if caught:
+                self.game_state = "game_over"
+                self.message = "Caught by enemy!"
+                if self.score > self.high_score:
+                    self.high_score = self.score
+
+            # Check for enemy kills by rocks
+            self.score += self.grid.crush_enemies() * SCORE_ENEMY_KILL
+
+    def step_ai(self, action, observe=True):
+        """
+        Execute an AI action and return observation, reward, done.
+
+        Each step advances a simulated clock by AI_STEP_TIME, so rollouts run
+        as fast as the machine allows and replay identically.
+
+        Args:
+            action: 0 = up, 1 = down, 2 = left, 3 = right, 4 = wait
+            observe: False skips building the observation (returned as None)
+
+        Returns:
+            (observation, reward, done)
+        """
+        prev_diamonds = self.grid.diamonds_collected
+        if self.game_state == "ready":
+            self.game_state = "playing"
+
+        dx, dy = 0, 0
+        if action == 0:
+            dy = -1
+        elif action == 1:
+            dy = 1
+        elif action == 2:
+            dx = -1
+        elif action == 3:
+            dx = 1
+
+        if dx != 0 or dy != 0:
+            self.move_player(dx, dy)
+
+        self.ai_time += AI_STEP_TIME
+        self.update(self.ai_time)
+
+        reward = REWARD_PER_STEP
+
+        if self.grid.diamonds_collected > prev_diamonds:
+            reward += REWARD_DIAMOND
+
+        if self.grid.enemy_killed:
+            reward += REWARD_ENEMY_KILL
+
+        observation = self.get_observation() if observe else None
+
+        if self.game_state == "win":
+            reward += REWARD_EXIT
+            return observation, reward, True
+
+        if self.game_state == "game_over":
+            reward = REWARD_DEATH
+            return observation, reward, True
+
+        return observation, reward, False
+
+    def get_observation(self):
+        """Return current game state for AI."""
+        obs = {
+            "player_x": self.player.x,
+            "player_y": self.player.y,
+            "diamonds_collected": self.grid.diamonds_collected,
+            "diamonds_total": self.grid.diamonds_total,
+            "exit_open": self.grid.exit_open,
+            "score": self.score,
+            "game_state": self.game_state,
+            "grid": [row[:] for row in self.grid.grid],
+            "enemies": [{"x": e["x"], "y": e["y"]} for e in self.grid.enemies]
+        }
+        return obs
+
+
+class Game(GameState):
+    """Main game class managing rendering and game loop."""
+
+    def __init__(self, level_data=None):
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption(CAPTION)
+        self.clock = pygame.time.Clock()
+        self.running = True
+
+        # Fonts
+        self.score_font = pygame.font.Font(None, FONT_SIZE_SCORE)
+        self.message_font = pygame.font.Font(None, FONT_SIZE_MESSAGE)
+        self.info_font = pygame.font.Font(None, FONT_SIZE_INFO)
+
+        super().__init__(level_data)
+
     def handle_input(self):
         """Handle user input."""
         for event in pygame.event.get():
@@ -105,44 +226,7 @@ class Game:
                         dx = 1
 
                     if dx != 0 or dy != 0:
-                        moved, got_diamond, at_exit = self.player.move(dx, dy, self.grid)
-                        if moved:
-                            self.steps_taken += 1
-                        if got_diamond:
-                            self.score += SCORE_PER_DIAMOND
-                        if at_exit:
-                            self.score += SCORE_EXIT_BONUS
-                            self.game_state = "win"
-                            self.message = f"Level Complete! Score: {self.score}"
-
-    def update(self):
-        """Update game state."""
-        if self.game_state == "playing":
-            current_time = pygame.time.get_ticks()
-
-            # Update physics
-            crushed = self.grid.update_physics(current_time, self.player.x, self.player.y)
-            if crushed:
-                self.game_state = "game_over"
-                self.message = "Crushed by a rock!"
-                if self.score > self.high_score:
-                    self.high_score = self.score
-
-            # Update enemies
-            caught = self.grid.update_enemies(current_time, self.player.x, self.player.y)
-            if caught:
-                self.game_state = "game_over"
-                self.message = "Caught by enemy!"
-                if self.score > self.high_score:
-                    self.high_score = self.score
-
-            # Check for enemy kills by rocks
-            for enemy in self.grid.enemies[:]:
-                ex, ey = enemy['x'], enemy['y']
-                tile = self.grid.get_tile(ex, ey)
-                if tile == TILE_ROCK:
-                    if self.grid.check_enemy_crushed(ex, ey):
-                        self.score += SCORE_ENEMY_KILL
+                        self.move_player(dx, dy)
 
     def draw_tile(self, x, y, tile):
         """Draw a single tile."""
@@ -304,79 +388,11 @@ class Game:
 
         pygame.display.flip()
 
-    def step_ai(self, action):
-        """
-        Execute an AI action and return observation, reward, done.
-
-        Args:
-            action: 0 = up, 1 = down, 2 = left, 3 = right, 4 = wait
-
-        Returns:
-            (observation, reward, done)
-        """
-        prev_score = self.score
-        prev_diamonds = self.grid.diamonds_collected
-
-        dx, dy = 0, 0
-        if action == 0:
-            dy = -1
-        elif action == 1:
-            dy = 1
-        elif action == 2:
-            dx = -1
-        elif action == 3:
-            dx = 1
-
-        if dx != 0 or dy != 0:
-            moved, got_diamond, at_exit = self.player.move(dx, dy, self.grid)
-            if moved:
-                self.steps_taken += 1
-            if got_diamond:
-                self.score += SCORE_PER_DIAMOND
-            if at_exit:
-                self.score += SCORE_EXIT_BONUS
-                self.game_state = "win"
-
-        self.update()
-
-        reward = REWARD_PER_STEP
-
-        if self.grid.diamonds_collected > prev_diamonds:
-            reward += REWARD_DIAMOND
-
-        if self.grid.enemy_killed:
-            reward += REWARD_ENEMY_KILL
-
-        if self.game_state == "win":
-            reward += REWARD_EXIT
-            return self.get_observation(), reward, True
-
-        if self.game_state == "game_over":
-            reward = REWARD_DEATH
-            return self.get_observation(), reward, True
-
-        return self.get_observation(), reward, False
-
-    def get_observation(self):
-        """Return current game state for AI."""
-        obs = {
-            "player_x": self.player.x,
-            "player_y": self.player.y,
-            "diamonds_collected": self.grid.diamonds_collected,
-            "diamonds_total": self.grid.diamonds_total,
-            "exit_open": self.grid.exit_open,
-            "score": self.score,
-            "game_state": self.game_state,
-            "grid": [row[:] for row in self.grid.grid],
-            "enemies": [{"x": e["x"], "y": e["y"]} for e in self.grid.enemies]
-        }
-        return obs
-
     def run(self):
         """Main game loop."""
         while self.running:
             self.handle_input()
-            self.update()
+            self.update(pygame.time.get_ticks())
             self.render()
             self.clock.tick(FPS)
 
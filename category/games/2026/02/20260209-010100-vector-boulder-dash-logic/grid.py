@@ -1,10 +1,23 @@
 """Grid-based level and physics simulation for Boulder Dash."""
 
+import heapq
+
 from config import *
 
+ROUNDED_TILES = (TILE_ROCK, TILE_DIAMOND)
+WALKABLE_TILES = (TILE_EMPTY, TILE_DIRT, TILE_DIAMOND, TILE_EXIT, TILE_EXIT_OPEN)
+
 
 class Grid:
-    """Manages the game grid and physics simulation."""
+    """Manages the game grid and physics simulation.
+
+    Only rocks and diamonds can move, and only after something next to them
+    changes, so the grid keeps the set of rounded objects that might have
+    become unstable. Every tile change marks the objects whose fall or roll
+    depends on that tile. A gravity tick visits just those cells, in the
+    same bottom-up, alternating-direction order as a scan of the whole cave,
+    so the outcome is identical.
+    """
 
     def __init__(self):
         self.grid = []
@@ -14,17 +27,25 @@ class Grid:
         self.diamonds_total = 0
         self.exit_open = False
         self.enemies = []
+        self.enemy_cells = {}  # (x, y) -> enemies standing there, in list order
         self.last_gravity_update = 0
         self.last_enemy_update = 0
         self.enemy_killed = False
+        self.dirty = set()  # (x, y) of objects to check on the next tick
+        self.rock_landings = set()  # Cells a rock moved into since the last crush check
+        self._queue = None  # Scan keys still to visit during a tick
+        self._scan_key_now = -1  # Scan key of the cell being processed
 
     def load_level(self, level_data):
         """Load a level from a string representation."""
         self.grid = []
         self.enemies = []
+        self.enemy_cells = {}
 
         # Parse level data
-        for row in level_data.strip().split('\n'):
+        rows = level_data.strip().split('\n')
+        self.width = max(GRID_COLS, max(len(row) for row in rows))
+        for row in rows:
             grid_row = []
             for char in row:
                 if char == '#':
@@ -40,16 +61,36 @@ class Grid:
                     self.diamonds_total += 1
                 elif char == 'E':
                     grid_row.append(TILE_EMPTY)
-                    self.enemies.append({'x': len(grid_row), 'y': len(self.grid)})
+                    self.add_enemy(len(grid_row), len(self.grid))
                 elif char == 'X':
                     grid_row.append(TILE_EXIT)
                 else:
                     grid_row.append(TILE_EMPTY)
+            grid_row.extend([TILE_WALL] * (self.width - len(grid_row)))
             self.grid.append(grid_row)
 
         # Ensure grid has correct dimensions
-        while len(self.grid) < self.height:
+        while len(self.grid) < GRID_ROWS:
             self.grid.append([TILE_WALL] * self.width)
+        self.height = len(self.grid)
+
+        # Every object gets checked once on the first tick
+        self.dirty = {(x, y) for y in range(self.height - 1) for x in range(self.width)
+                      if self.grid[y][x] in ROUNDED_TILES}
+        self.rock_landings = set()
+
+    def clone(self):
+        """An independent copy of the cave, for branching rollouts."""
+        other = Grid.__new__(Grid)
+        other.__dict__.update(self.__dict__)
+        other.grid = [row[:] for row in self.grid]
+        other.enemies = [dict(enemy) for enemy in self.enemies]
+        other.enemy_cells = {}
+        for enemy in other.enemies:
+            other.enemy_cells.setdefault((enemy['x'], enemy['y']), []).append(enemy)
+        other.dirty = set(self.dirty)
+        other.rock_landings = set(self.rock_landings)
+        return other
 
     def is_valid_pos(self, x, y):
         """Check if position is within grid bounds."""
@@ -65,11 +106,40 @@ class Grid:
         """Set tile at position."""
         if self.is_valid_pos(x, y):
             self.grid[y][x] = tile
+            self._touch(x, y)
+            if tile == TILE_ROCK:
+                self.rock_landings.add((x, y))
+
+    def _scan_key(self, x, y):
+        """Position of a cell in the physics scan order: rows bottom-up, alternating direction."""
+        if (self.height - y) % 2 == 1:
+            return (self.height - y) * self.width + x
+        return (self.height - y) * self.width + self.width - 1 - x
+
+    def _touch(self, x, y):
+        """Mark the objects whose stability depends on tile (x, y).
+
+        An object at (a, b) looks at the tiles below it and on both sides of
+        it and of the tile below, so a change at (x, y) concerns the objects
+        at x-1..x+1 on rows y-1 and y.
+        """
+        grid = self.grid
+        for b in (y - 1, y):
+            if not 0 <= b < self.height - 1:
+                continue
+            row = grid[b]
+            for a in (x - 1, x, x + 1):
+                if 0 <= a < self.width and row[a] in ROUNDED_TILES:
+                    if self._queue is not None and self._scan_key(a, b) > self._scan_key_now:
+                        # Still ahead in this tick's scan
+                        heapq.heappush(self._queue, (self._scan_key(a, b), a, b))
+                    else:
+                        self.dirty.add((a, b))
 
     def is_walkable(self, x, y):
         """Check if player can walk to position."""
         tile = self.get_tile(x, y)
-        return tile in (TILE_EMPTY, TILE_DIRT, TILE_DIAMOND, TILE_EXIT, TILE_EXIT_OPEN)
+        return tile in WALKABLE_TILES
 
     def dig(self, x, y):
         """Dig dirt at position, returns True if diamond collected."""
@@ -91,7 +161,7 @@ class Grid:
         for y in range(self.height):
             for x in range(self.width):
                 if self.grid[y][x] == TILE_EXIT:
-                    self.grid[y][x] = TILE_EXIT_OPEN
+                    self.set_tile(x, y, TILE_EXIT_OPEN)
 
     def can_fall_into(self, tile):
         """Check if an object can fall into this tile."""
@@ -99,11 +169,11 @@ class Grid:
 
     def can_roll_off(self, tile):
         """Check if a rounded object can roll off this tile."""
-        return tile in (TILE_ROCK, TILE_DIAMOND)
+        return tile in ROUNDED_TILES
 
     def is_rounded(self, tile):
         """Check if tile is a rounded object."""
-        return tile in (TILE_ROCK, TILE_DIAMOND)
+        return tile in ROUNDED_TILES
 
     def update_physics(self, current_time, player_x, player_y):
         """Update gravity and rock physics. Returns True if player was crushed."""
@@ -111,76 +181,81 @@ class Grid:
             return False
 
         self.last_gravity_update = current_time
-        player_crushed = False
-
-        # Process from bottom to top, alternating left-right direction
-        for y in range(self.height - 2, -1, -1):
-            direction = 1 if (self.height - y) % 2 == 1 else -1
-            x_range = range(self.width - 1, -1, -1) if direction == -1 else range(self.width)
-
-            for x in x_range:
-                tile = self.get_tile(x, y)
-
-                if self.is_rounded(tile):
-                    below = self.get_tile(x, y + 1)
-
-                    # Fall straight down
-                    if self.can_fall_into(below):
-                        self.set_tile(x, y, TILE_EMPTY)
-                        self.set_tile(x, y + 1, tile)
-
-                        # Check if player is crushed
-                        if x == player_x and y + 1 == player_y:
-                            player_crushed = True
-
-                    # Roll off rounded objects
-                    elif self.can_roll_off(below):
-                        # Try left
-                        left = self.get_tile(x - 1, y)
-                        left_below = self.get_tile(x - 1, y + 1)
-
-                        if self.can_fall_into(left) and self.can_fall_into(left_below):
-                            self.set_tile(x, y, TILE_EMPTY)
-                            self.set_tile(x - 1, y + 1, tile)
-
-                            if x - 1 == player_x and y + 1 == player_y:
-                                player_crushed = True
-
-                        # Try right
-                        else:
-                            right = self.get_tile(x + 1, y)
-                            right_below = self.get_tile(x + 1, y + 1)
-
-                            if self.can_fall_into(right) and self.can_fall_into(right_below):
-                                self.set_tile(x, y, TILE_EMPTY)
-                                self.set_tile(x + 1, y + 1, tile)
+        return self.tick(player_x, player_y)
 
-                                if x + 1 == player_x and y + 1 == player_y:
-                                    player_crushed = True
-
-                    # Roll off walls/dirt (with empty space below and to side)
-                    elif below in (TILE_WALL, TILE_DIRT):
-                        left = self.get_tile(x - 1, y)
-                        left_below = self.get_tile(x - 1, y + 1)
-                        right = self.get_tile(x + 1, y)
-                        right_below = self.get_tile(x + 1, y + 1)
-
-                        if self.can_fall_into(left) and self.can_fall_into(left_below):
-                            self.set_tile(x, y, TILE_EMPTY)
-                            self.set_tile(x - 1, y + 1, tile)
-
-                            if x - 1 == player_x and y + 1 == player_y:
-                                player_crushed = True
-
-                        elif self.can_fall_into(right) and self.can_fall_into(right_below):
-                            self.set_tile(x, y, TILE_EMPTY)
-                            self.set_tile(x + 1, y + 1, tile)
-
-                            if x + 1 == player_x and y + 1 == player_y:
-                                player_crushed = True
+    def tick(self, player_x, player_y):
+        """Run one gravity step over the marked objects. Returns True if player was crushed."""
+        if not self.dirty:
+            return False
+        player_crushed = False
 
+        # Objects marked since the last tick, in scan order; objects that
+        # get marked while the scan is still behind them join this tick
+        queue = [(self._scan_key(x, y), x, y) for x, y in self.dirty]
+        heapq.heapify(queue)
+        self.dirty = set()
+        self._queue = queue
+        self._scan_key_now = -1
+        try:
+            while queue:
+                key, x, y = heapq.heappop(queue)
+                if key == self._scan_key_now:
+                    continue  # Marked twice
+                self._scan_key_now = key
+                target = self._move_target(x, y)
+                if target is None:
+                    continue
+                tile = self.grid[y][x]
+                self.set_tile(x, y, TILE_EMPTY)
+                self.set_tile(target, y + 1, tile)
+
+                # Check if player is crushed
+                if target == player_x and y + 1 == player_y:
+                    player_crushed = True
+        finally:
+            self._queue = None
         return player_crushed
 
+    def _move_target(self, x, y):
+        """Column the object at (x, y) falls or rolls into on the row below, or None."""
+        tile = self.get_tile(x, y)
+        if not self.is_rounded(tile):
+            return None
+        below = self.get_tile(x, y + 1)
+
+        # Fall straight down
+        if self.can_fall_into(below):
+            return x
+
+        # Roll off rounded objects, walls and dirt, trying left first
+        if self.can_roll_off(below) or below in (TILE_WALL, TILE_DIRT):
+            if self.can_fall_into(self.get_tile(x - 1, y)) and self.can_fall_into(self.get_tile(x - 1, y + 1)):
+                return x - 1
+            if self.can_fall_into(self.get_tile(x + 1, y)) and self.can_fall_into(self.get_tile(x + 1, y + 1)):
+                return x + 1
+        return None
+
+    def add_enemy(self, x, y):
+        """Place an enemy and index it by position."""
+        enemy = {'x': x, 'y': y}
+        self.enemies.append(enemy)
+        self.enemy_cells.setdefault((x, y), []).append(enemy)
+        return enemy
+
+    def _move_enemy(self, enemy, x, y):
+        """Move an enemy, keeping the position index current."""
+        cell = self.enemy_cells[(enemy['x'], enemy['y'])]
+        cell.remove(enemy)
+        if not cell:
+            del self.enemy_cells[(enemy['x'], enemy['y'])]
+        enemy['x'] = x
+        enemy['y'] = y
+        self.enemy_cells.setdefault((x, y), []).append(enemy)
+
+    def enemies_at(self, x, y):
+        """Enemies standing on a cell."""
+        return self.enemy_cells.get((x, y), ())
+
     def update_enemies(self, current_time, player_x, player_y):
         """Update enemy positions. Returns True if player is caught."""
         if current_time - self.last_enemy_update < ENEMY_MOVE_INTERVAL:
@@ -208,8 +283,7 @@ class Grid:
             new_x, new_y = ex + move_x, ey + move_y
 
             if self.is_walkable(new_x, new_y) and self.get_tile(new_x, new_y) != TILE_EXIT:
-                enemy['x'] = new_x
-                enemy['y'] = new_y
+                self._move_enemy(enemy, new_x, new_y)
             else:
                 # Try alternate direction
                 if move_x != 0:
@@ -221,8 +295,7 @@ class Grid:
 
                 new_x, new_y = ex + move_x, ey + move_y
                 if self.is_walkable(new_x, new_y) and self.get_tile(new_x, new_y) != TILE_EXIT:
-                    enemy['x'] = new_x
-                    enemy['y'] = new_y
+                    self._move_enemy(enemy, new_x, new_y)
 
             # Check if enemy reached player
             if enemy['x'] == player_x and enemy['y'] == player_y:
@@ -232,12 +305,25 @@ class Grid:
 
     def check_enemy_crushed(self, x, y):
         """Check if an enemy was crushed by a falling rock."""
-        for enemy in self.enemies[:]:
-            if enemy['x'] == x and enemy['y'] == y:
-                self.enemies.remove(enemy)
-                self.enemy_killed = True
-                return True
-        return False
+        cell = self.enemy_cells.get((x, y))
+        if not cell:
+            return False
+        enemy = cell.pop(0)
+        if not cell:
+            del self.enemy_cells[(x, y)]
+        self.enemies.remove(enemy)
+        self.enemy_killed = True
+        return True
+
+    def crush_enemies(self):
+        """Remove every enemy a rock has moved onto; returns how many died."""
+        killed = 0
+        for x, y in self.rock_landings:
+            if self.grid[y][x] == TILE_ROCK:
+                while self.check_enemy_crushed(x, y):
+                    killed += 1
+        self.rock_landings = set()
+        return killed
 
     def can_push_rock(self, x, y, dx):
         """Check if rock at x,y can be pushed in direction dx."""
@@ -0,0 +1,125 @@
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import navigation
+from main import *
+from sim import MAX_FRAMES, run_episodes
+
+# Ghost steering before and after the navigation tables, the cost of building
+# versus loading the tables, and headless episodes per minute with the autopilot.
+
+SEED = 5
+GHOST_MOVES = 20000
+EPISODES = 60
+
+
+def legacy_target(ghost, pacman, blinky):
+    # The previous Ghost.get_target, one numpy scalar draw per coordinate
+    pr, pc = pacman.get_grid_position()
+    if ghost.mode == GhostMode.FRIGHTENED:
+        return (np.random.randint(0, ROWS), np.random.randint(0, COLS))
+    if ghost.ghost_type == PINKY:
+        dr, dc = pacman.direction.value
+        return (max(0, min(ROWS - 1, pr + dr * 4)), max(0, min(COLS - 1, pc + dc * 4)))
+    if ghost.ghost_type == INKY and blinky:
+        br, bc = blinky.get_grid_position()
+        dr, dc = pacman.direction.value
+        return (max(0, min(ROWS - 1, int(br + (pr + dr * 2 - br) * 2))),
+                max(0, min(COLS - 1, int(bc + (pc + dc * 2 - bc) * 2))))
+    if ghost.ghost_type == CLYDE and abs(ghost.row - pr) + abs(ghost.col - pc) < 8:
+        return (np.random.randint(0, ROWS), np.random.randint(0, COLS))
+    return (pr, pc)
+
+
+def legacy_move(ghost, maze, pacman, blinky):
+    # The previous Ghost.move: rebuild the candidates, pick by straight-line distance
+    target_row, target_col = legacy_target(ghost, pacman, blinky)
+    valid_moves = []
+    for direction in Direction:
+        if direction == Direction.NONE:
+            continue
+        dr, dc = direction.value
+        new_row = ghost.row + dr
+        new_col = ghost.col + dc
+        if maze.has_warp_tunnel(ghost.row, ghost.col):
+            if new_col < 0:
+                new_col = COLS - 1
+            elif new_col >= COLS:
+                new_col = 0
+        if 0 <= new_row < ROWS and 0 <= new_col < COLS:
+            if not maze.is_wall(new_row, new_col):
+                reverse = (direction.value[0] == -ghost.direction.value[0] and
+                           direction.value[1] == -ghost.direction.value[1])
+                if len(valid_moves) == 0 or not reverse:
+                    valid_moves.append((direction, new_row, new_col))
+    if valid_moves:
+        if ghost.mode == GhostMode.FRIGHTENED:
+            best_move = max(valid_moves, key=lambda m: -((m[1] - target_row)**2 + (m[2] - target_col)**2))
+        else:
+            best_move = min(valid_moves, key=lambda m: (m[1] - target_row)**2 + (m[2] - target_col)**2)
+        ghost.direction, ghost.row, ghost.col = best_move
+
+
+def bench_ghosts(move):
+    # Microseconds per ghost move, ghosts chasing a Pac-Man that hops around the maze
+    rng = random.Random(SEED)
+    np.random.seed(SEED)
+    maze = Maze()
+    cells = maze.tables.cells
+    pacman = Pacman(*cells[0])
+    ghosts = [Ghost(11, 14, BLINKY, RED, rng), Ghost(14, 13, PINKY, PINK, rng),
+              Ghost(14, 14, INKY, CYAN, rng), Ghost(14, 15, CLYDE, ORANGE, rng)]
+    hops = [rng.choice(cells) for _ in range(GHOST_MOVES // 64 + 1)]
+    start = time.perf_counter()
+    for i in range(GHOST_MOVES // len(ghosts)):
+        if i % 16 == 0:
+            pacman.row, pacman.col = hops[i // 16]
+        for ghost in ghosts:
+            move(ghost, maze, pacman, ghosts[0])
+    return (time.perf_counter() - start) * 1e6 / GHOST_MOVES
+
+
+def bench_tables():
+    walls = Maze().tables.walls
+    moves = [direction.value for direction in MOVES]
+    start = time.perf_counter()
+    tables = navigation.MazeTables(walls, moves)
+    tables.build()
+    built = time.perf_counter() - start
+    path = os.path.join(TABLES_DIR, f"maze_tables_{navigation.tables_key(walls, moves)}.npz")
+    start = time.perf_counter()
+    navigation.MazeTables(walls, moves).load(path)
+    loaded = time.perf_counter() - start
+    return tables, built, loaded
+
+
+def main():
+    tables, built, loaded = bench_tables()
+    print(f"tables: {tables.size} tiles, {tables.dist.nbytes + tables.next_move.nbytes} bytes, "
+          f"built in {built * 1000:.0f} ms, loaded from cache in {loaded * 1000:.1f} ms")
+
+    legacy = bench_ghosts(legacy_move)
+    table = bench_ghosts(lambda ghost, maze, pacman, blinky: ghost.move(maze, pacman, blinky))
+    print(f"ghost move: straight-line {legacy:.1f} us, maze-distance table {table:.1f} us")
+
+    cpus = os.cpu_count() or 1
+    for processes in sorted({1, cpus}):
+        start = time.perf_counter()
+        results = run_episodes(EPISODES, SEED, processes=processes)
+        elapsed = time.perf_counter() - start
+        frames = sum(result["frames"] for result in results)
+        score = sum(result["score"] for result in results) / EPISODES
+        print(f"autopilot episodes, {processes} process(es): {EPISODES * 60 / elapsed:.0f} games/min, "
+              f"{frames / elapsed / FPS:.0f}x real time, mean score {score:.0f} "
+              f"(cap {MAX_FRAMES // FPS} s of play)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,11 @@
 import pygame
 import numpy as np
+import os
+import random
 import sys
 from enum import Enum
 from typing import Tuple, List, Optional
+from navigation import NO_MOVE, load_tables
 
 # Constants
 SCREEN_WIDTH = 600
@@ -39,6 +42,16 @@ DOT_POINTS = 10
 POWER_PELLET_POINTS = 50
 GHOST_POINTS = [200, 400, 800, 1600]
 
+# Navigation tables are cached next to the game, one file per maze layout
+TABLES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Autopilot distances, in tiles along the maze: moves this close to a chasing
+# ghost are unsafe, a ghost this close switches to escaping, and frightened
+# ghosts this close are hunted
+AUTOPILOT_DANGER = 3
+AUTOPILOT_CAUTION = 6
+AUTOPILOT_HUNT = 8
+
 class Direction(Enum):
     UP = (0, -1)
     DOWN = (0, 1)
@@ -46,6 +59,11 @@ class Direction(Enum):
     RIGHT = (1, 0)
     NONE = (0, 0)
 
+# Move codes used by the navigation tables, in Direction order
+MOVES = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+MOVE_CODES = {direction: code for code, direction in enumerate(MOVES)}
+MOVE_CODES[Direction.NONE] = NO_MOVE
+
 class GhostMode(Enum):
     CHASE = 0
     FRIGHTENED = 1
@@ -88,6 +106,17 @@ class Maze:
         self.grid = np.zeros((ROWS, COLS), dtype=int)
         self._parse_layout()
 
+        # Shortest paths between all walkable tiles; rows below the layout are outside the maze
+        walls = self.grid == WALL
+        walls[len(self.LAYOUT):] = True
+        self.tables = load_tables(walls, [direction.value for direction in MOVES], TABLES_DIR)
+        self.node_tiles = self.tables.flat_cells
+
+        # Pellets sealed off from the rest of the maze could never be eaten,
+        # which would make the level impossible to clear
+        self.grid[(self.grid != WALL) & self.tables.walls] = EMPTY
+        self.pellets_left = int(self.get_dot_count() + self.get_power_pellet_count())
+
     def _parse_layout(self):
         ghost_box_start_row = 12
         ghost_box_end_row = 16
@@ -129,6 +158,7 @@ class Maze:
     def remove_dot(self, row: int, col: int) -> bool:
         if self.grid[row, col] in (DOT, POWER_PELLET):
             self.grid[row, col] = EMPTY
+            self.pellets_left -= 1
             return True
         return False
 
@@ -141,6 +171,11 @@ class Maze:
     def has_warp_tunnel(self, row: int, col: int) -> bool:
         return col == 0 or col == COLS - 1
 
+    def pellet_nodes(self) -> np.ndarray:
+        # Mask over the navigation nodes of tiles still holding a dot or power pellet
+        tiles = self.grid.ravel()[self.node_tiles]
+        return (tiles == DOT) | (tiles == POWER_PELLET)
+
 class Entity:
     def __init__(self, row: int, col: int):
         self.row = row
@@ -155,10 +190,12 @@ class Entity:
         return (self.row, self.col)
 
 class Ghost(Entity):
-    def __init__(self, row: int, col: int, ghost_type: int, color: Tuple[int, int, int]):
+    def __init__(self, row: int, col: int, ghost_type: int, color: Tuple[int, int, int],
+                 rng: Optional[random.Random] = None):
         super().__init__(row, col)
         self.ghost_type = ghost_type
         self.color = color
+        self.rng = rng or random.Random()
         self.mode = GhostMode.CHASE
         self.frightened_timer = 0
         self.direction = Direction.LEFT
@@ -187,7 +224,7 @@ class Ghost(Entity):
 
         if self.mode == GhostMode.FRIGHTENED:
             # Random target when frightened
-            return (np.random.randint(0, ROWS), np.random.randint(0, COLS))
+            return (self.rng.randrange(ROWS), self.rng.randrange(COLS))
 
         if self.ghost_type == BLINKY:
             # Target Pacman's current position
@@ -211,63 +248,29 @@ class Ghost(Entity):
             # Move randomly if too close to Pacman, otherwise target Pacman
             dist = abs(self.row - pr) + abs(self.col - pc)
             if dist < 8:
-                return (np.random.randint(0, ROWS), np.random.randint(0, COLS))
+                return (self.rng.randrange(ROWS), self.rng.randrange(COLS))
             return (pr, pc)
 
         return (pr, pc)
 
     def move(self, maze: Maze, pacman: 'Pacman', blinky: Optional['Ghost']):
-        target_row, target_col = self.get_target(pacman, blinky)
-
-        # Get valid moves
-        valid_moves = []
-        for direction in Direction:
-            if direction == Direction.NONE:
-                continue
-            dr, dc = direction.value
-            new_row = self.row + dr
-            new_col = self.col + dc
-
-            # Handle warp tunnels
-            if maze.has_warp_tunnel(self.row, self.col):
-                if new_col < 0:
-                    new_col = COLS - 1
-                elif new_col >= COLS:
-                    new_col = 0
-
-            # Check if valid move (not wall, and not reversing if possible)
-            if 0 <= new_row < ROWS and 0 <= new_col < COLS:
-                if not maze.is_wall(new_row, new_col):
-                    # Don't reverse direction unless necessary
-                    reverse = (direction.value[0] == -self.direction.value[0] and
-                              direction.value[1] == -self.direction.value[1])
-                    if len(valid_moves) == 0 or not reverse:
-                        valid_moves.append((direction, new_row, new_col))
-
-        # If no valid moves (shouldn't happen in proper maze), allow reverse
-        if not valid_moves:
-            for direction in Direction:
-                if direction == Direction.NONE:
-                    continue
-                dr, dc = direction.value
-                new_row = self.row + dr
-                new_col = self.col + dc
-                if 0 <= new_row < ROWS and 0 <= new_col < COLS:
-                    if not maze.is_wall(new_row, new_col):
-                        valid_moves.append((direction, new_row, new_col))
-
-        if valid_moves:
-            # Choose move that minimizes distance to target
+        tables = maze.tables
+        target = tables.target_node(*self.get_target(pacman, blinky))
+        # Maze distance from every tile to the target, by symmetry of the table
+        to_target = tables.dist_rows[target]
+
+        # Don't reverse direction unless it is the only way out
+        options = tables.options(self.row, self.col, MOVE_CODES[self.direction])
+        if options:
             if self.mode == GhostMode.FRIGHTENED:
                 # Maximize distance when frightened
-                best_move = max(valid_moves,
-                               key=lambda m: -((m[1] - target_row)**2 + (m[2] - target_col)**2))
+                code, node = max(options, key=lambda option: to_target[option[1]])
             else:
-                # Minimize distance when chasing
-                best_move = min(valid_moves,
-                               key=lambda m: (m[1] - target_row)**2 + (m[2] - target_col)**2)
+                # Follow a shortest path when chasing
+                code, node = min(options, key=lambda option: to_target[option[1]])
 
-            self.direction, self.row, self.col = best_move
+            self.direction = MOVES[code]
+            self.row, self.col = tables.cells[node]
 
 class Pacman(Entity):
     def __init__(self, row: int, col: int):
@@ -312,15 +315,55 @@ class Pacman(Entity):
                 self.row = new_row
                 self.col = new_col
 
-class Game:
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Vector Pac-Man Maze")
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.big_font = pygame.font.Font(None, 72)
-
+class Autopilot:
+    # Built-in Pac-Man agent, made of table lookups. Away from chasing ghosts
+    # it heads for the nearest pellet it can reach before any of them; when
+    # one comes close it takes the move that keeps the most of the maze on
+    # its side, and it hunts frightened ghosts nearby.
+    def choose(self, state: 'GameState') -> Direction:
+        maze = state.maze
+        tables = maze.tables
+        pacman = state.pacman
+        options = tables.options(pacman.row, pacman.col)
+        if not options:
+            return pacman.direction
+        nodes = [node for _, node in options]
+        from_options = tables.dist[nodes].astype(np.int32)
+
+        chasing = [tables.target_node(g.row, g.col) for g in state.ghosts if g.mode != GhostMode.FRIGHTENED]
+        frightened = [tables.target_node(g.row, g.col) for g in state.ghosts if g.mode == GhostMode.FRIGHTENED]
+        if chasing:
+            to_ghosts = tables.dist[chasing].min(axis=0)
+            danger = to_ghosts[nodes]
+            # Tiles Pac-Man reaches strictly before every chasing ghost, which move right after it
+            ahead = from_options + 1 < to_ghosts
+        else:
+            danger = np.full(len(nodes), tables.unreachable)
+            ahead = np.ones(from_options.shape, dtype=bool)
+
+        if frightened:
+            to_prey = tables.dist[frightened][:, nodes].min(axis=0)
+            to_prey = np.where(danger > AUTOPILOT_DANGER, to_prey, tables.unreachable)
+            if to_prey.min() <= AUTOPILOT_HUNT:
+                return MOVES[options[int(to_prey.argmin())][0]]
+
+        if danger.min() <= AUTOPILOT_CAUTION:
+            region = ahead.sum(axis=1)
+            best = max(range(len(options)), key=lambda i: (danger[i] > AUTOPILOT_DANGER, region[i], danger[i]))
+            return MOVES[options[best][0]]
+
+        # Nearest pellet, preferring the ones no ghost can get to first
+        pellets = maze.pellet_nodes()
+        reachable = ahead & pellets
+        targets = reachable if reachable.any() else np.broadcast_to(pellets, ahead.shape)
+        to_pellet = np.where(targets, from_options, tables.unreachable).min(axis=1)
+        return MOVES[options[int(to_pellet.argmin())][0]]
+
+class GameState:
+    # Game rules without a window, so episodes can also run headless
+    def __init__(self, seed: Optional[int] = None, autopilot: bool = False):
+        self.rng = random.Random(seed)
+        self.autopilot = Autopilot() if autopilot else None
         self.reset_game()
 
     def reset_game(self):
@@ -328,10 +371,10 @@ class Game:
         self.pacman = Pacman(21, 14)  # Starting position (lower-middle)
 
         # Initialize ghosts
-        self.blinky = Ghost(11, 14, BLINKY, RED)
-        self.pinky = Ghost(14, 13, PINKY, PINK)
-        self.inky = Ghost(14, 14, INKY, CYAN)
-        self.clyde = Ghost(14, 15, CLYDE, ORANGE)
+        self.blinky = Ghost(11, 14, BLINKY, RED, self.rng)
+        self.pinky = Ghost(14, 13, PINKY, PINK, self.rng)
+        self.inky = Ghost(14, 14, INKY, CYAN, self.rng)
+        self.clyde = Ghost(14, 15, CLYDE, ORANGE, self.rng)
 
         self.ghosts = [self.blinky, self.pinky, self.inky, self.clyde]
 
@@ -343,30 +386,13 @@ class Game:
         self.power_pellet_timer = 0
         self.move_timer = 0
         self.move_delay = 8  # Frames between moves
-
-    def handle_input(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.pacman.set_direction(Direction.UP)
-                elif event.key == pygame.K_DOWN:
-                    self.pacman.set_direction(Direction.DOWN)
-                elif event.key == pygame.K_LEFT:
-                    self.pacman.set_direction(Direction.LEFT)
-                elif event.key == pygame.K_RIGHT:
-                    self.pacman.set_direction(Direction.RIGHT)
-                elif event.key == pygame.K_r and (self.game_over or self.won):
-                    self.reset_game()
-                elif event.key == pygame.K_ESCAPE:
-                    return False
-        return True
+        self.frames = 0
 
     def update(self):
         if self.game_over or self.won:
             return
 
+        self.frames += 1
         self.move_timer += 1
 
         # Update frightened timer
@@ -382,6 +408,8 @@ class Game:
             self.move_timer = 0
 
             # Move Pacman
+            if self.autopilot:
+                self.pacman.set_direction(self.autopilot.choose(self))
             self.pacman.move(self.maze)
 
             # Check dot/power pellet collision
@@ -430,9 +458,41 @@ class Game:
                             self.ghost_eaten_count = 0
 
             # Check win condition
-            if self.maze.get_dot_count() == 0 and self.maze.get_power_pellet_count() == 0:
+            if self.maze.pellets_left == 0:
                 self.won = True
 
+class Game(GameState):
+    def __init__(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Vector Pac-Man Maze")
+        self.clock = pygame.time.Clock()
+        self.font = pygame.font.Font(None, 36)
+        self.big_font = pygame.font.Font(None, 72)
+
+        super().__init__()
+
+    def handle_input(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP:
+                    self.pacman.set_direction(Direction.UP)
+                elif event.key == pygame.K_DOWN:
+                    self.pacman.set_direction(Direction.DOWN)
+                elif event.key == pygame.K_LEFT:
+                    self.pacman.set_direction(Direction.LEFT)
+                elif event.key == pygame.K_RIGHT:
+                    self.pacman.set_direction(Direction.RIGHT)
+                elif event.key == pygame.K_a:
+                    self.autopilot = None if self.autopilot else Autopilot()
+                elif event.key == pygame.K_r and (self.game_over or self.won):
+                    self.reset_game()
+                elif event.key == pygame.K_ESCAPE:
+                    return False
+        return True
+
     def draw(self):
         self.screen.fill(BLACK)
 
@@ -469,6 +529,9 @@ class Game:
         lives_text = self.font.render(f"Lives: {self.lives}", True, WHITE)
         self.screen.blit(score_text, (10, 10))
         self.screen.blit(lives_text, (SCREEN_WIDTH - 150, 10))
+        if self.autopilot:
+            auto_text = self.font.render("AUTO", True, YELLOW)
+            self.screen.blit(auto_text, auto_text.get_rect(midtop=(SCREEN_WIDTH // 2, 10)))
 
         # Draw game over / win screen
         if self.game_over:
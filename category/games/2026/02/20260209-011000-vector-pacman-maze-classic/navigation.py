@@ -0,0 +1,203 @@
+import hashlib
+import os
+from collections import deque
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# All-pairs shortest paths over the walkable tiles of a maze, so ghosts and
+# the built-in Pac-Man agent steer with table lookups instead of searching.
+# Tables depend only on the walls; they are built once per layout and cached
+# on disk, so later runs only load two arrays.
+
+TABLES_VERSION = 1
+NO_MOVE = 255
+Exit = Tuple[int, int]  # (move code, neighbor node)
+
+
+class MazeTables:
+    def __init__(self, walls: np.ndarray, moves: Sequence[Tuple[int, int]]):
+        # walls: bool (rows, cols); moves: (dr, dc) for each move code.
+        # Stepping off the left or right edge wraps around (warp tunnels).
+        self.rows, self.cols = walls.shape
+        self.moves = tuple(tuple(move) for move in moves)
+        self.reverse = [self.moves.index((-dr, -dc)) for dr, dc in self.moves]
+        # Open tiles sealed off from the main maze are left out, so every pair is reachable
+        walls = walls | ~self._main_region(walls)
+        self.walls = walls
+        self.cells: List[Tuple[int, int]] = [tuple(cell) for cell in np.argwhere(~walls).tolist()]
+        self.size = len(self.cells)
+        # Flat grid offset of each node, for reading per-node tile values
+        self.flat_cells = np.flatnonzero(~walls)
+        self.index = np.full(walls.shape, -1, dtype=np.int32)
+        self.index[~walls] = np.arange(self.size)
+        self._index_rows = self.index.tolist()
+
+        self.exits: List[List[Exit]] = [self._find_exits(row, col) for row, col in self.cells]
+        # Exits by current heading: no reversing unless it is the only way out
+        self.turns: List[List[List[Exit]]] = []
+        for exits in self.exits:
+            by_heading = []
+            for heading in range(len(self.moves)):
+                forward = [(code, node) for code, node in exits if code != self.reverse[heading]]
+                by_heading.append(forward or exits)
+            by_heading.append(exits)  # standing still
+            self.turns.append(by_heading)
+        self._off_grid_exits: Dict[Tuple[int, int], List[Exit]] = {}
+
+        self.dist = None
+        self.next_move = None
+        self._nearest_rows = self._nearest_nodes().tolist()
+
+    def _main_region(self, walls: np.ndarray) -> np.ndarray:
+        # Largest set of open tiles connected by moves, edge wrap included
+        region = np.zeros(walls.shape, dtype=bool)
+        seen = walls.copy()
+        for start in zip(*np.nonzero(~walls)):
+            if seen[start]:
+                continue
+            component = [start]
+            seen[start] = True
+            for row, col in component:
+                for dr, dc in self.moves:
+                    next_row, next_col = row + dr, (col + dc) % self.cols
+                    if 0 <= next_row < self.rows and not seen[next_row, next_col]:
+                        seen[next_row, next_col] = True
+                        component.append((next_row, next_col))
+            if len(component) > region.sum():
+                region[:] = False
+                region[tuple(np.array(component).T)] = True
+        return region
+
+    @property
+    def unreachable(self) -> int:
+        return np.iinfo(self.dist.dtype).max
+
+    def _step(self, row: int, col: int, code: int) -> int:
+        dr, dc = self.moves[code]
+        new_row, new_col = row + dr, (col + dc) % self.cols
+        if not 0 <= new_row < self.rows:
+            return -1
+        return self._index_rows[new_row][new_col]
+
+    def _find_exits(self, row: int, col: int) -> List[Exit]:
+        exits = []
+        for code in range(len(self.moves)):
+            node = self._step(row, col, code)
+            if node >= 0:
+                exits.append((code, node))
+        return exits
+
+    def _nearest_nodes(self) -> np.ndarray:
+        # For every tile, the walkable tile closest in a straight line, so
+        # targets inside walls or off the maze still map to a node
+        rows, cols = np.indices((self.rows, self.cols))
+        cells = np.array(self.cells)
+        d2 = ((rows.reshape(-1, 1) - cells[:, 0]) ** 2 +
+              (cols.reshape(-1, 1) - cells[:, 1]) ** 2)
+        return d2.argmin(axis=1).reshape(self.rows, self.cols)
+
+    def build(self) -> None:
+        # Breadth-first search from every node; the graph is undirected, so
+        # dist[a, b] == dist[b, a]
+        size = self.size
+        dist = np.full((size, size), -1, dtype=np.int32)
+        for source in range(size):
+            row = [-1] * size
+            row[source] = 0
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                step = row[node] + 1
+                for _, neighbor in self.exits[node]:
+                    if row[neighbor] < 0:
+                        row[neighbor] = step
+                        queue.append(neighbor)
+            dist[source] = row
+        # Smallest dtype that holds the diameter, with its max meaning unreachable
+        dtype = np.uint8 if dist.max() < np.iinfo(np.uint8).max else np.uint16
+        dist[dist < 0] = np.iinfo(dtype).max
+        self.dist = dist.astype(dtype)
+
+        # First move of a shortest path: the exit whose node is one step closer
+        next_move = np.full((size, size), NO_MOVE, dtype=np.uint8)
+        for node, exits in enumerate(self.exits):
+            if not exits:
+                continue
+            codes = np.array([code for code, _ in exits], dtype=np.uint8)
+            ahead = self.dist[[neighbor for _, neighbor in exits]]
+            next_move[node] = codes[ahead.argmin(axis=0)]
+            next_move[node, (self.dist[node] == 0) | (self.dist[node] == self.unreachable)] = NO_MOVE
+        self.next_move = next_move
+        self._finish()
+
+    def _finish(self) -> None:
+        # Plain lists for the per-move lookups; indexing them is cheaper than numpy scalars
+        self.dist_rows: List[List[int]] = self.dist.tolist()
+        self.next_rows: List[List[int]] = self.next_move.tolist()
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(path, dist=self.dist, next_move=self.next_move)
+
+    def load(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        with np.load(path) as data:
+            dist, next_move = data["dist"], data["next_move"]
+        if dist.shape != (self.size, self.size) or next_move.shape != dist.shape:
+            return False
+        self.dist, self.next_move = dist, next_move
+        self._finish()
+        return True
+
+    def node(self, row: int, col: int) -> int:
+        # Node of a walkable tile, or -1
+        return self._index_rows[row][col]
+
+    def target_node(self, row: int, col: int) -> int:
+        # Nearest node to any tile on the grid
+        return self._nearest_rows[row][col]
+
+    def options(self, row: int, col: int, heading: int = NO_MOVE) -> List[Exit]:
+        # Moves available from a tile, without reversing the heading unless forced.
+        # Tiles that are not nodes (an entity placed inside a wall) get all their exits.
+        node = self._index_rows[row][col]
+        if node >= 0:
+            return self.turns[node][min(heading, len(self.moves))]
+        exits = self._off_grid_exits.get((row, col))
+        if exits is None:
+            exits = self._off_grid_exits[(row, col)] = self._find_exits(row, col)
+        return exits
+
+    def distance(self, a: int, b: int) -> int:
+        return self.dist_rows[a][b]
+
+    def first_move(self, a: int, b: int) -> int:
+        return self.next_rows[a][b]
+
+
+_loaded: Dict[str, MazeTables] = {}
+
+
+def tables_key(walls: np.ndarray, moves: Sequence[Tuple[int, int]]) -> str:
+    digest = hashlib.sha1()
+    digest.update(f"v{TABLES_VERSION} {walls.shape} {[tuple(move) for move in moves]}".encode())
+    digest.update(np.packbits(walls).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def load_tables(walls: np.ndarray, moves: Sequence[Tuple[int, int]], directory: str) -> MazeTables:
+    # Tables for a wall layout: from this process, the disk cache, or built and saved
+    key = tables_key(walls, moves)
+    if key in _loaded:
+        return _loaded[key]
+    tables = MazeTables(walls, moves)
+    path = os.path.join(directory, f"maze_tables_{key}.npz")
+    if not tables.load(path):
+        tables.build()
+        try:
+            tables.save(path)
+        except OSError:
+            pass  # read-only install: rebuilt on the next run
+    _loaded[key] = tables
+    return tables
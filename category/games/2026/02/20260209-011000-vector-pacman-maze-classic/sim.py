@@ -0,0 +1,41 @@
+import multiprocessing
+import os
+from typing import Dict, List, Optional
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from main import FPS, GameState
+
+# Headless episodes for agent evaluation: GameState runs the same rules as
+# the window, frame for frame, with the built-in autopilot (or any agent with
+# a choose(state) -> Direction method) steering Pac-Man.
+
+MAX_FRAMES = FPS * 60 * 5  # five minutes of play
+EPISODE_BATCH = 8
+
+
+def run_episode(seed: int, max_frames: int = MAX_FRAMES, agent=None) -> Dict[str, int]:
+    state = GameState(seed=seed, autopilot=agent is None)
+    if agent is not None:
+        state.autopilot = agent
+    while not (state.game_over or state.won) and state.frames < max_frames:
+        state.update()
+    return {
+        "seed": seed,
+        "score": state.score,
+        "won": state.won,
+        "lives": state.lives,
+        "frames": state.frames,
+        "pellets_left": state.maze.pellets_left,
+    }
+
+
+def run_episodes(episodes: int, seed: int = 0, max_frames: int = MAX_FRAMES,
+                 processes: Optional[int] = 1) -> List[Dict[str, int]]:
+    # One result per episode, seeded seed, seed + 1, ...; processes other than 1
+    # spread episodes over a worker pool (None uses every core)
+    seeds = list(range(seed, seed + episodes))
+    if processes == 1 or episodes <= EPISODE_BATCH:
+        return [run_episode(s, max_frames) for s in seeds]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.starmap(run_episode, [(s, max_frames) for s in seeds], chunksize=EPISODE_BATCH)
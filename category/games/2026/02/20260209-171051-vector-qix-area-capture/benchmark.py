@@ -0,0 +1,96 @@
+"""Collision benchmark: linear trail and region scans versus the spatial indexes.
+
+Builds random axis-aligned trails of increasing length (as the player draws
+them, one point per step) and a field of claimed regions, then times the
+per-frame Qix queries both ways.
+"""
+
+import math
+import random
+import sys
+import time
+
+import pygame
+import config
+from spatial import RegionTree, Trail
+
+SEED = 5
+TRAIL_LENGTHS = [100, 1000, 5000]
+REGION_COUNTS = [10, 100, 1000]
+QUERIES = 2000
+
+
+def random_trail(rng: random.Random, length: int, field: pygame.Rect):
+    """Points of a random walk with 3 px axis-aligned steps inside the field."""
+    x, y = field.center
+    dx, dy = 1, 0
+    points = []
+    for _ in range(length):
+        if rng.random() < 0.05:
+            dx, dy = rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        x = max(field.left, min(field.right, x + dx * config.PLAYER_SPEED))
+        y = max(field.top, min(field.bottom, y + dy * config.PLAYER_SPEED))
+        points.append((x, y))
+    return points
+
+
+def scan_points(points, cx: float, cy: float, radius: float) -> bool:
+    """The previous Qix check: distance to every trail point."""
+    for px, py in points:
+        if math.sqrt((cx - px) ** 2 + (cy - py) ** 2) < radius:
+            return True
+    return False
+
+
+def scan_regions(regions, rect: pygame.Rect) -> bool:
+    """The previous bounce check: colliderect against every region."""
+    for region in regions:
+        if region.colliderect(rect):
+            return True
+    return False
+
+
+def per_query_us(function, queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        function(*query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main() -> int:
+    """Print microseconds per query for every configuration."""
+    rng = random.Random(SEED)
+    field = pygame.Rect(config.FIELD_MARGIN, config.FIELD_MARGIN + 30, config.FIELD_WIDTH, config.FIELD_HEIGHT)
+    radius = config.QIX_SIZE + config.TRAIL_WIDTH
+    queries = [(rng.uniform(field.left, field.right), rng.uniform(field.top, field.bottom), radius)
+               for _ in range(QUERIES)]
+
+    print(f"{'trail points':>12} {'segments':>9} {'point scan us':>14} {'indexed us':>11}")
+    for length in TRAIL_LENGTHS:
+        points = random_trail(rng, length, field)
+        trail = Trail()
+        for point in points:
+            trail.append(point)
+        print(f"{length:>12} {trail.segment_count():>9} "
+              f"{per_query_us(lambda x, y, r: scan_points(points, x, y, r), queries):>14.2f} "
+              f"{per_query_us(trail.near, queries):>11.2f}")
+
+    rects = [(pygame.Rect(x - config.QIX_SIZE // 2, y - config.QIX_SIZE // 2, config.QIX_SIZE, config.QIX_SIZE),)
+             for x, y, _ in queries]
+    print(f"\n{'regions':>12} {'list scan us':>14} {'quadtree us':>11}")
+    for count in REGION_COUNTS:
+        regions = []
+        tree = RegionTree(field)
+        while len(regions) < count:
+            size = rng.randrange(4, 40)
+            region = pygame.Rect(rng.randrange(field.left, field.right - size),
+                                 rng.randrange(field.top, field.bottom - size), size, size)
+            regions.append(region)
+            tree.add(region)
+        print(f"{count:>12} {per_query_us(lambda r: scan_regions(regions, r), rects):>14.2f} "
+              f"{per_query_us(tree.collides, rects):>11.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,7 @@ PLAYER_SPEED = 3
 PLAYER_COLOR = (0, 255, 0)  # Green
 TRAIL_WIDTH = 2
 TRAIL_COLOR = (255, 255, 0)  # Yellow
+TRAIL_GRID_SIZE = 32  # pixels per trail index cell
 
 # Qix (enemy) settings
 QIX_COLOR = (255, 0, 255)  # Magenta
@@ -34,6 +35,7 @@ SPARK_SPEED = 2
 FILL_COLOR = (100, 100, 255)  # Light blue
 BORDER_COLOR = (200, 200, 255)  # Light border
 CLAIMED_COLOR = (50, 50, 150)  # Dark blue for claimed area
+REGION_TREE_DEPTH = 5  # quadtree levels below the whole field
 
 # UI settings
 BG_COLOR = (20, 20, 30)  # Dark background
@@ -5,6 +5,7 @@ import random
 from typing import List, Tuple, Optional, Set
 import pygame
 import config
+from spatial import RegionTree, Trail
 
 
 class Player:
@@ -15,7 +16,6 @@ class Player:
         self.reset_position()
         self.speed = config.PLAYER_SPEED
         self.is_drawing = False
-        self.trail: List[Tuple[int, int]] = []
 
     def reset_position(self):
         """Reset player to starting position at top-left corner."""
@@ -23,7 +23,7 @@ class Player:
         self.y = self.field_rect.top
         self.on_border = True
         self.direction = (0, 0)  # (dx, dy)
-        self.trail = []
+        self.trail = Trail()
 
     def set_direction(self, dx: int, dy: int):
         """Set movement direction."""
@@ -35,7 +35,8 @@ class Player:
         """Start drawing a trail (only if on border)."""
         if self.on_border and self.direction != (0, 0):
             self.is_drawing = True
-            self.trail = [(int(self.x), int(self.y))]
+            self.trail.clear()
+            self.trail.append((int(self.x), int(self.y)))
 
     def stop_drawing(self):
         """Stop drawing and return to border."""
@@ -106,29 +107,30 @@ class Player:
 class Qix:
     """The wandering enemy that moves unpredictably in the unclaimed area."""
 
-    def __init__(self, field_rect: pygame.Rect, claimed_regions: List[pygame.Rect]):
+    def __init__(self, field_rect: pygame.Rect, claimed_regions: RegionTree):
         self.field_rect = field_rect
         self.claimed_regions = claimed_regions
+        self.speed = config.QIX_SPEED
         self.reset_position()
 
     def reset_position(self):
         """Reset Qix to a random position in unclaimed area."""
         self.x = self.field_rect.centerx
         self.y = self.field_rect.centery
-        self.vx = random.choice([-1, 1]) * config.QIX_SPEED
-        self.vy = random.choice([-1, 1]) * config.QIX_SPEED
+        self.vx = random.choice([-1, 1]) * self.speed
+        self.vy = random.choice([-1, 1]) * self.speed
         self.lines = []
         self.phase = 0
 
-    def update(self, claimed_regions: List[pygame.Rect]):
+    def update(self, claimed_regions: RegionTree):
         """Update Qix position and animation."""
         self.claimed_regions = claimed_regions
 
         # Random direction changes
         if random.random() < 0.02:
-            self.vx = random.choice([-1, 1]) * config.QIX_SPEED
+            self.vx = random.choice([-1, 1]) * self.speed
         if random.random() < 0.02:
-            self.vy = random.choice([-1, 1]) * config.QIX_SPEED
+            self.vy = random.choice([-1, 1]) * self.speed
 
         # Move
         new_x = self.x + self.vx
@@ -152,11 +154,9 @@ class Qix:
         # Check collision with claimed areas
         test_rect = pygame.Rect(new_x - config.QIX_SIZE // 2, new_y - config.QIX_SIZE // 2,
                                config.QIX_SIZE, config.QIX_SIZE)
-        for region in claimed_regions:
-            if region.colliderect(test_rect):
-                self.vx *= -1
-                self.vy *= -1
-                break
+        if claimed_regions.collides(test_rect):
+            self.vx *= -1
+            self.vy *= -1
         else:
             self.x = new_x
             self.y = new_y
@@ -172,21 +172,10 @@ class Qix:
         """Get Qix collision radius."""
         return config.QIX_SIZE
 
-    def check_collision_with_trail(self, trail: List[Tuple[int, int]]) -> bool:
+    def check_collision_with_trail(self, trail: Trail) -> bool:
         """Check if Qix collides with player's trail."""
-        if len(trail) < 2:
-            return False
-
         cx, cy = self.get_center()
-        radius = self.get_radius()
-
-        for point in trail:
-            px, py = point
-            distance = math.sqrt((cx - px) ** 2 + (cy - py) ** 2)
-            if distance < radius + config.TRAIL_WIDTH:
-                return True
-
-        return False
+        return trail.near(cx, cy, self.get_radius() + config.TRAIL_WIDTH)
 
     def get_distance_from(self, x: float, y: float) -> float:
         """Get distance from a point."""
@@ -271,8 +260,11 @@ class GameState:
             config.FIELD_HEIGHT
         )
 
+        # Claimed regions (filled areas)
+        self.claimed_regions = RegionTree(self.field_rect)
+
         self.player = Player(self.field_rect)
-        self.qix = Qix(self.field_rect, [])
+        self.qix = Qix(self.field_rect, self.claimed_regions)
         self.sparks = [
             Spark(self.field_rect, 1),
             Spark(self.field_rect, -1)
@@ -284,9 +276,6 @@ class GameState:
         self.game_over = False
         self.level_complete = False
 
-        # Claimed regions (filled areas)
-        self.claimed_regions: List[pygame.Rect] = []
-
         # Total area
         self.total_area = self.field_rect.width * self.field_rect.height
 
@@ -296,10 +285,9 @@ class GameState:
 
     def get_claimed_percentage(self) -> float:
         """Get percentage of area claimed."""
-        claimed_area = sum(r.width * r.height for r in self.claimed_regions)
-        return (claimed_area / self.total_area) * 100
+        return (self.claimed_regions.total_area / self.total_area) * 100
 
-    def fill_area_from_trail(self, trail: List[Tuple[int, int]]) -> pygame.Rect:
+    def fill_area_from_trail(self, trail: Trail) -> pygame.Rect:
         """
         Create a filled region from a completed trail.
         This is a simplified version that creates a bounding box fill.
@@ -326,23 +314,18 @@ class GameState:
 
         return fill_rect
 
-    def complete_trail(self, trail: List[Tuple[int, int]]) -> int:
+    def complete_trail(self, trail: Trail) -> int:
         """
         Process a completed trail and return score earned.
         """
         fill_rect = self.fill_area_from_trail(trail)
         if fill_rect and fill_rect.width > 0 and fill_rect.height > 0:
-            # Check for overlaps with existing regions
-            merged = False
-            for i, region in enumerate(self.claimed_regions):
-                if region.colliderect(fill_rect):
-                    # Merge regions
-                    self.claimed_regions[i] = region.union(fill_rect)
-                    merged = True
-                    break
-
-            if not merged:
-                self.claimed_regions.append(fill_rect)
+            # Merge into the first existing region it overlaps
+            index = self.claimed_regions.first_colliding(fill_rect)
+            if index is not None:
+                self.claimed_regions.replace(index, self.claimed_regions.regions[index].union(fill_rect))
+            else:
+                self.claimed_regions.add(fill_rect)
 
             # Calculate score
             claimed_pct = self.get_claimed_percentage()
@@ -362,7 +345,7 @@ class GameState:
         """Handle player death."""
         self.lives -= 1
         self.death_timer = 60  # Frames to show death animation
-        self.player.trail = []
+        self.player.trail.clear()
         self.player.is_drawing = False
 
         if self.lives <= 0:
@@ -377,7 +360,7 @@ class GameState:
         """Advance to next level."""
         self.level += 1
         self.level_complete_timer = 60
-        self.claimed_regions = []
+        self.claimed_regions.clear()
         self.player.reset_position()
         self.qix.reset_position()
         self.qix.speed *= config.LEVEL_MULTIPLIER
@@ -409,7 +392,7 @@ class GameState:
         if trail_completed:
             score = self.complete_trail(self.player.trail)
             self.score += score
-            self.player.trail = []
+            self.player.trail.clear()
 
             # Check win condition
             if self.get_claimed_percentage() >= config.WIN_PERCENTAGE:
@@ -434,7 +417,7 @@ class GameState:
                 self.lose_life()
                 return False
 
-        return trail_complete
+        return trail_completed
 
     def reset(self):
         """Reset the game."""
@@ -0,0 +1,211 @@
+"""Spatial indexes for the player's trail and the claimed regions."""
+
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+import pygame
+import config
+
+
+def point_segment_distance(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """Distance from point P to the segment AB."""
+    dx = bx - ax
+    dy = by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return math.hypot(px - ax, py - ay)
+    t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+class Trail:
+    """The player's trail as a polyline of segments indexed in a uniform grid.
+
+    Points that continue the last segment in the same direction just move its
+    end, so a straight run of pixels is one segment. Every segment is
+    registered in each grid cell its bounding box touches, which makes
+    collision queries cost the segments near the query rather than the
+    length of the trail. Iterating, indexing and len() see the polyline
+    vertices, so the trail can be drawn and measured like a list of points.
+    """
+
+    def __init__(self, cell_size: int = config.TRAIL_GRID_SIZE):
+        self.cell_size = cell_size
+        self.points: List[Tuple[int, int]] = []
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def clear(self):
+        """Remove all points."""
+        self.points = []
+        self.cells = {}
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self.points)
+
+    def __getitem__(self, index):
+        return self.points[index]
+
+    def _register(self, index: int, x0: int, y0: int, x1: int, y1: int):
+        """Add segment `index` to every grid cell its bounding box touches."""
+        size = self.cell_size
+        for cx in range(min(x0, x1) // size, max(x0, x1) // size + 1):
+            for cy in range(min(y0, y1) // size, max(y0, y1) // size + 1):
+                bucket = self.cells.setdefault((cx, cy), [])
+                if not bucket or bucket[-1] != index:
+                    bucket.append(index)
+
+    def append(self, point: Tuple[int, int]):
+        """Extend the trail to `point`."""
+        points = self.points
+        if len(points) >= 2:
+            (ax, ay), (bx, by) = points[-2], points[-1]
+            px, py = point
+            # Same axis and direction as the last segment: stretch it
+            if (ax == bx == px and (by - ay) * (py - by) > 0) or (ay == by == py and (bx - ax) * (px - bx) > 0):
+                points[-1] = point
+                self._register(len(points) - 2, bx, by, px, py)
+                return
+        points.append(point)
+        if len(points) >= 2:
+            self._register(len(points) - 2, *points[-2], *point)
+
+    def segment_count(self) -> int:
+        """Number of segments in the trail."""
+        return max(len(self.points) - 1, 0)
+
+    def near(self, x: float, y: float, radius: float) -> bool:
+        """Whether any segment passes within `radius` of (x, y)."""
+        points = self.points
+        if len(points) < 2:
+            return False
+        size = self.cell_size
+        seen = set()
+        for cx in range(int((x - radius) // size), int((x + radius) // size) + 1):
+            for cy in range(int((y - radius) // size), int((y + radius) // size) + 1):
+                for index in self.cells.get((cx, cy), ()):
+                    if index in seen:
+                        continue
+                    seen.add(index)
+                    (ax, ay), (bx, by) = points[index], points[index + 1]
+                    if point_segment_distance(x, y, ax, ay, bx, by) < radius:
+                        return True
+        return False
+
+
+class RegionTree:
+    """Claimed regions in a quadtree over the field.
+
+    Each region is stored in the deepest node whose bounds fully contain it,
+    so a rectangle query only visits nodes it overlaps. Regions keep their
+    insertion index, and the total area is maintained as regions change.
+    """
+
+    def __init__(self, bounds: pygame.Rect, max_depth: int = config.REGION_TREE_DEPTH):
+        self.bounds = pygame.Rect(bounds)
+        self.max_depth = max_depth
+        self.clear()
+
+    def clear(self):
+        """Remove all regions."""
+        self.regions: List[Optional[pygame.Rect]] = []
+        self.root = _QuadNode(self.bounds, 0)
+        self.total_area = 0
+
+    def __len__(self) -> int:
+        return len(self.regions) - self.regions.count(None)
+
+    def __iter__(self) -> Iterator[pygame.Rect]:
+        return (region for region in self.regions if region is not None)
+
+    def add(self, rect: pygame.Rect) -> int:
+        """Store a region and return its index."""
+        index = len(self.regions)
+        self.regions.append(pygame.Rect(rect))
+        self.root.insert(index, self.regions[index], self.max_depth)
+        self.total_area += rect.width * rect.height
+        return index
+
+    def replace(self, index: int, rect: pygame.Rect):
+        """Change the rectangle of region `index`, keeping its index."""
+        old = self.regions[index]
+        self.root.remove(index, old)
+        self.total_area -= old.width * old.height
+        self.regions[index] = pygame.Rect(rect)
+        self.root.insert(index, self.regions[index], self.max_depth)
+        self.total_area += rect.width * rect.height
+
+    def first_colliding(self, rect: pygame.Rect) -> Optional[int]:
+        """Lowest index of a region that collides with `rect`, or None."""
+        hits = []
+        self.root.query(rect, hits, False)
+        return min(hits) if hits else None
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        """Whether any region collides with `rect`."""
+        hits = []
+        self.root.query(rect, hits, True)
+        return bool(hits)
+
+
+class _QuadNode:
+    """A quadtree node holding the regions that straddle its children."""
+
+    def __init__(self, bounds: pygame.Rect, depth: int):
+        self.bounds = bounds
+        self.depth = depth
+        self.items: List[Tuple[int, pygame.Rect]] = []
+        self.children: Optional[List["_QuadNode"]] = None
+
+    def _split(self):
+        half_w = self.bounds.width // 2
+        half_h = self.bounds.height // 2
+        x, y = self.bounds.topleft
+        self.children = [
+            _QuadNode(pygame.Rect(x, y, half_w, half_h), self.depth + 1),
+            _QuadNode(pygame.Rect(x + half_w, y, self.bounds.width - half_w, half_h), self.depth + 1),
+            _QuadNode(pygame.Rect(x, y + half_h, half_w, self.bounds.height - half_h), self.depth + 1),
+            _QuadNode(pygame.Rect(x + half_w, y + half_h, self.bounds.width - half_w,
+                                  self.bounds.height - half_h), self.depth + 1),
+        ]
+
+    def _child_for(self, rect: pygame.Rect) -> Optional["_QuadNode"]:
+        for child in self.children:
+            if child.bounds.contains(rect):
+                return child
+        return None
+
+    def insert(self, index: int, rect: pygame.Rect, max_depth: int):
+        if self.depth < max_depth:
+            if self.children is None:
+                self._split()
+            child = self._child_for(rect)
+            if child is not None:
+                child.insert(index, rect, max_depth)
+                return
+        self.items.append((index, rect))
+
+    def remove(self, index: int, rect: pygame.Rect) -> bool:
+        for i, (item_index, _) in enumerate(self.items):
+            if item_index == index:
+                del self.items[i]
+                return True
+        if self.children is not None:
+            child = self._child_for(rect)
+            if child is not None:
+                return child.remove(index, rect)
+        return False
+
+    def query(self, rect: pygame.Rect, hits: List[int], stop_at_first: bool):
+        for index, item in self.items:
+            if item.colliderect(rect):
+                hits.append(index)
+                if stop_at_first:
+                    return
+        if self.children is not None:
+            for child in self.children:
+                if child.bounds.colliderect(rect):
+                    child.query(rect, hits, stop_at_first)
+                    if stop_at_first and hits:
+                        return
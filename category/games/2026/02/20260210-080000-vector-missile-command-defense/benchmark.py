@@ -0,0 +1,133 @@
+"""
+Frame cost of missile/blast collision handling, old object loops against
+the NumPy swarm, plus throughput of the headless wave runner.
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from main import BLAST_DURATION, BLAST_RADIUS, SCREEN_HEIGHT, SCREEN_WIDTH, GameState
+from sim import run_game
+
+MISSILE_COUNTS = (10, 100, 1000)
+BLAST_COUNT = 10
+FRAMES = 100
+GAMES = 5
+SEED = 11
+
+
+class LegacyMissile:
+    """The former EnemyMissile update: Vector2-style math and a list trail."""
+
+    def __init__(self, rng: random.Random, target_x: float, target_y: float, speed: float):
+        self.x, self.y = rng.uniform(50, SCREEN_WIDTH - 50), 0.0
+        dx, dy = target_x - self.x, target_y - self.y
+        length = math.sqrt(dx * dx + dy * dy)
+        self.vx, self.vy = dx / length * speed, dy / length * speed
+        self.active = True
+        self.trail_points = []
+
+    def update(self) -> None:
+        self.trail_points.append((self.x, self.y))
+        if len(self.trail_points) > 20:
+            self.trail_points.pop(0)
+        self.x += self.vx
+        self.y += self.vy
+        if self.y >= SCREEN_HEIGHT or self.x < 0 or self.x > SCREEN_WIDTH:
+            self.active = False
+
+
+class LegacyBlast:
+    def __init__(self, x: float, y: float):
+        self.x, self.y = x, y
+        self.radius = BLAST_RADIUS
+        self.active = True
+
+    def affects_position(self, x: float, y: float) -> bool:
+        if not self.active:
+            return False
+        return math.sqrt((self.x - x) ** 2 + (self.y - y) ** 2) <= self.radius
+
+
+def legacy_frame(missiles, blasts, state: GameState) -> None:
+    """The former per-missile loop: rectangles built per landing, list.remove mid-iteration."""
+    for enemy in missiles[:]:
+        enemy.update()
+        if not enemy.active:
+            for city in state.cities:
+                if city.alive and city.get_rect().collidepoint(enemy.x, enemy.y):
+                    break
+            else:
+                for battery in state.batteries:
+                    rect = pygame.Rect(battery.x, battery.y - 15, battery.width, battery.height + 15)
+                    if battery.active and rect.collidepoint(enemy.x, enemy.y):
+                        break
+            missiles.remove(enemy)
+            continue
+        for blast in blasts:
+            if blast.active and blast.affects_position(enemy.x, enemy.y):
+                missiles.remove(enemy)
+                break
+
+
+def blast_sites(rng: random.Random):
+    # Low on the screen, out of the missiles' way for the whole run
+    return [(rng.uniform(0, SCREEN_WIDTH), rng.uniform(SCREEN_HEIGHT - 250, SCREEN_HEIGHT - 150))
+            for _ in range(BLAST_COUNT)]
+
+
+def time_legacy(count: int) -> float:
+    rng = random.Random(SEED)
+    state = GameState(seed=SEED)
+    targets = state.get_targets()
+    missiles = [LegacyMissile(rng, t.x, t.y, 1.0) for t in (rng.choice(targets) for _ in range(count))]
+    blasts = [LegacyBlast(x, y) for x, y in blast_sites(rng)]
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        legacy_frame(missiles, blasts, state)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def time_swarm(count: int) -> float:
+    rng = random.Random(SEED)
+    state = GameState(seed=SEED)
+    for _ in range(count):
+        state.spawn_enemy()
+    for x, y in blast_sites(rng):
+        state.explosions.spawn(x, y)
+    # Keep the blasts burning for the whole run
+    state.explosions.duration[:BLAST_COUNT] = BLAST_DURATION + FRAMES
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        state.update()
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main() -> int:
+    print(f"Enemy missile update and collisions per frame, {BLAST_COUNT} blasts ({FRAMES} frames)")
+    for count in MISSILE_COUNTS:
+        legacy = time_legacy(count)
+        swarm = time_swarm(count)
+        print(f"  {count:>5} missiles  object loops {legacy * 1000:8.3f} ms   "
+              f"GameState.update {swarm * 1000:7.3f} ms   {legacy / swarm:6.1f}x")
+
+    start = time.perf_counter()
+    frames = 0
+    for seed in range(GAMES):
+        results = run_game(seed)
+        frames += sum(result["frames"] for result in results)
+    elapsed = time.perf_counter() - start
+    print(f"Wave runner with auto-targeting: {GAMES} full games, {frames} frames in {elapsed:.2f}s "
+          f"({frames / elapsed:,.0f} frames/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
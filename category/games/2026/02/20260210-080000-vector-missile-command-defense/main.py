@@ -8,6 +8,8 @@ import random
 import math
 from typing import List, Tuple, Optional
 
+from swarm import MissileSwarm, BlastField
+
 
 # Constants
 SCREEN_WIDTH = 800
@@ -42,6 +44,14 @@ INTERCEPTOR_SPEED = 12
 
 ENEMY_MISSILE_BASE_SPEED = 1.0
 ENEMY_MISSILE_SPAWN_BASE = 120  # Frames between spawns
+ENEMY_TRAIL_LENGTH = 20  # Frames of trail drawn behind each missile
+
+# MIRVs: from this wave on, some missiles split into several warheads
+MIRV_FIRST_WAVE = 4
+MIRV_CHANCE_PER_WAVE = 0.1  # Chance a missile is a MIRV, per wave past the first MIRV wave
+MIRV_MAX_CHANCE = 0.6
+MIRV_WARHEADS = 3
+MIRV_SPLIT_Y = (120, 320)  # Height range where MIRVs split
 
 # Scoring
 SCORE_INTERCEPT = 25
@@ -160,6 +170,10 @@ class Battery:
     def get_position(self) -> Vector2:
         return Vector2(self.x + self.width / 2, self.y)
 
+    def get_hit_rect(self) -> pygame.Rect:
+        # The base plus the barrel above it
+        return pygame.Rect(self.x, self.y - 15, self.width, self.height + 15)
+
     def has_ammo(self) -> bool:
         return self.active and self.ammo > 0
 
@@ -174,66 +188,6 @@ class Battery:
             self.ammo = AMMO_PER_BATTERY
 
 
-class Explosion:
-    """An explosion that destroys enemy missiles."""
-
-    def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
-        self.radius = BLAST_RADIUS
-        self.max_duration = BLAST_DURATION
-        self.duration = self.max_duration
-        self.active = True
-
-    def update(self) -> None:
-        self.duration -= 1
-        if self.duration <= 0:
-            self.active = False
-
-    def draw(self, surface: pygame.Surface) -> None:
-        if not self.active:
-            return
-
-        # Calculate expanding/contracting radius
-        progress = self.duration / self.max_duration
-        if progress > 0.5:
-            # Expanding phase
-            current_radius = int(self.radius * (1 - progress) * 2)
-        else:
-            # Contracting phase
-            current_radius = int(self.radius * progress * 2)
-
-        if current_radius < 1:
-            current_radius = 1
-
-        # Draw explosion as concentric circles
-        alpha = int(255 * progress)
-        center = (int(self.x), int(self.y))
-
-        # Outer glow
-        if current_radius > 5:
-            glow_surface = pygame.Surface((current_radius * 2, current_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*COLOR_ORANGE, alpha // 2),
-                             (current_radius, current_radius), current_radius)
-            surface.blit(glow_surface, (center[0] - current_radius, center[1] - current_radius))
-
-        # Main explosion
-        pygame.draw.circle(surface, COLOR_YELLOW, center, current_radius)
-
-        # Inner bright core
-        core_radius = max(1, current_radius // 2)
-        pygame.draw.circle(surface, COLOR_WHITE, center, core_radius)
-
-        # Outer ring
-        pygame.draw.circle(surface, COLOR_RED, center, current_radius, 2)
-
-    def affects_position(self, pos: Vector2) -> bool:
-        if not self.active:
-            return False
-        explosion_pos = Vector2(self.x, self.y)
-        return explosion_pos.distance_to(pos) <= self.radius
-
-
 class InterceptorMissile:
     """A player-fired interceptor missile that creates an explosion at its target."""
 
@@ -246,7 +200,8 @@ class InterceptorMissile:
         direction = Vector2(target_pos.x - start_pos.x, target_pos.y - start_pos.y)
         self.velocity = direction.normalize() * INTERCEPTOR_SPEED
 
-    def update(self) -> Optional['Explosion']:
+    def update(self) -> Optional[Vector2]:
+        """Move the missile; returns the detonation point once it reaches its target."""
         if not self.active:
             return None
 
@@ -256,7 +211,7 @@ class InterceptorMissile:
         distance = self.current_pos.distance_to(self.target_pos)
         if distance < INTERCEPTOR_SPEED:
             self.active = False
-            return Explosion(self.current_pos.x, self.current_pos.y)
+            return self.current_pos
 
         return None
 
@@ -273,106 +228,23 @@ class InterceptorMissile:
         pygame.draw.circle(surface, COLOR_WHITE, end, 3)
 
 
-class EnemyMissile:
-    """An incoming enemy missile targeting cities or batteries."""
-
-    def __init__(self, speed_multiplier: float = 1.0):
-        # Start from top of screen
-        self.start_pos = Vector2(random.uniform(50, SCREEN_WIDTH - 50), 0)
+class GameState:
+    """Game rules without a window: cities, batteries, waves, missiles and blasts.
 
-        # Choose target (city or battery)
-        targets = []
-        for city in game_state['cities']:
-            if city.alive:
-                targets.append(city.get_center())
-        for battery in game_state['batteries']:
-            if battery.active:
-                targets.append(battery.get_position())
-
-        if not targets:
-            self.target_pos = Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 50)
-        else:
-            self.target_pos = random.choice(targets)
-
-        self.current_pos = Vector2(self.start_pos.x, self.start_pos.y)
-        self.speed = ENEMY_MISSILE_BASE_SPEED * speed_multiplier
-        self.active = True
-        self.trail_points: List[Tuple[float, float]] = []
-
-        # Calculate velocity
-        direction = Vector2(self.target_pos.x - self.start_pos.x,
-                          self.target_pos.y - self.start_pos.y)
-        self.velocity = direction.normalize() * self.speed
-
-    def update(self) -> None:
-        if not self.active:
-            return
-
-        # Store trail point
-        self.trail_points.append((self.current_pos.x, self.current_pos.y))
-        if len(self.trail_points) > 20:
-            self.trail_points.pop(0)
-
-        self.current_pos = self.current_pos + self.velocity
-
-        # Check if reached target or off screen
-        if (self.current_pos.y >= SCREEN_HEIGHT or
-            self.current_pos.x < 0 or
-            self.current_pos.x > SCREEN_WIDTH):
-            self.active = False
-
-    def draw(self, surface: pygame.Surface) -> None:
-        if not self.active or len(self.trail_points) < 2:
-            return
-
-        # Draw trail
-        if len(self.trail_points) >= 2:
-            points = [(int(x), int(y)) for x, y in self.trail_points]
-            pygame.draw.lines(surface, COLOR_RED, False, points, 2)
-
-        # Draw missile head
-        head = (int(self.current_pos.x), int(self.current_pos.y))
-        pygame.draw.circle(surface, COLOR_WHITE, head, 4)
-        pygame.draw.circle(surface, COLOR_RED, head, 2)
-
-    def get_position(self) -> Vector2:
-        return self.current_pos
-
-
-# Global game state for enemy missile target selection
-game_state = {'cities': [], 'batteries': []}
-
-
-class Game:
-    """Main game class managing all game state."""
-
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Vector Missile Command Defense")
-        self.clock = pygame.time.Clock()
-        self.running = True
-        self.game_over = False
-        self.wave_in_progress = False
-        self.wave_number = 0
-        self.wave_delay = 0
-
-        # Crosshair position
-        self.crosshair_pos = Vector2(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
+    Game adds rendering and input on top; sim.py runs it headless.
+    """
 
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
         self.reset_game()
 
     def reset_game(self) -> None:
         """Reset game to initial state."""
         self.cities: List[City] = []
         self.batteries: List[Battery] = []
-        self.enemy_missiles: List[EnemyMissile] = []
+        self.enemy_missiles = MissileSwarm()
         self.interceptor_missiles: List[InterceptorMissile] = []
-        self.explosions: List[Explosion] = []
+        self.explosions = BlastField(BLAST_RADIUS, BLAST_DURATION)
         self.score = 0
         self.game_over = False
         self.wave_in_progress = False
@@ -381,6 +253,7 @@ class Game:
         self.wave_score = 0
         self.enemies_spawned = 0
         self.enemies_per_wave = 5
+        self.frames = 0
 
         self._initialize_entities()
 
@@ -401,9 +274,9 @@ class Game:
             x = battery_spacing * (i + 1) - BATTERY_WIDTH // 2
             self.batteries.append(Battery(x, i + 1))
 
-        # Update global state
-        game_state['cities'] = self.cities
-        game_state['batteries'] = self.batteries
+        # Nothing moves, so hit rectangles are built once
+        self.city_rects = [city.get_rect() for city in self.cities]
+        self.battery_rects = [battery.get_hit_rect() for battery in self.batteries]
 
     def start_wave(self) -> None:
         """Start a new wave of enemy missiles."""
@@ -418,6 +291,169 @@ class Game:
         for battery in self.batteries:
             battery.refill()
 
+    def fire(self, battery_index: int, target_x: float, target_y: float) -> bool:
+        """Fire an interceptor from a battery at a point; False if it cannot fire."""
+        if not 0 <= battery_index < len(self.batteries):
+            return False
+        battery = self.batteries[battery_index]
+        if not battery.fire():
+            return False
+        self.interceptor_missiles.append(InterceptorMissile(battery.get_position(), Vector2(target_x, target_y)))
+        return True
+
+    def get_targets(self) -> List[Vector2]:
+        """Points enemy missiles aim at: living cities and working batteries."""
+        targets = [city.get_center() for city in self.cities if city.alive]
+        targets.extend(battery.get_position() for battery in self.batteries if battery.active)
+        return targets or [Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 50)]
+
+    def get_mirv_chance(self) -> float:
+        """Chance that a missile launched this wave is a MIRV."""
+        if self.wave_number < MIRV_FIRST_WAVE:
+            return 0.0
+        return min(MIRV_MAX_CHANCE, (self.wave_number - MIRV_FIRST_WAVE + 1) * MIRV_CHANCE_PER_WAVE)
+
+    def get_enemy_speed(self) -> float:
+        """Speed of the enemy missiles launched this wave."""
+        return ENEMY_MISSILE_BASE_SPEED * (1.0 + self.wave_number * 0.1)
+
+    def spawn_enemy(self) -> None:
+        """Launch one enemy missile from the top of the screen."""
+        rng = self.rng
+        start_x = rng.uniform(50, SCREEN_WIDTH - 50)
+        target = rng.choice(self.get_targets())
+        split_y = rng.uniform(*MIRV_SPLIT_Y) if rng.random() < self.get_mirv_chance() else -1.0
+        self.enemy_missiles.spawn(start_x, 0, target.x, target.y, self.get_enemy_speed(), split_y)
+
+    def _split_mirvs(self) -> None:
+        """Replace every MIRV at its split height by warheads aimed at separate targets."""
+        enemies = self.enemy_missiles
+        splitting = enemies.splitting()
+        if not splitting.any():
+            return
+        xs = enemies.x[:enemies.count][splitting].tolist()
+        ys = enemies.y[:enemies.count][splitting].tolist()
+        enemies.remove(splitting)
+        targets = self.get_targets()
+        for x, y in zip(xs, ys):
+            aims = [self.rng.choice(targets) for _ in range(MIRV_WARHEADS)]
+            enemies.spawn(x, y, [aim.x for aim in aims], [aim.y for aim in aims], self.get_enemy_speed())
+
+    def _impact(self, x: float, y: float) -> None:
+        """A missile landed at (x, y): destroy the city or battery it hit, if any."""
+        for city, rect in zip(self.cities, self.city_rects):
+            if city.alive and rect.collidepoint(x, y):
+                city.alive = False
+                self.explosions.spawn(city.x + city.width / 2, city.y + city.height / 2)
+                return
+        for battery, rect in zip(self.batteries, self.battery_rects):
+            if battery.active and rect.collidepoint(x, y):
+                battery.active = False
+                self.explosions.spawn(battery.x + battery.width / 2, battery.y)
+                return
+
+    def update(self) -> None:
+        """Update game state."""
+        if self.game_over:
+            return
+        self.frames += 1
+
+        # Check for game over
+        if self.get_alive_city_count() == 0:
+            self.game_over = True
+            self.wave_in_progress = False
+            return
+
+        # Wave management
+        if self.wave_in_progress:
+            if self.wave_delay > 0:
+                self.wave_delay -= 1
+            elif self.enemies_spawned < self.enemies_per_wave:
+                # Spawn enemies with decreasing interval
+                spawn_interval = max(30, ENEMY_MISSILE_SPAWN_BASE - self.wave_number * 5)
+                if self.enemies_spawned == 0 or self.rng.randint(0, spawn_interval) < 10:
+                    self.spawn_enemy()
+                    self.enemies_spawned += 1
+            elif len(self.enemy_missiles) == 0:
+                # Wave complete
+                self.end_wave()
+
+        # Update interceptors
+        for interceptor in self.interceptor_missiles:
+            detonation = interceptor.update()
+            if detonation:
+                self.explosions.spawn(detonation.x, detonation.y)
+        self.interceptor_missiles = [interceptor for interceptor in self.interceptor_missiles
+                                     if interceptor.active]
+
+        # Update explosions
+        self.explosions.update()
+
+        # Update enemy missiles
+        enemies = self.enemy_missiles
+        enemies.update()
+        self._split_mirvs()
+
+        # Missiles that reached the ground hit whatever is there
+        landed = enemies.landed(SCREEN_WIDTH)
+        if landed.any():
+            n = enemies.count
+            for x, y in zip(enemies.x[:n][landed].tolist(), enemies.y[:n][landed].tolist()):
+                self._impact(x, y)
+            enemies.remove(landed)
+
+        # Every missile against every blast in one test
+        n = enemies.count
+        intercepted = self.explosions.covers(enemies.x[:n], enemies.y[:n])
+        hits = int(intercepted.sum())
+        if hits:
+            self.score += hits * SCORE_INTERCEPT
+            self.wave_score += hits * SCORE_INTERCEPT
+            enemies.remove(intercepted)
+
+    def end_wave(self) -> None:
+        """End current wave and calculate bonuses."""
+        self.wave_in_progress = False
+
+        # City bonus
+        alive_cities = self.get_alive_city_count()
+        self.score += alive_cities * SCORE_CITY_BONUS
+
+        # Ammo bonus
+        total_ammo = sum(b.ammo for b in self.batteries if b.active)
+        self.score += total_ammo * SCORE_AMMO_BONUS
+
+        # Wave completion bonus
+        self.score += SCORE_WAVE_BONUS
+
+        # Check if game should end
+        if alive_cities == 0 or self.wave_number >= WAVE_COUNT:
+            self.game_over = True
+
+    def get_alive_city_count(self) -> int:
+        """Get number of cities still alive."""
+        return sum(1 for city in self.cities if city.alive)
+
+
+class Game(GameState):
+    """Main game class: window, input and rendering around GameState."""
+
+    def __init__(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Vector Missile Command Defense")
+        self.clock = pygame.time.Clock()
+        self.running = True
+
+        # Crosshair position
+        self.crosshair_pos = Vector2(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+
+        self.font_large = pygame.font.Font(None, 72)
+        self.font_medium = pygame.font.Font(None, 48)
+        self.font_small = pygame.font.Font(None, 32)
+
+        super().__init__()
+
     def handle_input(self) -> None:
         """Handle keyboard and mouse input."""
         for event in pygame.event.get():
@@ -469,18 +505,7 @@ class Game:
 
     def fire_interceptor(self, battery_index: int) -> None:
         """Fire an interceptor from the specified battery."""
-        if battery_index >= len(self.batteries):
-            return
-
-        battery = self.batteries[battery_index]
-        if not battery.has_ammo():
-            return
-
-        if battery.fire():
-            start_pos = battery.get_position()
-            target_pos = Vector2(self.crosshair_pos.x, self.crosshair_pos.y)
-            interceptor = InterceptorMissile(start_pos, target_pos)
-            self.interceptor_missiles.append(interceptor)
+        self.fire(battery_index, self.crosshair_pos.x, self.crosshair_pos.y)
 
     def fire_from_nearest_battery(self) -> None:
         """Fire from the battery with ammo that's closest to the crosshair x position."""
@@ -500,112 +525,6 @@ class Game:
                     self.fire_interceptor(i)
                     break
 
-    def update(self) -> None:
-        """Update game state."""
-        if self.game_over:
-            return
-
-        # Check for game over
-        if self.get_alive_city_count() == 0:
-            self.game_over = True
-            self.wave_in_progress = False
-            return
-
-        # Wave management
-        if self.wave_in_progress:
-            if self.wave_delay > 0:
-                self.wave_delay -= 1
-            elif self.enemies_spawned < self.enemies_per_wave:
-                # Spawn enemies with decreasing interval
-                spawn_interval = max(30, ENEMY_MISSILE_SPAWN_BASE - self.wave_number * 5)
-                if self.enemies_spawned == 0 or random.randint(0, spawn_interval) < 10:
-                    speed_multiplier = 1.0 + self.wave_number * 0.1
-                    self.enemy_missiles.append(EnemyMissile(speed_multiplier))
-                    self.enemies_spawned += 1
-            elif len(self.enemy_missiles) == 0:
-                # Wave complete
-                self.end_wave()
-
-        # Update interceptors
-        for interceptor in self.interceptor_missiles[:]:
-            explosion = interceptor.update()
-            if explosion:
-                self.explosions.append(explosion)
-            if not interceptor.active:
-                self.interceptor_missiles.remove(interceptor)
-
-        # Update explosions
-        for explosion in self.explosions[:]:
-            explosion.update()
-            if not explosion.active:
-                self.explosions.remove(explosion)
-
-        # Update enemy missiles
-        for enemy in self.enemy_missiles[:]:
-            enemy.update()
-
-            if not enemy.active:
-                # Check if it hit something
-                enemy_pos = enemy.get_position()
-                hit_city = False
-                hit_battery = False
-
-                # Check city collisions
-                for city in self.cities:
-                    if city.alive and city.get_rect().collidepoint(enemy_pos.x, enemy_pos.y):
-                        city.alive = False
-                        hit_city = True
-                        self.explosions.append(Explosion(city.x + city.width / 2,
-                                                         city.y + city.height / 2))
-                        break
-
-                # Check battery collisions
-                if not hit_city:
-                    for battery in self.batteries:
-                        if battery.active:
-                            bat_rect = pygame.Rect(battery.x, battery.y - 15,
-                                                 battery.width, battery.height + 15)
-                            if bat_rect.collidepoint(enemy_pos.x, enemy_pos.y):
-                                battery.active = False
-                                hit_battery = True
-                                self.explosions.append(Explosion(battery.x + battery.width / 2,
-                                                                 battery.y))
-                                break
-
-                self.enemy_missiles.remove(enemy)
-                continue
-
-            # Check explosion collisions
-            for explosion in self.explosions:
-                if explosion.active and explosion.affects_position(enemy.get_position()):
-                    self.score += SCORE_INTERCEPT
-                    self.wave_score += SCORE_INTERCEPT
-                    self.enemy_missiles.remove(enemy)
-                    break
-
-    def end_wave(self) -> None:
-        """End current wave and calculate bonuses."""
-        self.wave_in_progress = False
-
-        # City bonus
-        alive_cities = self.get_alive_city_count()
-        self.score += alive_cities * SCORE_CITY_BONUS
-
-        # Ammo bonus
-        total_ammo = sum(b.ammo for b in self.batteries if b.active)
-        self.score += total_ammo * SCORE_AMMO_BONUS
-
-        # Wave completion bonus
-        self.score += SCORE_WAVE_BONUS
-
-        # Check if game should end
-        if alive_cities == 0 or self.wave_number >= WAVE_COUNT:
-            self.game_over = True
-
-    def get_alive_city_count(self) -> int:
-        """Get number of cities still alive."""
-        return sum(1 for city in self.cities if city.alive)
-
     def draw(self) -> None:
         """Draw all game elements."""
         self.screen.fill(COLOR_BLACK)
@@ -619,16 +538,15 @@ class Game:
             battery.draw(self.screen)
 
         # Draw enemy missiles
-        for enemy in self.enemy_missiles:
-            enemy.draw(self.screen)
+        self.draw_enemy_missiles()
 
         # Draw interceptors
         for interceptor in self.interceptor_missiles:
             interceptor.draw(self.screen)
 
         # Draw explosions
-        for explosion in self.explosions:
-            explosion.draw(self.screen)
+        for i in range(len(self.explosions)):
+            self.draw_explosion(self.explosions.x[i], self.explosions.y[i], self.explosions.duration[i])
 
         # Draw crosshair
         crosshair_x = int(self.crosshair_pos.x)
@@ -740,6 +658,57 @@ class Game:
 
         pygame.display.flip()
 
+    def draw_enemy_missiles(self) -> None:
+        """Draw each enemy missile's trail and head."""
+        enemies = self.enemy_missiles
+        for i in range(len(enemies)):
+            trail = enemies.trail(i, ENEMY_TRAIL_LENGTH)
+            if len(trail) < 2:
+                continue
+            points = [(int(x), int(y)) for x, y in trail]
+            pygame.draw.lines(self.screen, COLOR_RED, False, points, 2)
+
+            head = (int(enemies.x[i]), int(enemies.y[i]))
+            pygame.draw.circle(self.screen, COLOR_WHITE, head, 4)
+            pygame.draw.circle(self.screen, COLOR_RED, head, 2)
+
+    def draw_explosion(self, x: float, y: float, duration: float) -> None:
+        """Draw one blast, growing then shrinking over its lifetime."""
+        surface = self.screen
+
+        # Calculate expanding/contracting radius
+        progress = duration / BLAST_DURATION
+        if progress > 0.5:
+            # Expanding phase
+            current_radius = int(BLAST_RADIUS * (1 - progress) * 2)
+        else:
+            # Contracting phase
+            current_radius = int(BLAST_RADIUS * progress * 2)
+
+        if current_radius < 1:
+            current_radius = 1
+
+        # Draw explosion as concentric circles
+        alpha = int(255 * progress)
+        center = (int(x), int(y))
+
+        # Outer glow
+        if current_radius > 5:
+            glow_surface = pygame.Surface((current_radius * 2, current_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surface, (*COLOR_ORANGE, alpha // 2),
+                             (current_radius, current_radius), current_radius)
+            surface.blit(glow_surface, (center[0] - current_radius, center[1] - current_radius))
+
+        # Main explosion
+        pygame.draw.circle(surface, COLOR_YELLOW, center, current_radius)
+
+        # Inner bright core
+        core_radius = max(1, current_radius // 2)
+        pygame.draw.circle(surface, COLOR_WHITE, center, core_radius)
+
+        # Outer ring
+        pygame.draw.circle(surface, COLOR_RED, center, current_radius, 2)
+
     def run(self) -> None:
         """Main game loop."""
         while self.running:
@@ -0,0 +1,146 @@
+"""
+Headless wave runner with an auto-targeting AI.
+
+GameState plays the same rules as the window, frame for frame, so waves can
+be fast-forwarded for testing, tuning and training agents. Any agent with a
+choose(state) -> (battery_index, x, y) or None method can take the AI's
+place.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+
+from main import (
+    BLAST_DURATION, BLAST_RADIUS, CITY_Y, FPS, INTERCEPTOR_SPEED, WAVE_COUNT, GameState
+)
+
+MAX_WAVE_FRAMES = FPS * 60 * 3  # three minutes of play
+FIRE_INTERVAL = 6  # Frames between the AI's shots
+COVER_MARGIN = 0.8  # Fraction of the blast radius the AI trusts to catch a missile
+LOWEST_AIM = CITY_Y - BLAST_RADIUS  # The AI never detonates closer to the ground than this
+
+Shot = Tuple[int, float, float]
+
+
+def closest_approach(x: np.ndarray, y: np.ndarray, vx: np.ndarray, vy: np.ndarray,
+                     cx: np.ndarray, cy: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Squared distance between each missile and each blast at their closest, for missiles x blasts.
+
+    Missiles move in straight lines; blast j sits at (cx[j], cy[j]) from
+    frame start[j] to frame end[j].
+    """
+    rx = x[:, None] - cx[None, :]
+    ry = y[:, None] - cy[None, :]
+    speed2 = (vx * vx + vy * vy)[:, None]
+    t = np.divide(-(rx * vx[:, None] + ry * vy[:, None]), speed2, out=np.zeros_like(rx), where=speed2 > 0)
+    t = np.clip(t, start[None, :], end[None, :])
+    dx = rx + vx[:, None] * t
+    dy = ry + vy[:, None] * t
+    return dx * dx + dy * dy
+
+
+class AutoTargeter:
+    """Fires at the most urgent missile that no blast, burning or on its way, will catch."""
+
+    def __init__(self, fire_interval: int = FIRE_INTERVAL):
+        self.fire_interval = fire_interval
+        self.cooldown = 0
+
+    def choose(self, state: GameState) -> Optional[Shot]:
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return None
+        enemies = state.enemy_missiles
+        n = len(enemies)
+        batteries = [i for i, battery in enumerate(state.batteries) if battery.has_ammo()]
+        if not n or not batteries:
+            return None
+        x, y = enemies.x[:n], enemies.y[:n]
+        vx, vy = enemies.vx[:n], enemies.vy[:n]
+
+        # Blasts burning now, plus those interceptors in flight will make
+        blasts = state.explosions
+        cx = list(blasts.x[:len(blasts)])
+        cy = list(blasts.y[:len(blasts)])
+        start = [0.0] * len(blasts)
+        end = list(blasts.duration[:len(blasts)])
+        for interceptor in state.interceptor_missiles:
+            eta = interceptor.current_pos.distance_to(interceptor.target_pos) / INTERCEPTOR_SPEED
+            cx.append(interceptor.target_pos.x)
+            cy.append(interceptor.target_pos.y)
+            start.append(eta)
+            end.append(eta + BLAST_DURATION)
+        uncovered = np.ones(n, dtype=bool)
+        if cx:
+            reach = closest_approach(x, y, vx, vy, np.array(cx), np.array(cy), np.array(start), np.array(end))
+            uncovered = ~(reach <= (BLAST_RADIUS * COVER_MARGIN) ** 2).any(axis=1)
+        if not uncovered.any():
+            return None
+
+        # Most urgent: the missile that lands soonest
+        frames_left = np.where(vy > 0, (enemies.target_y[:n] - y) / np.maximum(vy, 1e-9), np.inf)
+        for i in np.argsort(np.where(uncovered, frames_left, np.inf)).tolist():
+            if not uncovered[i]:
+                break
+            shot = self._aim(state, batteries, x[i], y[i], vx[i], vy[i])
+            if shot is not None:
+                self.cooldown = self.fire_interval
+                return shot
+        return None
+
+    @staticmethod
+    def _aim(state: GameState, batteries: List[int], x: float, y: float,
+             vx: float, vy: float) -> Optional[Shot]:
+        """Nearest battery and the point where its interceptor meets the missile, if high enough."""
+        best = None
+        for index in batteries:
+            origin = state.batteries[index].get_position()
+            dx, dy = x - origin.x, y - origin.y
+            # |d + v t| = speed * t; the interceptor is faster, so there is one positive root
+            a = vx * vx + vy * vy - INTERCEPTOR_SPEED ** 2
+            b = 2 * (dx * vx + dy * vy)
+            c = dx * dx + dy * dy
+            t = (-b - (b * b - 4 * a * c) ** 0.5) / (2 * a)
+            aim_x, aim_y = x + vx * t, y + vy * t
+            if aim_y <= LOWEST_AIM and (best is None or t < best[0]):
+                best = (t, index, aim_x, aim_y)
+        if best is None:
+            return None
+        return best[1], best[2], best[3]
+
+
+def run_wave(state: GameState, agent=None, max_frames: int = MAX_WAVE_FRAMES) -> Dict[str, int]:
+    """Start the next wave and play it to the end with the agent firing."""
+    agent = agent if agent is not None else AutoTargeter()
+    state.start_wave()
+    start_frame = state.frames
+    start_score = state.score
+    shots = 0
+    while state.wave_in_progress and not state.game_over and state.frames - start_frame < max_frames:
+        shot = agent.choose(state)
+        if shot is not None and state.fire(*shot):
+            shots += 1
+        state.update()
+    return {
+        "wave": state.wave_number,
+        "frames": state.frames - start_frame,
+        "score": state.score - start_score,
+        "intercept_score": state.wave_score,
+        "shots": shots,
+        "cities": state.get_alive_city_count(),
+        "batteries": sum(1 for battery in state.batteries if battery.active),
+        "game_over": state.game_over,
+    }
+
+
+def run_game(seed: int = 0, agent=None, waves: int = WAVE_COUNT) -> List[Dict[str, int]]:
+    """Play up to `waves` waves from a fresh game; one summary per wave played."""
+    state = GameState(seed=seed)
+    results = []
+    while len(results) < waves and not state.game_over:
+        results.append(run_wave(state, agent))
+    return results
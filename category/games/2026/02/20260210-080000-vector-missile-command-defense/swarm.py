@@ -0,0 +1,135 @@
+"""
+Enemy missiles and blasts held as parallel NumPy arrays.
+
+Every frame moves all missiles in one step and tests every missile against
+every blast with a single broadcasted distance check. The cost stays nearly
+flat however many warheads a late MIRV wave puts in the air.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+class _ArrayPool:
+    """Parallel arrays whose first `count` slots hold the live entries."""
+
+    FIELDS: Tuple[str, ...] = ()
+
+    def __init__(self, capacity: int = 64):
+        self.count = 0
+        self.capacity = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        for name in self.FIELDS:
+            array = np.zeros(capacity, dtype=np.float64)
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def _reserve(self, extra: int) -> slice:
+        """Make room for extra entries and return their slots."""
+        end = self.count + extra
+        if end > self.capacity:
+            self._grow(max(end, 2 * self.capacity))
+        slots = slice(self.count, end)
+        self.count = end
+        return slots
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def remove(self, mask: np.ndarray) -> None:
+        """Drop the live entries where mask is True, keeping the others in order."""
+        keep = ~mask
+        survivors = int(np.count_nonzero(keep))
+        if survivors == self.count:
+            return
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[:survivors] = array[:self.count][keep]
+        self.count = survivors
+
+
+class MissileSwarm(_ArrayPool):
+    """Enemy missiles flying in straight lines toward their targets.
+
+    A missile detonates on reaching its target's height. A missile with a
+    split height (split_y >= 0) breaks into warheads when it gets there.
+    """
+
+    FIELDS = ("x", "y", "vx", "vy", "target_x", "target_y", "split_y", "age")
+
+    def spawn(self, start_x, start_y, target_x, target_y, speed: float, split_y=-1.0) -> None:
+        """Launch one missile per target; arguments may be scalars or arrays."""
+        start_x, start_y, target_x, target_y, split_y = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=np.float64))
+              for value in (start_x, start_y, target_x, target_y, split_y)))
+        slots = self._reserve(len(start_x))
+        dx, dy = target_x - start_x, target_y - start_y
+        length = np.hypot(dx, dy)
+        scale = np.divide(speed, length, out=np.zeros_like(length), where=length > 0)
+        self.x[slots], self.y[slots] = start_x, start_y
+        self.vx[slots], self.vy[slots] = dx * scale, dy * scale
+        self.target_x[slots], self.target_y[slots] = target_x, target_y
+        self.split_y[slots] = split_y
+        self.age[slots] = 0
+
+    def update(self) -> None:
+        n = self.count
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.age[:n] += 1
+
+    def landed(self, width: float) -> np.ndarray:
+        """Missiles that reached their target's height or left the screen sideways."""
+        n = self.count
+        x = self.x[:n]
+        return (self.y[:n] >= self.target_y[:n]) | (x < 0) | (x > width)
+
+    def splitting(self) -> np.ndarray:
+        """MIRV missiles that reached their split height."""
+        n = self.count
+        split_y = self.split_y[:n]
+        return (split_y >= 0) & (self.y[:n] >= split_y)
+
+    def trail(self, index: int, length: int):
+        """Points the missile passed over its last `length` frames, oldest first."""
+        steps = min(int(self.age[index]), length)
+        x, y, vx, vy = self.x[index], self.y[index], self.vx[index], self.vy[index]
+        return [(x - k * vx, y - k * vy) for k in range(steps, 0, -1)]
+
+
+class BlastField(_ArrayPool):
+    """Blasts that destroy every enemy missile within their radius while they last."""
+
+    FIELDS = ("x", "y", "duration")
+
+    def __init__(self, radius: float, duration: int, capacity: int = 32):
+        super().__init__(capacity)
+        self.radius = radius
+        self.max_duration = duration
+
+    def spawn(self, x: float, y: float) -> None:
+        slot = self._reserve(1).start
+        self.x[slot], self.y[slot] = x, y
+        self.duration[slot] = self.max_duration
+
+    def update(self) -> None:
+        """Age every blast and drop those that burned out."""
+        n = self.count
+        self.duration[:n] -= 1
+        self.remove(self.duration[:n] <= 0)
+
+    def covers(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """For each point, whether any blast reaches it: one broadcasted test for all pairs."""
+        n = self.count
+        if not n or not len(x):
+            return np.zeros(len(x), dtype=bool)
+        dx = x[:, None] - self.x[None, :n]
+        dy = y[:, None] - self.y[None, :n]
+        return (dx * dx + dy * dy <= self.radius * self.radius).any(axis=1)
@@ -0,0 +1,214 @@
+"""
+Draw cost of the level tiles per frame: the former per-tile pygame.draw
+loop against blitting cached chunks, with the camera scrolling through
+levels of growing length.
+
+Physics throughput: the former rect-list collision against the swept
+TileMap, counted in entity-steps per second with crowds of enemies.
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from main import (
+    BROWN, DARK_GRAY, GRAVITY, GREEN, MAX_FALL_SPEED, MOVE_SPEED, ORANGE, RED, SCREEN_HEIGHT,
+    SCREEN_WIDTH, SKY_BLUE, TILE_BRICK, TILE_EMPTY, TILE_FLAGS, TILE_GROUND, TILE_PIPE_L,
+    TILE_PIPE_R, TILE_QUESTION, TILE_SIZE, TILE_USED, YELLOW, Direction, Enemy, Game,
+    LevelGenerator, Player
+)
+from physics import TileMap
+from tile_cache import TileLayer
+
+LEVELS = (1, 10, 50, 200)
+SEED = 5
+PHYSICS_LEVEL = 20
+ENEMY_COUNTS = (10, 100, 500)
+PHYSICS_FRAMES = 300
+LEGACY_SOLID = (TILE_GROUND, TILE_BRICK, TILE_QUESTION, TILE_PIPE_L, TILE_PIPE_R, TILE_USED)
+
+
+def legacy_draw_tiles(screen: pygame.Surface, font: pygame.font.Font, tiles, offset_x: float):
+    """The former Game.draw_tiles body, without the flag."""
+    start_col = max(0, int(offset_x // TILE_SIZE))
+    end_col = min(len(tiles[0]), start_col + (SCREEN_WIDTH // TILE_SIZE) + 2)
+
+    for row in range(len(tiles)):
+        for col in range(start_col, end_col):
+            tile = tiles[row][col]
+            if tile == TILE_EMPTY:
+                continue
+
+            screen_x = col * TILE_SIZE - int(offset_x)
+            screen_y = row * TILE_SIZE
+            rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
+
+            if tile == TILE_GROUND:
+                pygame.draw.rect(screen, BROWN, rect)
+                pygame.draw.rect(screen, DARK_GRAY, rect, 2)
+            elif tile == TILE_BRICK:
+                pygame.draw.rect(screen, ORANGE, rect)
+                pygame.draw.rect(screen, RED, rect, 2)
+                pygame.draw.line(screen, RED, (screen_x, screen_y + TILE_SIZE // 2),
+                                 (screen_x + TILE_SIZE, screen_y + TILE_SIZE // 2), 1)
+            elif tile == TILE_QUESTION:
+                pygame.draw.rect(screen, YELLOW, rect)
+                pygame.draw.rect(screen, ORANGE, rect, 2)
+                q_text = font.render("?", True, ORANGE)
+                screen.blit(q_text, q_text.get_rect(center=rect.center))
+            elif tile in (TILE_PIPE_L, TILE_PIPE_R):
+                pygame.draw.rect(screen, GREEN, rect)
+                pygame.draw.rect(screen, DARK_GRAY, rect, 2)
+
+
+def legacy_colliders(body, tiles):
+    """The former _get_tile_colliders: a fresh Rect per nearby solid tile."""
+    rects = []
+    start_col = max(0, int(body.x // TILE_SIZE) - 1)
+    end_col = min(len(tiles[0]), int((body.x + body.width) // TILE_SIZE) + 2)
+    start_row = max(0, int(body.y // TILE_SIZE) - 1)
+    end_row = min(len(tiles), int((body.y + body.height) // TILE_SIZE) + 2)
+    for row in range(start_row, end_row):
+        for col in range(start_col, end_col):
+            if tiles[row][col] in LEGACY_SOLID:
+                rects.append(pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+    return rects
+
+
+class LegacyPlayer(Player):
+    """The former Player.update and _handle_collision."""
+
+    def update(self, tiles, level_width: int, level_height: int):
+        self.vel_y = min(self.vel_y + GRAVITY, MAX_FALL_SPEED)
+        self.x += self.vel_x
+        self.x = max(0, min(self.x, level_width - self.width))
+        self._handle_collision(tiles, True)
+        self.y += self.vel_y
+        self.on_ground = False
+        self._handle_collision(tiles, False)
+        if self.y > level_height:
+            self.alive = False
+
+    def _handle_collision(self, tiles, horizontal: bool):
+        for tile_rect in legacy_colliders(self, tiles):
+            player_rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+            if player_rect.colliderect(tile_rect):
+                if horizontal:
+                    if self.vel_x > 0:
+                        self.x = tile_rect.left - self.width
+                    elif self.vel_x < 0:
+                        self.x = tile_rect.right
+                    self.vel_x = 0
+                else:
+                    if self.vel_y > 0:
+                        self.y = tile_rect.top - self.height
+                        self.on_ground = True
+                    elif self.vel_y < 0:
+                        self.y = tile_rect.bottom
+                    self.vel_y = 0
+
+
+class LegacyEnemy(Enemy):
+    """The former Enemy.update."""
+
+    def update(self, tiles):
+        self.vel_y = min(self.vel_y + GRAVITY, MAX_FALL_SPEED)
+        self.x += self.vel_x * self.direction.value
+        if self.x <= self.patrol_start or self.x >= self.patrol_end:
+            self.direction = Direction.LEFT if self.direction == Direction.RIGHT else Direction.RIGHT
+        tile_rects = legacy_colliders(self, tiles)
+        player_rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        for tile_rect in tile_rects:
+            if player_rect.colliderect(tile_rect):
+                self.direction = Direction.LEFT if self.direction == Direction.RIGHT else Direction.RIGHT
+                self.x += self.vel_x * self.direction.value * 2
+                break
+        self.y += self.vel_y
+        for tile_rect in tile_rects:
+            player_rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+            if player_rect.colliderect(tile_rect):
+                if self.vel_y > 0:
+                    self.y = tile_rect.top - self.height
+                self.vel_y = 0
+                break
+
+
+def crowd(spawns, count: int):
+    """Enemy spawn points for a crowd, cycling through the level's own spawns."""
+    rng = random.Random(SEED)
+    return [(x + rng.randint(-5, 5), y) for x, y in (spawns[i % len(spawns)] for i in range(count))]
+
+
+def run_physics(player, enemies, step_player, step_enemy) -> float:
+    """Entity-steps per second, the player running right and hopping now and then."""
+    player.move(Direction.RIGHT)
+    start = time.perf_counter()
+    for frame in range(PHYSICS_FRAMES):
+        step_player(player)
+        if player.vel_x == 0:
+            player.move(Direction.RIGHT)
+        if frame % 40 == 0:
+            player.jump()
+        for enemy in enemies:
+            step_enemy(enemy)
+    elapsed = time.perf_counter() - start
+    return PHYSICS_FRAMES * (1 + len(enemies)) / elapsed
+
+
+def camera_path(length: int):
+    """Offsets for a run through the whole level at walking speed."""
+    return [float(x) for x in range(0, length - SCREEN_WIDTH + 1, MOVE_SPEED)]
+
+
+def time_frames(screen: pygame.Surface, path, draw) -> float:
+    start = time.perf_counter()
+    for offset_x in path:
+        screen.fill(SKY_BLUE)
+        draw(offset_x)
+    return (time.perf_counter() - start) / len(path)
+
+
+def physics():
+    random.seed(SEED)
+    data = LevelGenerator(PHYSICS_LEVEL).generate()
+    tiles = data.tiles
+    tile_map = TileMap(tiles, TILE_FLAGS, TILE_SIZE)
+    print(f"Player and enemy physics, level {PHYSICS_LEVEL} ({len(tiles[0])} cols, {PHYSICS_FRAMES} frames)")
+    for count in ENEMY_COUNTS:
+        spawns = crowd(data.enemies, count)
+        legacy = run_physics(LegacyPlayer(*data.player_start), [LegacyEnemy(x, y) for x, y in spawns],
+                             lambda p: p.update(tiles, data.length, SCREEN_HEIGHT),
+                             lambda e: e.update(tiles))
+        swept = run_physics(Player(*data.player_start), [Enemy(x, y) for x, y in spawns],
+                            lambda p: p.update(tile_map), lambda e: e.update(tile_map))
+        print(f"  {count:>4} enemies  rect lists {legacy:10,.0f} steps/s   "
+              f"TileMap {swept:10,.0f} steps/s   {swept / legacy:5.1f}x")
+
+
+def main() -> int:
+    game = Game()
+    screen = game.screen
+    print("Tile drawing per frame, camera scrolling through the whole level")
+    for level in LEVELS:
+        random.seed(SEED)
+        data = LevelGenerator(level).generate()
+        path = camera_path(data.length)
+        legacy = time_frames(screen, path, lambda x: legacy_draw_tiles(screen, game.small_font, data.tiles, x))
+        layer = TileLayer(data.tiles, game.tile_sprites, TILE_SIZE, SCREEN_WIDTH)
+        chunked = time_frames(screen, path, lambda x: layer.draw(screen, x))
+
+        print(f"  level {level:>3} ({len(data.tiles[0]):>4} cols)  per-tile draw {legacy * 1000:6.3f} ms   "
+              f"chunks {chunked * 1000:6.3f} ms   {legacy / chunked:5.1f}x   "
+              f"{layer.chunks_built} chunk builds, {len(layer.chunks)} cached")
+    physics()
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,9 @@ from typing import List, Tuple, Optional
 from enum import Enum
 from dataclasses import dataclass
 
+from physics import ONE_WAY, SLOPE_DOWN, SLOPE_UP, SOLID, TileMap
+from tile_cache import TRANSPARENT, TileLayer
+
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -50,6 +53,23 @@ TILE_QUESTION = 3
 TILE_PIPE_L = 4
 TILE_PIPE_R = 5
 TILE_FLAG = 6
+TILE_USED = 7  # Question block that has been bumped
+TILE_ONE_WAY = 8  # Thin platform that can be jumped through from below
+TILE_SLOPE_UP = 9  # Hillside rising to the right
+TILE_SLOPE_DOWN = 10  # Hillside falling to the right
+
+# Collision flags per tile type
+TILE_FLAGS = {
+    TILE_GROUND: SOLID,
+    TILE_BRICK: SOLID,
+    TILE_QUESTION: SOLID,
+    TILE_PIPE_L: SOLID,
+    TILE_PIPE_R: SOLID,
+    TILE_USED: SOLID,
+    TILE_ONE_WAY: ONE_WAY,
+    TILE_SLOPE_UP: SLOPE_UP,
+    TILE_SLOPE_DOWN: SLOPE_DOWN,
+}
 
 
 class Direction(Enum):
@@ -99,75 +119,38 @@ class Player:
         self.invincible_timer = 0
         self.coins_collected = 0
         self.enemies_defeated = 0
+        self.bumped: Optional[Tuple[int, int]] = None  # (row, col) of the tile hit from below
 
-    def update(self, tiles: List[List[int]], level_width: int, level_height: int):
+    def update(self, tile_map: TileMap):
         """Update player physics."""
         if not self.alive or self.won:
             return
 
+        self.bumped = None
+
         # Apply gravity
         self.vel_y = min(self.vel_y + GRAVITY, MAX_FALL_SPEED)
 
-        # Move X
-        self.x += self.vel_x
-        self.x = max(0, min(self.x, level_width - self.width))
-
-        # Horizontal collision
-        self._handle_collision(tiles, True)
-
-        # Move Y
-        self.y += self.vel_y
+        # Move X, stopping at walls and the level edges
+        if tile_map.move_x(self, self.vel_x) >= 0:
+            self.vel_x = 0
+        self.x = max(0, min(self.x, tile_map.width - self.width))
 
-        # Vertical collision
-        self.on_ground = False
-        self._handle_collision(tiles, False)
+        # Move Y, landing on floors or bumping ceilings
+        hit = tile_map.move_y(self, self.vel_y)
+        if hit >= 0:
+            if self.vel_y < 0:
+                self.bumped = divmod(hit, tile_map.cols)
+            self.vel_y = 0
 
         # Check if fell off
-        if self.y > level_height:
+        if self.y > tile_map.height:
             self.alive = False
 
         # Update invincibility
         if self.invincible_timer > 0:
             self.invincible_timer -= 1
 
-    def _handle_collision(self, tiles: List[List[int]], horizontal: bool):
-        """Handle tile collisions."""
-        tile_rects = self._get_tile_colliders(tiles)
-
-        for tile_rect in tile_rects:
-            player_rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
-
-            if player_rect.colliderect(tile_rect):
-                if horizontal:
-                    if self.vel_x > 0:
-                        self.x = tile_rect.left - self.width
-                    elif self.vel_x < 0:
-                        self.x = tile_rect.right
-                    self.vel_x = 0
-                else:
-                    if self.vel_y > 0:
-                        self.y = tile_rect.top - self.height
-                        self.on_ground = True
-                    elif self.vel_y < 0:
-                        self.y = tile_rect.bottom
-                    self.vel_y = 0
-
-    def _get_tile_colliders(self, tiles: List[List[int]]) -> List[pygame.Rect]:
-        """Get colliding tile rectangles."""
-        rects = []
-        start_col = max(0, int(self.x // TILE_SIZE) - 1)
-        end_col = min(len(tiles[0]), int((self.x + self.width) // TILE_SIZE) + 2)
-        start_row = max(0, int(self.y // TILE_SIZE) - 1)
-        end_row = min(len(tiles), int((self.y + self.height) // TILE_SIZE) + 2)
-
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                if tiles[row][col] in (TILE_GROUND, TILE_BRICK, TILE_QUESTION, TILE_PIPE_L, TILE_PIPE_R):
-                    rects.append(pygame.Rect(
-                        col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE
-                    ))
-        return rects
-
     def jump(self) -> bool:
         """Jump if on ground."""
         if self.on_ground:
@@ -237,12 +220,13 @@ class Enemy:
         self.height = 30
         self.vel_x = 1.0
         self.vel_y = 0.0
+        self.on_ground = False
         self.alive = True
         self.direction = Direction.LEFT
         self.patrol_start = x - 100
         self.patrol_end = x + 100
 
-    def update(self, tiles: List[List[int]]):
+    def update(self, tile_map: TileMap):
         """Update enemy movement."""
         if not self.alive:
             return
@@ -250,50 +234,17 @@ class Enemy:
         # Apply gravity
         self.vel_y = min(self.vel_y + GRAVITY, MAX_FALL_SPEED)
 
-        # Move X
-        self.x += self.vel_x * self.direction.value
+        # Move X, turning around at walls
+        if tile_map.move_x(self, self.vel_x * self.direction.value) >= 0:
+            self.direction = Direction.LEFT if self.direction == Direction.RIGHT else Direction.RIGHT
 
         # Reverse at patrol bounds
         if self.x <= self.patrol_start or self.x >= self.patrol_end:
             self.direction = Direction.LEFT if self.direction == Direction.RIGHT else Direction.RIGHT
 
-        # Horizontal collision
-        tile_rects = self._get_tile_colliders(tiles)
-        player_rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
-
-        for tile_rect in tile_rects:
-            if player_rect.colliderect(tile_rect):
-                self.direction = Direction.LEFT if self.direction == Direction.RIGHT else Direction.RIGHT
-                self.x += self.vel_x * self.direction.value * 2
-                break
-
         # Move Y
-        self.y += self.vel_y
-
-        # Vertical collision
-        for tile_rect in tile_rects:
-            player_rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
-            if player_rect.colliderect(tile_rect):
-                if self.vel_y > 0:
-                    self.y = tile_rect.top - self.height
-                self.vel_y = 0
-                break
-
-    def _get_tile_colliders(self, tiles: List[List[int]]) -> List[pygame.Rect]:
-        """Get nearby tile rectangles."""
-        rects = []
-        start_col = max(0, int(self.x // TILE_SIZE) - 1)
-        end_col = min(len(tiles[0]), int((self.x + self.width) // TILE_SIZE) + 2)
-        start_row = max(0, int(self.y // TILE_SIZE) - 1)
-        end_row = min(len(tiles), int((self.y + self.height) // TILE_SIZE) + 2)
-
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                if tiles[row][col] in (TILE_GROUND, TILE_BRICK, TILE_QUESTION, TILE_PIPE_L, TILE_PIPE_R):
-                    rects.append(pygame.Rect(
-                        col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE
-                    ))
-        return rects
+        if tile_map.move_y(self, self.vel_y) >= 0:
+            self.vel_y = 0
 
     def get_rect(self) -> pygame.Rect:
         """Get collision rectangle."""
@@ -306,6 +257,8 @@ class Enemy:
 
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y)
+        if screen_x < -self.width or screen_x > SCREEN_WIDTH:
+            return
 
         # Goomba body
         pygame.draw.ellipse(surface, BROWN, (screen_x, screen_y + 10, 30, 20))
@@ -404,10 +357,11 @@ class LevelGenerator:
                     tiles[ground_height + 1][gc] = TILE_EMPTY
                     tiles[ground_height + 2][gc] = TILE_EMPTY
 
-            # Place platform
+            # Place platform, some of them thin enough to jump up through
+            platform = TILE_ONE_WAY if random.random() < 0.3 else TILE_BRICK
             for c in range(col, min(col + width, self.cols)):
                 if 0 <= row < self.rows and 0 <= c < self.cols:
-                    tiles[row][c] = TILE_BRICK
+                    tiles[row][c] = platform
 
         # Place pipes
         num_pipes = 2 + self.level // 2
@@ -421,6 +375,19 @@ class LevelGenerator:
                     tiles[base_row - h][col] = TILE_PIPE_L
                     tiles[base_row - h][col + 1] = TILE_PIPE_R
 
+        # Place hills: a slope up, a flat top and a slope down, on solid ground
+        num_hills = 1 + self.level // 3
+        for _ in range(num_hills):
+            col = random.randint(8, self.cols - 12)
+            top_width = random.randint(1, 3)
+            span = range(col, col + top_width + 2)
+            if all(tiles[ground_height - 1][c] == TILE_EMPTY and tiles[ground_height][c] == TILE_GROUND
+                   for c in span):
+                tiles[ground_height - 1][col] = TILE_SLOPE_UP
+                for c in range(col + 1, col + top_width + 1):
+                    tiles[ground_height - 1][c] = TILE_GROUND
+                tiles[ground_height - 1][col + top_width + 1] = TILE_SLOPE_DOWN
+
         # Place question blocks
         num_blocks = 3 + self.level
         for _ in range(num_blocks):
@@ -434,8 +401,12 @@ class LevelGenerator:
         num_enemies = 3 + self.level
         for _ in range(num_enemies):
             col = random.randint(8, self.cols - 10)
+            # Drop in just above whatever stands on the ground here
+            row = ground_height
+            while row > 1 and tiles[row - 1][col] != TILE_EMPTY:
+                row -= 1
             x = col * TILE_SIZE + 5
-            y = (ground_height - 1) * TILE_SIZE
+            y = (row - 1) * TILE_SIZE
             enemies.append((x, y))
 
         # Place coins
@@ -480,6 +451,7 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         self.big_font = pygame.font.Font(None, 64)
         self.small_font = pygame.font.Font(None, 24)
+        self.tile_sprites = self._render_tile_sprites()
 
         self.high_score = self._load_high_score()
         self.current_level = 1
@@ -510,12 +482,54 @@ class Game:
         except:
             pass
 
+    def _render_tile_sprites(self) -> dict:
+        """Draw each tile type once; the tile layer bakes these into its chunks."""
+        sprites = {}
+        for tile in TILE_FLAGS:
+            sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            sprite.fill(TRANSPARENT)
+            rect = sprite.get_rect()
+            if tile == TILE_GROUND:
+                pygame.draw.rect(sprite, BROWN, rect)
+                pygame.draw.rect(sprite, DARK_GRAY, rect, 2)
+            elif tile == TILE_BRICK:
+                pygame.draw.rect(sprite, ORANGE, rect)
+                pygame.draw.rect(sprite, RED, rect, 2)
+                # Brick pattern
+                pygame.draw.line(sprite, RED, (0, TILE_SIZE // 2), (TILE_SIZE, TILE_SIZE // 2), 1)
+            elif tile == TILE_QUESTION:
+                pygame.draw.rect(sprite, YELLOW, rect)
+                pygame.draw.rect(sprite, ORANGE, rect, 2)
+                # Question mark
+                q_text = self.small_font.render("?", True, ORANGE)
+                sprite.blit(q_text, q_text.get_rect(center=rect.center))
+            elif tile == TILE_USED:
+                pygame.draw.rect(sprite, BROWN, rect)
+                pygame.draw.rect(sprite, ORANGE, rect, 2)
+            elif tile == TILE_ONE_WAY:
+                plank = pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE // 4)
+                pygame.draw.rect(sprite, WHITE, plank)
+                pygame.draw.rect(sprite, GRAY, plank, 2)
+            elif tile == TILE_SLOPE_UP:
+                pygame.draw.polygon(sprite, BROWN, [rect.bottomleft, rect.topright, rect.bottomright])
+                pygame.draw.line(sprite, DARK_GRAY, rect.bottomleft, rect.topright, 2)
+            elif tile == TILE_SLOPE_DOWN:
+                pygame.draw.polygon(sprite, BROWN, [rect.topleft, rect.bottomright, rect.bottomleft])
+                pygame.draw.line(sprite, DARK_GRAY, rect.topleft, rect.bottomright, 2)
+            else:
+                pygame.draw.rect(sprite, GREEN, rect)
+                pygame.draw.rect(sprite, DARK_GRAY, rect, 2)
+            sprites[tile] = sprite
+        return sprites
+
     def _generate_level(self):
         """Generate a new level."""
         generator = LevelGenerator(self.current_level)
         level_data = generator.generate()
 
         self.tiles = level_data.tiles
+        self.tile_layer = TileLayer(self.tiles, self.tile_sprites, TILE_SIZE, SCREEN_WIDTH)
+        self.tile_map = TileMap(self.tiles, TILE_FLAGS, TILE_SIZE)
         self.level_width = level_data.length
         self.level_height = SCREEN_HEIGHT
 
@@ -529,6 +543,11 @@ class Game:
         self.camera.offset_x = 0
         self.state = "playing"
 
+    def set_tile(self, row: int, col: int, tile: int):
+        """Change a tile in the level, its drawing and its collision flags."""
+        self.tile_layer.set_tile(row, col, tile)
+        self.tile_map.set_tile(row, col, tile)
+
     def handle_input(self) -> bool:
         """Handle player input."""
         for event in pygame.event.get():
@@ -564,17 +583,27 @@ class Game:
             return
 
         # Update player
-        self.player.update(self.tiles, self.level_width, self.level_height)
+        self.player.update(self.tile_map)
+
+        # Question blocks pay out a coin when bumped from below
+        if self.player.bumped is not None:
+            row, col = self.player.bumped
+            if self.tiles[row][col] == TILE_QUESTION:
+                self.set_tile(row, col, TILE_USED)
+                self.player.coins_collected += 1
+                self.total_score += COIN_SCORE
 
         # Update camera
         self.camera.update(self.player.x, self.level_width)
 
         # Update enemies
         for enemy in self.enemies:
-            enemy.update(self.tiles)
+            enemy.update(self.tile_map)
 
-            # Check collision with player
-            if enemy.alive and enemy.get_rect().colliderect(self.player.get_rect()):
+            # Check collision with player, skipping enemies that are nowhere near
+            if not enemy.alive or abs(enemy.x - self.player.x) > TILE_SIZE:
+                continue
+            if enemy.get_rect().colliderect(self.player.get_rect()):
                 # Check if player stomped enemy (from above)
                 if self.player.vel_y > 0 and self.player.y + self.player.height < enemy.y + enemy.height // 2:
                     enemy.alive = False
@@ -642,39 +671,8 @@ class Game:
             pygame.draw.ellipse(self.screen, WHITE, (x, y, 80, 40))
 
     def draw_tiles(self):
-        """Draw visible tiles."""
-        start_col = max(0, int(self.camera.offset_x // TILE_SIZE))
-        end_col = min(len(self.tiles[0]), start_col + (SCREEN_WIDTH // TILE_SIZE) + 2)
-
-        for row in range(len(self.tiles)):
-            for col in range(start_col, end_col):
-                tile = self.tiles[row][col]
-                if tile == TILE_EMPTY:
-                    continue
-
-                screen_x = col * TILE_SIZE - int(self.camera.offset_x)
-                screen_y = row * TILE_SIZE
-                rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
-
-                if tile == TILE_GROUND:
-                    pygame.draw.rect(self.screen, BROWN, rect)
-                    pygame.draw.rect(self.screen, DARK_GRAY, rect, 2)
-                elif tile == TILE_BRICK:
-                    pygame.draw.rect(self.screen, ORANGE, rect)
-                    pygame.draw.rect(self.screen, RED, rect, 2)
-                    # Brick pattern
-                    pygame.draw.line(self.screen, RED, (screen_x, screen_y + TILE_SIZE // 2),
-                                    (screen_x + TILE_SIZE, screen_y + TILE_SIZE // 2), 1)
-                elif tile == TILE_QUESTION:
-                    pygame.draw.rect(self.screen, YELLOW, rect)
-                    pygame.draw.rect(self.screen, ORANGE, rect, 2)
-                    # Question mark
-                    q_text = self.small_font.render("?", True, ORANGE)
-                    q_rect = q_text.get_rect(center=rect.center)
-                    self.screen.blit(q_text, q_rect)
-                elif tile in (TILE_PIPE_L, TILE_PIPE_R):
-                    pygame.draw.rect(self.screen, GREEN, rect)
-                    pygame.draw.rect(self.screen, DARK_GRAY, rect, 2)
+        """Draw visible tiles from the cached level chunks."""
+        self.tile_layer.draw(self.screen, self.camera.offset_x)
 
         # Draw flag
         flag_screen_x = self.flag_rect.x - int(self.camera.offset_x)
@@ -0,0 +1,201 @@
+"""
+Swept tile collision shared by the player and every enemy.
+
+The level is flattened once into a bytearray of tile flags. A move sweeps
+the box's leading edge across the tile rows or columns it would cross and
+stops flush against the first blocking one. Everything is integer tile
+math on that bitmap, so a step builds no rects or lists.
+
+A body covers the pixels from int(x) to int(x) + width - 1 and from
+int(y) to int(y) + height - 1. Both axes round its edges that way, so a
+tile one move slides past is never skipped by the other.
+
+Bodies are any objects with float x, y, int width, height and a bool
+on_ground attribute.
+"""
+from typing import Dict, List
+
+# Tile flags
+SOLID = 1
+ONE_WAY = 2  # Blocks only from above: bodies jump up through it and land on top
+SLOPE_UP = 4  # Floor rises from the tile's bottom-left corner to its top-right
+SLOPE_DOWN = 8  # Floor falls from the tile's top-left corner to its bottom-right
+SLOPE = SLOPE_UP | SLOPE_DOWN
+
+
+class TileMap:
+    """Collision flags for one level, one byte per tile."""
+
+    def __init__(self, tiles: List[List[int]], tile_flags: Dict[int, int], tile_size: int):
+        self.tile_size = tile_size
+        self.rows = len(tiles)
+        self.cols = len(tiles[0])
+        self.width = self.cols * tile_size
+        self.height = self.rows * tile_size
+        self.tile_flags = tile_flags
+        self.flags = bytearray(tile_flags.get(tile, 0) for row in tiles for tile in row)
+        # Grounded bodies walk over ledges this low, which only slopes produce
+        self.step_height = tile_size // 2
+
+    def set_tile(self, row: int, col: int, tile: int):
+        """Update the flags after a tile changes."""
+        self.flags[row * self.cols + col] = self.tile_flags.get(tile, 0)
+
+    def flag_at(self, row: int, col: int) -> int:
+        """Flags of a tile; everything outside the level is open."""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.flags[row * self.cols + col]
+        return 0
+
+    def _blocked_row(self, row: int, first_col: int, last_col: int, mask: int) -> int:
+        """Flat index of the first tile in a row span with any mask flag, or -1."""
+        if not 0 <= row < self.rows:
+            return -1
+        first_col = max(first_col, 0)
+        last_col = min(last_col, self.cols - 1)
+        base = row * self.cols
+        flags = self.flags
+        for index in range(base + first_col, base + last_col + 1):
+            if flags[index] & mask:
+                return index
+        return -1
+
+    def _blocked_col(self, col: int, first_row: int, last_row: int) -> int:
+        """Flat index of the first solid tile in a column span, or -1."""
+        if not 0 <= col < self.cols:
+            return -1
+        first_row = max(first_row, 0)
+        last_row = min(last_row, self.rows - 1)
+        flags = self.flags
+        cols = self.cols
+        for index in range(first_row * cols + col, last_row * cols + col + 1, cols):
+            if flags[index] & SOLID:
+                return index
+        return -1
+
+    def move_x(self, body, dx: float) -> int:
+        """Move a body sideways, stopping against the first solid column crossed.
+
+        Returns the flat index of the tile hit, or -1.
+        """
+        if not dx:
+            return -1
+        size = self.tile_size
+        left = int(body.x)
+        top = int(body.y)
+        bottom = top + body.height - 1
+        if body.on_ground:
+            bottom -= self.step_height
+        first_row = top // size
+        last_row = bottom // size
+
+        if dx > 0:
+            edge = left + body.width
+            target = body.x + body.width + dx
+            col = -(-edge // size)  # First column whose left side the edge reaches
+            while col * size < target:
+                hit = self._blocked_col(col, first_row, last_row)
+                if hit >= 0:
+                    body.x = col * size - body.width
+                    return hit
+                col += 1
+        else:
+            target = body.x + dx
+            col = left // size - 1  # First column whose right side the edge reaches
+            while (col + 1) * size > target:
+                hit = self._blocked_col(col, first_row, last_row)
+                if hit >= 0:
+                    body.x = (col + 1) * size
+                    return hit
+                col -= 1
+        body.x += dx
+        return -1
+
+    def move_y(self, body, dy: float) -> int:
+        """Move a body vertically, landing on floors and slopes or stopping under ceilings.
+
+        Sets on_ground. Returns the flat index of the tile hit, or -1.
+        """
+        size = self.tile_size
+        was_grounded = body.on_ground
+        body.on_ground = False
+        left = int(body.x)
+        top = int(body.y)
+        first_col = left // size
+        last_col = (left + body.width - 1) // size
+
+        if dy < 0:
+            target = body.y + dy
+            row = top // size - 1
+            while (row + 1) * size > target:
+                hit = self._blocked_row(row, first_col, last_col, SOLID)
+                if hit >= 0:
+                    body.y = (row + 1) * size
+                    return hit
+                row -= 1
+            body.y += dy
+            return -1
+
+        # Falling: one-way tiles block too, since only tops at or below the
+        # feet are swept
+        edge = top + body.height
+        target = body.y + body.height + dy
+        row = -(-edge // size)
+        hit = -1
+        while row * size < target:
+            hit = self._blocked_row(row, first_col, last_col, SOLID | ONE_WAY)
+            if hit >= 0:
+                body.y = row * size - body.height
+                body.on_ground = True
+                break
+            row += 1
+        else:
+            body.y += dy
+        # A slope can still lift a body standing at its foot
+        slope = self._settle(body, was_grounded or body.on_ground)
+        return slope if slope >= 0 else hit
+
+    def _settle(self, body, was_grounded: bool) -> int:
+        """Stand a body on the highest slope or ledge top under it, within a step of its feet."""
+        size = self.tile_size
+        left = int(body.x)
+        right = left + body.width
+        feet = body.y + body.height
+        low = feet - self.step_height  # Highest surface the body steps up to
+        high = feet + (self.step_height if was_grounded else 0)  # Lowest it snaps down to
+        first_col = max(left // size, 0)
+        last_col = min((right - 1) // size, self.cols - 1)
+        flags = self.flags
+        best = None
+        best_index = -1
+        # Any floor in the row the feet are in is above any in the row below
+        first_row = (int(feet) - 1) // size
+        for row in (first_row, first_row + 1):
+            if not 0 <= row < self.rows:
+                continue
+            top = row * size
+            base = row * self.cols
+            for index in range(base + first_col, base + last_col + 1):
+                flag = flags[index]
+                if not flag:
+                    continue
+                col_left = (index - base) * size
+                if flag & SLOPE_UP:
+                    # Highest where the body's right side is over it
+                    surface = top + size - (min(right, col_left + size) - col_left)
+                elif flag & SLOPE_DOWN:
+                    surface = top + max(left, col_left) - col_left
+                elif flag & SOLID and was_grounded:
+                    surface = top
+                else:
+                    continue
+                if low <= surface <= high and (best is None or surface < best):
+                    best = surface
+                    best_index = index
+            if best is not None:
+                break
+        if best is None:
+            return -1
+        body.y = best - body.height
+        body.on_ground = True
+        return best_index
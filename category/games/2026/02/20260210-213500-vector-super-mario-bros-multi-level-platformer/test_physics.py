@@ -0,0 +1,61 @@
+"""Swept tile collision edge cases."""
+
+from physics import SLOPE_DOWN, SLOPE_UP, SOLID, TileMap
+
+SIZE = 40
+GROUND, HILL_UP, HILL_DOWN = 1, 2, 3
+FLAGS = {GROUND: SOLID, HILL_UP: SLOPE_UP, HILL_DOWN: SLOPE_DOWN}
+
+
+class Body:
+    def __init__(self, x, y, width, height, on_ground=False):
+        self.x = float(x)
+        self.y = float(y)
+        self.width = width
+        self.height = height
+        self.on_ground = on_ground
+
+
+def overlaps_solid(tile_map, body):
+    """True if any pixel of the body is inside a solid tile."""
+    left, top = int(body.x), int(body.y)
+    for row in range(top // SIZE, (top + body.height - 1) // SIZE + 1):
+        for col in range(left // SIZE, (left + body.width - 1) // SIZE + 1):
+            if tile_map.flag_at(row, col) & SOLID:
+                return True
+    return False
+
+
+def test_feet_just_below_tile_top_land_on_it():
+    """Feet a fraction of a pixel past a block's top land on it instead of falling in."""
+    tiles = [[0] * 6 for _ in range(6)]
+    tiles[3][2] = GROUND
+    tile_map = TileMap(tiles, FLAGS, SIZE)
+    for y in (80.0, 80.5, 80.99):
+        body = Body(50, y, 30, 40)
+        tile_map.move_x(body, 5)
+        tile_map.move_y(body, 5)
+        assert body.y == 80
+        assert body.on_ground
+        assert not overlaps_solid(tile_map, body)
+
+
+def test_walk_over_hill_without_sinking():
+    """A body walking up a slope, over the flat top and down again never enters a solid tile."""
+    tiles = [[0] * 8 for _ in range(5)]
+    tiles[4] = [GROUND] * 8
+    tiles[3][2] = HILL_UP
+    tiles[3][3] = GROUND
+    tiles[3][4] = HILL_DOWN
+    tile_map = TileMap(tiles, FLAGS, SIZE)
+    body = Body(20, 4 * SIZE - 30, 30, 30, on_ground=True)
+    heights = []
+    for _ in range(200):
+        tile_map.move_x(body, 1)
+        tile_map.move_y(body, 0.8)
+        assert body.on_ground
+        assert not overlaps_solid(tile_map, body)
+        heights.append(body.y)
+    # Stood on the hilltop, then came back down to the ground
+    assert min(heights) == 3 * SIZE - 30
+    assert body.y == 4 * SIZE - 30
@@ -0,0 +1,99 @@
+"""
+Level tiles baked into fixed-width chunk surfaces.
+
+A chunk is rendered the first time the camera comes near it and kept in a
+small LRU cache, so drawing the level costs a couple of blits per frame no
+matter how long it is. Changing a tile repaints just that cell in its chunk.
+"""
+import pygame
+from collections import OrderedDict
+from typing import Dict, List
+
+CHUNK_TILES = 16  # Tile columns per chunk
+PREFETCH_TILES = 4  # Build chunks this many columns before they scroll into view
+MAX_CHUNKS = 6  # Cached chunks; must cover the view plus the prefetch margin
+TRANSPARENT = (255, 0, 255)  # Colorkey for empty cells, unused by any tile
+
+
+class TileLayer:
+    """The solid tiles of one level, drawn from lazily built chunk surfaces."""
+
+    def __init__(self, tiles: List[List[int]], sprites: Dict[int, pygame.Surface],
+                 tile_size: int, view_width: int, chunk_tiles: int = CHUNK_TILES,
+                 max_chunks: int = MAX_CHUNKS):
+        self.tiles = tiles
+        self.sprites = sprites
+        self.tile_size = tile_size
+        self.view_width = view_width
+        self.chunk_tiles = chunk_tiles
+        self.chunk_width = chunk_tiles * tile_size
+        self.max_chunks = max_chunks
+        self.rows = len(tiles)
+        self.cols = len(tiles[0])
+        self.num_chunks = -(-self.cols // chunk_tiles)
+        self.chunks: "OrderedDict[int, pygame.Surface]" = OrderedDict()
+        self.chunks_built = 0
+
+    def _build_chunk(self, index: int) -> pygame.Surface:
+        """Render every tile in one chunk onto a fresh surface."""
+        first_col = index * self.chunk_tiles
+        last_col = min(first_col + self.chunk_tiles, self.cols)
+        surface = pygame.Surface(((last_col - first_col) * self.tile_size, self.rows * self.tile_size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(TRANSPARENT)
+        # Run-length encoding skips the empty sky cells quickly when blitting
+        surface.set_colorkey(TRANSPARENT, pygame.RLEACCEL)
+
+        blits = []
+        for row, tile_row in enumerate(self.tiles):
+            y = row * self.tile_size
+            for col in range(first_col, last_col):
+                sprite = self.sprites.get(tile_row[col])
+                if sprite is not None:
+                    blits.append((sprite, ((col - first_col) * self.tile_size, y)))
+        surface.blits(blits, doreturn=False)
+        self.chunks_built += 1
+        return surface
+
+    def _get_chunk(self, index: int) -> pygame.Surface:
+        """Fetch a chunk, building it on a miss and evicting the least recently used."""
+        surface = self.chunks.get(index)
+        if surface is None:
+            surface = self._build_chunk(index)
+            self.chunks[index] = surface
+            while len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(index)
+        return surface
+
+    def set_tile(self, row: int, col: int, tile: int):
+        """Change a tile and repaint its cell in the cached chunk, if there is one."""
+        self.tiles[row][col] = tile
+        index = col // self.chunk_tiles
+        surface = self.chunks.get(index)
+        if surface is None:
+            return  # Built with the new tile when it next comes into view
+        cell = pygame.Rect((col - index * self.chunk_tiles) * self.tile_size, row * self.tile_size,
+                           self.tile_size, self.tile_size)
+        surface.fill(TRANSPARENT, cell)
+        sprite = self.sprites.get(tile)
+        if sprite is not None:
+            surface.blit(sprite, cell)
+
+    def draw(self, surface: pygame.Surface, offset_x: float):
+        """Blit the chunks under the view and make sure the next ones are ready."""
+        camera_x = int(offset_x)
+        first = max(0, camera_x // self.chunk_width)
+        last = min(self.num_chunks - 1, (camera_x + self.view_width - 1) // self.chunk_width)
+        for index in range(first, last + 1):
+            surface.blit(self._get_chunk(index), (index * self.chunk_width - camera_x, 0))
+
+        # Prefetch on both sides so a chunk is never built the frame it appears
+        margin = PREFETCH_TILES * self.tile_size
+        ahead = (camera_x + self.view_width + margin) // self.chunk_width
+        behind = (camera_x - margin) // self.chunk_width
+        for index in (ahead, behind):
+            if 0 <= index < self.num_chunks and index not in self.chunks:
+                self._get_chunk(index)
@@ -0,0 +1,195 @@
+"""Guard navigation benchmark for Vector Lode Runner Gold Collect.
+
+Measures how often the former sign-check chase and the flow-field guards
+reach a standing player on the built-in level, times a full flow-field
+search against repairing it after a hole is dug or refilled on generated
+levels of growing size (checking the repaired field matches a fresh
+search), and times per-frame guard decisions.
+
+Run with: uv run python benchmark.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from main import (CLIMB_SPEED, GRAVITY, GRID_HEIGHT, GUARD_SPEED, MAX_FALL_SPEED, SCREEN_HEIGHT,
+                  SCREEN_WIDTH, TILE_NAV_FLAGS, TILE_SIZE, Level, Player, TileType)
+from navigation import FlowField
+
+CHASE_FRAMES = 60 * 20
+LEVEL_SIZES = ((20, 15), (100, 60), (300, 150))
+EDITS = 200
+GUARDS = 500
+SEED = 3
+
+
+def legacy_guard_update(guard, level, player):
+    """The former Guard.update and _apply_movement: chase by the signs of dx and dy."""
+    gx, gy = guard.grid_x, guard.grid_y
+    tile_below = level.get_tile(gx, gy + 1) if gy + 1 < GRID_HEIGHT else TileType.EMPTY
+    guard.on_ladder = level.get_tile(gx, gy) == TileType.LADDER
+    guard.on_ground = (tile_below == TileType.BRICK or tile_below == TileType.LADDER or
+                       guard.y >= (gy + 1) * TILE_SIZE - 5)
+    dx = player.x - guard.x
+    dy = player.y - guard.y
+    guard.vel_x = (GUARD_SPEED if dx > 0 else -GUARD_SPEED) if abs(dx) > 5 else 0
+    if guard.on_ladder:
+        guard.vel_y = -CLIMB_SPEED * 0.7 if dy < -10 else CLIMB_SPEED * 0.7 if dy > 10 else 0
+    elif not guard.on_ground:
+        guard.vel_y = min(guard.vel_y + GRAVITY, MAX_FALL_SPEED)
+
+    new_x = guard.x + guard.vel_x
+    if TILE_SIZE // 2 <= new_x <= SCREEN_WIDTH - TILE_SIZE // 2:
+        if guard.vel_x > 0:
+            tile_right = level.get_tile(int((new_x + guard.width // 2) // TILE_SIZE), guard.grid_y)
+            if tile_right not in [TileType.BRICK, TileType.HOLE]:
+                guard.x = new_x
+        elif guard.vel_x < 0:
+            tile_left = level.get_tile(int((new_x - guard.width // 2) // TILE_SIZE), guard.grid_y)
+            if tile_left not in [TileType.BRICK, TileType.HOLE]:
+                guard.x = new_x
+    new_y = guard.y + guard.vel_y
+    test_grid_y = int((new_y + guard.height // 2) // TILE_SIZE)
+    if guard.vel_y > 0:
+        if test_grid_y < GRID_HEIGHT:
+            tile_below = level.get_tile(guard.grid_x, test_grid_y)
+            if tile_below == TileType.BRICK:
+                guard.y = test_grid_y * TILE_SIZE
+            elif tile_below != TileType.HOLE:
+                guard.y = min(new_y, test_grid_y * TILE_SIZE + TILE_SIZE // 2)
+        else:
+            guard.y = new_y
+    elif guard.vel_y < 0:
+        if level.get_tile(guard.grid_x, test_grid_y) != TileType.BRICK:
+            guard.y = new_y
+    guard.y = max(0, min(SCREEN_HEIGHT, guard.y))
+    guard.update_grid_pos()
+
+
+def chase(update):
+    """Frames until a guard touches a player standing at each open floor cell, or None."""
+    results = []
+    for col in range(2, 18, 3):
+        level = Level()
+        player = Player(col, GRID_HEIGHT - 2)
+        caught = None
+        for frame in range(CHASE_FRAMES):
+            update(level, player)
+            if any(guard.get_rect().colliderect(player.get_rect()) for guard in level.guards):
+                caught = frame
+                break
+        results.append(caught)
+    return results
+
+
+def chase_benchmark():
+    """Compare how quickly each guard AI reaches the player."""
+    def legacy(level, player):
+        for guard in level.guards:
+            legacy_guard_update(guard, level, player)
+
+    def flow(level, player):
+        level.chase(player)
+        for guard in level.guards:
+            guard.update(1 / 60, level, player)
+
+    print(f"Chase on the built-in level, player standing on the floor, up to {CHASE_FRAMES // 60}s")
+    for name, update in (("sign checks", legacy), ("flow field", flow)):
+        results = chase(update)
+        text = "  ".join(f"{frame / 60:4.1f}s" if frame is not None else " never" for frame in results)
+        caught = sum(frame is not None for frame in results)
+        print(f"  {name:<12} caught {caught}/{len(results)}   {text}")
+
+
+def random_level(width, height, rng):
+    """Brick floors with gaps, ladders between them and ropes over the gaps."""
+    tiles = [[TileType.EMPTY] * width for _ in range(height)]
+    for y in range(height):
+        tiles[y][0] = tiles[y][width - 1] = TileType.BRICK
+    for y in range(3, height, 3):
+        for x in range(width):
+            if rng.random() < 0.85 or y == height - 1:
+                tiles[y][x] = TileType.BRICK
+        for x in range(1, width - 1):
+            if rng.random() < 0.08:
+                for ladder_y in range(y - 3, y + 1):
+                    if ladder_y > 0:
+                        tiles[ladder_y][x] = TileType.LADDER
+            elif rng.random() < 0.05 and tiles[y - 2][x] == TileType.EMPTY:
+                tiles[y - 2][x] = TileType.ROPE
+    for x in range(width):
+        tiles[height - 1][x] = TileType.BRICK
+    return tiles
+
+
+def flow_benchmark():
+    """Full search against local repair after digs and refills."""
+    print(f"Flow field, {EDITS} holes dug and refilled per level")
+    for width, height in LEVEL_SIZES:
+        rng = random.Random(SEED)
+        tiles = random_level(width, height, rng)
+        field = FlowField(tiles, TILE_NAV_FLAGS)
+        target = next((x, y) for y in range(height - 2, 0, -1) for x in range(width // 2, width)
+                      if tiles[y][x] == TileType.EMPTY and tiles[y + 1][x] == TileType.BRICK)
+        start = time.perf_counter()
+        field.set_targets([target])
+        full = time.perf_counter() - start
+        reachable = field.cells_searched
+
+        bricks = [(x, y) for y in range(1, height - 1) for x in range(1, width - 1)
+                  if tiles[y][x] == TileType.BRICK]
+        repaired = 0
+        searched = 0
+        edits = 0
+        for x, y in rng.sample(bricks, min(EDITS, len(bricks))):
+            # Leave about half the holes open so later repairs meet them
+            for tile in (TileType.HOLE, TileType.BRICK) if rng.random() < 0.5 else (TileType.HOLE,):
+                tiles[y][x] = tile
+                start = time.perf_counter()
+                field.set_tile(x, y, tile)
+                repaired += time.perf_counter() - start
+                searched += field.cells_searched
+                edits += 1
+        check = FlowField(tiles, TILE_NAV_FLAGS)
+        check.set_targets([target])
+        assert check.distance == field.distance, f"repair diverged at {width}x{height}"
+        repair = repaired / edits
+        print(f"  {width:>3}x{height:<3} {reachable:>6} cells reach the player   full search {full * 1000:7.2f} ms   "
+              f"repair {repair * 1000:5.3f} ms ({searched / edits:5.1f} cells)   {full / repair:6.0f}x   (identical)")
+    return field
+
+
+def decision_benchmark(field):
+    """Per-frame cost of every guard looking up its next step."""
+    rng = random.Random(SEED)
+    cells = [(rng.randrange(field.cols), rng.randrange(field.rows)) for _ in range(GUARDS)]
+    frames = 100
+    start = time.perf_counter()
+    for _ in range(frames):
+        for col, row in cells:
+            field.step(col, row)
+    elapsed = (time.perf_counter() - start) / frames
+    print(f"Guard decisions: {GUARDS} guards in {elapsed * 1000:.3f} ms per frame "
+          f"({elapsed / GUARDS * 1e6:.2f} us each)")
+
+
+def main():
+    """Run every benchmark."""
+    pygame.init()
+    chase_benchmark()
+    field = flow_benchmark()
+    decision_benchmark(field)
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
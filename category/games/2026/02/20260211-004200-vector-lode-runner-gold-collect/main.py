@@ -9,6 +9,8 @@ from typing import List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+from navigation import LADDER, ROPE, SOLID, TRAP, FlowField
+
 
 # Constants
 SCREEN_WIDTH = 640
@@ -64,6 +66,15 @@ class TileType(Enum):
     HOLE = 4
 
 
+# Navigation flags of each tile type for the guards' flow field
+TILE_NAV_FLAGS = {
+    TileType.BRICK: SOLID,
+    TileType.LADDER: LADDER,
+    TileType.ROPE: ROPE,
+    TileType.HOLE: TRAP,
+}
+
+
 @dataclass
 class Hole:
     grid_x: int
@@ -278,6 +289,7 @@ class Guard(Entity):
     def __init__(self, grid_x: int, grid_y: int):
         super().__init__(grid_x, grid_y)
         self.patrol_dir = 1
+        self.target: Optional[Tuple[int, int]] = None  # Cell being moved into
         self.state = 'chase'  # chase, trapped, respawn
         self.respawn_timer = 0
         self.alive = True
@@ -288,87 +300,82 @@ class Guard(Entity):
             if self.respawn_timer <= 0:
                 self.state = 'chase'
                 self.alive = True
+                self.target = None
+                self.vel_y = 0.0
             return
 
         if not self.alive:
             return
 
-        # Get current tile info
-        gx, gy = self.grid_x, self.grid_y
-        tile_below = level.get_tile(gx, gy + 1) if gy + 1 < GRID_HEIGHT else TileType.EMPTY
-        tile_current = level.get_tile(gx, gy)
+        # Pick the next cell on arriving at one
+        if self.target is None:
+            self.target = self._choose_target(level)
+            if self.target is None:
+                return
+        self._apply_movement(level)
 
-        self.on_ladder = tile_current == TileType.LADDER
-        self.on_ground = (tile_below == TileType.BRICK or
-                         tile_below == TileType.LADDER or
-                         self.y >= (gy + 1) * TILE_SIZE - 5)
+    def respawn(self) -> None:
+        """Leave the level for a while and come back at the top."""
+        self.state = 'respawn'
+        self.respawn_timer = 3000
+        self.grid_x = random.randint(2, GRID_WIDTH - 3)
+        self.grid_y = 1
+        self.x = self.grid_x * TILE_SIZE + TILE_SIZE // 2
+        self.y = self.grid_y * TILE_SIZE
+        self.target = None
+
+    def _choose_target(self, level: 'Level') -> Optional[Tuple[int, int]]:
+        """Next cell to move to: down if unsupported, else the flow field's step."""
+        gx, gy = self.grid_x, self.grid_y
+        flow = level.flow
+        tile = level.get_tile(gx, gy)
+        if tile == TileType.HOLE:
+            return None  # Trapped until the level lets it out
+        if tile == TileType.BRICK:
+            # A hole refilled as it fell in
+            self.respawn()
+            return None
+        self.on_ladder = level.get_tile(gx, gy) == TileType.LADDER
+        self.on_ground = flow.standing(gy * GRID_WIDTH + gx)
+        if not self.on_ground:
+            return (gx, gy + 1) if gy + 1 < GRID_HEIGHT else None
+        self.vel_y = 0.0
 
-        # Simple AI: chase player
-        dx = player.x - self.x
-        dy = player.y - self.y
+        step = flow.step(gx, gy)
+        if step is None:
+            # No route to the player: patrol back and forth
+            moves = flow.out_edges[gy * GRID_WIDTH + gx]
+            ahead = gy * GRID_WIDTH + gx + self.patrol_dir
+            if ahead not in moves:
+                self.patrol_dir = -self.patrol_dir
+                ahead = gy * GRID_WIDTH + gx + self.patrol_dir
+                if ahead not in moves:
+                    return None
+            step = (self.patrol_dir, 0)
+        if step[0]:
+            self.facing_right = step[0] > 0
+        return gx + step[0], gy + step[1]
 
-        # Horizontal movement
-        if abs(dx) > 5:
-            move_x = GUARD_SPEED if dx > 0 else -GUARD_SPEED
-            self.vel_x = move_x
-            self.facing_right = dx > 0
+    def _apply_movement(self, level: 'Level') -> None:
+        # Slide toward the target cell, settling on it once reached
+        tx, ty = self.target
+        goal_x = tx * TILE_SIZE + TILE_SIZE // 2
+        goal_y = ty * TILE_SIZE
+        if goal_x != self.x:
+            self.vel_x = GUARD_SPEED if goal_x > self.x else -GUARD_SPEED
+            self.x = min(self.x + self.vel_x, goal_x) if self.vel_x > 0 else max(self.x + self.vel_x, goal_x)
         else:
             self.vel_x = 0
+        if goal_y > self.y and not self.on_ground:
+            self.vel_y = min(self.vel_y + GRAVITY, MAX_FALL_SPEED)
+            self.y = min(self.y + self.vel_y, goal_y)
+        elif goal_y != self.y:
+            climb = CLIMB_SPEED * 0.7
+            self.y = min(self.y + climb, goal_y) if goal_y > self.y else max(self.y - climb, goal_y)
 
-        # Vertical movement on ladders
-        if self.on_ladder:
-            if dy < -10:
-                self.vel_y = -CLIMB_SPEED * 0.7
-            elif dy > 10:
-                self.vel_y = CLIMB_SPEED * 0.7
-            else:
-                self.vel_y = 0
-        else:
-            # Apply gravity when not on ladder
-            if not self.on_ground:
-                self.vel_y = min(self.vel_y + GRAVITY, MAX_FALL_SPEED)
-
-        # Apply movement
-        self._apply_movement(level)
-
-    def _apply_movement(self, level: 'Level') -> None:
-        # Similar to player but simpler
-        new_x = self.x + self.vel_x
-
-        # Check horizontal bounds
-        if TILE_SIZE // 2 <= new_x <= SCREEN_WIDTH - TILE_SIZE // 2:
-            test_x = int(new_x // TILE_SIZE)
-            if self.vel_x > 0:
-                right_edge = int((new_x + self.width // 2) // TILE_SIZE)
-                tile_right = level.get_tile(right_edge, self.grid_y)
-                if tile_right not in [TileType.BRICK, TileType.HOLE]:
-                    self.x = new_x
-            elif self.vel_x < 0:
-                left_edge = int((new_x - self.width // 2) // TILE_SIZE)
-                tile_left = level.get_tile(left_edge, self.grid_y)
-                if tile_left not in [TileType.BRICK, TileType.HOLE]:
-                    self.x = new_x
-
-        # Vertical movement
-        new_y = self.y + self.vel_y
-        test_grid_y = int((new_y + self.height // 2) // TILE_SIZE)
-
-        if self.vel_y > 0:
-            if test_grid_y < GRID_HEIGHT:
-                tile_below = level.get_tile(self.grid_x, test_grid_y)
-                if tile_below == TileType.BRICK:
-                    self.y = test_grid_y * TILE_SIZE
-                elif tile_below != TileType.HOLE:
-                    self.y = min(new_y, test_grid_y * TILE_SIZE + TILE_SIZE // 2)
-            else:
-                self.y = new_y
-        elif self.vel_y < 0:
-            tile_above = level.get_tile(self.grid_x, test_grid_y)
-            if tile_above != TileType.BRICK:
-                self.y = new_y
-
-        self.y = max(0, min(SCREEN_HEIGHT, self.y))
-        self.update_grid_pos()
+        if self.x == goal_x and self.y == goal_y:
+            self.grid_x, self.grid_y = tx, ty
+            self.target = None
 
     def draw(self, surface: pygame.Surface) -> None:
         if not self.alive or self.state == 'respawn':
@@ -450,6 +457,7 @@ class Level:
         self.collected_gold = 0
 
         self._generate_level()
+        self.flow = FlowField(self.tiles, TILE_NAV_FLAGS)
 
     def get_tile(self, grid_x: int, grid_y: int) -> TileType:
         if 0 <= grid_x < GRID_WIDTH and 0 <= grid_y < GRID_HEIGHT:
@@ -459,6 +467,16 @@ class Level:
     def set_tile(self, grid_x: int, grid_y: int, tile_type: TileType) -> None:
         if 0 <= grid_x < GRID_WIDTH and 0 <= grid_y < GRID_HEIGHT:
             self.tiles[grid_y][grid_x] = tile_type
+            self.flow.set_tile(grid_x, grid_y, tile_type)
+
+    def chase(self, player: 'Player') -> None:
+        """Aim the guards' flow field at the open cell the player is in."""
+        gx = min(max(player.grid_x, 0), GRID_WIDTH - 1)
+        gy = min(max(player.grid_y, 0), GRID_HEIGHT - 1)
+        # Standing on a platform puts the player's grid row on the brick itself
+        if self.get_tile(gx, gy) == TileType.BRICK and gy > 0:
+            gy -= 1
+        self.flow.set_targets([(gx, gy)])
 
     def dig_hole(self, grid_x: int, grid_y: int) -> None:
         self.set_tile(grid_x, grid_y, TileType.HOLE)
@@ -558,12 +576,7 @@ class Level:
         for tg in self.trapped_guards[:]:
             if time_ms - tg.trap_time >= TRAP_DURATION:
                 # Guard escapes - respawn at top
-                tg.guard.state = 'respawn'
-                tg.guard.respawn_timer = 3000
-                tg.guard.grid_x = random.randint(2, GRID_WIDTH - 3)
-                tg.guard.grid_y = 1
-                tg.guard.x = tg.guard.grid_x * TILE_SIZE + TILE_SIZE // 2
-                tg.guard.y = tg.guard.grid_y * TILE_SIZE
+                tg.guard.respawn()
                 self.trapped_guards.remove(tg)
 
         # Update gold
@@ -735,6 +748,7 @@ class Game:
         self.player.update(dt, keys, self.level)
 
         # Update guards
+        self.level.chase(self.player)
         for guard in self.level.guards:
             guard.update(dt, self.level, self.player)
 
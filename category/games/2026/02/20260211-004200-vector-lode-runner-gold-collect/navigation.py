@@ -0,0 +1,211 @@
+"""
+Navigation graph and shared flow field for guard AI.
+
+Every open cell of the level is a node. Its edges are the moves a guard
+can make from it: walking along a floor or a rope, climbing a ladder,
+dropping off a ladder or rope, falling when nothing holds it up, and
+climbing out of a dug hole. Climbing out costs TRAP_COST moves, so routes
+go around holes when they can and through them when they must. A
+shortest-path search back from the player's cell gives every cell its
+distance to the player and the neighbour one step closer, so a guard's
+decision is a single table lookup however many guards there are.
+
+Digging or refilling a hole only changes the edges of the cells around
+it. Those cells, and the cells whose route ran through a removed edge,
+are repaired in place instead of searching the whole level again.
+"""
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Tile flags
+SOLID = 1  # Blocks movement and holds up whatever stands on it
+LADDER = 2  # Climbable, and can be stood on from above
+ROPE = 4  # Hangs whatever is on it and can be traversed sideways
+TRAP = 8  # A dug hole: whatever falls in stays until it is let out
+
+TRAP_COST = 10  # Moves a guard loses climbing out of a hole
+UNREACHABLE = 1 << 30
+
+
+class FlowField:
+    """Move graph of one level and each cell's next step toward the targets."""
+
+    def __init__(self, tiles: List[list], tile_flags: Dict[object, int]):
+        self.rows = len(tiles)
+        self.cols = len(tiles[0])
+        self.tile_flags = tile_flags
+        self.flags = bytearray(tile_flags.get(tile, 0) for row in tiles for tile in row)
+        cells = self.rows * self.cols
+        self.out_edges: List[Tuple[int, ...]] = [()] * cells
+        self.in_edges: List[set] = [set() for _ in range(cells)]
+        for cell in range(cells):
+            self._link(cell)
+        self.distance = [UNREACHABLE] * cells
+        self.next_cell = [-1] * cells
+        self.targets: Tuple[int, ...] = ()
+        self.cells_searched = 0  # Cells settled by the last search or repair
+
+    def _flag(self, col: int, row: int) -> int:
+        """Flags of a cell; beyond the edges counts as solid."""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.flags[row * self.cols + col]
+        return SOLID
+
+    def standing(self, cell: int) -> bool:
+        """True if whatever is in the cell is held up rather than falling."""
+        row, col = divmod(cell, self.cols)
+        flag = self.flags[cell]
+        return bool(flag & (LADDER | ROPE) or self._flag(col, row + 1) & (SOLID | LADDER))
+
+    def cost(self, cell: int) -> int:
+        """Cost of any move out of the cell."""
+        return TRAP_COST if self.flags[cell] & TRAP else 1
+
+    def _moves(self, cell: int) -> Tuple[int, ...]:
+        """Cells a guard can move to from this one."""
+        flag = self.flags[cell]
+        if flag & SOLID:
+            return ()
+        row, col = divmod(cell, self.cols)
+        if flag & TRAP:
+            # Climb out onto either side of the hole, or up a ladder or rope above it
+            above = cell - self.cols
+            moves = [above + step for step in (-1, 1) if not self._flag(col + step, row - 1) & SOLID]
+            if self._flag(col, row - 1) & (LADDER | ROPE):
+                moves.append(above)
+            return tuple(moves)
+        below = self._flag(col, row + 1)
+        if not self.standing(cell):
+            return () if below & SOLID else (cell + self.cols,)
+
+        moves = []
+        for step in (-1, 1):
+            if not self._flag(col + step, row) & SOLID:
+                moves.append(cell + step)
+        if flag & LADDER and not self._flag(col, row - 1) & SOLID:
+            moves.append(cell - self.cols)
+        if not below & SOLID and (below & LADDER or flag & (LADDER | ROPE)):
+            moves.append(cell + self.cols)
+        return tuple(moves)
+
+    def _link(self, cell: int):
+        """Rebuild a cell's out edges and the matching in edges."""
+        for old in self.out_edges[cell]:
+            self.in_edges[old].discard(cell)
+        moves = self._moves(cell)
+        self.out_edges[cell] = moves
+        for new in moves:
+            self.in_edges[new].add(cell)
+
+    def set_targets(self, cells: Iterable[Tuple[int, int]]):
+        """Point the field at new (col, row) targets, searching again if they moved."""
+        targets = tuple(sorted({row * self.cols + col for col, row in cells
+                                if 0 <= row < self.rows and 0 <= col < self.cols}))
+        if targets != self.targets:
+            self.targets = targets
+            self.rebuild()
+
+    def rebuild(self):
+        """Shortest-path search back from the targets over every cell."""
+        distance = [UNREACHABLE] * len(self.flags)
+        next_cell = [-1] * len(self.flags)
+        in_edges = self.in_edges
+        flags = self.flags
+        for target in self.targets:
+            distance[target] = 0
+        # Moves cost 1 or TRAP_COST, so cells are queued in one bucket per
+        # distance instead of a heap
+        buckets = [list(self.targets)]
+        value = 0
+        while value < len(buckets):
+            for cell in buckets[value]:
+                if distance[cell] != value:
+                    continue
+                for source in in_edges[cell]:
+                    step = value + (TRAP_COST if flags[source] & TRAP else 1)
+                    if step < distance[source]:
+                        distance[source] = step
+                        next_cell[source] = cell
+                        while len(buckets) <= step:
+                            buckets.append([])
+                        buckets[step].append(source)
+            value += 1
+        self.distance = distance
+        self.next_cell = next_cell
+        self.cells_searched = sum(1 for value in distance if value != UNREACHABLE)
+
+    def set_tile(self, col: int, row: int, tile):
+        """Update the graph after a tile changes and repair the field around it."""
+        cell = row * self.cols + col
+        self.flags[cell] = self.tile_flags.get(tile, 0)
+
+        # The tile holds up the cell above, is entered from the cells
+        # beside, above and below it, and is climbed onto from holes
+        # diagonally below it
+        below = cell + self.cols
+        changed = [neighbour for neighbour in (cell, cell - 1, cell + 1, cell - self.cols, below, below - 1, below + 1)
+                   if 0 <= neighbour < len(self.flags) and abs(neighbour % self.cols - col) <= 1]
+        for neighbour in changed:
+            self._link(neighbour)
+        self._repair(changed)
+
+    def _repair(self, changed: List[int]):
+        """Fix distances after the out edges of the changed cells were rebuilt."""
+        distance = self.distance
+        next_cell = self.next_cell
+        out_edges = self.out_edges
+        in_edges = self.in_edges
+
+        # Cells whose route used a removed or repriced edge lose their
+        # distance, along with every cell routed through them
+        orphans = []
+        stack = [cell for cell in changed if next_cell[cell] >= 0 and
+                 (next_cell[cell] not in out_edges[cell] or
+                  distance[cell] != distance[next_cell[cell]] + self.cost(cell))]
+        while stack:
+            cell = stack.pop()
+            if distance[cell] == UNREACHABLE:
+                continue
+            distance[cell] = UNREACHABLE
+            next_cell[cell] = -1
+            orphans.append(cell)
+            stack.extend(source for source in in_edges[cell] if next_cell[source] == cell)
+
+        # Restart from the best surviving neighbour of each orphan and from
+        # any new edges, then spread outward in distance order
+        queue = []
+        for cell in orphans + changed:
+            best = distance[cell]
+            cost = self.cost(cell)
+            for neighbour in out_edges[cell]:
+                if distance[neighbour] + cost < best:
+                    best = distance[neighbour] + cost
+                    next_cell[cell] = neighbour
+            if best < distance[cell]:
+                distance[cell] = best
+                heapq.heappush(queue, (best, cell))
+
+        flags = self.flags
+        settled = 0
+        while queue:
+            value, cell = heapq.heappop(queue)
+            if value != distance[cell]:
+                continue
+            settled += 1
+            for source in in_edges[cell]:
+                step = value + (TRAP_COST if flags[source] & TRAP else 1)
+                if step < distance[source]:
+                    distance[source] = step
+                    next_cell[source] = cell
+                    heapq.heappush(queue, (step, source))
+        self.cells_searched = len(orphans) + settled
+
+    def step(self, col: int, row: int) -> Optional[Tuple[int, int]]:
+        """(dx, dy) of the move one step closer to a target, or None if there is none."""
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return None
+        following = self.next_cell[row * self.cols + col]
+        if following < 0:
+            return None
+        next_row, next_col = divmod(following, self.cols)
+        return next_col - col, next_row - row
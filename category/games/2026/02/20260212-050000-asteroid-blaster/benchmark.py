@@ -0,0 +1,107 @@
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from main import BLACK, PARTICLE_COLORS, SCREEN_HEIGHT, SCREEN_WIDTH
+from particles import ParticleSystem
+
+# Frame cost of explosion particles: the former one-object-per-particle
+# loop against the pooled NumPy system, with explosions topping the
+# particle count back up every frame like a long chain of hits.
+
+LIVE_PARTICLES = (1000, 10000)
+EXPLOSION_SIZE = 30
+FRAMES = 120
+SEED = 7
+
+
+class LegacyParticle:
+    # The former Particle class, kept here for comparison
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+        self.vx = random.uniform(-3, 3)
+        self.vy = random.uniform(-3, 3)
+        self.lifetime = random.randint(20, 40)
+        self.max_lifetime = self.lifetime
+        self.size = random.randint(2, 5)
+        self.color = random.choice(PARTICLE_COLORS)
+
+    def update(self) -> None:
+        self.x += self.vx
+        self.y += self.vy
+        self.vx *= 0.98
+        self.vy *= 0.98
+        self.lifetime -= 1
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self.lifetime > 0:
+            alpha = self.lifetime / self.max_lifetime
+            size = int(self.size * alpha)
+            if size > 0:
+                color = tuple(int(c * alpha) for c in self.color)
+                pygame.draw.circle(surface, color, (int(self.x), int(self.y)), size)
+
+
+def explosion_sites(rng: random.Random):
+    while True:
+        yield rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+
+
+def run_legacy(screen: pygame.Surface, live: int) -> float:
+    random.seed(SEED)
+    sites = explosion_sites(random.Random(SEED))
+    particles = []
+    elapsed = 0.0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        while len(particles) < live:
+            x, y = next(sites)
+            particles.extend(LegacyParticle(x, y) for _ in range(EXPLOSION_SIZE))
+        for particle in particles[:]:
+            particle.update()
+            if particle.lifetime <= 0:
+                particles.remove(particle)
+        screen.fill(BLACK)
+        for particle in particles:
+            particle.draw(screen)
+        elapsed += time.perf_counter() - start
+    return elapsed / FRAMES
+
+
+def run_pooled(screen: pygame.Surface, live: int) -> float:
+    sites = explosion_sites(random.Random(SEED))
+    particles = ParticleSystem(PARTICLE_COLORS, seed=SEED)
+    elapsed = 0.0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        while len(particles) < live:
+            particles.emit(*next(sites), EXPLOSION_SIZE)
+        particles.update()
+        screen.fill(BLACK)
+        particles.draw(screen)
+        elapsed += time.perf_counter() - start
+    return elapsed / FRAMES
+
+
+def main() -> int:
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"Emit, update and draw per frame ({FRAMES} frames, {EXPLOSION_SIZE}-particle explosions)")
+    for live in LIVE_PARTICLES:
+        legacy = run_legacy(screen, live)
+        pooled = run_pooled(screen, live)
+        print(f"  {live:>6} live  Particle objects {legacy * 1000:7.2f} ms   "
+              f"ParticleSystem {pooled * 1000:6.2f} ms   {legacy / pooled:5.1f}x")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
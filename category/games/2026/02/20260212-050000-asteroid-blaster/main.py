@@ -4,6 +4,8 @@ import math
 from dataclasses import dataclass
 from typing import List, Tuple
 
+from particles import ParticleSystem
+
 # Screen dimensions
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -28,6 +30,7 @@ ASTEROID_MAX_SIZE = 50
 ASTEROID_MIN_SPEED = 1
 ASTEROID_MAX_SPEED = 3
 SPAWN_INTERVAL = 120  # Frames between asteroid spawns
+PARTICLE_COLORS = [WHITE, YELLOW, ORANGE, RED]
 
 
 @dataclass
@@ -274,33 +277,6 @@ class Player:
             pygame.draw.polygon(surface, ORANGE, flame_points)
 
 
-class Particle:
-    def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-3, 3)
-        self.vy = random.uniform(-3, 3)
-        self.lifetime = random.randint(20, 40)
-        self.max_lifetime = self.lifetime
-        self.size = random.randint(2, 5)
-        self.color = random.choice([WHITE, YELLOW, ORANGE, RED])
-
-    def update(self) -> None:
-        self.x += self.vx
-        self.y += self.vy
-        self.vx *= 0.98
-        self.vy *= 0.98
-        self.lifetime -= 1
-
-    def draw(self, surface: pygame.Surface) -> None:
-        if self.lifetime > 0:
-            alpha = self.lifetime / self.max_lifetime
-            size = int(self.size * alpha)
-            if size > 0:
-                color = tuple(int(c * alpha) for c in self.color)
-                pygame.draw.circle(surface, color, (int(self.x), int(self.y)), size)
-
-
 class Game:
     def __init__(self):
         pygame.init()
@@ -317,14 +293,13 @@ class Game:
         self.player = Player()
         self.bullets: List[Bullet] = []
         self.asteroids: List[Asteroid] = []
-        self.particles: List[Particle] = []
+        self.particles = ParticleSystem(PARTICLE_COLORS)
         self.score = 0
         self.spawn_timer = 0
         self.level = 1
 
     def create_explosion(self, x: float, y: float, count: int = 15) -> None:
-        for _ in range(count):
-            self.particles.append(Particle(x, y))
+        self.particles.emit(x, y, count)
 
     def check_collision(self, obj1_x: float, obj1_y: float, obj1_radius: float,
                        obj2_x: float, obj2_y: float, obj2_radius: float) -> bool:
@@ -359,10 +334,7 @@ class Game:
                 self.asteroids.remove(asteroid)
 
         # Update particles
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
 
         # Bullet-asteroid collisions
         for bullet in self.bullets[:]:
@@ -427,8 +399,7 @@ class Game:
 
     def draw_game(self) -> None:
         # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        self.particles.draw(self.screen)
 
         # Draw asteroids
         for asteroid in self.asteroids:
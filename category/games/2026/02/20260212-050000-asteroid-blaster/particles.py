@@ -0,0 +1,116 @@
+import numpy as np
+import pygame
+from typing import List, Optional, Sequence, Tuple
+
+# Explosion particles as a pool of parallel NumPy arrays (structure of
+# arrays): one vectorized step moves, slows and ages every particle, dead
+# ones are dropped in a single compaction, and drawing blits pre-rendered
+# circles instead of calling pygame.draw.circle per particle.
+
+PARTICLE_DRAG = 0.98
+PARTICLE_MAX_SPEED = 3.0
+PARTICLE_LIFETIME = (20, 40)  # frames, inclusive
+PARTICLE_SIZE = (2, 5)  # radius in pixels, inclusive
+FADE_STEPS = 32  # brightness levels in the sprite cache
+INITIAL_CAPACITY = 256
+
+
+class ParticleSystem:
+    def __init__(self, palette: Sequence[Tuple[int, int, int]], capacity: int = INITIAL_CAPACITY,
+                 seed: Optional[int] = None):
+        self.palette = [tuple(color) for color in palette]
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self._allocate(capacity)
+        self._sprites = self._render_sprites()
+
+    def _allocate(self, capacity: int) -> None:
+        # Live particles occupy the first self.count slots of every array
+        old = self.count
+        arrays = {
+            "x": np.float32, "y": np.float32, "vx": np.float32, "vy": np.float32,
+            "life": np.int16, "max_life": np.int16, "size": np.int8, "color": np.int8,
+        }
+        for name, dtype in arrays.items():
+            grown = np.zeros(capacity, dtype=dtype)
+            if old:
+                grown[:old] = getattr(self, name)[:old]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def emit(self, x: float, y: float, count: int) -> None:
+        # Same spread as the old Particle: uniform velocity, lifetime, size and color
+        end = self.count + count
+        if end > self.capacity:
+            self._allocate(max(end, 2 * self.capacity))
+        new = slice(self.count, end)
+        rng = self.rng
+        self.x[new] = x
+        self.y[new] = y
+        self.vx[new] = rng.uniform(-PARTICLE_MAX_SPEED, PARTICLE_MAX_SPEED, count)
+        self.vy[new] = rng.uniform(-PARTICLE_MAX_SPEED, PARTICLE_MAX_SPEED, count)
+        self.life[new] = rng.integers(PARTICLE_LIFETIME[0], PARTICLE_LIFETIME[1] + 1, count)
+        self.max_life[new] = self.life[new]
+        self.size[new] = rng.integers(PARTICLE_SIZE[0], PARTICLE_SIZE[1] + 1, count)
+        self.color[new] = rng.integers(0, len(self.palette), count)
+        self.count = end
+
+    def update(self) -> None:
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vx[:n] *= PARTICLE_DRAG
+        self.vy[:n] *= PARTICLE_DRAG
+        self.life[:n] -= 1
+
+        # Compact the survivors to the front in one pass
+        alive = self.life[:n] > 0
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            for name in ("x", "y", "vx", "vy", "life", "max_life", "size", "color"):
+                array = getattr(self, name)
+                array[:survivors] = array[:n][alive]
+            self.count = survivors
+
+    def _render_sprites(self) -> List[pygame.Surface]:
+        # Every faded circle a particle can show, indexed by
+        # (color * PARTICLE_SIZE[1] + radius - 1) * FADE_STEPS + fade - 1
+        sprites = []
+        for color in self.palette:
+            for radius in range(1, PARTICLE_SIZE[1] + 1):
+                for fade in range(1, FADE_STEPS + 1):
+                    faded = tuple(int(c * fade / FADE_STEPS) for c in color)
+                    sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1))
+                    sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+                    pygame.draw.circle(sprite, faded, (radius, radius), radius)
+                    sprites.append(sprite)
+        return sprites
+
+    def blit_list(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        # Particles fade and shrink with remaining life; those shrunk to
+        # nothing are skipped
+        n = self.count
+        if not n:
+            return []
+        alpha = self.life[:n] / self.max_life[:n]
+        radius = (self.size[:n] * alpha).astype(np.int32)
+        visible = np.flatnonzero(radius > 0)
+        if not visible.size:
+            return []
+        radius = radius[visible]
+        fade = np.ceil(alpha[visible] * FADE_STEPS).astype(np.int32)
+        index = (self.color[visible].astype(np.int32) * PARTICLE_SIZE[1] + radius - 1) * FADE_STEPS + fade - 1
+        left = self.x[visible].astype(np.int32) - radius
+        top = self.y[visible].astype(np.int32) - radius
+        return list(zip(map(self._sprites.__getitem__, index.tolist()), zip(left.tolist(), top.tolist())))
+
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.blits(self.blit_list(), doreturn=False)
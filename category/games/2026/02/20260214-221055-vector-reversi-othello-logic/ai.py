@@ -0,0 +1,172 @@
+"""Iterative-deepening alpha-beta AI for Vector Reversi Othello Logic."""
+
+import time
+from bitboard import get_moves, apply_move, iter_bits, count, bit_to_square, square_to_bit
+from config import *
+
+CORNERS = 0x8100000000000081
+# Diagonal neighbours of the corners; risky while the corner is still empty
+X_SQUARES = 0x0042000000004200
+# Edge neighbours of the corners
+C_SQUARES = 0x4281000000008142
+EDGES = 0xFF818181818181FF & ~(CORNERS | C_SQUARES)
+
+WIN_SCORE = 100000
+
+# Transposition table entry flags
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the move-time budget runs out."""
+
+
+class ReversiAI:
+    """Alpha-beta searcher over bitboard positions with a transposition table."""
+
+    def __init__(self, move_time=AI_MOVE_TIME, max_depth=AI_MAX_DEPTH):
+        """Initialize the AI with a per-move time budget in seconds."""
+        self.move_time = move_time
+        self.max_depth = max_depth
+        self.table = {}
+        self.nodes = 0
+        self.last_depth = 0
+        self.deadline = 0.0
+
+    def evaluate(self, player, opponent):
+        """Score a position from the side to move's point of view."""
+        empty = ~(player | opponent) & 0xFFFFFFFFFFFFFFFF
+        # X-squares only hurt while their corner is still open
+        open_x = 0
+        for corner, x_square in ((0, 9), (7, 14), (56, 49), (63, 54)):
+            if empty >> corner & 1:
+                open_x |= 1 << x_square
+
+        score = 25 * (count(player & CORNERS) - count(opponent & CORNERS))
+        score -= 12 * (count(player & open_x) - count(opponent & open_x))
+        score -= 4 * (count(player & C_SQUARES) - count(opponent & C_SQUARES))
+        score += 3 * (count(player & EDGES) - count(opponent & EDGES))
+        score += 5 * (count(get_moves(player, opponent)) - count(get_moves(opponent, player)))
+        return score
+
+    def order_moves(self, moves, best_move):
+        """Return moves as a list with the table move, corners and edges first."""
+        ordered = []
+        if best_move and moves & best_move:
+            ordered.append(best_move)
+            moves &= ~best_move
+        for group in (CORNERS, EDGES, moves & ~(CORNERS | EDGES | C_SQUARES | X_SQUARES), C_SQUARES, X_SQUARES):
+            ordered.extend(iter_bits(moves & group))
+        return ordered
+
+    def search(self, player, opponent, depth, alpha, beta, passed=False):
+        """Negamax alpha-beta search returning a score for the side to move."""
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+        moves = get_moves(player, opponent)
+        if not moves:
+            if passed or not get_moves(opponent, player):
+                diff = count(player) - count(opponent)
+                return WIN_SCORE * (diff > 0) - WIN_SCORE * (diff < 0) + diff
+            return -self.search(opponent, player, depth, -beta, -alpha, True)
+
+        if depth == 0:
+            return self.evaluate(player, opponent)
+
+        key = (player, opponent)
+        entry = self.table.get(key)
+        best_move = 0
+        if entry is not None:
+            entry_depth, entry_score, entry_flag, best_move = entry
+            if entry_depth >= depth:
+                if entry_flag == EXACT:
+                    return entry_score
+                if entry_flag == LOWER_BOUND and entry_score >= beta:
+                    return entry_score
+                if entry_flag == UPPER_BOUND and entry_score <= alpha:
+                    return entry_score
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE * 2
+        for move in self.order_moves(moves, best_move):
+            new_player, new_opponent = apply_move(move, player, opponent)
+            score = -self.search(new_opponent, new_player, depth - 1, -beta, -alpha)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table[key] = (depth, best_score, flag, best_move)
+        return best_score
+
+    def search_root(self, player, opponent, moves, depth, best_move):
+        """Search every root move to a fixed depth and return (move, score)."""
+        alpha = -WIN_SCORE * 2
+        beta = WIN_SCORE * 2
+        root_best = 0
+        for move in self.order_moves(moves, best_move):
+            new_player, new_opponent = apply_move(move, player, opponent)
+            score = -self.search(new_opponent, new_player, depth - 1, -beta, -alpha)
+            if score > alpha:
+                alpha = score
+                root_best = move
+        return root_best, alpha
+
+    def choose_bitboard_move(self, player, opponent):
+        """Return the best single-bit move for the side to move, or 0 if none."""
+        moves = get_moves(player, opponent)
+        if not moves:
+            return 0
+        if count(moves) == 1:
+            return moves
+
+        self.nodes = 0
+        self.last_depth = 0
+        self.deadline = time.perf_counter() + self.move_time
+        # Cap the depth at the number of empties; deeper plies add nothing
+        max_depth = min(self.max_depth, 64 - count(player | opponent))
+        best_move = self.order_moves(moves, 0)[0]
+        for depth in range(1, max_depth + 1):
+            try:
+                move, score = self.search_root(player, opponent, moves, depth, best_move)
+            except SearchTimeout:
+                break
+            best_move = move
+            self.last_depth = depth
+            if abs(score) >= WIN_SCORE:
+                # Proven win or loss; deeper iterations cannot change it
+                break
+
+        # Entries from earlier moves are rarely reached again
+        if len(self.table) > AI_TABLE_LIMIT:
+            self.table.clear()
+        return best_move
+
+    def choose_move(self, board, player):
+        """Return the best (row, col) for player on a list-of-lists board, or None."""
+        mine = 0
+        theirs = 0
+        for row in range(GRID_SIZE):
+            for col in range(GRID_SIZE):
+                if board[row][col] == player:
+                    mine |= square_to_bit(row, col)
+                elif board[row][col] != EMPTY:
+                    theirs |= square_to_bit(row, col)
+
+        move = self.choose_bitboard_move(mine, theirs)
+        if not move:
+            return None
+        return bit_to_square(move)
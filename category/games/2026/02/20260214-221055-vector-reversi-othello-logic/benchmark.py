@@ -0,0 +1,72 @@
+"""Perft benchmark comparing the bitboard core with ReversiGame.get_flippable_pieces."""
+
+import sys
+import time
+from config import *
+from bitboard import START_BLACK, START_WHITE, perft, to_grid
+from game import ReversiGame
+
+DEFAULT_DEPTH = 7
+
+
+def legacy_perft(game, player, depth, passed=False):
+    """Perft over the list-of-lists board using get_flippable_pieces."""
+    if depth == 0:
+        return 1
+
+    opponent = WHITE if player == BLACK else BLACK
+    moves = []
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            flippable = game.get_flippable_pieces(row, col, player)
+            if flippable:
+                moves.append((row, col, flippable))
+
+    if not moves:
+        if passed:
+            return 1
+        return legacy_perft(game, opponent, depth - 1, True)
+    if depth == 1:
+        return len(moves)
+
+    total = 0
+    board = game.board
+    for row, col, flippable in moves:
+        board[row][col] = player
+        for r, c in flippable:
+            board[r][c] = player
+        total += legacy_perft(game, opponent, depth - 1)
+        board[row][col] = EMPTY
+        for r, c in flippable:
+            board[r][c] = opponent
+    return total
+
+
+def run_benchmark(depth):
+    """Run both perft implementations to the given depth and print the results."""
+    # Build the game without opening a window; only the board logic is needed
+    game = ReversiGame.__new__(ReversiGame)
+    game.board = to_grid(START_BLACK, START_WHITE)
+
+    print(f"Perft depth {depth} from the starting position")
+    results = []
+    for name, func in (
+        ("bitboard", lambda: perft(START_BLACK, START_WHITE, depth)),
+        ("get_flippable_pieces", lambda: legacy_perft(game, BLACK, depth)),
+    ):
+        start = time.perf_counter()
+        nodes = func()
+        elapsed = time.perf_counter() - start
+        results.append((name, nodes, elapsed))
+        print(f"  {name:<22} nodes={nodes:>10}  time={elapsed:8.3f}s  "
+              f"nps={nodes / elapsed:>12,.0f}")
+
+    if results[0][1] != results[1][1]:
+        print("  MISMATCH: node counts differ")
+        return 1
+    print(f"  speedup: {results[1][2] / results[0][2]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DEPTH))
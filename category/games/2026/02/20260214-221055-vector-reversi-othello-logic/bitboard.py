@@ -0,0 +1,144 @@
+"""Headless 64-bit bitboard core for Vector Reversi Othello Logic.
+
+Square (row, col) maps to bit ``row * GRID_SIZE + col``. A position is a pair
+of integers ``(player, opponent)`` holding the discs of the side to move and
+of the other side. Move generation and flipping use shift-and-mask sweeps in
+the eight directions instead of walking the board square by square.
+"""
+
+from config import EMPTY, BLACK, WHITE, GRID_SIZE
+
+FULL_MASK = 0xFFFFFFFFFFFFFFFF
+NOT_A_FILE = 0xFEFEFEFEFEFEFEFE  # every square except column 0
+NOT_H_FILE = 0x7F7F7F7F7F7F7F7F  # every square except column 7
+
+# (shift, mask) per direction; positive shifts move towards higher bits.
+# The mask drops the bits that wrapped around a board edge.
+SHIFTS = (
+    (1, NOT_A_FILE),    # east
+    (-1, NOT_H_FILE),   # west
+    (8, FULL_MASK),     # south
+    (-8, FULL_MASK),    # north
+    (9, NOT_A_FILE),    # south-east
+    (7, NOT_H_FILE),    # south-west
+    (-7, NOT_A_FILE),   # north-east
+    (-9, NOT_H_FILE),   # north-west
+)
+
+START_BLACK = (1 << 28) | (1 << 35)
+START_WHITE = (1 << 27) | (1 << 36)
+
+
+def shift(bits, amount, mask):
+    """Shift a bitboard one step in a direction, discarding wrapped bits."""
+    if amount > 0:
+        return (bits << amount) & mask
+    return (bits >> -amount) & mask
+
+
+def square_to_bit(row, col):
+    """Return the single-bit mask for a board square."""
+    return 1 << (row * GRID_SIZE + col)
+
+
+def bit_to_square(bit):
+    """Return the (row, col) square of a single-bit mask."""
+    return divmod(bit.bit_length() - 1, GRID_SIZE)
+
+
+def iter_bits(bits):
+    """Yield each set bit of a bitboard as a single-bit mask, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low
+        bits ^= low
+
+
+def iter_squares(bits):
+    """Yield each set bit of a bitboard as a (row, col) square in row-major order."""
+    for bit in iter_bits(bits):
+        yield bit_to_square(bit)
+
+
+def count(bits):
+    """Return the number of discs on a bitboard."""
+    return bits.bit_count()
+
+
+def get_moves(player, opponent):
+    """Return a bitboard of every legal move for the side to move."""
+    empty = ~(player | opponent) & FULL_MASK
+    moves = 0
+    for amount, mask in SHIFTS:
+        run = shift(player, amount, mask) & opponent
+        # An outflanked run is at most six discs long
+        run |= shift(run, amount, mask) & opponent
+        run |= shift(run, amount, mask) & opponent
+        run |= shift(run, amount, mask) & opponent
+        run |= shift(run, amount, mask) & opponent
+        run |= shift(run, amount, mask) & opponent
+        moves |= shift(run, amount, mask) & empty
+    return moves
+
+
+def get_flips(move, player, opponent):
+    """Return a bitboard of the discs flipped by playing the single-bit move."""
+    flips = 0
+    for amount, mask in SHIFTS:
+        run = 0
+        cursor = shift(move, amount, mask)
+        while cursor & opponent:
+            run |= cursor
+            cursor = shift(cursor, amount, mask)
+        if cursor & player:
+            flips |= run
+    return flips
+
+
+def apply_move(move, player, opponent):
+    """Play a move and return the new (player, opponent) from the mover's view."""
+    flips = get_flips(move, player, opponent)
+    return player | move | flips, opponent & ~flips
+
+
+def perft(player, opponent, depth, passed=False):
+    """Count leaf positions at a given depth; a forced pass counts as a ply."""
+    if depth == 0:
+        return 1
+    moves = get_moves(player, opponent)
+    if not moves:
+        if passed:
+            # Neither side can move: the game is over at this node
+            return 1
+        return perft(opponent, player, depth - 1, True)
+    if depth == 1:
+        return count(moves)
+    total = 0
+    for move in iter_bits(moves):
+        new_player, new_opponent = apply_move(move, player, opponent)
+        total += perft(new_opponent, new_player, depth - 1)
+    return total
+
+
+def from_grid(board):
+    """Convert a list-of-lists board into (black, white) bitboards."""
+    black = 0
+    white = 0
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            cell = board[row][col]
+            if cell == BLACK:
+                black |= square_to_bit(row, col)
+            elif cell == WHITE:
+                white |= square_to_bit(row, col)
+    return black, white
+
+
+def to_grid(black, white):
+    """Convert (black, white) bitboards into a list-of-lists board."""
+    board = [[EMPTY for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    for row, col in iter_squares(black):
+        board[row][col] = BLACK
+    for row, col in iter_squares(white):
+        board[row][col] = WHITE
+    return board
@@ -42,3 +42,10 @@ FONT_SIZE_SMALL = 18
 
 # Animation settings
 FLIP_DELAY = 100  # ms between piece flips in animation
+
+# AI settings
+AI_PLAYER = WHITE  # side played by the AI when enabled
+AI_ENABLED = True
+AI_MOVE_TIME = 0.5  # seconds of search per AI move
+AI_MAX_DEPTH = 20
+AI_TABLE_LIMIT = 500000  # transposition table entries kept between moves
@@ -3,6 +3,8 @@
 import sys
 import pygame
 from config import *
+from bitboard import from_grid, get_moves, iter_squares
+from ai import ReversiAI
 
 
 class ReversiGame:
@@ -17,6 +19,8 @@ class ReversiGame:
         self.font_large = pygame.font.Font(None, FONT_SIZE_LARGE)
         self.font_medium = pygame.font.Font(None, FONT_SIZE_MEDIUM)
         self.font_small = pygame.font.Font(None, FONT_SIZE_SMALL)
+        self.ai = ReversiAI()
+        self.ai_enabled = AI_ENABLED
 
         self.reset_game()
 
@@ -71,12 +75,12 @@ class ReversiGame:
 
     def calculate_valid_moves(self):
         """Calculate all valid moves for the current player."""
-        self.valid_moves = []
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                flippable = self.get_flippable_pieces(row, col, self.current_player)
-                if flippable:
-                    self.valid_moves.append((row, col))
+        black, white = from_grid(self.board)
+        if self.current_player == BLACK:
+            moves = get_moves(black, white)
+        else:
+            moves = get_moves(white, black)
+        self.valid_moves = list(iter_squares(moves))
 
     def make_move(self, row, col):
         """Make a move at the given position."""
@@ -96,6 +100,16 @@ class ReversiGame:
 
         return True
 
+    def update_ai(self):
+        """Let the AI play its move when it is the AI's turn."""
+        if (not self.ai_enabled or self.flip_animation or self.game_over or
+                self.current_player != AI_PLAYER):
+            return
+
+        move = self.ai.choose_move(self.board, self.current_player)
+        if move is not None:
+            self.make_move(*move)
+
     def update_flip_animation(self):
         """Update the flip animation."""
         if not self.flip_animation:
@@ -154,6 +168,8 @@ class ReversiGame:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_r:
                 self.reset_game()
+            elif event.key == pygame.K_a:
+                self.ai_enabled = not self.ai_enabled
             elif event.key == pygame.K_ESCAPE:
                 return False
 
@@ -235,7 +251,8 @@ class ReversiGame:
             self.screen.blit(result_surface, (SCREEN_WIDTH // 2 - result_surface.get_width() // 2, BOARD_SIZE + 35))
 
         # Draw controls hint
-        hint_text = self.font_small.render("R: Restart | ESC: Quit", True, COLOR_TEXT)
+        ai_label = "On" if self.ai_enabled else "Off"
+        hint_text = self.font_small.render(f"A: White AI {ai_label} | R: Restart | ESC: Quit", True, COLOR_TEXT)
         self.screen.blit(hint_text, (SCREEN_WIDTH - hint_text.get_width() - 20, BOARD_SIZE + 40))
 
     def draw(self):
@@ -254,6 +271,7 @@ class ReversiGame:
 
             self.update_flip_animation()
             self.draw()
+            self.update_ai()
             self.clock.tick(60)
 
         pygame.quit()
@@ -0,0 +1,139 @@
+"""Solver and move legality timings for Vector Klotski Block Escape.
+
+Builds the distance table from scratch and times loading it back, measures
+hint latency over random reachable states, and compares the former
+block-by-block overlap scan against the bitboard legality check.
+
+Run with: uv run python benchmark.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config import *
+from solver import ENTER_MASK, KlotskiSolver, decode, layout_code, occupancy
+
+STATES = 2000
+HINTS = 2000
+SEED = 3
+
+
+class Piece:
+    """The block fields the legacy scan reads."""
+
+    def __init__(self, block_type, cell):
+        self.block_type = block_type
+        self.grid_x = cell % GRID_COLS
+        self.grid_y = cell // GRID_COLS
+        self.width, self.height = {KING_2x2: (2, 2), VERTICAL_1x2: (1, 2),
+                                   HORIZONTAL_2x1: (2, 1)}.get(block_type, (1, 1))
+
+
+def legacy_can_move(blocks, block, direction):
+    """The former KlotskiGame.can_move: scan every other block cell by cell."""
+    new_x = block.grid_x + direction[0]
+    new_y = block.grid_y + direction[1]
+    if new_x < 0 or new_y < 0:
+        return False
+    if new_x + block.width > GRID_COLS or new_y + block.height > GRID_ROWS:
+        return False
+    for other in blocks:
+        if other is block:
+            continue
+        for dy in range(block.height):
+            for dx in range(block.width):
+                check_x = new_x + dx
+                check_y = new_y + dy
+                if (other.grid_x <= check_x < other.grid_x + other.width and
+                        other.grid_y <= check_y < other.grid_y + other.height):
+                    return False
+    return True
+
+
+def bitboard_can_move(occupied, block, direction_index):
+    """The current check: one table lookup and one AND."""
+    enter = ENTER_MASK[block.block_type][block.grid_y * GRID_COLS + block.grid_x][direction_index]
+    return enter >= 0 and not enter & occupied
+
+
+def solver_build(name, layout):
+    """Time a full build, the table save and a reload."""
+    solver = KlotskiSolver(layout, name)
+    start = time.perf_counter()
+    solver.build()
+    built = time.perf_counter() - start
+    solver.save()
+    size = os.path.getsize(solver.path)
+    start = time.perf_counter()
+    loaded = KlotskiSolver(layout, name).load()
+    load = time.perf_counter() - start
+    assert loaded
+    print(f"  {name:<8} {solver.reachable:>6} states, {len(solver.distances):>6} stored   "
+          f"start {solver.distance(solver.root):>2} moves, deepest {solver.deepest():>2}   "
+          f"build {built:5.2f}s   load {load * 1000:5.1f} ms   {size / 1024:5.0f} KB")
+    return solver
+
+
+def legality(solver, rng):
+    """Check every slide in random reachable states both ways."""
+    codes = rng.sample(sorted(solver.distances), min(STATES, len(solver.distances)))
+    cases = []
+    for code in codes:
+        blocks = [Piece(block_type, cell) for block_type, cell in decode(code)]
+        cases.append((blocks, occupancy(code)))
+
+    start = time.perf_counter()
+    legacy = [legacy_can_move(blocks, block, direction)
+              for blocks, _ in cases for block in blocks for direction in DIRECTIONS]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bitboard = [bitboard_can_move(occupied, block, index)
+                for blocks, occupied in cases for block in blocks for index in range(len(DIRECTIONS))]
+    bitboard_time = time.perf_counter() - start
+
+    assert legacy == bitboard
+    checks = len(legacy)
+    print(f"Move legality, {checks} checks: block scan {legacy_time / checks * 1e6:5.2f} us   "
+          f"bitboard {bitboard_time / checks * 1e6:5.2f} us   {legacy_time / bitboard_time:4.1f}x   (identical)")
+
+
+def hints(solver, rng):
+    """Hint latency over random unsolved states."""
+    codes = [code for code in rng.sample(sorted(solver.distances), min(HINTS, len(solver.distances)))
+             if solver.distances[code]]
+    start = time.perf_counter()
+    for code in codes:
+        solver.hint(code)
+    elapsed = time.perf_counter() - start
+    print(f"Hints: {len(codes)} states, {elapsed / len(codes) * 1e6:.1f} us each")
+
+
+def generator(solver, rng):
+    """Mine one layout per difficulty and confirm its solution length."""
+    for name, min_moves, max_moves in DIFFICULTY_LEVELS:
+        layout = solver.generate(min_moves, max_moves, rng)
+        distance = solver.distance(layout_code(layout))
+        assert min_moves <= distance <= max_moves
+        print(f"  {name:<7} {min_moves:>2}-{max_moves:<3} -> {distance} moves")
+
+
+def main():
+    """Run every benchmark."""
+    rng = random.Random(SEED)
+    print("Distance tables")
+    solver = solver_build("classic", STARTING_LAYOUT)
+    solver_build("easy", EASY_LAYOUT)
+    legality(solver, rng)
+    hints(solver, rng)
+    print("Generated layouts")
+    generator(solver, rng)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
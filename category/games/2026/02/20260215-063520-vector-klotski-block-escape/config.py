@@ -70,3 +70,12 @@ EASY_LAYOUT = [
     [VERTICAL_1x2, SMALL_1x1, SMALL_1x1, VERTICAL_1x2],
     [EMPTY, EMPTY, EMPTY, EMPTY],
 ]
+
+# Solver
+SOLVER_TABLE_FILE = "distances_{name}.bin"  # Distance-to-goal table, built on first run
+DIFFICULTY_LEVELS = [  # Name and optimal solution length range for generated layouts
+    ("Easy", 5, 14),
+    ("Medium", 15, 24),
+    ("Hard", 25, 34),
+    ("Expert", 35, 999),
+]
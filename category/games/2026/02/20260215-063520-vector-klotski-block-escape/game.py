@@ -1,8 +1,10 @@
 """Vector Klotski Block Escape - Game implementation."""
 
+import random
 import sys
 import pygame
 from config import *
+from solver import BLOCK_MASK, ENTER_MASK, encode, get_solver
 
 
 class Block:
@@ -62,6 +64,10 @@ class KlotskiGame:
         self.font_medium = pygame.font.Font(None, FONT_SIZE_MEDIUM)
         self.font_small = pygame.font.Font(None, FONT_SIZE_SMALL)
 
+        self.use_easy_layout = False
+        self.difficulty = -1  # Index into DIFFICULTY_LEVELS of a generated layout, -1 for none
+        self.layout = STARTING_LAYOUT
+        self.solver = get_solver(STARTING_LAYOUT, "classic")
         self.reset_game()
 
     def reset_game(self):
@@ -70,15 +76,36 @@ class KlotskiGame:
         self.selected_block = None
         self.moves = 0
         self.game_won = False
-        self.use_easy_layout = False
         self.animating = False
         self.animation_data = None
+        self.hint = None  # (block, direction) shown after pressing H
 
         self._init_blocks()
 
+    def toggle_easy_layout(self):
+        """Switch between the starting and easy layouts."""
+        self.use_easy_layout = not self.use_easy_layout
+        self.difficulty = -1
+        if self.use_easy_layout:
+            self.layout = EASY_LAYOUT
+            self.solver = get_solver(EASY_LAYOUT, "easy")
+        else:
+            self.layout = STARTING_LAYOUT
+            self.solver = get_solver(STARTING_LAYOUT, "classic")
+        self.reset_game()
+
+    def new_puzzle(self):
+        """Load a layout mined from the solver's graph at the next difficulty."""
+        self.difficulty = (self.difficulty + 1) % len(DIFFICULTY_LEVELS)
+        _, min_moves, max_moves = DIFFICULTY_LEVELS[self.difficulty]
+        self.use_easy_layout = False
+        self.solver = get_solver(STARTING_LAYOUT, "classic")
+        self.layout = self.solver.generate(min_moves, max_moves, random) or STARTING_LAYOUT
+        self.reset_game()
+
     def _init_blocks(self):
         """Initialize blocks from layout."""
-        layout = EASY_LAYOUT if self.use_easy_layout else STARTING_LAYOUT
+        layout = self.layout
         self.blocks = []
 
         # Process layout row by row, creating blocks
@@ -112,6 +139,17 @@ class KlotskiGame:
 
                 self.blocks.append(Block(block_type, col, row))
 
+        # Occupancy bitboard and state code, kept current by move_block
+        self.occupied = 0
+        for block in self.blocks:
+            self.occupied |= self._block_mask(block)
+        self.state_code = encode((block.block_type, block.grid_x, block.grid_y) for block in self.blocks)
+        self.moves_to_goal = self.solver.distance(self.state_code)
+
+    def _block_mask(self, block):
+        """Occupancy bits of a block where it stands."""
+        return BLOCK_MASK[block.block_type][block.grid_y * GRID_COLS + block.grid_x]
+
     def is_valid_position(self, block, new_x, new_y):
         """Check if a block can be placed at the given position."""
         # Check bounds
@@ -121,27 +159,13 @@ class KlotskiGame:
             return False
 
         # Check collision with other blocks
-        for other in self.blocks:
-            if other is block:
-                continue
-
-            # Check if any cell would overlap
-            for dy in range(block.height):
-                for dx in range(block.width):
-                    check_x = new_x + dx
-                    check_y = new_y + dy
-                    if (other.grid_x <= check_x < other.grid_x + other.width and
-                            other.grid_y <= check_y < other.grid_y + other.height):
-                        return False
-
-        return True
+        mask = BLOCK_MASK[block.block_type][new_y * GRID_COLS + new_x]
+        return not mask & self.occupied & ~self._block_mask(block)
 
     def can_move(self, block, direction):
         """Check if a block can move in the given direction."""
-        dx, dy = direction
-        new_x = block.grid_x + dx
-        new_y = block.grid_y + dy
-        return self.is_valid_position(block, new_x, new_y)
+        enter = ENTER_MASK[block.block_type][block.grid_y * GRID_COLS + block.grid_x][DIRECTIONS.index(direction)]
+        return enter >= 0 and not enter & self.occupied
 
     def move_block(self, block, direction):
         """Move a block in the given direction."""
@@ -163,8 +187,15 @@ class KlotskiGame:
             'progress': 0
         }
 
+        old_cell = block.grid_y * GRID_COLS + block.grid_x
+        self.occupied &= ~self._block_mask(block)
         block.grid_x = new_x
         block.grid_y = new_y
+        self.occupied |= self._block_mask(block)
+        new_cell = new_y * GRID_COLS + new_x
+        self.state_code += (block.block_type << (3 * new_cell)) - (block.block_type << (3 * old_cell))
+        self.moves_to_goal = self.solver.distance(self.state_code)
+        self.hint = None
         self.moves += 1
 
         # Check win condition (King block at bottom center)
@@ -174,6 +205,19 @@ class KlotskiGame:
 
         return True
 
+    def show_hint(self):
+        """Select the block whose slide gets closest to the goal and point the way."""
+        hint = self.solver.hint(self.state_code)
+        if hint is None:
+            return
+        cell, direction = hint
+        block = self.get_block_at(cell % GRID_COLS, cell // GRID_COLS)
+        if self.selected_block:
+            self.selected_block.selected = False
+        self.selected_block = block
+        block.selected = True
+        self.hint = (block, direction)
+
     def get_block_at(self, grid_x, grid_y):
         """Get the block at the given grid position."""
         for block in self.blocks:
@@ -196,8 +240,15 @@ class KlotskiGame:
                 return True
 
             if event.key == pygame.K_e:
-                self.use_easy_layout = not self.use_easy_layout
-                self.reset_game()
+                self.toggle_easy_layout()
+                return True
+
+            if event.key == pygame.K_g:
+                self.new_puzzle()
+                return True
+
+            if event.key == pygame.K_h and not self.animating and not self.game_won:
+                self.show_hint()
                 return True
 
             # Move selected block with arrow keys
@@ -340,6 +391,17 @@ class KlotskiGame:
                 ]
                 pygame.draw.polygon(self.screen, (255, 255, 255), points)
 
+            # Draw hint arrow pointing the way to slide
+            if self.hint and self.hint[0] is block and not self.animating:
+                dx, dy = self.hint[1]
+                tip_x = x + width // 2 + dx * (width // 2 - 12)
+                tip_y = y + height // 2 + dy * (height // 2 - 12)
+                pygame.draw.polygon(self.screen, COLOR_HIGHLIGHT, [
+                    (tip_x, tip_y),
+                    (tip_x - dx * 14 - dy * 10, tip_y - dy * 14 - dx * 10),
+                    (tip_x - dx * 14 + dy * 10, tip_y - dy * 14 + dx * 10),
+                ])
+
     def draw(self):
         """Draw everything."""
         self.screen.fill(COLOR_BG)
@@ -359,11 +421,20 @@ class KlotskiGame:
         moves_text = self.font_medium.render(f"MOVES: {self.moves}", True, COLOR_TEXT)
         self.screen.blit(moves_text, (GRID_OFFSET_X, panel_y))
 
+        # Draw optimal moves left
+        if not self.game_won:
+            left = "?" if self.moves_to_goal is None else self.moves_to_goal
+            goal_moves_text = self.font_medium.render(f"TO GOAL: {left}", True, COLOR_HIGHLIGHT)
+            self.screen.blit(goal_moves_text, (GRID_OFFSET_X + GRID_COLS * CELL_SIZE - goal_moves_text.get_width(),
+                                               panel_y))
+
         # Draw controls
         controls = [
             "CLICK: Select block",
             "ARROWS: Move selected",
             "R: Reset | E: Easy mode",
+            "H: Hint",
+            "G: New puzzle",
         ]
         for i, text in enumerate(controls):
             control_surf = self.font_small.render(text, True, (150, 150, 170))
@@ -371,9 +442,15 @@ class KlotskiGame:
                                          GRID_OFFSET_Y + 100 + i * 25))
 
         # Draw goal indicator
+        goal_y = GRID_OFFSET_Y + 105 + len(controls) * 25
         goal_text = self.font_small.render("GOAL: Red block to exit", True, COLOR_KING_BLOCK)
-        self.screen.blit(goal_text, (GRID_OFFSET_X + GRID_COLS * CELL_SIZE + 30,
-                                     GRID_OFFSET_Y + 180))
+        self.screen.blit(goal_text, (GRID_OFFSET_X + GRID_COLS * CELL_SIZE + 30, goal_y))
+
+        # Draw difficulty of a generated puzzle
+        if self.difficulty >= 0:
+            name = DIFFICULTY_LEVELS[self.difficulty][0]
+            difficulty_text = self.font_small.render(f"PUZZLE: {name}", True, COLOR_TEXT)
+            self.screen.blit(difficulty_text, (GRID_OFFSET_X + GRID_COLS * CELL_SIZE + 30, goal_y + 25))
 
         # Draw game won message
         if self.game_won:
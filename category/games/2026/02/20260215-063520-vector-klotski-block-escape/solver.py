@@ -0,0 +1,280 @@
+"""Klotski state graph: compact encoding, distance tables, hints and a layout generator.
+
+A board state is a single integer holding, for each of the 20 cells, the
+3-bit type of the block whose top-left corner sits there (0 if none).
+Blocks of the same type are interchangeable, so this already merges
+states that only differ by swapping identical blocks. The left-right
+mirror of a state is just as far from the goal (the exit is centered), so
+the table stores each mirror pair once, under the smaller code.
+"""
+
+import os
+import random
+from array import array
+from collections import deque
+
+from config import *
+
+CELLS = GRID_COLS * GRID_ROWS
+GOAL_CELL = 3 * GRID_COLS + 1  # King's top-left corner on the exit
+TABLE_MAGIC = b"KLDT1"
+
+BLOCK_SIZES = {
+    KING_2x2: (2, 2),
+    VERTICAL_1x2: (1, 2),
+    HORIZONTAL_2x1: (2, 1),
+    SMALL_1x1: (1, 1),
+}
+
+
+def _cell_mask(block_type, x, y):
+    """Occupancy bits of a block with its top-left corner at (x, y), or -1 off the board."""
+    width, height = BLOCK_SIZES[block_type]
+    if x < 0 or y < 0 or x + width > GRID_COLS or y + height > GRID_ROWS:
+        return -1
+    mask = 0
+    for dy in range(height):
+        for dx in range(width):
+            mask |= 1 << ((y + dy) * GRID_COLS + x + dx)
+    return mask
+
+
+# Per block type and anchor cell: the cells it covers, the cells it would
+# newly enter moving in each direction (-1 if that leaves the board), and
+# its anchor once the board is mirrored
+BLOCK_MASK = {}
+ENTER_MASK = {}
+MIRROR_CELL = {}
+for _type, (_width, _height) in BLOCK_SIZES.items():
+    BLOCK_MASK[_type] = [0] * CELLS
+    ENTER_MASK[_type] = [[-1] * len(DIRECTIONS) for _ in range(CELLS)]
+    MIRROR_CELL[_type] = [-1] * CELLS
+    for _cell in range(CELLS):
+        _x, _y = _cell % GRID_COLS, _cell // GRID_COLS
+        _mask = _cell_mask(_type, _x, _y)
+        if _mask < 0:
+            continue
+        BLOCK_MASK[_type][_cell] = _mask
+        MIRROR_CELL[_type][_cell] = _y * GRID_COLS + GRID_COLS - _width - _x
+        for _index, (_dx, _dy) in enumerate(DIRECTIONS):
+            _moved = _cell_mask(_type, _x + _dx, _y + _dy)
+            if _moved >= 0:
+                ENTER_MASK[_type][_cell][_index] = _moved & ~_mask
+CELL_STEP = [dy * GRID_COLS + dx for dx, dy in DIRECTIONS]
+
+
+def encode(blocks):
+    """State code of (block_type, grid_x, grid_y) triples."""
+    code = 0
+    for block_type, x, y in blocks:
+        code |= block_type << (3 * (y * GRID_COLS + x))
+    return code
+
+
+def decode(code):
+    """(block_type, anchor_cell) pairs of a state code, in cell order."""
+    blocks = []
+    cell = 0
+    while code:
+        block_type = code & 7
+        if block_type:
+            blocks.append((block_type, cell))
+        code >>= 3
+        cell += 1
+    return blocks
+
+
+def occupancy(code):
+    """Bitboard of the cells covered in a state."""
+    occupied = 0
+    for block_type, cell in decode(code):
+        occupied |= BLOCK_MASK[block_type][cell]
+    return occupied
+
+
+def mirror(code):
+    """The state flipped left to right."""
+    mirrored = 0
+    for block_type, cell in decode(code):
+        mirrored |= block_type << (3 * MIRROR_CELL[block_type][cell])
+    return mirrored
+
+
+def canonical(code):
+    """The smaller code of a state and its mirror image."""
+    return min(code, mirror(code))
+
+
+def neighbors(code):
+    """(anchor_cell, direction_index, next_code) for every legal one-cell slide."""
+    blocks = decode(code)
+    occupied = 0
+    for block_type, cell in blocks:
+        occupied |= BLOCK_MASK[block_type][cell]
+    moves = []
+    for block_type, cell in blocks:
+        enter = ENTER_MASK[block_type][cell]
+        for index in range(len(DIRECTIONS)):
+            if enter[index] >= 0 and not enter[index] & occupied:
+                step = CELL_STEP[index]
+                moves.append((cell, index, code + (block_type << (3 * (cell + step))) - (block_type << (3 * cell))))
+    return moves
+
+
+def is_goal(code):
+    """True when the king sits on the exit."""
+    return (code >> (3 * GOAL_CELL)) & 7 == KING_2x2
+
+
+def layout_code(layout):
+    """State code of a layout grid like STARTING_LAYOUT."""
+    blocks = []
+    covered = 0
+    for row in range(GRID_ROWS):
+        for col in range(GRID_COLS):
+            block_type = layout[row][col]
+            if block_type == EMPTY or covered >> (row * GRID_COLS + col) & 1:
+                continue
+            blocks.append((block_type, col, row))
+            covered |= BLOCK_MASK[block_type][row * GRID_COLS + col]
+    return encode(blocks)
+
+
+def code_layout(code):
+    """Layout grid of a state code."""
+    layout = [[EMPTY] * GRID_COLS for _ in range(GRID_ROWS)]
+    for block_type, cell in decode(code):
+        mask = BLOCK_MASK[block_type][cell]
+        for covered in range(CELLS):
+            if mask >> covered & 1:
+                layout[covered // GRID_COLS][covered % GRID_COLS] = block_type
+    return layout
+
+
+class KlotskiSolver:
+    """Distance to the goal for every state reachable from one layout."""
+
+    def __init__(self, layout, name):
+        self.root = canonical(layout_code(layout))
+        self.name = name
+        self.distances = {}
+        self.reachable = 0
+
+    @property
+    def path(self):
+        """Table file for this layout, next to this file."""
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            SOLVER_TABLE_FILE.format(name=self.name))
+
+    def build(self):
+        """Breadth-first search of the whole state graph, then back out from the goals."""
+        # Every state reachable from the layout
+        seen = {self.root}
+        queue = deque([self.root])
+        goals = []
+        while queue:
+            code = queue.popleft()
+            if is_goal(code):
+                goals.append(code)
+            for _, _, following in neighbors(code):
+                following = canonical(following)
+                if following not in seen:
+                    seen.add(following)
+                    queue.append(following)
+
+        # Slides are reversible, so distances spread back out from every goal
+        distances = dict.fromkeys(goals, 0)
+        queue = deque(goals)
+        while queue:
+            code = queue.popleft()
+            distance = distances[code] + 1
+            for _, _, following in neighbors(code):
+                following = canonical(following)
+                if following not in distances:
+                    distances[following] = distance
+                    queue.append(following)
+        self.distances = distances
+        self.reachable = len(seen)
+        return self
+
+    def save(self):
+        """Write the table as sorted 64-bit codes and 16-bit distances."""
+        codes = array("Q", sorted(self.distances))
+        distances = array("H", (self.distances[code] for code in codes))
+        with open(self.path, "wb") as handle:
+            handle.write(TABLE_MAGIC)
+            array("Q", [self.root, len(codes)]).tofile(handle)
+            codes.tofile(handle)
+            distances.tofile(handle)
+
+    def load(self):
+        """Read the table back; False if missing, stale or damaged."""
+        try:
+            with open(self.path, "rb") as handle:
+                if handle.read(len(TABLE_MAGIC)) != TABLE_MAGIC:
+                    return False
+                header = array("Q")
+                header.fromfile(handle, 2)
+                root, count = header
+                if root != self.root:
+                    return False
+                codes = array("Q")
+                codes.fromfile(handle, count)
+                distances = array("H")
+                distances.fromfile(handle, count)
+        except (OSError, EOFError, ValueError):
+            return False
+        self.distances = dict(zip(codes, distances))
+        return True
+
+    def ensure(self):
+        """Load the table, building and saving it on the first run."""
+        if not self.load():
+            self.build()
+            try:
+                self.save()
+            except OSError:
+                pass  # Still usable for this session
+        return self
+
+    def distance(self, code):
+        """Moves from code to the goal, or None if the goal is out of reach."""
+        return self.distances.get(canonical(code))
+
+    def hint(self, code):
+        """(anchor_cell, direction) of a slide one move closer to the goal, or None."""
+        best = None
+        for cell, index, following in neighbors(code):
+            distance = self.distance(following)
+            if distance is not None and (best is None or distance < best[0]):
+                best = (distance, cell, DIRECTIONS[index])
+        return None if best is None else best[1:]
+
+    def generate(self, min_moves, max_moves, rng=None):
+        """A layout whose optimal solution takes min_moves..max_moves, or None.
+
+        Either mirror image may be returned.
+        """
+        rng = rng or random
+        candidates = [code for code, distance in self.distances.items()
+                      if min_moves <= distance <= max_moves]
+        if not candidates:
+            return None
+        code = rng.choice(candidates)
+        if rng.random() < 0.5:
+            code = mirror(code)
+        return code_layout(code)
+
+    def deepest(self):
+        """Largest distance to the goal in the table."""
+        return max(self.distances.values(), default=0)
+
+
+_solvers = {}
+
+
+def get_solver(layout, name):
+    """Solver for a named layout, loaded or built once per process."""
+    if name not in _solvers:
+        _solvers[name] = KlotskiSolver(layout, name).ensure()
+    return _solvers[name]
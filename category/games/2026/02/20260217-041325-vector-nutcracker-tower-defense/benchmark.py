@@ -0,0 +1,128 @@
+"""Late-wave stress benchmark: the previous all-pairs update versus the enemy grid.
+
+Fills the cells next to the path with towers, spreads a few hundred mice
+along the path with enough health to survive the run, and times
+Game.update headlessly. Reports milliseconds per frame and the total damage
+dealt, which should be the same order for every variant.
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from config import *
+from enemy import Enemy
+from game import Game
+from tower import Tower
+
+ENEMIES = 400
+TOWER_REACH = 2  # towers go on free cells within this many cells of the path
+FRAMES = 120
+DT = 1.0 / FPS
+TYPES = ("Standard", "Fast", "Tank")
+
+
+def legacy_update(game, dt):
+    """The previous enemy, tower and projectile loops of Game.update."""
+    for enemy in game.enemies[:]:
+        enemy.update(dt)
+        if enemy.reached_end:
+            game.health -= 1
+            game.enemies.remove(enemy)
+        elif not enemy.alive:
+            game.enemies.remove(enemy)
+
+    for tower in game.towers:
+        tower.update(dt)
+        if tower.can_fire():
+            closest = None
+            closest_dist = float('inf')
+            for enemy in game.enemies:
+                if not enemy.alive:
+                    continue
+                dist = ((tower.x - enemy.x) ** 2 + (tower.y - enemy.y) ** 2) ** 0.5
+                if dist <= tower.get_range_pixels() and dist < closest_dist:
+                    closest = enemy
+                    closest_dist = dist
+            if closest:
+                tower.set_target(closest.get_position())
+                game.projectiles.append(tower.fire(closest.get_position()))
+
+    for projectile in game.projectiles[:]:
+        projectile.update(dt)
+        if not projectile.active:
+            game.projectiles.remove(projectile)
+            continue
+        for enemy in game.enemies:
+            if not enemy.alive:
+                continue
+            dist = ((projectile.x - enemy.x) ** 2 + (projectile.y - enemy.y) ** 2) ** 0.5
+            if dist < CELL_SIZE * 0.4:
+                enemy.take_damage(projectile.damage)
+                if projectile.is_frost:
+                    enemy.apply_slow(projectile.slow_factor, projectile.slow_duration)
+                projectile.active = False
+                break
+
+
+def setup(targeting):
+    """A game mid-wave with towers along the path and ENEMIES mice on it."""
+    game = Game()
+    game.wave_delay_timer = 0
+    game.current_wave_enemies = []
+    game.health = ENEMIES
+    path = set(ENEMY_PATH)
+    cells = sorted({(x + dx, y + dy) for x, y in ENEMY_PATH
+                    for dx in range(-TOWER_REACH, TOWER_REACH + 1)
+                    for dy in range(-TOWER_REACH, TOWER_REACH + 1)})
+    free = [(gx, gy) for gx, gy in cells
+            if (gx, gy) not in path and 0 <= gx < GRID_SIZE and 0 <= gy < GRID_SIZE]
+    tower_types = list(TOWER_TYPES)
+    for i, (gx, gy) in enumerate(free):
+        game.towers.append(Tower(gx, gy, tower_types[i % len(tower_types)], targeting))
+    for i in range(ENEMIES):
+        enemy = Enemy(TYPES[i % len(TYPES)], ENEMY_PATH)
+        enemy.max_health = enemy.health = 10 ** 6
+        # Spread over the first half of the path so none reach the end during the run
+        along = i * (len(ENEMY_PATH) - 1) / 2 / ENEMIES
+        enemy.path_index = int(along)
+        (x0, y0), (x1, y1) = ENEMY_PATH[enemy.path_index], ENEMY_PATH[enemy.path_index + 1]
+        t = along - enemy.path_index
+        enemy.x = (x0 + (x1 - x0) * t) * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_X
+        enemy.y = (y0 + (y1 - y0) * t) * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_Y
+        game.enemies.append(enemy)
+    return game
+
+
+def run(targeting, legacy):
+    """Milliseconds per frame, damage dealt, and the tower count."""
+    game = setup(targeting)
+    start_health = sum(enemy.health for enemy in game.enemies)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        if legacy:
+            legacy_update(game, DT)
+        else:
+            game.update(DT)
+    elapsed = time.perf_counter() - start
+    damage = start_health - sum(enemy.health for enemy in game.enemies)
+    return elapsed * 1000 / FRAMES, damage, len(game.towers)
+
+
+def main() -> int:
+    """Print frame cost per update variant."""
+    pygame.init()
+    print(f"{'update':<22} {'towers':>6} {'mice':>5} {'ms/frame':>9} {'damage':>8}")
+    variants = [("legacy (closest)", "closest", True)]
+    variants += [(f"grid ({policy})", policy, False) for policy in TARGETING_POLICIES]
+    for name, targeting, legacy in variants:
+        ms, damage, towers = run(targeting, legacy)
+        print(f"{name:<22} {towers:>6} {ENEMIES:>5} {ms:>9.2f} {damage:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -63,6 +63,12 @@ TOWER_TYPES = {
     }
 }
 
+# Targeting policies, cycled with T; towers start with the first
+TARGETING_POLICIES = ["closest", "first", "strongest"]
+
+# Distance from an enemy's centre at which a projectile hits it
+PROJECTILE_HIT_RADIUS = CELL_SIZE * 0.4
+
 # Wave configuration
 WAVES = [
     [{"type": "Standard", "count": 3, "interval": 2.0}],
@@ -125,6 +125,15 @@ class Enemy:
         """Get current position."""
         return (self.x, self.y)
 
+    def progress(self):
+        """Distance travelled along the path, in path steps."""
+        if self.path_index >= len(self.path) - 1:
+            return float(self.path_index)
+        target_x, target_y = self.path[self.path_index + 1]
+        dx = target_x * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_X - self.x
+        dy = target_y * CELL_SIZE + CELL_SIZE // 2 + GRID_OFFSET_Y - self.y
+        return self.path_index + 1 - (dx * dx + dy * dy) ** 0.5 / CELL_SIZE
+
     def get_grid_position(self):
         """Get current grid position."""
         grid_x = int((self.x - GRID_OFFSET_X) // CELL_SIZE)
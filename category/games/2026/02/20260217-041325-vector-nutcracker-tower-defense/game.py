@@ -5,6 +5,7 @@ import sys
 from config import *
 from enemy import Enemy
 from tower import Tower, Projectile
+from spatial import EnemyGrid, swap_remove
 
 
 class Game:
@@ -33,6 +34,7 @@ class Game:
         self.towers = []
         self.enemies = []
         self.projectiles = []
+        self.enemy_grid = EnemyGrid()
 
         # Wave management
         self.current_wave_enemies = []
@@ -43,6 +45,7 @@ class Game:
 
         # Tower selection
         self.selected_tower = "Scout"
+        self.targeting = TARGETING_POLICIES[0]
 
         # Path for validity checking
         self.path_set = set(ENEMY_PATH)
@@ -119,6 +122,8 @@ class Game:
                     self.selected_tower = "Frost"
                 elif event.key == pygame.K_r:
                     self.show_range = not self.show_range
+                elif event.key == pygame.K_t:
+                    self.cycle_targeting()
                 elif event.key == pygame.K_SPACE and self.game_over:
                     self.restart_game()
             elif event.type == pygame.MOUSEBUTTONDOWN and not self.game_over:
@@ -130,9 +135,16 @@ class Game:
                     if self.is_valid_position(grid_x, grid_y):
                         tower_config = TOWER_TYPES[self.selected_tower]
                         if self.currency >= tower_config["cost"]:
-                            self.towers.append(Tower(grid_x, grid_y, self.selected_tower))
+                            self.towers.append(Tower(grid_x, grid_y, self.selected_tower, self.targeting))
                             self.currency -= tower_config["cost"]
 
+    def cycle_targeting(self):
+        """Switch every tower, and towers placed later, to the next targeting policy."""
+        index = TARGETING_POLICIES.index(self.targeting)
+        self.targeting = TARGETING_POLICIES[(index + 1) % len(TARGETING_POLICIES)]
+        for tower in self.towers:
+            tower.targeting = self.targeting
+
     def restart_game(self):
         """Restart the game."""
         self.currency = INITIAL_CURRENCY
@@ -142,9 +154,11 @@ class Game:
         self.time_survived = 0
         self.game_over = False
         self.victory = False
-        self.towers = []
-        self.enemies = []
-        self.projectiles = []
+        # Emptied in place so the lists keep their storage
+        self.towers.clear()
+        self.enemies.clear()
+        self.projectiles.clear()
+        self.enemy_grid.rebuild(self.enemies)
         self.prepare_wave()
 
     def update(self, dt):
@@ -178,19 +192,26 @@ class Game:
             return
 
         # Update enemies
-        for enemy in self.enemies[:]:
+        i = 0
+        while i < len(self.enemies):
+            enemy = self.enemies[i]
             enemy.update(dt)
 
             if enemy.reached_end:
                 self.health -= 1
-                self.enemies.remove(enemy)
+                swap_remove(self.enemies, i)
                 if self.health <= 0:
                     self.game_over = True
 
             elif not enemy.alive:
                 self.score += enemy.reward
                 self.currency += enemy.reward
-                self.enemies.remove(enemy)
+                swap_remove(self.enemies, i)
+
+            else:
+                i += 1
+
+        self.enemy_grid.rebuild(self.enemies)
 
         # Update towers
         for tower in self.towers:
@@ -208,46 +229,28 @@ class Game:
                     tower.target_angle = 0
 
         # Update projectiles
-        for projectile in self.projectiles[:]:
+        i = 0
+        while i < len(self.projectiles):
+            projectile = self.projectiles[i]
             projectile.update(dt)
 
             if not projectile.active:
-                self.projectiles.remove(projectile)
+                swap_remove(self.projectiles, i)
                 continue
 
-            # Check collision with enemies
-            for enemy in self.enemies:
-                if not enemy.alive:
-                    continue
-                ex, ey = enemy.get_position()
-                dist = ((projectile.x - ex) ** 2 + (projectile.y - ey) ** 2) ** 0.5
-                if dist < CELL_SIZE * 0.4:
-                    enemy.take_damage(projectile.damage)
-                    if projectile.is_frost:
-                        enemy.apply_slow(projectile.slow_factor, projectile.slow_duration)
-                    projectile.active = False
-                    break
+            # Check collision with enemies near the projectile
+            enemy = self.enemy_grid.first_hit(projectile.x, projectile.y, PROJECTILE_HIT_RADIUS)
+            if enemy is not None:
+                enemy.take_damage(projectile.damage)
+                if projectile.is_frost:
+                    enemy.apply_slow(projectile.slow_factor, projectile.slow_duration)
+                projectile.active = False
+            i += 1
 
     def find_target(self, tower):
-        """Find target enemy for tower."""
-        tower_pos = tower.get_position()
-        tower_range = tower.get_range_pixels()
-
-        # Find closest enemy in range
-        closest = None
-        closest_dist = float('inf')
-
-        for enemy in self.enemies:
-            if not enemy.alive:
-                continue
-            enemy_pos = enemy.get_position()
-            dist = ((tower_pos[0] - enemy_pos[0]) ** 2 + (tower_pos[1] - enemy_pos[1]) ** 2) ** 0.5
-
-            if dist <= tower_range and dist < closest_dist:
-                closest = enemy
-                closest_dist = dist
-
-        return closest
+        """Find target enemy for tower under its targeting policy."""
+        return self.enemy_grid.find_target(tower.x, tower.y, tower.get_range_pixels(),
+                                           tower.targeting, tower.range_cells)
 
     def draw_grid(self):
         """Draw the game grid."""
@@ -377,7 +380,8 @@ class Game:
             self.screen.blit(key_text, (x_offset + 50, panel_y + 10))
 
         # Controls hint
-        hint_text = self.small_font.render("R: Toggle Range | ESC: Exit", True, (150, 150, 150))
+        hint_text = self.small_font.render(f"R: Toggle Range | T: Target {self.targeting} | ESC: Exit",
+                                           True, (150, 150, 150))
         self.screen.blit(hint_text, (270, panel_y + 25))
 
         # Wave status
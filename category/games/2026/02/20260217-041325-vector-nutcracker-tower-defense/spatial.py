@@ -0,0 +1,94 @@
+"""Spatial hash of enemies for tower targeting and projectile hits."""
+
+from config import *
+
+
+def swap_remove(items, index):
+    """Remove items[index] in O(1) by moving the last item into its place."""
+    last = items.pop()
+    if index < len(items):
+        items[index] = last
+
+
+# Score of a candidate enemy under each targeting policy; the highest wins
+TARGETING_KEYS = {
+    "closest": lambda enemy, dist_sq: -dist_sq,
+    "first": lambda enemy, dist_sq: enemy.progress(),
+    "strongest": lambda enemy, dist_sq: enemy.health,
+}
+
+
+class EnemyGrid:
+    """Uniform grid of live enemies, one bucket per board cell.
+
+    Rebuilt once per frame from the enemy list, so a range query only looks
+    at enemies in the cells the query circle touches instead of every enemy
+    on the board. Distances are compared squared.
+    """
+
+    def __init__(self):
+        self.cells = {}
+
+    def rebuild(self, enemies):
+        """Bucket the live enemies by get_grid_position."""
+        cells = {}
+        for enemy in enemies:
+            if enemy.alive:
+                key = enemy.get_grid_position()
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [enemy]
+                else:
+                    bucket.append(enemy)
+        self.cells = cells
+
+    @staticmethod
+    def cells_in_range(x, y, radius):
+        """Grid keys of every cell the circle around (x, y) can reach."""
+        left = int((x - radius - GRID_OFFSET_X) // CELL_SIZE)
+        right = int((x + radius - GRID_OFFSET_X) // CELL_SIZE)
+        top = int((y - radius - GRID_OFFSET_Y) // CELL_SIZE)
+        bottom = int((y + radius - GRID_OFFSET_Y) // CELL_SIZE)
+        return [(gx, gy) for gx in range(left, right + 1) for gy in range(top, bottom + 1)]
+
+    def in_range(self, x, y, radius, keys=None):
+        """Yield (enemy, squared distance) for live enemies within radius of (x, y).
+
+        `keys` may pass precomputed cells_in_range for a fixed query point.
+        """
+        radius_sq = radius * radius
+        cells = self.cells
+        for key in keys if keys is not None else self.cells_in_range(x, y, radius):
+            bucket = cells.get(key)
+            if bucket is None:
+                continue
+            for enemy in bucket:
+                if not enemy.alive:
+                    continue
+                dx = enemy.x - x
+                dy = enemy.y - y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq <= radius_sq:
+                    yield enemy, dist_sq
+
+    def find_target(self, x, y, radius, policy="closest", keys=None):
+        """Best enemy within radius under a TARGETING_KEYS policy, or None."""
+        score = TARGETING_KEYS[policy]
+        best = None
+        best_score = None
+        for enemy, dist_sq in self.in_range(x, y, radius, keys):
+            value = score(enemy, dist_sq)
+            if best is None or value > best_score:
+                best = enemy
+                best_score = value
+        return best
+
+    def first_hit(self, x, y, radius):
+        """Closest live enemy strictly within radius of (x, y), or None."""
+        best = None
+        best_dist_sq = radius * radius
+        for enemy, dist_sq in self.in_range(x, y, radius):
+            if dist_sq < best_dist_sq:
+                best = enemy
+                best_dist_sq = dist_sq
+        return best
@@ -3,6 +3,7 @@
 import pygame
 import math
 from config import *
+from spatial import EnemyGrid
 
 
 class Projectile:
@@ -56,7 +57,7 @@ class Projectile:
 class Tower:
     """Nutcracker tower that fires projectiles."""
 
-    def __init__(self, grid_x, grid_y, tower_type):
+    def __init__(self, grid_x, grid_y, tower_type, targeting=TARGETING_POLICIES[0]):
         """Initialize tower."""
         self.grid_x = grid_x
         self.grid_y = grid_y
@@ -75,6 +76,9 @@ class Tower:
         self.cooldown_timer = 0
         self.angle = 0
         self.target_angle = 0
+        self.targeting = targeting
+        # Towers never move, so the cells their range covers are fixed
+        self.range_cells = EnemyGrid.cells_in_range(self.x, self.y, self.get_range_pixels())
 
         # Frost tower special properties
         self.slow_factor = self.config.get("slow_factor", 1.0)
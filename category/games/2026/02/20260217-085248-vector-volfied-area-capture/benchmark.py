@@ -0,0 +1,109 @@
+"""Capture benchmark for the territory engine.
+
+Plays out a level of rectangular bites cut from the edge of the claimed
+territory, then a comb of thin cuts (the worst case: hundreds of free runs
+per row band), and reports capture, redraw and percentage timings.
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import config
+from territory import FREE, Territory
+
+SEED = 7
+LEVELS = 20
+
+
+def trail_line(territory: Territory, col: int, row: int, dcol: int, drow: int, length: int) -> int:
+    """Mark free cells from (col, row) in one direction; return the cells marked."""
+    marked = 0
+    for _ in range(length):
+        if not (0 <= col < territory.width and 0 <= row < territory.height):
+            break
+        if territory.at(col, row) != FREE:
+            break
+        territory.mark_trail(col, row)
+        marked += 1
+        col += dcol
+        row += drow
+    return marked
+
+
+def bite(territory: Territory, rng: random.Random) -> None:
+    """Cut a rectangle off the left or right end of the free space."""
+    row = rng.randrange(2, territory.height - 40)
+    depth = rng.randrange(20, 120)
+    height = rng.randrange(10, 60)
+    free_cols = (territory.grid[row] == FREE).nonzero()[0]
+    if len(free_cols) == 0:
+        return
+    if rng.random() < 0.5:
+        col, direction = int(free_cols[0]), 1
+    else:
+        col, direction = int(free_cols[-1]), -1
+    marked = trail_line(territory, col, row, direction, 0, depth)
+    end_col = col + direction * (marked - 1)
+    trail_line(territory, end_col, row + 1, 0, 1, height)
+    trail_line(territory, end_col - direction, row + height, -direction, 0, territory.width)
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def report(name: str, samples) -> None:
+    samples = sorted(samples)
+    print(f"{name:<28} {len(samples):>6} {sum(samples) / len(samples):>9.3f} "
+          f"{samples[len(samples) // 2]:>9.3f} {samples[-1]:>9.3f}")
+
+
+def main() -> int:
+    """Print timings in milliseconds per operation."""
+    pygame.init()
+    field = pygame.Rect(config.FIELD_X, config.FIELD_Y, config.FIELD_WIDTH, config.FIELD_HEIGHT)
+    territory = Territory(field)
+    boss_x, boss_y = field.center
+    rng = random.Random(SEED)
+    print(f"grid {territory.width}x{territory.height} cells of {config.CLAIM_CELL_SIZE}px")
+    print(f"{'operation':<28} {'count':>6} {'mean ms':>9} {'p50 ms':>9} {'max ms':>9}")
+
+    captures, redraws, reads = [], [], []
+    for _ in range(LEVELS):
+        territory.reset()
+        territory.render()
+        while territory.get_percentage() < config.WIN_PERCENTAGE:
+            bite(territory, rng)
+            if not territory.trail_cells:
+                break
+            captures.append(timed(territory.capture, boss_x, boss_y))
+            redraws.append(timed(territory.render))
+            reads.append(timed(territory.get_percentage))
+    report("capture (edge bites)", captures)
+    report("redraw dirty rect", redraws)
+    report("read percentage", reads)
+
+    captures = []
+    territory.reset()
+    for col in range(4, territory.width - 4, 6):
+        trail_line(territory, col, rng.randrange(1, territory.height // 2), 0, 1, territory.height)
+        captures.append(timed(territory.capture, *territory.pixel_of(2, 2)))
+    report("capture (comb worst case)", captures)
+    report("full redraw", [timed(full_redraw, territory) for _ in range(20)])
+    return 0
+
+
+def full_redraw(territory: Territory) -> None:
+    territory.dirty = [pygame.Rect(0, 0, territory.width, territory.height)]
+    territory.render()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
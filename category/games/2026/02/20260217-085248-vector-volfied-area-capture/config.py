@@ -28,6 +28,9 @@ SPARK_COLOR = (255, 100, 0)
 PLAYER_SIZE = 8
 PLAYER_SPEED = 3
 
+# Territory settings
+CLAIM_CELL_SIZE = 2  # pixels per claim cell
+
 # Trail settings
 TRAIL_WIDTH = 2
 
@@ -3,6 +3,7 @@
 import pygame
 import random
 import config
+from territory import CLAIMED, FREE, TRAIL, Territory
 from pygame import Rect
 from typing import List, Tuple
 
@@ -53,8 +54,14 @@ class Player:
         """Check if current position is on the field perimeter."""
         return self.is_on_border(self.x, self.y)
 
-    def move(self, claimed_grid: List[List[bool]]) -> Tuple[bool, Rect]:
-        """Move player and return (claimed_area, area_rect) if area claimed."""
+    def move(self, territory: Territory) -> bool:
+        """Move player one step and return True when the trail closes on claimed territory.
+
+        Off the trail the player runs along claimed cells that touch open space;
+        stepping into open space starts a trail. The step is walked cell by
+        cell so the trail cells stay connected, and it stops at the first
+        claimed cell reached while drawing.
+        """
         new_x = self.x + self.dx * config.PLAYER_SPEED
         new_y = self.y + self.dy * config.PLAYER_SPEED
 
@@ -64,55 +71,44 @@ class Player:
 
         # If not moving, return
         if new_x == self.x and new_y == self.y:
-            return False, None
+            return False
 
-        # Check if trying to enter claimed area
-        grid_x = int((new_x - self.field_rect.x) // 2)
-        grid_y = int((new_y - self.field_rect.y) // 2)
+        current = territory.cell_of(self.x, self.y)
+        stop_at = None
+        closed = False
+        for cell in territory.cells_between(self.x, self.y, new_x, new_y):
+            state = territory.at(*cell)
+            if state == TRAIL:
+                # Never cross our own trail
+                stop_at = current
+                break
+            if self.is_drawing:
+                if state == CLAIMED:
+                    stop_at = cell
+                    closed = True
+                    break
+                territory.mark_trail(*cell)
+            elif state == FREE:
+                self.start_drawing()
+                territory.mark_trail(*cell)
+            elif not territory.is_edge(*cell) and territory.is_edge(*current):
+                # Stay on the edge of the claimed territory
+                stop_at = current
+                break
+            current = cell
 
-        if self.is_drawing:
-            # When drawing, can only enter unclaimed space
-            if claimed_grid and 0 <= grid_y < len(claimed_grid) and 0 <= grid_x < len(claimed_grid[0]):
-                if claimed_grid[grid_y][grid_x]:
-                    # Hit claimed area, stop drawing
-                    self.clear_trail()
-                    return False, None
+        if stop_at is None:
+            self.x, self.y = new_x, new_y
         else:
-            # When not drawing, can move on border or unclaimed
-            if claimed_grid and 0 <= grid_y < len(claimed_grid) and 0 <= grid_x < len(claimed_grid[0]):
-                if claimed_grid[grid_y][grid_x] and not self.is_on_border(new_x, new_y):
-                    return False, None
-
-        self.x = new_x
-        self.y = new_y
+            if stop_at == territory.cell_of(self.x, self.y):
+                return False
+            self.x, self.y = territory.pixel_of(*stop_at)
 
-        # Add to trail if drawing
         if self.is_drawing:
             self.trail.append((self.x, self.y))
-
-        # Check if we returned to border while drawing
-        claimed_area = None
-        if self.is_drawing and self.is_on_border(self.x, self.y) and len(self.trail) > 2:
-            claimed_area = self._calculate_claimed_area()
+        if closed:
             self.clear_trail()
-
-        return claimed_area is not None, claimed_area
-
-    def _calculate_claimed_area(self) -> Rect:
-        """Calculate the area claimed by the current trail."""
-        if len(self.trail) < 3:
-            return None
-
-        # Simple area calculation using bounding box
-        xs = [p[0] for p in self.trail]
-        ys = [p[1] for p in self.trail]
-
-        return Rect(
-            min(xs),
-            min(ys),
-            max(xs) - min(xs),
-            max(ys) - min(ys)
-        )
+        return closed
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the player and trail."""
@@ -137,9 +133,8 @@ class Player:
 class Boss:
     """The main boss entity that moves within unclaimed space."""
 
-    def __init__(self, field_rect: Rect, claimed_regions: List[Rect]):
+    def __init__(self, field_rect: Rect):
         self.field_rect = field_rect
-        self.claimed_regions = claimed_regions
         self.reset()
 
     def reset(self) -> None:
@@ -150,9 +145,8 @@ class Boss:
         self.vy = random.choice([-1, 1]) * config.BOSS_BASE_SPEED
         self.phase = 0
 
-    def update(self, level: int, claimed_regions: List[Rect]) -> None:
+    def update(self, level: int, territory: Territory) -> None:
         """Update boss position and behavior."""
-        self.claimed_regions = claimed_regions
         speed = config.BOSS_BASE_SPEED + (level - 1) * 0.3
 
         # Change direction periodically
@@ -170,12 +164,7 @@ class Boss:
         new_x = self.x + self.vx + wobble.x
         new_y = self.y + self.vy + wobble.y
 
-        # Check if in claimed region
-        in_claimed = False
-        for region in self.claimed_regions:
-            if region.collidepoint(new_x, new_y):
-                in_claimed = True
-                break
+        in_claimed = territory.is_claimed(new_x, new_y)
 
         # Bounce off walls and claimed areas
         if in_claimed or new_x <= self.field_rect.left or new_x >= self.field_rect.right:
@@ -339,23 +328,10 @@ class GameState:
     def __init__(self):
         self.field_rect = Rect(config.FIELD_X, config.FIELD_Y, config.FIELD_WIDTH, config.FIELD_HEIGHT)
 
-        # Create a grid for claimed/unclaimed tracking
-        grid_w = config.FIELD_WIDTH // 2
-        grid_h = config.FIELD_HEIGHT // 2
-        self.claimed_grid = [[False for _ in range(grid_w)] for _ in range(grid_h)]
-
-        # Mark borders as claimed
-        for x in range(grid_w):
-            self.claimed_grid[0][x] = True
-            self.claimed_grid[grid_h - 1][x] = True
-        for y in range(grid_h):
-            self.claimed_grid[y][0] = True
-            self.claimed_grid[y][grid_w - 1] = True
-
-        self.claimed_regions: List[Rect] = [self.field_rect]
+        self.territory = Territory(self.field_rect)
 
         self.player = Player(self.field_rect)
-        self.boss = Boss(self.field_rect, self.claimed_regions)
+        self.boss = Boss(self.field_rect)
         self.sparks = [
             Spark(self.field_rect, 'top'),
             Spark(self.field_rect, 'bottom'),
@@ -371,18 +347,7 @@ class GameState:
 
     def reset(self) -> None:
         """Reset the game to initial state."""
-        grid_w = config.FIELD_WIDTH // 2
-        grid_h = config.FIELD_HEIGHT // 2
-        self.claimed_grid = [[False for _ in range(grid_w)] for _ in range(grid_h)]
-
-        for x in range(grid_w):
-            self.claimed_grid[0][x] = True
-            self.claimed_grid[grid_h - 1][x] = True
-        for y in range(grid_h):
-            self.claimed_grid[y][0] = True
-            self.claimed_grid[y][grid_w - 1] = True
-
-        self.claimed_regions = [self.field_rect]
+        self.territory.reset()
         self.claimed_area = 0
 
         self.player.reset()
@@ -399,6 +364,8 @@ class GameState:
     def next_level(self) -> None:
         """Advance to the next level."""
         self.level += 1
+        self.territory.reset()
+        self.claimed_area = 0
         self.player.reset()
         self.boss.reset()
         for spark in self.sparks:
@@ -409,32 +376,20 @@ class GameState:
         """Handle losing a life."""
         self.lives -= 1
         self.score = max(0, self.score - config.DEATH_PENALTY)
+        self.territory.clear_trail()
         self.player.clear_trail()
         self.player.reset()
 
         if self.lives <= 0:
             self.game_over = True
 
-    def claim_area(self, area_rect: Rect) -> None:
-        """Mark an area as claimed."""
-        if not area_rect:
-            return
-
-        self.claimed_regions.append(area_rect)
-
-        # Mark grid cells as claimed
-        grid_w = config.FIELD_WIDTH // 2
-        start_x = max(0, int((area_rect.x - self.field_rect.x) // 2))
-        start_y = max(0, int((area_rect.y - self.field_rect.y) // 2))
-        end_x = min(grid_w, int((area_rect.right - self.field_rect.x) // 2) + 1)
-        end_y = min(grid_h, int((area_rect.bottom - self.field_rect.y) // 2) + 1)
-
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                self.claimed_grid[y][x] = True
+    def claim_area(self) -> None:
+        """Claim the closed trail and every region the boss is not in."""
+        new_cells = self.territory.capture(self.boss.x, self.boss.y)
+        area_size = new_cells * config.CLAIM_CELL_SIZE ** 2
+        self.claimed_area += area_size
 
         # Calculate score
-        area_size = area_rect.width * area_rect.height
         multiplier = 1.0
         if area_size > config.SIZE_MULTIPLIER_THRESHOLD:
             multiplier = 1.5
@@ -450,12 +405,11 @@ class GameState:
             return
 
         # Move player and check for area claim
-        claimed, area_rect = self.player.move(self.claimed_grid)
-        if claimed:
-            self.claim_area(area_rect)
+        if self.player.move(self.territory):
+            self.claim_area()
 
         # Update enemies
-        self.boss.update(self.level, self.claimed_regions)
+        self.boss.update(self.level, self.territory)
         for spark in self.sparks:
             spark.update(self.level, self.player.x, self.player.y)
 
@@ -479,14 +433,5 @@ class GameState:
             self.score += config.LEVEL_COMPLETE_BONUS * self.level
 
     def get_claimed_percentage(self) -> float:
-        """Calculate the percentage of claimed area."""
-        total_cells = 0
-        claimed_cells = 0
-
-        for row in self.claimed_grid:
-            for cell in row:
-                total_cells += 1
-                if cell:
-                    claimed_cells += 1
-
-        return (claimed_cells / total_cells) * 100 if total_cells > 0 else 0
+        """Percentage of the field interior that has been claimed."""
+        return self.territory.get_percentage()
@@ -72,7 +72,6 @@ class VolfiedGame:
 
         self._draw_ui()
         self._draw_field()
-        self._draw_claimed_areas()
         self._draw_boss()
         self._draw_sparks()
         self._draw_player()
@@ -114,19 +113,11 @@ class VolfiedGame:
         pygame.draw.rect(self.screen, config.TEXT_COLOR, (bar_x, bar_y, bar_width, bar_height), 1)
 
     def _draw_field(self) -> None:
-        """Draw the game field border."""
+        """Draw the field with its claimed territory and border."""
         rect = self.state.field_rect
-        pygame.draw.rect(self.screen, config.FIELD_BG_COLOR, rect)
+        self.screen.blit(self.state.territory.render(), rect.topleft, (0, 0, rect.width, rect.height))
         pygame.draw.rect(self.screen, config.BORDER_COLOR, rect, 2)
 
-    def _draw_claimed_areas(self) -> None:
-        """Draw claimed/filled areas."""
-        for region in self.state.claimed_regions[1:]:
-            draw_rect = region.clip(self.state.field_rect)
-            if draw_rect.width > 0 and draw_rect.height > 0:
-                pygame.draw.rect(self.screen, config.CLAIMED_COLOR, draw_rect)
-                pygame.draw.rect(self.screen, config.BORDER_COLOR, draw_rect, 1)
-
     def _draw_player(self) -> None:
         """Draw the player."""
         self.state.player.draw(self.screen)
@@ -0,0 +1,210 @@
+"""Territory engine: claim bitmap, trail cells, scanline capture and cached drawing."""
+
+import numpy as np
+import pygame
+import config
+
+FREE = 0
+CLAIMED = 1
+TRAIL = 2
+
+
+class Territory:
+    """Claim state of the field on a grid of CLAIM_CELL_SIZE pixel cells.
+
+    The grid covers the field edges inclusively, so the outer ring of cells is
+    the starting border. Captured cells are counted as they change, so the
+    claimed percentage of the interior is exact and O(1) to read. The field
+    is cached as a surface and only the rectangles touched by a capture are
+    redrawn.
+    """
+
+    def __init__(self, field_rect: pygame.Rect):
+        self.field_rect = field_rect
+        self.cell = config.CLAIM_CELL_SIZE
+        self.width = field_rect.width // self.cell + 1
+        self.height = field_rect.height // self.cell + 1
+        self.interior_cells = (self.width - 2) * (self.height - 2)
+        self.grid = np.zeros((self.height, self.width), dtype=np.uint8)
+        # Field colours per cell: free, claimed, claimed edge
+        self.palette = np.array([config.FIELD_BG_COLOR, config.CLAIMED_COLOR, config.BORDER_COLOR], dtype=np.uint8)
+        self.cell_surface = pygame.Surface((self.width, self.height))
+        self.surface = pygame.Surface((self.width * self.cell, self.height * self.cell))
+        self.reset()
+
+    def reset(self) -> None:
+        """Claim only the border ring."""
+        self.grid[:] = FREE
+        self.grid[0, :] = self.grid[-1, :] = CLAIMED
+        self.grid[:, 0] = self.grid[:, -1] = CLAIMED
+        self.claimed_cells = 0
+        self.trail_cells = []
+        self.dirty = [pygame.Rect(0, 0, self.width, self.height)]
+
+    # Coordinates
+
+    def cell_of(self, x: float, y: float):
+        """Grid (col, row) of a field pixel position, clamped to the grid."""
+        col = int((x - self.field_rect.x) // self.cell)
+        row = int((y - self.field_rect.y) // self.cell)
+        return min(max(col, 0), self.width - 1), min(max(row, 0), self.height - 1)
+
+    def pixel_of(self, col: int, row: int):
+        """Field pixel position of a cell's top-left corner."""
+        return self.field_rect.x + col * self.cell, self.field_rect.y + row * self.cell
+
+    def cells_between(self, x0: float, y0: float, x1: float, y1: float):
+        """Cells crossed moving from (x0, y0) to (x1, y1), start cell excluded.
+
+        Movement is along one axis at a time, so the path is a straight run.
+        """
+        col0, row0 = self.cell_of(x0, y0)
+        col1, row1 = self.cell_of(x1, y1)
+        path = []
+        step = 1 if col1 > col0 else -1
+        path.extend((col, row0) for col in range(col0 + step, col1 + step, step) if col != col0)
+        step = 1 if row1 > row0 else -1
+        path.extend((col1, row) for row in range(row0 + step, row1 + step, step) if row != row0)
+        return path
+
+    # Queries
+
+    def at(self, col: int, row: int) -> int:
+        return int(self.grid[row, col])
+
+    def is_claimed(self, x: float, y: float) -> bool:
+        """Whether the field pixel position lies in claimed territory."""
+        col, row = self.cell_of(x, y)
+        return self.grid[row, col] == CLAIMED
+
+    def is_edge(self, col: int, row: int) -> bool:
+        """Whether a claimed cell touches unclaimed space (8-neighbourhood)."""
+        window = self.grid[max(row - 1, 0):row + 2, max(col - 1, 0):col + 2]
+        return bool((window != CLAIMED).any())
+
+    def get_percentage(self) -> float:
+        """Claimed share of the interior, in percent."""
+        return self.claimed_cells * 100 / self.interior_cells
+
+    # Trail and capture
+
+    def mark_trail(self, col: int, row: int) -> None:
+        self.grid[row, col] = TRAIL
+        self.trail_cells.append((col, row))
+
+    def clear_trail(self) -> None:
+        """Release the cells of an abandoned trail."""
+        for col, row in self.trail_cells:
+            self.grid[row, col] = FREE
+        self.trail_cells = []
+
+    def _free_runs(self):
+        """Horizontal runs of free cells as (rows, starts, ends), ordered by row then start."""
+        free = self.grid == FREE
+        padded = np.zeros((self.height, self.width + 2), dtype=np.int8)
+        padded[:, 1:-1] = free
+        change = np.diff(padded, axis=1)
+        rows, starts = np.nonzero(change == 1)
+        _, ends = np.nonzero(change == -1)
+        return rows, starts, ends
+
+    def _seed_cell(self, x: float, y: float):
+        """A free cell at or next to the pixel position, or None."""
+        col, row = self.cell_of(x, y)
+        for dc, dr in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)):
+            c, r = col + dc, row + dr
+            if 0 <= c < self.width and 0 <= r < self.height and self.grid[r, c] == FREE:
+                return c, r
+        return None
+
+    def capture(self, keep_x: float, keep_y: float) -> int:
+        """Claim the trail and every free region except the one containing (keep_x, keep_y).
+
+        The regions are found with a scanline flood fill over runs of free
+        cells: the run under the boss is the seed, and a run is reached when
+        it overlaps a reached run in the row above or below. Returns the
+        number of newly claimed cells.
+        """
+        new_cells = len(self.trail_cells)
+        cols = [c for c, _ in self.trail_cells]
+        rows_touched = [r for _, r in self.trail_cells]
+        for col, row in self.trail_cells:
+            self.grid[row, col] = CLAIMED
+        self.trail_cells = []
+
+        rows, starts, ends = self._free_runs()
+        if len(rows):
+            # Runs keyed by position in the row-major grid (one spare column per row so
+            # keys never collide across rows). The runs of a row that overlap
+            # [start, end) form a contiguous index range in either neighbouring row.
+            stride = self.width + 1
+            start_keys = rows * stride + starts
+            end_keys = rows * stride + ends
+            below_first = np.searchsorted(end_keys, start_keys + stride, side="right").tolist()
+            below_last = np.searchsorted(start_keys, end_keys + stride, side="left").tolist()
+            above_first = np.searchsorted(end_keys, start_keys - stride, side="right").tolist()
+            above_last = np.searchsorted(start_keys, end_keys - stride, side="left").tolist()
+            reached = bytearray(len(rows))
+
+            seed = self._seed_cell(keep_x, keep_y)
+            if seed is not None:
+                col, row = seed
+                first = int(np.searchsorted(start_keys, row * stride + col, side="right")) - 1
+                reached[first] = 1
+                stack = [first]
+                while stack:
+                    run = stack.pop()
+                    for other in range(above_first[run], above_last[run]):
+                        if not reached[other]:
+                            reached[other] = 1
+                            stack.append(other)
+                    for other in range(below_first[run], below_last[run]):
+                        if not reached[other]:
+                            reached[other] = 1
+                            stack.append(other)
+
+            # Fill the unreached runs: +1 at each start, -1 at each end, then a running sum
+            lost = np.frombuffer(bytes(reached), dtype=np.uint8) == 0
+            if lost.any():
+                marks = np.zeros(self.height * stride + 1, dtype=np.int32)
+                np.add.at(marks, start_keys[lost], 1)
+                np.add.at(marks, end_keys[lost], -1)
+                fill = np.cumsum(marks[:-1]).reshape(self.height, stride)[:, :self.width] > 0
+                self.grid[fill] = CLAIMED
+                new_cells += int((ends[lost] - starts[lost]).sum())
+                cols.extend((int(starts[lost].min()), int(ends[lost].max()) - 1))
+                rows_touched.extend((int(rows[lost].min()), int(rows[lost].max())))
+
+        self.claimed_cells += new_cells
+        if cols:
+            left, top = min(cols), min(rows_touched)
+            self.dirty.append(pygame.Rect(left, top, max(cols) - left + 1, max(rows_touched) - top + 1))
+        return new_cells
+
+    # Drawing
+
+    def render(self) -> pygame.Surface:
+        """Bring the cached field surface up to date and return it."""
+        for rect in self.dirty:
+            # Edge colouring depends on the neighbours, so redraw one cell beyond the change
+            rect = rect.inflate(2, 2).clip(pygame.Rect(0, 0, self.width, self.height))
+            window = self.grid[max(rect.top - 1, 0):rect.bottom + 1, max(rect.left - 1, 0):rect.right + 1]
+            claimed = np.ones((window.shape[0] + 2, window.shape[1] + 2), dtype=bool)
+            claimed[1:-1, 1:-1] = window == CLAIMED
+            # A claimed cell is an edge if anything in its 3x3 neighbourhood is not claimed
+            rows_all = claimed[:-2] & claimed[1:-1] & claimed[2:]
+            interior = rows_all[:, :-2] & rows_all[:, 1:-1] & rows_all[:, 2:]
+            top = rect.top - max(rect.top - 1, 0)
+            left = rect.left - max(rect.left - 1, 0)
+            inner = (slice(top, top + rect.height), slice(left, left + rect.width))
+            code = claimed[1:-1, 1:-1][inner].astype(np.uint8)
+            code[code.astype(bool) & ~interior[inner]] = 2
+
+            # surfarray is indexed (x, y); colour the cells, then scale them up to pixels
+            cells = self.cell_surface.subsurface(rect)
+            pygame.surfarray.blit_array(cells, self.palette[code.T])
+            target = pygame.Rect(rect.x * self.cell, rect.y * self.cell,
+                                 rect.width * self.cell, rect.height * self.cell)
+            pygame.transform.scale(cells, target.size, self.surface.subsurface(target))
+        self.dirty = []
+        return self.surface
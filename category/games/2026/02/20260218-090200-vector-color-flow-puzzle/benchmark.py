@@ -0,0 +1,120 @@
+"""Level generation, solving and pack benchmark for Color Flow Puzzle."""
+
+import random
+import sys
+import time
+
+import config
+import level_pack
+from level import Level, LevelGenerator
+from solver import FlowSolver, rate_level
+
+SEED = 2024
+GENERATE_COUNT = 50
+LEGACY_COUNT = 200
+GENERATE_SIZES = ((5, 6), (9, 12), (12, 3), (12, 6), (12, 18), (16, 26))  # (grid size, colors)
+RATE_SIZES = ((5, 6), (7, 9), (9, 12))
+RATE_COUNT = 50
+CONNECTED_LEVELS = 20
+CONNECTED_REPEAT = 100
+
+
+def legacy_dot_positions(grid_size: int, num_colors: int, rng: random.Random):
+    """The former generator: each color's two dots on random cells that are not side by side."""
+    available_cells = [(r, c) for r in range(grid_size) for c in range(grid_size)]
+    rng.shuffle(available_cells)
+    positions = []
+    for _ in range(num_colors):
+        pos1 = available_cells.pop()
+        pos2 = available_cells.pop()
+        while abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1]) <= 1 and available_cells:
+            available_cells.insert(0, pos2)
+            pos2 = available_cells.pop()
+        positions.append((pos1[0], pos1[1], pos2[0], pos2[1]))
+    return positions
+
+
+def legacy_is_color_connected(level: Level, color_id: int) -> bool:
+    """The former connectivity check: BFS with list.pop(0) and list membership."""
+    r1, c1, r2, c2 = level.dot_positions[color_id - 1]
+    dots = [(r1, c1), (r2, c2)]
+    color_cells = [(r, c) for r in range(level.grid_size) for c in range(level.grid_size)
+                   if level.grid[r][c] == color_id]
+    visited = {color_cells[0]}
+    queue = [color_cells[0]]
+    while queue:
+        current = queue.pop(0)
+        if current in dots:
+            dots.remove(current)
+        for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            cell = (current[0] + dr, current[1] + dc)
+            if cell in color_cells and cell not in visited:
+                visited.add(cell)
+                queue.append(cell)
+    return not dots
+
+
+def rate(label: str, count: int, elapsed: float, unit: str = "levels") -> None:
+    """Print one throughput line."""
+    print(f"  {label:<34} {count:>5} in {elapsed:7.3f}s  {count / elapsed:9.1f} {unit}/s")
+
+
+def main() -> int:
+    """Benchmark the old and new generators, the solver, the pack loader and the connectivity check."""
+    rng = random.Random(SEED)
+    size, colors = config.GRID_SIZE, len(config.COLORS)
+
+    print(f"Solvable levels, {size}x{size} with {colors} colors")
+    solvable = sum(FlowSolver(size, legacy_dot_positions(size, colors, rng)).count_solutions(1)
+                   for _ in range(LEGACY_COUNT))
+    print(f"  {'random dots (former generator)':<34} {solvable:>5} of {LEGACY_COUNT}")
+    solvable = sum(FlowSolver(size, LevelGenerator(size, colors, rng).generate()[1]).count_solutions(1)
+                   for _ in range(LEGACY_COUNT))
+    print(f"  {'grown paths':<34} {solvable:>5} of {LEGACY_COUNT}")
+
+    print("Generation (solvable by construction)")
+    for size, colors in GENERATE_SIZES:
+        times = []
+        for _ in range(GENERATE_COUNT):
+            start = time.perf_counter()
+            LevelGenerator(size, colors, rng).generate()
+            times.append(time.perf_counter() - start)
+        label = f"{size}x{size}, {colors} colors"
+        print(f"  {label:<34} mean {sum(times) / len(times) * 1000:6.1f} ms  worst {max(times) * 1000:6.1f} ms")
+
+    print("Uniqueness check and rating")
+    for size, colors in RATE_SIZES:
+        levels = [LevelGenerator(size, colors, rng).generate()[1] for _ in range(RATE_COUNT)]
+        start = time.perf_counter()
+        grades = [rate_level(size, dots, config.PACK_MAX_NODES) for dots in levels]
+        rate(f"{size}x{size}, {colors} colors", RATE_COUNT, time.perf_counter() - start)
+        print(f"    unique: {RATE_COUNT - grades.count(None)}, " + ", ".join(
+            f"{name}: {grades.count(grade)}" for grade, name in enumerate(config.DIFFICULTY_NAMES)))
+
+    size = config.GRID_SIZE
+    print(f"Level pack, {size}x{size}")
+    start = time.perf_counter()
+    levels = level_pack.get_levels(size, len(config.COLORS))
+    elapsed = time.perf_counter() - start
+    total = sum(len(level_pack.get_levels(size, colors)) for colors in range(1, len(config.COLORS) + 1))
+    print(f"  {'first load':<34} {total:>5} in {elapsed * 1000:6.2f} ms")
+
+    print(f"Connectivity check, solved {size}x{size} levels")
+    solved = []
+    for dots, _ in levels[:CONNECTED_LEVELS]:
+        level = Level(size, len(dots), dots)
+        level.grid = FlowSolver(size, dots).solve()
+        solved.append(level)
+    checks = [(level, color) for level in solved for color in range(1, level.num_colors + 1)]
+    for label, check in (("deque BFS", Level._is_color_connected),
+                         ("list BFS (former)", legacy_is_color_connected)):
+        start = time.perf_counter()
+        for _ in range(CONNECTED_REPEAT):
+            for level, color in checks:
+                check(level, color)
+        rate(label, CONNECTED_REPEAT * len(checks), time.perf_counter() - start, "checks")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
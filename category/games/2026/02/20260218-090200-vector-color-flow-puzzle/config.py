@@ -27,3 +27,22 @@ FPS = 60
 POINTS_PER_CONNECTION = 100
 TIME_BONUS_MULTIPLIER = 10
 LEVEL_TIME_LIMIT = 300  # 5 minutes
+
+# Level generation
+MIN_PATH_LENGTH = 3  # cells per color, dots included; keeps a color's dots apart
+GENERATOR_ATTEMPTS = 200
+SHIFTS_PER_CELL = 1  # end-cell hand-overs allowed per attempt when no two paths can join
+DENSE_PATH_LENGTH = 16  # most cells per color for which paths are grown; sparser levels cut one long path
+BACKBITE_MOVES_PER_CELL = 10  # random moves that shuffle the long path, per grid cell
+
+# Difficulty: solver branches needed to prove a level's solution unique;
+# DIFFICULTY_NODES[i] is the most a level rated DIFFICULTY_NAMES[i] may take
+DIFFICULTY_NAMES = ["Easy", "Medium", "Hard", "Expert"]
+DIFFICULTY_NODES = (0, 16, 128)
+
+# Level packs: one file per grid size, built with level_pack.py
+LEVEL_PACK_FILE = "levels_{size}x{size}.txt"
+LEVEL_PACK_SIZE = 1000
+PACK_COLORS = {GRID_SIZE: (3, len(COLORS))}  # color counts per grid size; others use level_pack.pack_colors
+PACK_ATTEMPTS = 20  # generated levels tried per pack level before giving up
+PACK_MAX_NODES = 20000  # solver branches before a level counts as too hard to check
@@ -1,6 +1,7 @@
 """Main game logic for Color Flow Puzzle."""
 
 import pygame
+import random
 import sys
 import time
 from typing import Optional, Tuple, List
@@ -8,9 +9,11 @@ from typing import Optional, Tuple, List
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, CELL_SIZE, GRID_SIZE, MARGIN,
     BACKGROUND_COLOR, GRID_COLOR, TEXT_COLOR, COLORS,
-    FPS, POINTS_PER_CONNECTION, TIME_BONUS_MULTIPLIER, LEVEL_TIME_LIMIT
+    FPS, POINTS_PER_CONNECTION, TIME_BONUS_MULTIPLIER, LEVEL_TIME_LIMIT,
+    DIFFICULTY_NAMES
 )
 from level import Level
+from level_pack import get_levels
 
 
 class Game:
@@ -36,7 +39,7 @@ class Game:
         self.game_state = "playing"  # playing, level_complete, game_over, win
 
         # Initialize level
-        self.level = Level(self.grid_size, self.num_colors)
+        self.level = self._new_level()
 
         # Interaction state
         self.selected_color = 0
@@ -249,7 +252,10 @@ class Game:
     def draw_header(self) -> None:
         """Draw the header with score and level info."""
         score_text = self.font.render(f"Score: {self.score}", True, TEXT_COLOR)
-        level_text = self.font.render(f"Level: {self.level_num}", True, TEXT_COLOR)
+        level_label = f"Level: {self.level_num}"
+        if self.level.difficulty is not None:
+            level_label += f" ({DIFFICULTY_NAMES[self.level.difficulty]})"
+        level_text = self.font.render(level_label, True, TEXT_COLOR)
         time_text = self.font.render(f"Time: {int(self.level_time)}", True, TEXT_COLOR)
 
         self.screen.blit(score_text, (20, 20))
@@ -383,9 +389,20 @@ class Game:
         self.score = 0
         self.level_time = LEVEL_TIME_LIMIT
         self.start_time = time.time()
-        self.level = Level(self.grid_size, self.num_colors)
+        self.level = self._new_level()
         self.game_state = "playing"
 
+    def _new_level(self) -> Level:
+        """Pick a level from the pack for this grid size and color count.
+
+        Falls back to generating one (always solvable) when there is no pack.
+        """
+        levels = get_levels(self.grid_size, self.num_colors)
+        if levels:
+            dot_positions, difficulty = random.choice(levels)
+            return Level(self.grid_size, self.num_colors, dot_positions, difficulty)
+        return Level(self.grid_size, self.num_colors)
+
     # AI/RL Interface
     def get_observation(self) -> dict:
         """Get current game state for AI agents."""
@@ -1,69 +1,342 @@
 """Level generator and management for Color Flow Puzzle."""
 
 import random
-from typing import List, Tuple, Set
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Set, Tuple
+
+from config import (BACKBITE_MOVES_PER_CELL, DENSE_PATH_LENGTH, GENERATOR_ATTEMPTS, MIN_PATH_LENGTH,
+                    SHIFTS_PER_CELL)
+
+Cell = Tuple[int, int]
+DotPositions = List[Tuple[int, int, int, int]]
 
 
 class LevelGenerator:
-    """Generate solvable color flow puzzle levels."""
+    """Generate solvable color flow puzzle levels.
+
+    Levels are built from a solution: random non-crossing paths are grown
+    until they cover the grid, then merged or split until there is one per
+    color, and the two ends of each path become that color's dots. Every
+    generated level can therefore be solved; solver.FlowSolver checks
+    whether the solution is also unique.
+
+    Merging rarely gets down to a few long paths that keep clear of
+    themselves, so levels averaging more than DENSE_PATH_LENGTH cells per
+    color, or whose grown paths cannot be fitted, are cut from one random
+    path through every cell instead.
+    """
 
-    def __init__(self, grid_size: int, num_colors: int):
+    def __init__(self, grid_size: int, num_colors: int, rng: Optional[random.Random] = None):
         self.grid_size = grid_size
         self.num_colors = num_colors
+        self.rng = rng or random.Random()
+        self.paths: List[List[Cell]] = []
 
-    def generate(self) -> Tuple[List[List[int]], List[Tuple[int, int, int, int]]]:
+    def generate(self) -> Tuple[List[List[int]], DotPositions]:
         """Generate a solvable level with the specified number of color pairs.
 
         Returns:
             Tuple of (initial_grid, dot_positions) where dot_positions is a list
-            of (row1, col1, row2, col2) for each color pair.
+            of (row1, col1, row2, col2) for each color pair. The solution is
+            left in self.paths, one list of cells per color.
+        """
+        self.paths = self.generate_paths()
+        dot_positions = [(path[0][0], path[0][1], path[-1][0], path[-1][1]) for path in self.paths]
+        return dots_to_grid(self.grid_size, dot_positions), dot_positions
+
+    def generate_paths(self) -> List[List[Cell]]:
+        """Paths covering every cell exactly once, one per color, each at least MIN_PATH_LENGTH long."""
+        if self.num_colors * MIN_PATH_LENGTH > self.grid_size ** 2:
+            raise ValueError(f"{self.num_colors} colors do not fit on a {self.grid_size}x{self.grid_size} grid")
+        if self.grid_size ** 2 <= self.num_colors * DENSE_PATH_LENGTH:
+            for _ in range(GENERATOR_ATTEMPTS):
+                paths = self._grow_paths()
+                if paths is not None and self._fit_count(paths):
+                    self.rng.shuffle(paths)
+                    return [list(path) for path in paths]
+        return self._cut_paths(self._covering_path())
+
+    def _covering_path(self) -> List[Cell]:
+        """A random path through every cell of the grid.
+
+        Starts from a path snaking along the rows and shuffles it with
+        backbite moves: one end steps onto a neighboring cell of the path,
+        and the part of the path past that cell is reversed so the path
+        stays whole.
         """
-        # Create empty grid
-        grid = [[0 for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        rng = self.rng
+        n = self.grid_size
+        path = [(r, c if r % 2 == 0 else n - 1 - c) for r in range(n) for c in range(n)]
+        for _ in range(BACKBITE_MOVES_PER_CELL * n * n):
+            if rng.random() < 0.5:
+                path.reverse()
+            next_to = rng.choice(self._neighbors(path[-1]))
+            if next_to == path[-2]:
+                continue
+            i = path.index(next_to)
+            path[i + 1:] = path[:i:-1]
+        return path
+
+    def _cut_paths(self, path: List[Cell]) -> List[List[Cell]]:
+        """Cut a path into one piece per color of roughly even length, each at least MIN_PATH_LENGTH long."""
+        rng = self.rng
+        colors = self.num_colors
+        average = len(path) / colors
+        cuts = [0]
+        for k in range(1, colors):
+            cut = int((k + rng.uniform(-0.3, 0.3)) * average)
+            cuts.append(min(max(cut, cuts[-1] + MIN_PATH_LENGTH), len(path) - (colors - k) * MIN_PATH_LENGTH))
+        cuts.append(len(path))
+        paths = [path[start:end] for start, end in zip(cuts, cuts[1:])]
+        rng.shuffle(paths)
+        return paths
+
+    def _neighbors(self, cell: Cell) -> List[Cell]:
+        r, c = cell
+        n = self.grid_size
+        return [(r + dr, c + dc) for dr, dc in ((0, 1), (0, -1), (1, 0), (-1, 0))
+                if 0 <= r + dr < n and 0 <= c + dc < n]
+
+    def _grow_paths(self) -> Optional[List[Deque[Cell]]]:
+        """Cover the grid with random paths that do not touch themselves."""
+        rng = self.rng
+        owner = {}
+        paths: List[Deque[Cell]] = []
+        # Random target lengths around the average a color needs
+        average = self.grid_size ** 2 / self.num_colors
+        cells = [(r, c) for r in range(self.grid_size) for c in range(self.grid_size)]
+        rng.shuffle(cells)
+
+        for start in cells:
+            if start in owner:
+                continue
+            path_id = len(paths)
+            path = deque([start])
+            owner[start] = path_id
+            limit = rng.randint(MIN_PATH_LENGTH, max(MIN_PATH_LENGTH, int(2 * average)))
+            for at_front in (False, True):
+                while len(path) < limit:
+                    end = path[0] if at_front else path[-1]
+                    # Free neighbors not touching this path anywhere but at its end
+                    options = [cell for cell in self._neighbors(end) if cell not in owner and
+                               all(owner.get(next_to) != path_id or next_to == end
+                                   for next_to in self._neighbors(cell))]
+                    if not options:
+                        break
+                    cell = rng.choice(options)
+                    owner[cell] = path_id
+                    if at_front:
+                        path.appendleft(cell)
+                    else:
+                        path.append(cell)
+            paths.append(path)
+
+        # Single cells join a neighboring path, through one of its ends or by splitting it
+        for path_id, path in enumerate(paths):
+            if len(path) > 1:
+                continue
+            cell = path[0]
+            if not self._absorb(cell, path_id, paths, owner):
+                return None
+        return [path for path in paths if path]
+
+    def _absorb(self, cell: Cell, path_id: int, paths: List[Deque[Cell]], owner: dict) -> bool:
+        """Move a lone cell into a neighboring path; False if no neighbor can take it."""
+        neighbors = self._neighbors(cell)
+        self.rng.shuffle(neighbors)
+        for next_to in neighbors:
+            other = paths[owner[next_to]]
+            if len(other) < 2 or next_to not in (other[0], other[-1]):
+                continue
+            # The cell may only touch the path at the end it joins
+            if any(owner.get(cell_next_to) == owner[next_to] and cell_next_to != next_to
+                   for cell_next_to in neighbors):
+                continue
+            if other[-1] == next_to:
+                other.append(cell)
+            else:
+                other.appendleft(cell)
+            owner[cell] = owner[next_to]
+            paths[path_id] = deque()
+            return True
+        for next_to in neighbors:
+            other_id = owner[next_to]
+            other = list(paths[other_id])
+            i = other.index(next_to)
+            # Cut the path at the neighbor so the cell ends one piece; both pieces keep two cells
+            if len(other) - i - 1 >= 2:
+                head, tail = other[:i + 1] + [cell], other[i + 1:]
+            elif i >= 2:
+                head, tail = [cell] + other[i:], other[:i]
+            else:
+                continue
+            if touches_itself(head):
+                continue
+            paths[other_id] = deque(head)
+            paths[path_id] = deque(tail)
+            for moved in head:
+                owner[moved] = other_id
+            for moved in tail:
+                owner[moved] = path_id
+            return True
+        return False
 
-        # Generate valid dot positions
-        dot_positions = self._generate_dot_positions()
+    def _dissolve(self, paths: List[Deque[Cell]], index: int) -> bool:
+        """Replace a path by its cells, each absorbed into a neighboring path; False if one cannot be."""
+        cells = paths.pop(index)
+        owner = {cell: i for i, path in enumerate(paths) for cell in path}
+        first = len(paths)
+        for cell in cells:
+            owner[cell] = len(paths)
+            paths.append(deque([cell]))
+        for path_id in range(first, first + len(cells)):
+            if not self._absorb(paths[path_id][0], path_id, paths, owner):
+                return False
+        paths[:] = [path for path in paths if path]
+        return True
+
+    def _fit_count(self, paths: List[Deque[Cell]]) -> bool:
+        """Merge or split paths until there is one per color; False if that fails."""
+        rng = self.rng
+        shifts = SHIFTS_PER_CELL * self.grid_size ** 2
+        dissolves = self.grid_size
+        while len(paths) > self.num_colors or any(len(path) < MIN_PATH_LENGTH for path in paths):
+            shortest = min(len(path) for path in paths)
+            # Join two paths whose ends touch, starting from the shortest ones
+            joins = [(i, a_end, j, b_end) for i, a_end, j, b_end in self._touching_ends(paths)
+                     if i < j and (len(paths) > self.num_colors or shortest in (len(paths[i]), len(paths[j])))]
+            rng.shuffle(joins)
+            for i, a_end, j, b_end in joins:
+                joined = self._join(paths[i], a_end, paths[j], b_end)
+                if not touches_itself(joined):
+                    break
+            else:
+                # No join keeps paths apart from themselves. With few enough paths,
+                # let the short ones grow; otherwise move a path end onto a neighbor's
+                # end cell and look again, or give in and join anyway.
+                if len(paths) <= self.num_colors:
+                    short = {k for k, path in enumerate(paths) if len(path) < MIN_PATH_LENGTH}
+                    if self._shift_end(paths, short):
+                        continue
+                if joins and shifts > 0 and self._shift_end(paths):
+                    shifts -= 1
+                    continue
+                if not joins:
+                    # The shortest path has no end to join: break it into lone cells
+                    # for neighboring paths to take in
+                    shortest_id = next(k for k, path in enumerate(paths) if len(path) == shortest)
+                    if dissolves <= 0 or not self._dissolve(paths, shortest_id):
+                        return False
+                    dissolves -= 1
+                    continue
+                i, a_end, j, b_end = joins[0]
+                joined = self._join(paths[i], a_end, paths[j], b_end)
+            paths[i] = deque(joined)
+            del paths[j]
 
-        # Place dots on the grid
-        for color_id, (r1, c1, r2, c2) in enumerate(dot_positions, 1):
-            grid[r1][c1] = color_id
-            grid[r2][c2] = color_id
+        while len(paths) < self.num_colors:
+            longest = max(range(len(paths)), key=lambda k: len(paths[k]))
+            path = list(paths[longest])
+            if len(path) < 2 * MIN_PATH_LENGTH:
+                return False
+            cut = rng.randint(MIN_PATH_LENGTH, len(path) - MIN_PATH_LENGTH)
+            paths[longest] = deque(path[:cut])
+            paths.append(deque(path[cut:]))
+        return True
 
-        return grid, dot_positions
+    @staticmethod
+    def _touching_ends(paths: Sequence[Deque[Cell]]) -> List[Tuple[int, int, int, int]]:
+        """(i, end of path i, j, end of path j) for every two ends of different paths side by side."""
+        ends = {}
+        for i, path in enumerate(paths):
+            ends[path[0]] = (i, 0)
+            ends[path[-1]] = (i, -1)
+        touching = []
+        for (r, c), (i, a_end) in ends.items():
+            for next_to in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+                other = ends.get(next_to)
+                if other is not None and other[0] != i:
+                    touching.append((i, a_end, other[0], other[1]))
+        return touching
 
-    def _generate_dot_positions(self) -> List[Tuple[int, int, int, int]]:
-        """Generate valid dot positions for all color pairs."""
-        available_cells = [(r, c) for r in range(self.grid_size) for c in range(self.grid_size)]
-        random.shuffle(available_cells)
+    @staticmethod
+    def _join(a: Sequence[Cell], a_end: int, b: Sequence[Cell], b_end: int) -> List[Cell]:
+        """Path a followed by path b, joined at the given ends (0 or -1)."""
+        a, b = list(a), list(b)
+        if a_end == 0:
+            a.reverse()
+        if b_end == -1:
+            b.reverse()
+        return a + b
 
-        positions = []
-        for _ in range(self.num_colors):
-            if len(available_cells) < 2:
-                break
+    def _shift_end(self, paths: List[Deque[Cell]], growing: Optional[Set[int]] = None) -> bool:
+        """Hand the end cell of one path to a path ending next to it; False if no such move exists.
 
-            pos1 = available_cells.pop()
-            pos2 = available_cells.pop()
+        growing limits the paths that may take a cell; those never give one up.
+        """
+        shifts = [(i, a_end, j, b_end) for i, a_end, j, b_end in self._touching_ends(paths)
+                  if (growing is None or (i in growing and j not in growing))
+                  and len(paths[j]) > (2 if growing is None else MIN_PATH_LENGTH)]
+        self.rng.shuffle(shifts)
+        for i, a_end, j, b_end in shifts:
+            a = list(paths[i])
+            cell = paths[j][b_end]
+            grown = [cell] + a if a_end == 0 else a + [cell]
+            if touches_itself(grown):
+                continue
+            paths[i] = deque(grown)
+            if b_end == 0:
+                paths[j].popleft()
+            else:
+                paths[j].pop()
+            return True
+        return False
 
-            # Ensure dots are not adjacent horizontally or vertically
-            # to make the puzzle more interesting
-            while abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1]) <= 1 and available_cells:
-                available_cells.insert(0, pos2)
-                pos2 = available_cells.pop()
 
-            positions.append((pos1[0], pos1[1], pos2[0], pos2[1]))
+def touches_itself(path: Sequence[Cell]) -> bool:
+    """Whether two cells of the path are side by side without being consecutive.
 
-        return positions
+    Such a path invites a shortcut, which tends to give a level more than one solution.
+    """
+    index = {cell: i for i, cell in enumerate(path)}
+    for i, (r, c) in enumerate(path):
+        for next_to in ((r + 1, c), (r, c + 1)):
+            j = index.get(next_to)
+            if j is not None and abs(i - j) != 1:
+                return True
+    return False
+
+
+def dots_to_grid(grid_size: int, dot_positions: Sequence[Tuple[int, int, int, int]]) -> List[List[int]]:
+    """An empty grid with each color's two dots placed (color ids start at 1)."""
+    grid = [[0 for _ in range(grid_size)] for _ in range(grid_size)]
+    for color_id, (r1, c1, r2, c2) in enumerate(dot_positions, 1):
+        grid[r1][c1] = color_id
+        grid[r2][c2] = color_id
+    return grid
 
 
 class Level:
-    """Represents a single puzzle level."""
+    """Represents a single puzzle level.
+
+    Levels come from a level pack (dot_positions given, with their difficulty)
+    or are generated on the spot, which guarantees a solution but not a
+    unique one.
+    """
 
-    def __init__(self, grid_size: int, num_colors: int):
+    def __init__(self, grid_size: int, num_colors: int,
+                 dot_positions: Optional[DotPositions] = None, difficulty: Optional[int] = None,
+                 rng: Optional[random.Random] = None):
         self.grid_size = grid_size
-        self.num_colors = num_colors
-        self.initial_grid, self.dot_positions = LevelGenerator(
-            grid_size, num_colors
-        ).generate()
+        if dot_positions is None:
+            self.initial_grid, self.dot_positions = LevelGenerator(
+                grid_size, num_colors, rng
+            ).generate()
+        else:
+            self.dot_positions = [tuple(dot) for dot in dot_positions]
+            self.initial_grid = dots_to_grid(grid_size, self.dot_positions)
+        self.num_colors = len(self.dot_positions)
+        self.difficulty = difficulty
         self.reset()
 
     def reset(self):
@@ -74,15 +347,8 @@ class Level:
 
     def get_empty_cells(self) -> int:
         """Count empty cells that are not dots."""
-        count = 0
-        dot_cells = {(r1, c1) for (r1, c1, _, _) in self.dot_positions}
-        dot_cells.update({(r2, c2) for (_, _, r2, c2) in self.dot_positions})
-
-        for r in range(self.grid_size):
-            for c in range(self.grid_size):
-                if self.grid[r][c] == 0 and (r, c) not in dot_cells:
-                    count += 1
-        return count
+        # Dots always hold their color id, so every 0 is an empty non-dot cell
+        return sum(row.count(0) for row in self.grid)
 
     def is_full(self) -> bool:
         """Check if all cells are filled."""
@@ -97,33 +363,19 @@ class Level:
 
     def _is_color_connected(self, color_id: int) -> bool:
         """Check if a color's dots are connected by its pipe."""
-        dots = [(r1, c1) for (r1, c1, _, _) in [self.dot_positions[color_id - 1]]]
-        dots.append((self.dot_positions[color_id - 1][2], self.dot_positions[color_id - 1][3]))
-
-        # Get all cells with this color (including pipe)
-        color_cells = []
-        for r in range(self.grid_size):
-            for c in range(self.grid_size):
-                if self.grid[r][c] == color_id:
-                    color_cells.append((r, c))
-
-        # Use BFS to check if both dots are connected
-        if not color_cells:
-            return False
-
-        visited = set()
-        queue = [color_cells[0]]
-        visited.add(color_cells[0])
+        r1, c1, r2, c2 = self.dot_positions[color_id - 1]
+        grid = self.grid
+        n = self.grid_size
 
+        # BFS from one dot through cells of this color
+        visited = {(r1, c1)}
+        queue = deque(visited)
         while queue:
-            current = queue.pop(0)
-            if current in dots:
-                dots.remove(current)
-
-            for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nr, nc = current[0] + dr, current[1] + dc
-                if (nr, nc) in color_cells and (nr, nc) not in visited:
+            r, c = queue.popleft()
+            if (r, c) == (r2, c2):
+                return True
+            for nr, nc in ((r, c + 1), (r, c - 1), (r + 1, c), (r - 1, c)):
+                if 0 <= nr < n and 0 <= nc < n and grid[nr][nc] == color_id and (nr, nc) not in visited:
                     visited.add((nr, nc))
                     queue.append((nr, nc))
-
-        return len(dots) == 0
+        return False
@@ -0,0 +1,126 @@
+"""Pre-generated level packs: build them once, load them when a grid size is first played.
+
+There is one pack file per grid size. Each line holds one level as two
+space-separated fields: the difficulty index into config.DIFFICULTY_NAMES
+and the dot positions, four base-36 digits (row1, col1, row2, col2) per
+color. Every level in a pack has exactly one solution.
+
+Build a pack with:  uv run level_pack.py [grid_size] [count] [seed]
+"""
+
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import config
+from level import LevelGenerator, DotPositions
+from solver import rate_level
+
+PackEntry = Tuple[DotPositions, int]
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+_packs: Dict[int, Dict[int, List[PackEntry]]] = {}
+
+
+def pack_path(grid_size: int) -> str:
+    """Path of the pack file for a grid size, next to this file."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        config.LEVEL_PACK_FILE.format(size=grid_size))
+
+
+def pack_colors(grid_size: int) -> Tuple[int, int]:
+    """Smallest and largest number of colors for levels of a grid size.
+
+    Sparse levels (few, long pipes) rarely have a unique solution on large
+    grids, so the default range grows with the grid.
+    """
+    if grid_size in config.PACK_COLORS:
+        return config.PACK_COLORS[grid_size]
+    return grid_size + grid_size // 3, grid_size * 3 // 2
+
+
+def build_pack(grid_size: int, count: int, seed: int = 0) -> List[PackEntry]:
+    """Generate up to count rated levels with unique solutions.
+
+    Levels whose solution is not unique, or that the solver cannot settle
+    within config.PACK_MAX_NODES branches, are dropped; building stops after
+    config.PACK_ATTEMPTS tries per level.
+    """
+    if grid_size > len(DIGITS):
+        raise ValueError(f"Pack files hold grids up to {len(DIGITS)}x{len(DIGITS)}")
+    rng = random.Random(seed)
+    low, high = pack_colors(grid_size)
+    entries = []
+    for _ in range(count * config.PACK_ATTEMPTS):
+        if len(entries) == count:
+            break
+        _, dot_positions = LevelGenerator(grid_size, rng.randint(low, high), rng).generate()
+        difficulty = rate_level(grid_size, dot_positions, config.PACK_MAX_NODES)
+        if difficulty is not None:
+            entries.append((dot_positions, difficulty))
+    return entries
+
+
+def save_pack(path: str, entries: List[PackEntry]) -> None:
+    """Write a pack to disk."""
+    with open(path, "w", encoding="utf-8") as f:
+        for dot_positions, difficulty in entries:
+            dots = "".join(DIGITS[value] for dot in dot_positions for value in dot)
+            f.write(f"{difficulty} {dots}\n")
+
+
+def load_pack(path: str) -> List[PackEntry]:
+    """Read a pack from disk; returns an empty list if there is no pack file."""
+    if not os.path.exists(path):
+        return []
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) == 2 and len(fields[1]) % 4 == 0:
+                values = [DIGITS.index(digit) for digit in fields[1]]
+                dot_positions = [tuple(values[i:i + 4]) for i in range(0, len(values), 4)]
+                entries.append((dot_positions, int(fields[0])))
+    return entries
+
+
+def get_levels(grid_size: int, num_colors: int) -> List[PackEntry]:
+    """Pack levels for a grid size and number of colors.
+
+    The pack file is read the first time its grid size is asked for and kept
+    in memory, grouped by number of colors.
+    """
+    if grid_size not in _packs:
+        by_colors: Dict[int, List[PackEntry]] = {}
+        for entry in load_pack(pack_path(grid_size)):
+            by_colors.setdefault(len(entry[0]), []).append(entry)
+        _packs[grid_size] = by_colors
+    return _packs[grid_size].get(num_colors, [])
+
+
+def main() -> int:
+    """Build the pack for one grid size next to this file."""
+    grid_size = int(sys.argv[1]) if len(sys.argv) > 1 else config.GRID_SIZE
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else config.LEVEL_PACK_SIZE
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    path = pack_path(grid_size)
+
+    start = time.perf_counter()
+    entries = build_pack(grid_size, count, seed)
+    elapsed = time.perf_counter() - start
+    save_pack(path, entries)
+
+    print(f"Wrote {len(entries)} levels to {path} in {elapsed:.1f}s ({len(entries) / elapsed:.1f} levels/s)")
+    for level, name in enumerate(config.DIFFICULTY_NAMES):
+        print(f"  {name:<8} {sum(1 for entry in entries if entry[1] == level)}")
+    low, high = pack_colors(grid_size)
+    for num_colors in range(low, high + 1):
+        print(f"  {num_colors} colors {sum(1 for entry in entries if len(entry[0]) == num_colors)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
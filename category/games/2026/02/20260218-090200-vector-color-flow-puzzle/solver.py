@@ -0,0 +1,271 @@
+"""Constraint-propagation solver for Color Flow Puzzle.
+
+Every cell has two bitmask domains: the pipe shapes it may take (which of its
+four sides it connects through) and the colors it may carry. Dots connect
+through exactly one side; every other cell connects through exactly two, so
+filling the grid is the same as fixing every shape. Two neighbors agree on
+whether they connect, and connected cells share a color. Search only branches
+on shapes; colors follow by propagation, and a closed loop of fixed pipes is
+rejected as soon as it appears.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from config import DIFFICULTY_NODES
+
+# Sides, as (row, col) steps: up, right, down, left
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+# A shape is a 4-bit mask of connected sides; a shape domain is a 16-bit mask
+# with bit `shape` set for every shape still possible
+HAS_SIDE = [sum(1 << shape for shape in range(16) if shape >> side & 1) for side in range(4)]
+DOT_SHAPES = sum(1 << (1 << side) for side in range(4))
+PIPE_SHAPES = sum(1 << (1 << a | 1 << b) for a in range(4) for b in range(a + 1, 4))
+
+Cell = Tuple[int, int]
+
+
+class Unsolvable(Exception):
+    """Raised internally when propagation empties a domain or closes a loop."""
+
+
+class NodeLimit(Exception):
+    """Raised internally when a search runs past its node budget."""
+
+
+def _single(mask: int) -> bool:
+    return mask & (mask - 1) == 0
+
+
+class FlowSolver:
+    """Counts the solutions of a level given as dot positions.
+
+    dot_positions holds (row1, col1, row2, col2) per color, in the format
+    Level uses. `nodes` counts the branching decisions of the last search,
+    which is how levels are graded: zero means propagation alone solved it.
+    """
+
+    def __init__(self, grid_size: int, dot_positions: Sequence[Tuple[int, int, int, int]]):
+        self.size = grid_size
+        self.num_colors = len(dot_positions)
+        self.nodes = 0
+        n = grid_size
+        cells = n * n
+        # Neighbor index per side, or -1 off the grid
+        self.neighbors: List[List[int]] = []
+        for r in range(n):
+            for c in range(n):
+                self.neighbors.append([(r + dr) * n + c + dc if 0 <= r + dr < n and 0 <= c + dc < n else -1
+                                       for dr, dc in DIRECTIONS])
+
+        all_colors = (1 << self.num_colors) - 1
+        self.is_dot = [False] * cells
+        self.dots: List[Tuple[int, int]] = []
+        shapes = [PIPE_SHAPES] * cells
+        colors = [all_colors] * cells
+        for color, (r1, c1, r2, c2) in enumerate(dot_positions):
+            self.dots.append((r1 * n + c1, r2 * n + c2))
+            for r, c in ((r1, c1), (r2, c2)):
+                i = r * n + c
+                self.is_dot[i] = True
+                shapes[i] = DOT_SHAPES
+                colors[i] = 1 << color
+        for i in range(cells):
+            for side, j in enumerate(self.neighbors[i]):
+                if j < 0:
+                    shapes[i] &= ~HAS_SIDE[side]
+        self.start = (shapes, colors)
+
+    def count_solutions(self, limit: int = 2, max_nodes: int = 0) -> Optional[int]:
+        """Number of solutions, counting no further than limit.
+
+        Returns:
+            The count, or None if the search gave up after max_nodes branches
+            (0 means no budget).
+        """
+        self.nodes = 0
+        self._solutions: List[List[int]] = []
+        self._limit = limit
+        self._max_nodes = max_nodes
+        try:
+            shapes, colors = self._settle(*self._copy(self.start), range(self.size * self.size))
+        except Unsolvable:
+            return 0
+        try:
+            self._search(shapes, colors)
+        except NodeLimit:
+            return None
+        return len(self._solutions)
+
+    def solve(self) -> Optional[List[List[int]]]:
+        """The grid of color ids (1-based) of a solution, or None if there is none."""
+        if not self.count_solutions(limit=1):
+            return None
+        n = self.size
+        colors = self._solutions[0]
+        return [[colors[r * n + c].bit_length() for c in range(n)] for r in range(n)]
+
+    def is_unique(self) -> bool:
+        return self.count_solutions(limit=2) == 1
+
+    @staticmethod
+    def _copy(state: Tuple[List[int], List[int]]) -> Tuple[List[int], List[int]]:
+        return state[0][:], state[1][:]
+
+    def _search(self, shapes: List[int], colors: List[int]) -> None:
+        # Branch on the open cell with the fewest shapes left
+        best = -1
+        best_count = 17
+        for i, mask in enumerate(shapes):
+            if not _single(mask):
+                count = bin(mask).count('1')
+                if count < best_count:
+                    best, best_count = i, count
+                    if count == 2:
+                        break
+        if best < 0:
+            self._solutions.append(colors)
+            return
+
+        mask = shapes[best]
+        while mask and len(self._solutions) < self._limit:
+            bit = mask & -mask
+            mask ^= bit
+            self.nodes += 1
+            if self.nodes == self._max_nodes:
+                raise NodeLimit
+            branch_shapes, branch_colors = shapes[:], colors[:]
+            branch_shapes[best] = bit
+            try:
+                branch = self._settle(branch_shapes, branch_colors, (best,))
+            except Unsolvable:
+                continue
+            self._search(*branch)
+
+    def _settle(self, shapes: List[int], colors: List[int], changed) -> Tuple[List[int], List[int]]:
+        """Propagate, then prune colors that cannot reach their dots, until nothing changes."""
+        while changed:
+            shapes, colors = self._propagate(shapes, colors, changed)
+            changed = self._prune_unreachable(shapes, colors)
+        return shapes, colors
+
+    def _prune_unreachable(self, shapes: List[int], colors: List[int]) -> List[int]:
+        """Drop each color from the cells its first dot cannot reach; fail if that cuts off its second dot.
+
+        A color travels between neighbors that both still allow it and may
+        still connect across their shared side, and it never passes through
+        its second dot. This catches regions sealed off from every color.
+        """
+        neighbors = self.neighbors
+        changed = []
+        for color, (start, goal) in enumerate(self.dots):
+            bit = 1 << color
+            seen = {start}
+            stack = [start]
+            while stack:
+                i = stack.pop()
+                if i == goal:
+                    continue
+                shape = shapes[i]
+                for side, j in enumerate(neighbors[i]):
+                    if (j >= 0 and j not in seen and colors[j] & bit and shape & HAS_SIDE[side]
+                            and shapes[j] & HAS_SIDE[(side + 2) & 3]):
+                        seen.add(j)
+                        stack.append(j)
+            if goal not in seen:
+                raise Unsolvable
+            for i, cell_colors in enumerate(colors):
+                if cell_colors & bit and i not in seen:
+                    cell_colors &= ~bit
+                    if not cell_colors:
+                        raise Unsolvable
+                    colors[i] = cell_colors
+                    changed.append(i)
+        return changed
+
+    def _propagate(self, shapes: List[int], colors: List[int], changed) -> Tuple[List[int], List[int]]:
+        """Make every pair of neighbors consistent, starting from the changed cells."""
+        neighbors = self.neighbors
+        queue = list(changed)
+        queued = set(queue)
+        fixed = [i for i in queue if _single(shapes[i])]
+        while queue:
+            i = queue.pop()
+            queued.discard(i)
+            for side, j in enumerate(neighbors[i]):
+                if j < 0:
+                    continue
+                back = (side + 2) & 3
+                a, b = shapes[i], shapes[j]
+                a_yes, b_yes = a & HAS_SIDE[side], b & HAS_SIDE[back]
+                a_no, b_no = a ^ a_yes, b ^ b_yes
+                # They connect only if both may, and stay apart only if both may
+                if not (colors[i] & colors[j]):
+                    a_yes = b_yes = 0
+                if not b_yes:
+                    a = a_no
+                if not a_yes:
+                    b = b_no
+                if not b_no:
+                    a = a_yes
+                if not a_no:
+                    b = b_yes
+                if not a or not b:
+                    raise Unsolvable
+                color_i, color_j = colors[i], colors[j]
+                if not (a & ~HAS_SIDE[side]):
+                    # Connected: one pipe, one color
+                    color_i = color_j = color_i & color_j
+                for k, shape, color in ((i, a, color_i), (j, b, color_j)):
+                    if shape != shapes[k] or color != colors[k]:
+                        if not color:
+                            raise Unsolvable
+                        if shape != shapes[k] and _single(shape):
+                            fixed.append(k)
+                        shapes[k], colors[k] = shape, color
+                        if k not in queued:
+                            queued.add(k)
+                            queue.append(k)
+        for i in fixed:
+            self._check_loop(shapes, i)
+        return shapes, colors
+
+    def _check_loop(self, shapes: List[int], start: int) -> None:
+        """Follow fixed pipes from start; coming back to it means a closed loop."""
+        if self.is_dot[start]:
+            return
+        previous, cell = -1, start
+        while True:
+            shape = shapes[cell]
+            if not _single(shape):
+                return
+            sides = shape.bit_length() - 1
+            step = -1
+            for side in range(4):
+                if sides >> side & 1:
+                    j = self.neighbors[cell][side]
+                    if j != previous:
+                        step = j
+                        break
+            if step < 0 or self.is_dot[step]:
+                return
+            previous, cell = cell, step
+            if cell == start:
+                raise Unsolvable
+
+
+def rate_level(grid_size: int, dot_positions: Sequence[Tuple[int, int, int, int]],
+               max_nodes: int = 0) -> Optional[int]:
+    """Difficulty index (into config.DIFFICULTY_NAMES) of a level with a unique solution.
+
+    The grade is the number of branches needed to find the solution and rule
+    out a second one: none means every pipe follows from the dots alone.
+
+    Returns:
+        The difficulty, or None if the level has no solution, more than one,
+        or could not be settled within max_nodes branches.
+    """
+    solver = FlowSolver(grid_size, dot_positions)
+    if solver.count_solutions(limit=2, max_nodes=max_nodes) != 1:
+        return None
+    return sum(1 for nodes in DIFFICULTY_NODES if solver.nodes > nodes)
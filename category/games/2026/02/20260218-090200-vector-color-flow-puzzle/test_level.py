@@ -0,0 +1,37 @@
+"""Level generator checks."""
+
+import random
+import time
+
+from config import MIN_PATH_LENGTH
+from level import LevelGenerator
+
+
+def check_paths(generator, grid_size, num_colors):
+    """The paths cover every cell once, one per color, each a chain of neighbors."""
+    paths = generator.paths
+    cells = [cell for path in paths for cell in path]
+    assert len(paths) == num_colors
+    assert len(cells) == len(set(cells)) == grid_size ** 2
+    for path in paths:
+        assert len(path) >= MIN_PATH_LENGTH
+        assert all(abs(r1 - r2) + abs(c1 - c2) == 1 for (r1, c1), (r2, c2) in zip(path, path[1:]))
+
+
+def test_sparse_12x12_generates_quickly():
+    """Few long pipes on a 12x12 grid, as the game deals without a pack, take well under a second."""
+    for num_colors in range(2, 7):
+        for seed in range(5):
+            generator = LevelGenerator(12, num_colors, random.Random(seed))
+            start = time.perf_counter()
+            generator.generate()
+            assert time.perf_counter() - start < 0.5, (num_colors, seed)
+            check_paths(generator, 12, num_colors)
+
+
+def test_dense_levels_keep_grown_paths():
+    """Dense levels still come from grown paths."""
+    for grid_size, num_colors in ((5, 3), (5, 6), (9, 12), (12, 18)):
+        generator = LevelGenerator(grid_size, num_colors, random.Random(grid_size))
+        generator.generate()
+        check_paths(generator, grid_size, num_colors)
@@ -0,0 +1,351 @@
+"""Run one game under instrumented pygame and write its frame metrics as JSON.
+
+Started by fleet_runtime.py with the game folder as the working directory:
+
+    python fleet_probe.py --out metrics.json --duration 10 --seed 1 script main.py
+    python fleet_probe.py --out metrics.json --duration 10 --seed 1 module src.main
+
+Before the game is imported, pygame is patched so that:
+
+- display.flip / display.update mark the end of a frame;
+- event.get / event.poll / event.wait deliver a seeded script of key and
+  mouse events, and key.get_pressed / mouse.get_pos / mouse.get_pressed
+  reflect the keys and buttons the script is holding;
+- time.Clock records how long tick() sleeps, so busy time per frame can be
+  told apart from the frame-rate cap;
+- at the first frame, the update/draw/render methods of every class defined
+  in the game folder are wrapped with timers (only the outermost call is
+  timed, so an entity update inside Game.update is not counted twice).
+
+After --duration seconds a QUIT event is posted. A game that ignores it for
+--grace seconds is stopped from inside the next frame.
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import runpy
+import sys
+import time
+import traceback
+
+UPDATE_METHODS = ("update",)
+DRAW_METHODS = ("draw", "render")
+# Keys the script presses; ESC and Q are left out because many games quit on them
+SCRIPT_KEYS = ("K_UP", "K_DOWN", "K_LEFT", "K_RIGHT", "K_w", "K_a", "K_s", "K_d",
+               "K_SPACE", "K_RETURN", "K_z", "K_x")
+START_KEYS = ("K_SPACE", "K_RETURN")
+START_AT = 1.0  # seconds after the first frame
+KEY_INTERVAL = 0.25
+KEY_HOLD = (0.05, 0.6)
+CLICK_INTERVAL = 1.0
+
+
+class StopProbe(BaseException):
+    """Raised inside the game loop when it ignores QUIT past the grace period."""
+
+
+class Pressed:
+    """Stand-in for key.get_pressed(): the real state plus the scripted held keys."""
+
+    def __init__(self, real, held):
+        self.real = real
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held or bool(self.real[key])
+
+    def __len__(self):
+        return len(self.real)
+
+    def __iter__(self):
+        return iter(self.real)
+
+
+class Clock:
+    """Delegating wrapper around pygame.time.Clock that records time spent in tick()."""
+
+    def __init__(self, probe, real_clock):
+        self._probe = probe
+        self._clock = real_clock()
+
+    def tick(self, *args):
+        start = time.perf_counter()
+        result = self._clock.tick(*args)
+        self._probe.frame_tick += time.perf_counter() - start
+        return result
+
+    def tick_busy_loop(self, *args):
+        start = time.perf_counter()
+        result = self._clock.tick_busy_loop(*args)
+        self._probe.frame_tick += time.perf_counter() - start
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self._clock, name)
+
+
+class Probe:
+    def __init__(self, pygame, duration, grace, seed, launched_at):
+        self.pygame = pygame
+        self.duration = duration
+        self.grace = grace
+        self.rng = random.Random(seed)
+        self.launched_at = launched_at
+
+        self.first_frame = None
+        self.last_frame = None
+        self.frames = []  # (frame_ms, busy_ms, update_ms, draw_ms)
+        self.frame_tick = 0.0
+        self.phase_time = {"update": 0.0, "draw": 0.0}
+        self.phase = None
+        self.phase_start = 0.0
+        self.depth = 0
+        self.wrapped = 0
+        self.quit_posted_at = None
+        self.stopped = False
+
+        self.held_keys = {}  # key -> release time
+        self.mouse_pos = (0, 0)
+        self.mouse_down = False
+        self.next_key = START_AT
+        self.next_click = START_AT
+        self.started = False
+        self.injected = 0
+
+    # Hooks
+
+    def install(self):
+        pg = self.pygame
+        self.real = {
+            "flip": pg.display.flip,
+            "update": pg.display.update,
+            "get": pg.event.get,
+            "poll": pg.event.poll,
+            "wait": pg.event.wait,
+            "get_pressed": pg.key.get_pressed,
+            "mouse_pos": pg.mouse.get_pos,
+            "mouse_pressed": pg.mouse.get_pressed,
+            "Clock": pg.time.Clock,
+        }
+        self.keys = [getattr(pg, name) for name in SCRIPT_KEYS if hasattr(pg, name)]
+        self.start_keys = [getattr(pg, name) for name in START_KEYS]
+
+        def flip(*args, **kwargs):
+            result = self.real["flip"](*args, **kwargs)
+            self.on_frame()
+            return result
+
+        def update(*args, **kwargs):
+            result = self.real["update"](*args, **kwargs)
+            self.on_frame()
+            return result
+
+        def get(*args, **kwargs):
+            self.inject()
+            return self.real["get"](*args, **kwargs)
+
+        def poll():
+            self.inject()
+            return self.real["poll"]()
+
+        def wait(*args, **kwargs):
+            self.inject()
+            return self.real["wait"](*args, **kwargs)
+
+        pg.display.flip = flip
+        pg.display.update = update
+        pg.event.get = get
+        pg.event.poll = poll
+        pg.event.wait = wait
+        pg.key.get_pressed = lambda: Pressed(self.real["get_pressed"](), self.held_keys)
+        pg.mouse.get_pos = lambda: self.mouse_pos if self.started else self.real["mouse_pos"]()
+        pg.mouse.get_pressed = self.mouse_pressed
+        pg.time.Clock = lambda: Clock(self, self.real["Clock"])
+
+    def mouse_pressed(self, *args, **kwargs):
+        real = self.real["mouse_pressed"](*args, **kwargs)
+        if not self.mouse_down:
+            return real
+        return (True,) + tuple(real[1:])
+
+    def wrap_game_methods(self):
+        """Time update/draw methods of classes defined in the game folder."""
+        root = os.getcwd()
+        for module in list(sys.modules.values()):
+            path = getattr(module, "__file__", None)
+            if not path or not os.path.abspath(path).startswith(root + os.sep):
+                continue
+            for value in list(vars(module).values()):
+                if isinstance(value, type) and value.__module__ == module.__name__:
+                    self.wrap_class(value)
+
+    def wrap_class(self, cls):
+        for name, value in list(vars(cls).items()):
+            if not callable(value) or isinstance(value, (staticmethod, classmethod, type)):
+                continue
+            if name in UPDATE_METHODS:
+                setattr(cls, name, self.timed(value, "update"))
+            elif name in DRAW_METHODS:
+                setattr(cls, name, self.timed(value, "draw"))
+
+    def timed(self, method, phase):
+        probe = self
+
+        def wrapper(*args, **kwargs):
+            if probe.depth:
+                return method(*args, **kwargs)
+            probe.depth += 1
+            probe.phase = phase
+            probe.phase_start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                probe.phase_time[phase] += time.perf_counter() - probe.phase_start
+                probe.depth -= 1
+                probe.phase = None
+
+        wrapper.__wrapped__ = method
+        self.wrapped += 1
+        return wrapper
+
+    # Frames
+
+    def on_frame(self):
+        now = time.perf_counter()
+        if self.phase is not None:
+            # Flipped from inside draw(): the time so far belongs to the frame that is ending
+            self.phase_time[self.phase] += now - self.phase_start
+            self.phase_start = now
+        if self.first_frame is None:
+            self.first_frame = now
+            self.startup = time.time() - self.launched_at
+            self.wrap_game_methods()
+        else:
+            frame = now - self.last_frame
+            self.frames.append((frame * 1000, (frame - self.frame_tick) * 1000,
+                                self.phase_time["update"] * 1000, self.phase_time["draw"] * 1000))
+        self.last_frame = now
+        self.frame_tick = 0.0
+        self.phase_time = {"update": 0.0, "draw": 0.0}
+
+        elapsed = now - self.first_frame
+        if self.quit_posted_at is None and elapsed >= self.duration:
+            self.real["get"]()  # drop pending scripted input so QUIT is seen promptly
+            self.pygame.event.post(self.pygame.event.Event(self.pygame.QUIT))
+            self.quit_posted_at = now
+        elif self.quit_posted_at is not None and now - self.quit_posted_at > self.grace:
+            self.stopped = True
+            raise StopProbe()
+
+    # Input script
+
+    def post_key(self, key, down):
+        pg = self.pygame
+        kind = pg.KEYDOWN if down else pg.KEYUP
+        name = pg.key.name(key)
+        unicode = (" " if key == pg.K_SPACE else "\r" if key == pg.K_RETURN else
+                   name if len(name) == 1 else "")
+        pg.event.post(pg.event.Event(kind, key=key, mod=0, unicode=unicode, scancode=0))
+        self.injected += 1
+
+    def post_click(self):
+        pg = self.pygame
+        surface = pg.display.get_surface()
+        if surface is None:
+            return
+        width, height = surface.get_size()
+        old = self.mouse_pos
+        self.mouse_pos = (self.rng.randrange(width), self.rng.randrange(height))
+        rel = (self.mouse_pos[0] - old[0], self.mouse_pos[1] - old[1])
+        pg.event.post(pg.event.Event(pg.MOUSEMOTION, pos=self.mouse_pos, rel=rel, buttons=(0, 0, 0)))
+        pg.event.post(pg.event.Event(pg.MOUSEBUTTONDOWN, pos=self.mouse_pos, button=1))
+        pg.event.post(pg.event.Event(pg.MOUSEBUTTONUP, pos=self.mouse_pos, button=1))
+        self.mouse_down = True
+        self.injected += 3
+
+    def inject(self):
+        """Post the scripted events that are due."""
+        if self.first_frame is None or self.quit_posted_at is not None:
+            return
+        elapsed = time.perf_counter() - self.first_frame
+        self.mouse_down = False
+        for key, release in list(self.held_keys.items()):
+            if elapsed >= release:
+                del self.held_keys[key]
+                self.post_key(key, False)
+        if elapsed < START_AT:
+            return
+        if not self.started:
+            # Get past title screens
+            self.started = True
+            for key in self.start_keys:
+                self.post_key(key, True)
+                self.post_key(key, False)
+        if elapsed >= self.next_key:
+            self.next_key = elapsed + KEY_INTERVAL
+            key = self.rng.choice(self.keys)
+            if key not in self.held_keys:
+                self.post_key(key, True)
+            self.held_keys[key] = elapsed + self.rng.uniform(*KEY_HOLD)
+        if elapsed >= self.next_click:
+            self.next_click = elapsed + CLICK_INTERVAL
+            self.post_click()
+
+    def metrics(self):
+        return {
+            "startup_s": getattr(self, "startup", None),
+            "frames": self.frames,
+            "wrapped_methods": self.wrapped,
+            "injected_events": self.injected,
+            "quit_ignored": self.stopped,
+            "shutdown_s": (time.perf_counter() - self.quit_posted_at) if self.quit_posted_at else None,
+            "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--grace", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--launched-at", type=float, default=None)
+    parser.add_argument("kind", choices=["script", "module"])
+    parser.add_argument("target")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    sys.path.insert(0, os.getcwd())
+    sys.argv = [args.target]
+
+    result = {"error": None, "exit": "returned"}
+    probe = None
+    try:
+        import pygame
+        probe = Probe(pygame, args.duration, args.grace, args.seed, args.launched_at or time.time())
+        probe.install()
+        if args.kind == "script":
+            runpy.run_path(args.target, run_name="__main__")
+        else:
+            runpy.run_module(args.target, run_name="__main__", alter_sys=True)
+    except SystemExit:
+        result["exit"] = "sys.exit"
+    except StopProbe:
+        result["exit"] = "stopped"
+    except BaseException:
+        result["exit"] = "error"
+        result["error"] = traceback.format_exc(limit=-3)
+    if probe is not None:
+        result.update(probe.metrics())
+    with open(args.out, "w") as f:
+        json.dump(result, f)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""Fleet-wide headless runtime analysis for every game in the repository.
+
+Discovers game folders from their appinfo.json, runs each game's entry point
+(from how_to_start) under fleet_probe.py with SDL_VIDEODRIVER=dummy, and
+collects startup time, frame time, update/draw time, busy time and peak RSS.
+Games run in parallel, one process each. The consolidated report is written
+as JSON and CSV; with --baseline, games whose p99 busy time grew past
+--threshold, or that stopped running cleanly, are listed as regressions.
+
+    python tools/fleet_runtime.py --duration 10 --jobs 8
+    python tools/fleet_runtime.py --filter tetris --baseline old/fleet_runtime.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROBE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fleet_probe.py")
+SKIP_DIRS = {".git", ".venv", "venv", "__pycache__", "node_modules"}
+
+CSV_FIELDS = [
+    "folder", "app_name", "status", "exit", "startup_s", "shutdown_s", "frames", "fps",
+    "frame_p50_ms", "frame_p99_ms", "busy_p50_ms", "busy_p99_ms",
+    "update_p50_ms", "update_p99_ms", "draw_p50_ms", "draw_p99_ms",
+    "peak_rss_mb", "wall_s", "error",
+]
+
+
+def log(message):
+    timestamp = time.strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+def discover(root, name_filter=None):
+    """Return (folder, appinfo) for every appinfo.json under root, sorted by folder."""
+    games = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        if "appinfo.json" not in filenames:
+            continue
+        folder = os.path.relpath(dirpath, root)
+        if name_filter and name_filter not in folder:
+            continue
+        try:
+            with open(os.path.join(dirpath, "appinfo.json"), encoding="utf-8") as f:
+                info = json.load(f)
+        except (OSError, ValueError) as e:
+            info = {"error": f"unreadable appinfo.json: {e}"}
+        games.append((folder, info))
+    return sorted(games)
+
+
+def entry_point(folder_path, info):
+    """Return ("script", path) or ("module", name) from how_to_start, or None if absent.
+
+    how_to_start is a uv command such as "uv run main.py",
+    "uv run python main.py" or "uv run python -m src.main".
+    """
+    words = shlex.split(info.get("how_to_start") or "uv run main.py")
+    if "run" in words:
+        words = words[words.index("run") + 1:]
+    args = []
+    skip = False
+    for word in words:
+        if skip:
+            skip = False
+        elif word in ("--python", "--with", "--project", "--directory"):
+            skip = True
+        elif word.startswith("-") and word != "-m":
+            continue
+        elif word.startswith("python") and not args:
+            continue
+        else:
+            args.append(word)
+    if len(args) >= 2 and args[0] == "-m":
+        module = args[1]
+        module_path = os.path.join(folder_path, *module.split("."))
+        if os.path.exists(module_path + ".py") or os.path.isdir(module_path):
+            return "module", module
+        return None
+    if args and args[0].endswith(".py") and os.path.exists(os.path.join(folder_path, args[0])):
+        return "script", args[0]
+    return None
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers, or None if it is empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def rounded(value, digits=3):
+    return None if value is None else round(value, digits)
+
+
+def summarize(folder, info, probe, exit_code, rusage, wall, stderr_tail, timed_out):
+    """Build one report row from the probe output and the process accounting."""
+    row = {
+        "folder": folder,
+        "app_name": info.get("app_name", os.path.basename(folder)),
+        "exit_code": exit_code,
+        "wall_s": rounded(wall),
+        "peak_rss_mb": rounded(rusage.ru_maxrss / 1024, 1) if rusage else None,
+        "error": None,
+    }
+    if probe is None:
+        row["status"] = "timeout" if timed_out else "crashed"
+        row["exit"] = None
+        row["error"] = stderr_tail or "probe wrote no metrics"
+        return row
+
+    frames = probe.get("frames") or []
+    columns = list(zip(*frames)) if frames else [[], [], [], []]
+    frame_ms, busy_ms, update_ms, draw_ms = (list(c) for c in columns)
+    has_phases = probe.get("wrapped_methods", 0) > 0
+    row.update({
+        "exit": probe.get("exit"),
+        "startup_s": rounded(probe.get("startup_s")),
+        "shutdown_s": rounded(probe.get("shutdown_s")),
+        "frames": len(frames),
+        "fps": rounded(len(frame_ms) / (sum(frame_ms) / 1000), 1) if frame_ms and sum(frame_ms) else None,
+        "injected_events": probe.get("injected_events"),
+        "quit_ignored": probe.get("quit_ignored"),
+    })
+    for name, values in (("frame", frame_ms), ("busy", busy_ms),
+                         ("update", update_ms if has_phases else []), ("draw", draw_ms if has_phases else [])):
+        row[f"{name}_p50_ms"] = rounded(percentile(values, 0.50))
+        row[f"{name}_p99_ms"] = rounded(percentile(values, 0.99))
+        row[f"{name}_max_ms"] = rounded(max(values)) if values else None
+
+    if probe.get("exit") == "error":
+        row["status"] = "error"
+        row["error"] = probe.get("error")
+    elif not frames:
+        row["status"] = "no_frames"
+        row["error"] = stderr_tail or None
+    elif probe.get("quit_ignored"):
+        row["status"] = "quit_ignored"
+    else:
+        row["status"] = "ok"
+    return row
+
+
+def run_game(folder, info, args):
+    """Run one game under the probe and return its report row."""
+    folder_path = os.path.join(args.root, folder)
+    entry = entry_point(folder_path, info)
+    if entry is None:
+        return {"folder": folder, "app_name": info.get("app_name", os.path.basename(folder)),
+                "status": "no_entry", "error": info.get("error") or "no runnable entry point"}
+
+    seed = args.seed ^ zlib.crc32(folder.encode())
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1", PYTHONDONTWRITEBYTECODE="1")
+    with tempfile.TemporaryDirectory(prefix="fleet-") as tmp:
+        out_path = os.path.join(tmp, "metrics.json")
+        err_path = os.path.join(tmp, "stderr.txt")
+        command = [args.python, PROBE, "--out", out_path, "--duration", str(args.duration),
+                   "--grace", str(args.grace), "--seed", str(seed), "--launched-at", str(time.time()),
+                   entry[0], entry[1]]
+        start = time.perf_counter()
+        with open(err_path, "wb") as err:
+            proc = subprocess.Popen(command, cwd=folder_path, env=env, stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.DEVNULL, stderr=err)
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                proc.kill()
+
+            # Startup plus the scripted run plus shutdown grace, with slack for slow imports
+            timer = threading.Timer(args.duration + args.grace + args.timeout, kill)
+            timer.start()
+            # wait4 reports the child's peak RSS, even when it had to be killed
+            _, status, rusage = os.wait4(proc.pid, 0)
+            timer.cancel()
+            proc.returncode = os.waitstatus_to_exitcode(status)
+        wall = time.perf_counter() - start
+
+        probe = None
+        if os.path.exists(out_path):
+            with open(out_path) as f:
+                probe = json.load(f)
+        with open(err_path, "rb") as f:
+            lines = f.read().decode("utf-8", "replace").strip().splitlines()
+        stderr_tail = "\n".join(lines[-5:])
+    return summarize(folder, info, probe, proc.returncode, rusage, wall, stderr_tail, timed_out.is_set())
+
+
+def compare(rows, baseline_path, threshold, min_delta):
+    """List games that got slower (p99 busy time) or stopped running cleanly since baseline.
+
+    A slowdown must exceed both the relative threshold and min_delta
+    milliseconds, so jitter on games that take ~1 ms a frame is ignored.
+    """
+    with open(baseline_path) as f:
+        baseline = {row["folder"]: row for row in json.load(f)["games"]}
+    regressions = []
+    for row in rows:
+        old = baseline.get(row["folder"])
+        if old is None:
+            continue
+        if old.get("status") == "ok" and row.get("status") != "ok":
+            regressions.append({"folder": row["folder"], "kind": "status",
+                                "baseline": old["status"], "current": row.get("status")})
+            continue
+        before, after = old.get("busy_p99_ms"), row.get("busy_p99_ms")
+        if before and after and after > before * (1 + threshold) and after - before > min_delta:
+            regressions.append({"folder": row["folder"], "kind": "busy_p99_ms",
+                                "baseline": before, "current": after, "ratio": round(after / before, 2)})
+    return regressions
+
+
+def write_reports(rows, args, elapsed, regressions):
+    by_status = {}
+    for row in rows:
+        by_status[row["status"]] = by_status.get(row["status"], 0) + 1
+    measured = [row for row in rows if row.get("busy_p99_ms") is not None]
+    report = {
+        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "host": {
+            "platform": platform.platform(),
+            "python": args.python,
+            "cpu_count": os.cpu_count(),
+        },
+        "settings": {
+            "duration_s": args.duration,
+            "grace_s": args.grace,
+            "jobs": args.jobs,
+            "seed": args.seed,
+            "baseline": args.baseline,
+        },
+        "summary": {
+            "games": len(rows),
+            "by_status": by_status,
+            "elapsed_s": round(elapsed, 1),
+            "slowest_busy_p99": [
+                {"folder": row["folder"], "busy_p99_ms": row["busy_p99_ms"]}
+                for row in sorted(measured, key=lambda r: r["busy_p99_ms"], reverse=True)[:10]
+            ],
+            "regressions": regressions,
+        },
+        "games": rows,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    with open(args.csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            # Only the last line of a traceback fits a CSV cell
+            lines = (row.get("error") or "").strip().splitlines()
+            writer.writerow({**row, "error": lines[-1] if lines else ""})
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Headless runtime analysis for every game in the repo.")
+    parser.add_argument("--root", default=REPO_ROOT, help="repository root to search for appinfo.json")
+    parser.add_argument("--filter", default=None, help="only run folders containing this text")
+    parser.add_argument("--duration", type=float, default=10.0, help="scripted play time per game (s)")
+    parser.add_argument("--grace", type=float, default=3.0, help="time a game gets to exit after QUIT (s)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="extra time before a game is killed (s)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="games run at once")
+    parser.add_argument("--seed", type=int, default=0, help="input script seed")
+    parser.add_argument("--python", default=sys.executable, help="interpreter with pygame installed")
+    parser.add_argument("--out", default="fleet_runtime.json")
+    parser.add_argument("--csv", default="fleet_runtime.csv")
+    parser.add_argument("--baseline", default=None, help="earlier JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="p99 busy time growth that counts as a regression")
+    parser.add_argument("--min-delta", type=float, default=2.0, help="smallest p99 busy time growth that counts (ms)")
+    args = parser.parse_args()
+    args.root = os.path.abspath(args.root)
+
+    games = discover(args.root, args.filter)
+    log(f"{len(games)} games, {args.jobs} at a time, {args.duration:g}s each")
+    start = time.perf_counter()
+    rows = []
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(run_game, folder, info, args) for folder, info in games]
+        for future in futures:
+            row = future.result()
+            rows.append(row)
+            busy = row.get("busy_p99_ms")
+            log(f"{row['status']:<12} {row['folder']}" + (f"  busy p99 {busy:.2f} ms" if busy is not None else ""))
+    elapsed = time.perf_counter() - start
+
+    regressions = compare(rows, args.baseline, args.threshold, args.min_delta) if args.baseline else []
+    report = write_reports(rows, args, elapsed, regressions)
+    log(f"done in {elapsed:.0f}s: {report['summary']['by_status']}; wrote {args.out} and {args.csv}")
+    for regression in regressions:
+        log(f"REGRESSION {regression['folder']}: {regression['kind']} "
+            f"{regression['baseline']} -> {regression['current']}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())